@@ -0,0 +1,252 @@
+"""Measure the CPU cost of the client's hot paths on synthetic boards.
+
+The fixtures are generated from a fixed seed, so runs on the same machine are
+comparable.  Save a baseline and compare later runs against it:
+
+    $ python benchmarks/hot_paths.py run --items 10000 --output baseline.json
+    $ python benchmarks/hot_paths.py run --items 10000 --output current.json
+    $ python benchmarks/hot_paths.py compare baseline.json current.json
+"""
+
+import argparse, gc, json, os, platform, random, statistics, sys, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from moncli import entities as en, column_value as cv
+from moncli.api_v2 import constants, graphql, requests
+from moncli.models import MondayModel
+from moncli.types import create_monday_type
+
+
+SEED = 20211004
+QUERY_IDS = 100
+STATUS_SETTINGS = {'labels': {str(index): 'Status {}'.format(index) for index in range(10)}}
+DROPDOWN_SETTINGS = {'labels': [{'id': index, 'name': 'Option {}'.format(index)} for index in range(1, 11)]}
+
+# Board column type, settings and a function of a random generator returning the raw value and text.
+# Team columns are left out because they have no column value class.
+COLUMNS = [
+    ('boolean', None, lambda r: ({'checked': 'true'} if r.random() < 0.5 else None, '')),
+    ('country', None, lambda r: ({'countryCode': 'US', 'countryName': 'United States'}, 'United States')),
+    ('date', None, lambda r: ({'date': '2021-{:02d}-{:02d}'.format(r.randint(1, 12), r.randint(1, 28)), 'time': None}, '')),
+    ('dependency', None, lambda r: ({'linkedPulseIds': [{'linkedPulseId': r.randint(1, 10 ** 9)} for _ in range(r.randint(0, 3))]}, '')),
+    ('dropdown', DROPDOWN_SETTINGS, lambda r: ({'ids': r.sample(range(1, 11), r.randint(1, 3))}, '')),
+    ('email', None, lambda r: ({'email': 'user{}@example.com'.format(r.randint(1, 999)), 'text': 'User'}, 'User')),
+    ('hour', None, lambda r: ({'hour': r.randint(0, 23), 'minute': r.choice([0, 15, 30, 45])}, '')),
+    ('link', None, lambda r: ({'url': 'https://example.com/{}'.format(r.randint(1, 999)), 'text': 'Example'}, 'Example')),
+    ('location', None, lambda r: ({'lat': r.uniform(-90, 90), 'lng': r.uniform(-180, 180), 'address': 'Somewhere'}, 'Somewhere')),
+    ('long-text', None, lambda r: ({'text': 'Lorem ipsum ' * r.randint(1, 20)}, '')),
+    ('numeric', None, lambda r: (str(round(r.uniform(0, 1000), 2)), '')),
+    ('multiple-person', None, lambda r: ({'personsAndTeams': [{'id': r.randint(1, 500), 'kind': 'person'} for _ in range(r.randint(0, 3))]}, '')),
+    ('phone', None, lambda r: ({'phone': '1555{:07d}'.format(r.randint(0, 9999999)), 'countryShortName': 'US'}, '')),
+    ('pulse-updated', None, lambda r: (None, '2021-10-04 19:45:20 UTC')),
+    ('rating', None, lambda r: ({'rating': r.randint(1, 5)}, '')),
+    ('color', STATUS_SETTINGS, lambda r: ({'index': r.randint(0, 9)}, '')),
+    ('tag', None, lambda r: ({'tag_ids': r.sample(range(1, 100), r.randint(0, 3))}, '')),
+    ('text', None, lambda r: ('Text {}'.format(r.randint(1, 10 ** 6)), '')),
+    ('timerange', None, lambda r: ({'from': '2021-01-{:02d}'.format(r.randint(1, 14)), 'to': '2021-02-{:02d}'.format(r.randint(1, 28))}, '')),
+    ('week', None, lambda r: ({'week': {'startDate': '2021-10-04', 'endDate': '2021-10-10'}}, '')),
+    ('timezone', None, lambda r: ({'timezone': r.choice(['America/New_York', 'Europe/London', 'Asia/Tokyo'])}, '')),
+    ('file', None, lambda r: ({'files': []}, '')),
+    ('board-relation', None, lambda r: ({'linkedPulseIds': [{'linkedPulseId': r.randint(1, 10 ** 9)} for _ in range(r.randint(0, 3))]}, '')),
+    ('subtasks', None, lambda r: ({'linkedPulseIds': [{'linkedPulseId': r.randint(1, 10 ** 9)} for _ in range(r.randint(0, 3))]}, '')),
+    ('pulse-log', None, lambda r: (None, '2021-10-04 19:20:32 UTC'))
+]
+
+
+class Fixtures(object):
+    """A wide board with every column type and generated item data."""
+
+    def __init__(self, items: int, width: int, seed: int = SEED):
+        generator = random.Random(seed)
+        self.creds = en.MondayClientCredentials(None)
+        self.columns = [{'id': 'name', 'title': 'Name', 'type': 'name', 'settings_str': '{}'}]
+        generators = {}
+        for copy in range(width):
+            for column_type, settings, generate in COLUMNS:
+                column_id = '{}_{}'.format(column_type.replace('-', '_'), copy)
+                self.columns.append({'id': column_id, 'title': '{} {}'.format(column_type, copy), 'type': column_type, 'settings_str': json.dumps(settings or {})})
+                generators[column_id] = generate
+        self.board = en.Board(creds=self.creds, id='1', name='Benchmark', columns=self.columns)
+        self.items_data = []
+        for index in range(items):
+            # The name column is not returned with the column values.
+            column_values = []
+            for column in self.columns[1:]:
+                value, text = generators[column['id']](generator)
+                column_values.append({'id': column['id'], 'title': column['title'], 'text': text, 'value': json.dumps(value) if value is not None else None})
+            self.items_data.append({'id': str(index + 1), 'name': 'Item {}'.format(index), 'column_values': column_values})
+        # Readonly and non-mappable columns are left out of the model.
+        model_fields = {
+            column['id']: create_monday_type(en.column.COLUMN_TYPE_MAPPINGS[column['type']], column['id'], column['title'], column['settings_str'])
+            for column in self.columns[1:] if column['type'] not in ('file', 'pulse-log', 'pulse-updated', 'subtasks')}
+        self.model = type('BenchmarkModel', (MondayModel,), model_fields)
+
+
+def bench_format_body(fixtures: Fixtures, size: int):
+    default_fields, default_arguments = constants.QUERY_MAP[constants.ITEMS]
+    fields = requests.get_field_list(default_fields, None, *['column_values.{}'.format(field) for field in constants.DEFAULT_COLUMN_VALUE_QUERY_FIELDS])
+    arguments = requests.get_method_arguments(default_arguments, ids=list(range(size)), limit=size, page=1)
+    def run():
+        for _ in range(100):
+            graphql.GraphQLOperation(graphql.OperationType.QUERY, constants.ITEMS, constants.FIELD_MAP, *fields, **arguments).format_body()
+    return run, 100
+
+
+def bench_method_arguments(fixtures: Fixtures, size: int):
+    mappings = constants.QUERY_MAP[constants.ITEMS][1]
+    arguments = {'ids': list(range(size)), 'limit': size, 'page': 1, 'newest_first': True}
+    def run():
+        for _ in range(100):
+            requests.get_method_arguments(mappings, **arguments)
+    return run, 100
+
+
+def bench_decode_column_values(fixtures: Fixtures, size: int):
+    columns = {column['id']: (en.column.COLUMN_TYPE_MAPPINGS[column['type']], column['settings_str']) for column in fixtures.columns}
+    values = [data for item in fixtures.items_data[:size] for data in item['column_values']]
+    def run():
+        for data in values:
+            column_type, settings_str = columns[data['id']]
+            cv.create_column_value(column_type, settings_str=settings_str, **data)
+    return run, len(values)
+
+
+def bench_hydrate_items(fixtures: Fixtures, size: int):
+    items_data = fixtures.items_data[:size]
+    def run():
+        for data in items_data:
+            en.Item(creds=fixtures.creds, __board=fixtures.board, **data)
+    return run, len(items_data)
+
+
+def bench_build_models(fixtures: Fixtures, size: int):
+    items = [en.Item(creds=fixtures.creds, __board=fixtures.board, **data) for data in fixtures.items_data[:size]]
+    def run():
+        for item in items:
+            fixtures.model(item)
+    return run, len(items)
+
+
+def bench_model_diff(fixtures: Fixtures, size: int):
+    models = [fixtures.model(en.Item(creds=fixtures.creds, __board=fixtures.board, **data)) for data in fixtures.items_data[:size]]
+    for model in models[::2]:
+        setattr(model, 'text_0', 'Changed')
+    def run():
+        for model in models:
+            model.to_primitive(diff_only=True)
+    return run, len(models)
+
+
+def bench_column_lookups(fixtures: Fixtures, size: int):
+    items = [en.Item(creds=fixtures.creds, __board=fixtures.board, **data) for data in fixtures.items_data[:size]]
+    keys = [column['id'] for column in fixtures.columns[1:]] + [column['title'] for column in fixtures.columns[1:]]
+    def run():
+        for item in items:
+            column_values = item.column_values
+            for key in keys:
+                column_values[key]
+    return run, len(items) * len(keys)
+
+
+# Benchmark name, function and the share of the fixture items it uses, or None for queries of QUERY_IDS ids.
+BENCHMARKS = {
+    'graphql.format_body': (bench_format_body, None),
+    'requests.get_method_arguments': (bench_method_arguments, None),
+    'column_value.create_column_value': (bench_decode_column_values, 0.1),
+    'entities.Item.__init__': (bench_hydrate_items, 0.1),
+    'models.MondayModel.__init__': (bench_build_models, 0.1),
+    'models.MondayModel.to_primitive(diff_only)': (bench_model_diff, 0.1),
+    'entities.BaseColumnCollection.__getitem__': (bench_column_lookups, 0.1)
+}
+
+
+def measure(function, fixtures: Fixtures, size: int, repeat: int):
+    """Get the per operation times (us) of a benchmark."""
+
+    run, operations = function(fixtures, size)
+    times = []
+    # Collections are disabled while timing, as in timeit.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            times.append((time.perf_counter() - start) * 10 ** 6 / operations)
+            gc.collect()
+    finally:
+        if enabled:
+            gc.enable()
+    return times, operations
+
+
+def run_benchmarks(items: int, width: int, repeat: int, names: list = None):
+    """Run the benchmarks and get the results in baseline form."""
+
+    fixtures = Fixtures(items, width)
+    results = {}
+    for name, (function, share) in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        size = QUERY_IDS if share is None else max(1, int(items * share))
+        times, operations = measure(function, fixtures, size, repeat)
+        results[name] = {'median_us': round(statistics.median(times), 4), 'min_us': round(min(times), 4), 'operations': operations}
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'items': items,
+        'columns': len(fixtures.columns),
+        'results': results}
+
+
+def compare(baseline: dict, current: dict, threshold: float):
+    """Get the relative change of each benchmark's fastest run and whether it regressed."""
+
+    for key in ('items', 'columns'):
+        if baseline[key] != current[key]:
+            raise ValueError('The baseline has {} {} but the results have {}.'.format(baseline[key], key, current[key]))
+    changes = {}
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if not base:
+            continue
+        change = (result['min_us'] - base['min_us']) / base['min_us'] * 100
+        changes[name] = {'baseline_us': base['min_us'], 'current_us': result['min_us'], 'change_pct': round(change, 1), 'regressed': change > threshold}
+    return changes
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('--items', type=int, default=10000, help='items on the synthetic board')
+    run_parser.add_argument('--width', type=int, default=2, help='columns of each type on the synthetic board')
+    run_parser.add_argument('--repeat', type=int, default=5, help='runs per benchmark')
+    run_parser.add_argument('--only', action='append', help='run only the named benchmark')
+    run_parser.add_argument('--output', help='save the results as a JSON baseline')
+    compare_parser = commands.add_parser('compare', help='compare results against a baseline')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=10, help='slowdown (%%) reported as a regression')
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run_benchmarks(args.items, args.width, args.repeat, args.only)
+        if args.output:
+            with open(args.output, 'w') as file:
+                json.dump(results, file, indent=2)
+        for name, result in results['results'].items():
+            print('{:<45} median {:>10.2f} us  min {:>10.2f} us  ({} ops)'.format(name, result['median_us'], result['min_us'], result['operations']))
+        return 0
+
+    with open(args.baseline) as baseline, open(args.current) as current:
+        changes = compare(json.load(baseline), json.load(current), args.threshold)
+    for name, change in changes.items():
+        print('{:<45} {:>10.2f} -> {:>10.2f} us  {:>+7.1f}%{}'.format(
+            name, change['baseline_us'], change['current_us'], change['change_pct'], '  REGRESSED' if change['regressed'] else ''))
+    return 1 if any(change['regressed'] for change in changes.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
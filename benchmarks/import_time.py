@@ -0,0 +1,62 @@
+"""Measure the cold start cost of importing moncli.
+
+Each scenario runs in a fresh interpreter so nothing is cached between runs:
+
+    $ python benchmarks/import_time.py --runs 20
+"""
+
+import argparse, json, os, statistics, subprocess, sys
+
+
+SCENARIOS = {
+    'import moncli': 'import moncli',
+    'configure api key': 'import moncli; moncli.api.api_key = "key"',
+    'webhook receiver': 'from moncli.webhooks import WebhookServer',
+    'default client': 'from moncli import client'
+}
+
+_TIMER = '''
+import time
+start = time.perf_counter()
+{}
+elapsed = time.perf_counter() - start
+import sys
+print(elapsed * 1000, ' '.join(name for name in ('requests', 'schematics', 'pytz', 'pycountry') if name in sys.modules))
+'''
+
+
+def measure(statement: str, runs: int):
+    """Get the import times (ms) of a statement and the heavy dependencies it loaded."""
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', _TIMER.format(statement)],
+            cwd=root, check=True, capture_output=True, text=True).stdout.split(maxsplit=1)
+        times.append(float(output[0]))
+        loaded = output[1].split() if len(output) > 1 else []
+    return times, loaded
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10, help='interpreters to start per scenario')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, statement in SCENARIOS.items():
+        times, loaded = measure(statement, args.runs)
+        results[name] = {'median_ms': round(statistics.median(times), 2), 'min_ms': round(min(times), 2), 'loaded': loaded}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for name, result in results.items():
+        print('{:<20} median {:>8.2f} ms  min {:>8.2f} ms  loaded: {}'.format(
+            name, result['median_ms'], result['min_ms'], ', '.join(result['loaded']) or '-'))
+
+
+if __name__ == '__main__':
+    main()
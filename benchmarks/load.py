@@ -0,0 +1,171 @@
+"""Measure client throughput and latency under concurrency against a simulated API.
+
+Each scenario runs a MondayClient workload on a pool of threads against a local
+fake monday.com server with configurable latency, rate limits and complexity
+budget:
+
+    $ python benchmarks/load.py --threads 1 4 16 --duration 10 --latency 0.05
+    $ python benchmarks/load.py --scenario bulk_writes --budget 5000 --budget-window 5
+"""
+
+import argparse, json, os, random, statistics, sys, threading, time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from moncli import entities as en
+from moncli.testing import FakeMondayBackend, FakeMondayServer, install
+
+
+STATUS_SETTINGS = {'labels': {'0': 'Working on it', '1': 'Done', '2': 'Stuck'}}
+
+
+class Workload(object):
+    """A seeded board and the operations run against it."""
+
+    def __init__(self, backend: FakeMondayBackend, items: int, seed: int):
+        self.random = random.Random(seed)
+        self._lock = threading.Lock()
+        board = backend.add_board('Load', columns=[
+            {'id': 'status', 'title': 'Status', 'type': 'color', 'settings': STATUS_SETTINGS},
+            {'id': 'estimate', 'title': 'Estimate', 'type': 'numeric'},
+            {'id': 'notes', 'title': 'Notes', 'type': 'text'}])
+        self.item_ids = [
+            backend.add_item(board['id'], 'Item {}'.format(index), column_values={'status': {'index': index % 3}, 'estimate': str(index)})['id']
+            for index in range(items)]
+        self.board_id = board['id']
+        self.creds = None
+        self.client = None
+        self.board = None
+
+    def setup(self):
+        """Load the board schema once, as a long running integration would."""
+
+        self.creds = en.MondayClientCredentials(None)
+        self.client = en.MondayClient()
+        self.board = self.client.get_board(id=self.board_id)
+        self.board.columns
+
+    def pick(self, values: list):
+        with self._lock:
+            return self.random.choice(values)
+
+    def item(self, item_id):
+        return en.Item(creds=self.creds, id=str(item_id), name='', __board=self.board)
+
+    def paged_reads(self):
+        """Read a random page of items with their column values."""
+
+        page = self.pick(range(1, max(1, len(self.item_ids) // 25) + 1))
+        self.board.get_items(get_column_values=True, limit=25, page=page)
+
+    def bulk_writes(self):
+        """Update several column values of a random item."""
+
+        item = self.item(self.pick(self.item_ids))
+        item.change_multiple_column_values({'status': {'index': self.pick([0, 1, 2])}, 'estimate': str(self.pick(range(100)))})
+
+    def webhook_lookups(self):
+        """Look up the item of a webhook event and update one in five of them."""
+
+        item = self.client.get_items(get_column_values=True, ids=[int(self.pick(self.item_ids))])[0]
+        if self.pick(range(5)) == 0:
+            item.change_multiple_column_values({'notes': 'Seen'})
+
+
+SCENARIOS = ['paged_reads', 'bulk_writes', 'webhook_lookups']
+
+
+def percentile(values: list, percent: float):
+    """Get the nearest-rank percentile of values."""
+
+    if not values:
+        return 0
+    values = sorted(values)
+    return values[min(len(values) - 1, max(0, int(round(percent / 100 * len(values) + 0.5)) - 1))]
+
+
+def run_scenario(scenario: str, threads: int, duration: float, backend: FakeMondayBackend, workload: Workload):
+    """Run a scenario on a number of threads for a duration and summarize it."""
+
+    operation = getattr(workload, scenario)
+    start_requests = len(backend.requests)
+    deadline = time.perf_counter() + duration
+    latencies, errors = [], []
+
+    def worker():
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                operation()
+            except Exception as error:
+                errors.append(type(error).__name__)
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        for future in [executor.submit(worker) for _ in range(threads)]:
+            future.result()
+    elapsed = time.perf_counter() - start
+
+    requests = backend.requests[start_requests:]
+    budget_used = sum(request['complexity'] for request in requests if not request['errors'])
+    return {
+        'scenario': scenario,
+        'threads': threads,
+        'operations': len(latencies),
+        'errors': len(errors),
+        'throughput_ops': round(len(latencies) / elapsed, 2),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+        'max_ms': round(max(latencies, default=0) * 1000, 2),
+        'mean_ms': round(statistics.mean(latencies) * 1000, 2) if latencies else 0,
+        'requests': len(requests),
+        'retries': sum(1 for request in requests if request['rate_limited']),
+        'budget_used': budget_used,
+        'budget_per_window': round(budget_used / elapsed * backend.budget_window)}
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenario', action='append', choices=SCENARIOS, help='run only the named scenario')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4, 16], help='thread counts to run each scenario with')
+    parser.add_argument('--duration', type=float, default=5, help='seconds per run')
+    parser.add_argument('--items', type=int, default=500, help='items on the simulated board')
+    parser.add_argument('--latency', type=float, default=0.02, help='simulated seconds per request')
+    parser.add_argument('--budget', type=int, default=1000000, help='complexity budget per window')
+    parser.add_argument('--budget-window', type=float, default=60, help='seconds per complexity budget window')
+    parser.add_argument('--requests-per-minute', type=int, help='requests per minute before answering 429')
+    parser.add_argument('--in-process', action='store_true', help='skip HTTP and answer requests in-process')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args(argv)
+
+    results = []
+    for scenario in args.scenario or SCENARIOS:
+        for threads in args.threads:
+            # Every run starts on a fresh backend with a full budget.
+            backend = FakeMondayBackend(
+                complexity_budget=args.budget, budget_window=args.budget_window,
+                latency=args.latency, requests_per_minute=args.requests_per_minute)
+            workload = Workload(backend, args.items, args.seed)
+            if args.in_process:
+                with install(backend):
+                    workload.setup()
+                    results.append(run_scenario(scenario, threads, args.duration, backend, workload))
+            else:
+                with FakeMondayServer(backend) as server, server.install():
+                    workload.setup()
+                    results.append(run_scenario(scenario, threads, args.duration, backend, workload))
+            if not args.json:
+                result = results[-1]
+                print('{scenario:<16} {threads:>3} threads  {throughput_ops:>9.2f} ops/s  p50 {p50_ms:>8.2f} ms  p99 {p99_ms:>8.2f} ms  '
+                      'requests {requests:>6}  retries {retries:>5}  errors {errors:>4}  budget {budget_used:>9}'.format(**result))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
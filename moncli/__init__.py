@@ -1,8 +1,37 @@
+from importlib import import_module
 
 from .enums import *
 from .config import *
 from .error import *
-from . import api_v2 as api
-from . import entities as en, column_value as cv
 
-client = en.MondayClient()
\ No newline at end of file
+# Submodules and aliases loaded on first access (PEP 562) to keep `import moncli` fast.
+LAZY_MODULES = {
+    'api': '.api_v2',
+    'api_v2': '.api_v2',
+    'en': '.entities',
+    'entities': '.entities',
+    'cv': '.column_value',
+    'column_value': '.column_value',
+    'models': '.models',
+    'types': '.types'
+}
+
+# Star imports keep exporting the lazy names, loading them on demand.
+__all__ = [name for name in globals() if not name.startswith('_') and name not in ('import_module', 'LAZY_MODULES')] + \
+    ['api', 'api_v2', 'en', 'entities', 'cv', 'column_value', 'client']
+
+
+def __getattr__(name: str):
+    if name in LAZY_MODULES:
+        module = import_module(LAZY_MODULES[name], __name__)
+        globals()[name] = module
+        return module
+    if name == 'client':
+        # The default client is only created once it is used.
+        client = globals()['client'] = import_module('.entities', __name__).MondayClient()
+        return client
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_MODULES) | {'client'})
@@ -1,8 +1,24 @@
 api_key = None
 connection_timeout = 10
+max_connections = 10
+# Rate limited requests are resent after the server's reset time, or this many seconds.
+rate_limit_wait = 5
+rate_limit_retries = 10
+# Queries built from operations are estimated before sending and fail above this complexity (None disables the check).
+max_query_complexity = 5000000
+# The `moncli.api_v2.RequestScheduler` sharing the complexity budget between request priorities, if any.
+scheduler = None
+# The `moncli.api_v2.ResponseCache` caching query responses, if any.
+response_cache = None
+# Identical queries sent while one is in flight wait for its response instead of being sent again, if enabled.
+coalesce_queries = False
 
 from . import graphql as gql
 from .exceptions import *
+from .caching import ResponseCache, get_cache_key
+from .coalescing import SingleFlight
+from .complexity import estimate_complexity, get_max_list_size
+from .scheduling import PriorityKey, RequestScheduler, priority
 from .constants import *
 from .handlers import *
-from .requests import execute_query, upload_file, get_field_list, get_method_arguments
\ No newline at end of file
+from .requests import execute_query, execute_query_async, upload_file, observe_requests, create_operation, get_field_list, get_method_arguments, get_session
\ No newline at end of file
@@ -0,0 +1,213 @@
+import hashlib, json, re, threading, time
+from collections import OrderedDict
+
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_TTL = 60
+# Identifiers of boards, items, users and other entities are numeric; column and group ids are not.
+_ENTITY_ID = re.compile(r'^\d+$')
+# Mutation arguments naming the entities a mutation changes; others (e.g. "user_ids") only refer to entities.
+ENTITY_ID_ARGUMENTS = ('board_id', 'item_id', 'parent_item_id', 'update_id')
+_WHITESPACE = re.compile(r'\s+')
+
+
+class ResponseCache(object):
+    """A read-through cache of query responses.
+
+    Responses are cached by the normalized query text, its variables and the API key, and
+    evicted least recently used first once the cache is full.  Each response is indexed by
+    the entity ids it contains, so that mutations and webhook events touching an entity
+    invalidate the responses that contain it.  Any object with the `get`, `put` and
+    `invalidate` methods may be used as a response cache.
+
+    Properties
+
+        max_size : `int`
+            The maximum number of cached responses.
+        ttl : `float`
+            The seconds a response stays valid, or None to keep it until evicted.
+        ttls : `dict[str, float]`
+            The seconds a response stays valid per query name (e.g. "me" or "boards").
+
+    Methods
+
+        get : `dict`
+            Get a cached response.
+        put : `void`
+            Cache a response.
+        invalidate : `int`
+            Remove the responses containing entities.
+        invalidate_items : `int`
+            Remove the responses containing a board or its items, as a webhook invalidation hook.
+        clear : `void`
+            Remove all responses.
+        get_stats : `dict`
+            Get the hit, miss, eviction, expiration and invalidation counts.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl: float = DEFAULT_TTL, ttls: dict = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self._entries = OrderedDict()
+        self._keys_by_id = {}
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str):
+        """Get a cached response, or None if it is not cached or expired.
+
+            Parameters
+
+                key : `str`
+                    The cache key of the request.
+
+            Returns
+
+                response : `dict`
+                    A copy of the cached response data.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry['expires_at'] is not None and entry['expires_at'] <= time.monotonic():
+                self._remove(key)
+                self._stats['expirations'] += 1
+                entry = None
+            if not entry:
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            content = entry['content']
+        # Callers get their own copy, so that changing it does not change the cache.
+        return json.loads(content)
+
+    def put(self, key: str, query_name: str, response: dict):
+        """Cache a response.
+
+            Parameters
+
+                key : `str`
+                    The cache key of the request.
+                query_name : `str`
+                    The name of the query, selecting its time to live.
+                response : `dict`
+                    The response data.
+        """
+
+        ttl = self.ttls.get(query_name, self.ttl)
+        if ttl is not None and ttl <= 0:
+            return
+        entry = {
+            'content': json.dumps(response),
+            'expires_at': time.monotonic() + ttl if ttl is not None else None,
+            'ids': get_entity_ids(response)}
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            for id in entry['ids']:
+                self._keys_by_id.setdefault(id, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self._stats['evictions'] += 1
+
+    def invalidate(self, *ids):
+        """Remove the responses containing entities.
+
+            Parameters
+
+                ids : `tuple`
+                    The unique identifiers of the changed entities.
+
+            Returns
+
+                count : `int`
+                    The number of removed responses.
+        """
+
+        with self._lock:
+            keys = set()
+            for id in ids:
+                keys.update(self._keys_by_id.get(str(id), ()))
+            for key in keys:
+                self._remove(key)
+            self._stats['invalidations'] += len(keys)
+            return len(keys)
+
+    def invalidate_items(self, board_id: str, item_ids: set = ()):
+        """Remove the responses containing a board or its items.
+
+            The signature matches `moncli.webhooks.WebhookServer.on_invalidate` hooks.
+
+            Parameters
+
+                board_id : `str`
+                    The board's unique identifier.
+                item_ids : `set[str]`
+                    The changed items' unique identifiers.
+
+            Returns
+
+                count : `int`
+                    The number of removed responses.
+        """
+
+        return self.invalidate(board_id, *item_ids)
+
+    def clear(self):
+        """Remove all responses."""
+
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_id.clear()
+
+    def get_stats(self):
+        """Get the hit, miss, eviction, expiration and invalidation counts and the number of cached responses."""
+
+        with self._lock:
+            return dict(self._stats, size=len(self._entries))
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        for id in entry['ids']:
+            keys = self._keys_by_id.get(id)
+            if keys:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_id[id]
+
+
+def get_cache_key(query: str, variables: dict = None, api_key: str = None):
+    """Get the cache key of a request from its normalized query text, variables and API key."""
+
+    query = _WHITESPACE.sub(' ', query).strip()
+    content = json.dumps([query, variables, hashlib.sha256(str(api_key).encode('utf-8')).hexdigest()], sort_keys=True)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def get_entity_ids(*values, arguments: tuple = ()):
+    """Get the entity ids in response data: the numeric "id" values of its objects, and the values of the given argument names.
+
+        Other keys ending in "_id" (e.g. "creator_id") refer to entities the data does not contain.
+    """
+
+    ids = set()
+    stack = list(values)
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            for key, child in value.items():
+                if key == 'id' or key in arguments:
+                    for id in (child if isinstance(child, list) else [child]):
+                        if id is not None and not isinstance(id, bool) and _ENTITY_ID.match(str(id)):
+                            ids.add(str(id))
+                if isinstance(child, (dict, list)):
+                    stack.append(child)
+        elif isinstance(value, list):
+            stack.extend(value)
+    return ids
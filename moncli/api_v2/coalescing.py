@@ -0,0 +1,106 @@
+import asyncio, copy, threading
+from concurrent.futures import Future
+
+
+class SingleFlight(object):
+    """Coalesces concurrent identical calls into a single call.
+
+    The first caller of a key runs the call while later callers of the same key, in other
+    threads or in asyncio tasks, wait for its result instead of running their own.  Every
+    caller gets its own copy of the result, and every caller gets the error if the call fails.
+
+    Methods
+
+        do : `object`
+            Run a call, or wait for the identical call in flight.
+        do_async : `object`
+            Run a call in an executor thread, or await the identical call in flight.
+        get_stats : `dict`
+            Get the number of calls run and shared.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'shared': 0}
+
+    def do(self, key: str, function):
+        """Run a call, or wait for the identical call in flight.
+
+            Parameters
+
+                key : `str`
+                    The key identifying identical calls.
+                function : `callable`
+                    The call, taking no arguments.
+
+            Returns
+
+                result : `object`
+                    The call's result.
+        """
+
+        future, leader = self._join(key)
+        if not leader:
+            return copy.deepcopy(future.result())
+        return self._run(key, future, function)
+
+    async def do_async(self, key: str, function, executor = None):
+        """Run a call in an executor thread, or await the identical call in flight.
+
+            Parameters
+
+                key : `str`
+                    The key identifying identical calls.
+                function : `callable`
+                    The blocking call, taking no arguments.
+                executor : `concurrent.futures.Executor`
+                    The executor running the call, or the event loop's default executor.
+
+            Returns
+
+                result : `object`
+                    The call's result.
+        """
+
+        future, leader = self._join(key)
+        if not leader:
+            return copy.deepcopy(await asyncio.wrap_future(future))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self._run, key, future, function)
+
+    def get_stats(self):
+        """Get the number of calls run and the number of callers that shared a call in flight."""
+
+        with self._lock:
+            return dict(self._stats, pending=len(self._calls))
+
+    def _join(self, key: str):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call['followers'] += 1
+                self._stats['shared'] += 1
+                return call['future'], False
+            future = Future()
+            self._calls[key] = {'future': future, 'followers': 0}
+            self._stats['calls'] += 1
+            return future, True
+
+    def _run(self, key: str, future: Future, function):
+        try:
+            result = function()
+        except BaseException as error:
+            self._finish(key)
+            future.set_exception(error)
+            raise
+        # No caller joins once the call is finished, and followers copy a snapshot the leader cannot change.
+        if self._finish(key):
+            future.set_result(copy.deepcopy(result))
+        else:
+            future.set_result(None)
+        return result
+
+    def _finish(self, key: str):
+        with self._lock:
+            return self._calls.pop(key)['followers']
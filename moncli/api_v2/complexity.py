@@ -0,0 +1,84 @@
+from .graphql import GraphQLField, GraphQLOperation
+
+
+# Complexity charged per object a list field may return when no limit or ids are given.
+DEFAULT_LIST_COMPLEXITY = 25
+MUTATION_COMPLEXITY = 10
+# Fields returning a single object; every other field with sub-selections returns a list.
+SINGULAR_FIELDS = {'board', 'group', 'parent_item', 'creator', 'owner', 'uploaded_by', 'top_group', 'workspace', 'account', 'me', 'complexity', 'plan'}
+
+
+def estimate_complexity(operation: GraphQLOperation, sizes: dict = None):
+    """Estimate the complexity of an operation before sending it.
+
+        Each object a field may return costs one point, multiplied by the size of its parent
+        lists.  List sizes are taken from the `limit` or `ids` arguments, or default to
+        `DEFAULT_LIST_COMPLEXITY`.  Mutations cost `MUTATION_COMPLEXITY` extra points.
+
+        Parameters
+
+            operation : `moncli.api_v2.graphql.GraphQLOperation`
+                The operation to estimate.
+            sizes : `dict`
+                List sizes by field path (e.g. "items.updates"), replacing the sizes taken
+                from the arguments.
+
+        Returns
+
+            complexity : `int`
+                The estimated complexity.
+    """
+
+    complexity = _estimate(operation, operation.name, sizes or {})
+    if operation.action_type == 'mutation':
+        complexity += MUTATION_COMPLEXITY
+    return complexity
+
+
+def get_max_list_size(operation: GraphQLOperation, path: str, max_complexity: int):
+    """Get the largest size of a list field keeping an operation within a complexity.
+
+        Parameters
+
+            operation : `moncli.api_v2.graphql.GraphQLOperation`
+                The operation to size.
+            path : `str`
+                The path of the list field, starting with the operation name (e.g. "boards.items").
+            max_complexity : `int`
+                The complexity the operation may not exceed.
+
+        Returns
+
+            size : `int`
+                The largest list size, or 0 if the operation exceeds the complexity without the list.
+    """
+
+    # The complexity grows linearly with the size of a single list.
+    base = estimate_complexity(operation, {path: 0})
+    cost = estimate_complexity(operation, {path: 1}) - base
+    if base > max_complexity:
+        return 0
+    if not cost:
+        return max_complexity
+    return (max_complexity - base) // cost
+
+
+def _estimate(field: GraphQLField, path: str, sizes: dict):
+    fields = field.get_fields()
+    if not fields:
+        return 0
+    return _get_size(field, path, sizes) * (1 + sum(_estimate(child, '{}.{}'.format(path, child.name), sizes) for child in fields))
+
+
+def _get_size(field: GraphQLField, path: str, sizes: dict):
+    if path in sizes:
+        return sizes[path]
+    if field.name in SINGULAR_FIELDS:
+        return 1
+    limit = field.arguments.get('limit')
+    if limit:
+        return int(limit)
+    ids = field.arguments.get('ids')
+    if isinstance(ids, list):
+        return len(ids)
+    return DEFAULT_LIST_COMPLEXITY
@@ -291,7 +291,10 @@ QUERY_MAP = {
             'items': {
                 'ids': (ArgumentValueKind.List, ArgumentValueKind.Int),
                 'limit': ArgumentValueKind.Int,
-                'page': ArgumentValueKind.Int
+                'page': ArgumentValueKind.Int,
+                'column_values': {
+                    'ids': (ArgumentValueKind.List, ArgumentValueKind.Default)
+                }
             },
             'order_by': ArgumentValueKind.Enum,
             'updates': {
@@ -458,7 +461,7 @@ QUERY_MAP = {
         {
             'config': ArgumentValueKind.Json
         }),
-    DELETE_WEBHOOK: (DEFAULT_WEBHOOK_QUERY_FIELDS, ),
+    DELETE_WEBHOOK: (DEFAULT_WEBHOOK_QUERY_FIELDS, {}),
     CREATE_WORKSPACE: (
         DEFAULT_WORKSPACE_QUERY_FIELDS, 
         {
@@ -19,4 +19,23 @@ class MondayApiError(Exception):
         self.query = query
         self.status_code = status_code
         self.error_code = error_code
-        self.messages = messages
\ No newline at end of file
+        self.messages = messages
+
+class ComplexityError(MondayApiError):
+    """A query estimated to exceed the maximum complexity, raised before it is sent.
+
+    __________
+    Properties
+    __________
+    complexity : `int`
+        The estimated complexity of the query.
+    max_complexity : `int`
+        The maximum complexity of a query.
+    """
+
+    def __init__(self, query: str, complexity: int, max_complexity: int):
+
+        message = 'Query has an estimated complexity of {}, which exceeds max complexity of {}.'.format(complexity, max_complexity)
+        super(ComplexityError, self).__init__(query, None, 'ComplexityException', [message])
+        self.complexity = complexity
+        self.max_complexity = max_complexity
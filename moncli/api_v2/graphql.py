@@ -79,6 +79,8 @@ class GraphQLField(GraphQLNode):
                 Add arguments to node.
             get_field : `moncli.api_v2.graphql.GraphQLField`
                 Get a child field of the given GraphQL field.
+            get_fields : `list[moncli.api_v2.graphql.GraphQLField]`
+                Get the child fields of the given GraphQL field.
             format_body : `str`
                 Format the GraphQL node into a query string.
             format_children : `str`
@@ -195,6 +197,12 @@ class GraphQLField(GraphQLNode):
         return node.get_field('.'.join(remaining_path))
 
 
+    def get_fields(self):
+        """Get the child fields of the given GraphQL field."""
+
+        return list(self.__children.values())
+
+
     def format_body(self):
         """Format the GraphQL node into a query string."""
 
@@ -754,7 +754,7 @@ def get_assets(ids: list, *args, **kwargs):
     
     ids = [gql.IntValue(id).value for id in ids]
     kwargs['ids'] = gql.ListValue(ids)
-    return execute_query(api_key=kwargs.pop('api_key', None), query_name=ASSETS, operation_type=gql.OperationType.QUERY, *args, fields=args, arguments=kwargs)
+    return execute_query(api_key=kwargs.pop('api_key', None), query_name=ASSETS, operation_type=gql.OperationType.QUERY, fields=args, arguments=kwargs)
 
 
 def duplicate_group(board_id: str, group_id: str, *args, **kwargs):
@@ -1885,11 +1885,13 @@ def add_file_to_update(update_id: str, file_path: str, *args, **kwargs):
 
             api_key : `str`
                 The monday.com v2 API user key.
+            callback : `callable`
+                Called with the bytes sent so far and the total request size while uploading.
     """
     
     kwargs['file'] = gql.FileValue('$file')
     kwargs['update_id'] = gql.IntValue(update_id)
-    return upload_file(file_path, api_key=kwargs.pop('api_key', None), query_name=ADD_FILE_TO_UPDATE, operation_type=gql.OperationType.MUTATION, fields=args, arguments=kwargs)
+    return upload_file(file_path, api_key=kwargs.pop('api_key', None), callback=kwargs.pop('callback', None), query_name=ADD_FILE_TO_UPDATE, operation_type=gql.OperationType.MUTATION, fields=args, arguments=kwargs)
 
 
 def add_file_to_column(item_id: str, column_id: str, file_path: str, *args, **kwargs):
@@ -1938,12 +1940,14 @@ def add_file_to_column(item_id: str, column_id: str, file_path: str, *args, **kw
 
             api_key : `str`
                 The monday.com v2 API user key.
+            callback : `callable`
+                Called with the bytes sent so far and the total request size while uploading.
     """
     
     kwargs['file'] = gql.FileValue('$file')
     kwargs['item_id'] = gql.IntValue(item_id)
     kwargs['column_id'] = gql.StringValue(column_id)
-    return upload_file(file_path, api_key=kwargs.pop('api_key', None), query_name=ADD_FILE_TO_COLUMN, operation_type=gql.OperationType.MUTATION, fields=args, arguments=kwargs)
+    return upload_file(file_path, api_key=kwargs.pop('api_key', None), callback=kwargs.pop('callback', None), query_name=ADD_FILE_TO_COLUMN, operation_type=gql.OperationType.MUTATION, fields=args, arguments=kwargs)
 
 
 def get_users(*args, **kwargs):
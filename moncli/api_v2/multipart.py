@@ -0,0 +1,149 @@
+import mimetypes, os, uuid
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class MultipartEncoder(object):
+    """A streaming multipart/form-data request body.
+
+    Files are read in chunks while the request is sent, so uploads never hold a whole
+    file in memory, and every file handle is closed once it has been read (or when the
+    encoder is closed).
+
+    Properties
+
+        boundary : `str`
+            The multipart boundary.
+        content_type : `str`
+            The request's Content-Type header value.
+        chunk_size : `int`
+            The number of bytes read from a file at a time.
+        callback : `callable`
+            Called with the bytes read so far and the total body size after every read.
+
+    Methods
+
+        read : `bytes`
+            Read up to `size` bytes of the encoded body.
+        close : `void`
+            Close any open file handles.
+    """
+
+    def __init__(self, fields: dict = None, files: dict = None, chunk_size: int = DEFAULT_CHUNK_SIZE, callback = None):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = 'multipart/form-data; boundary={}'.format(self.boundary)
+        self.chunk_size = chunk_size
+        self.callback = callback
+        self._parts = []
+        for name, value in (fields or {}).items():
+            self._parts.append(self._get_header(name) + str(value).encode('utf-8') + b'\r\n')
+        for name, file_path in (files or {}).items():
+            file_name = os.path.basename(file_path)
+            content_type = mimetypes.guess_type(file_name)[0] or 'application/octet-stream'
+            self._parts.append(self._get_header(name, file_name, content_type))
+            self._parts.append(_FilePart(file_path))
+            self._parts.append(b'\r\n')
+        self._parts.append('--{}--\r\n'.format(self.boundary).encode('utf-8'))
+        self._length = sum(len(part) for part in self._parts)
+        self._index = 0
+        self._offset = 0
+        self._read = 0
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def read(self, size: int = -1):
+        """Read up to `size` bytes of the encoded body.
+
+            Parameters
+
+                size : `int`
+                    The maximum number of bytes to read, or -1 to read the rest of the body.
+
+            Returns
+
+                data : `bytes`
+                    The next bytes of the body, or empty bytes at the end of the body.
+        """
+
+        if size is None or size < 0:
+            size = self._length - self._read
+        chunks = []
+        remaining = size
+        while remaining > 0 and self._index < len(self._parts):
+            part = self._parts[self._index]
+            if isinstance(part, _FilePart):
+                chunk = part.read(min(remaining, self.chunk_size))
+            else:
+                chunk = part[self._offset:self._offset + remaining]
+                self._offset += len(chunk)
+            if not chunk:
+                self._index += 1
+                self._offset = 0
+                continue
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        data = b''.join(chunks)
+        self._read += len(data)
+        if data and self.callback:
+            self.callback(self._read, self._length)
+        return data
+
+    def close(self):
+        """Close any open file handles."""
+
+        for part in self._parts:
+            if isinstance(part, _FilePart):
+                part.close()
+
+    def _get_header(self, name: str, file_name: str = None, content_type: str = None):
+        disposition = 'form-data; name="{}"'.format(name)
+        if file_name:
+            disposition += '; filename="{}"'.format(file_name.replace('"', '\\"'))
+        header = '--{}\r\nContent-Disposition: {}\r\n'.format(self.boundary, disposition)
+        if content_type:
+            header += 'Content-Type: {}\r\n'.format(content_type)
+        return (header + '\r\n').encode('utf-8')
+
+
+class _FilePart(object):
+    """A file read lazily and closed at its end."""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._size = os.path.getsize(file_path)
+        self._file = None
+        self._done = False
+
+    def __len__(self):
+        return self._size
+
+    def read(self, size: int):
+        if self._done:
+            return b''
+        if not self._file:
+            self._file = open(self.file_path, 'rb')
+        chunk = self._file.read(size)
+        if not chunk:
+            self.close()
+        return chunk
+
+    def close(self):
+        self._done = True
+        if self._file:
+            self._file.close()
+            self._file = None
@@ -1,8 +1,48 @@
-import requests, json, time
+import asyncio, contextvars, functools, json, re, threading, time
+from contextlib import contextmanager
 
 from . import MondayApiError
 from .graphql import *
+from .caching import ENTITY_ID_ARGUMENTS, get_cache_key, get_entity_ids
+from .coalescing import SingleFlight
+from .complexity import DEFAULT_LIST_COMPLEXITY, estimate_complexity
 from .constants import *
+from .exceptions import ComplexityError
+from .multipart import MultipartEncoder
+from .scheduling import get_priority
+
+_session = None
+_session_lock = threading.Lock()
+_observed = threading.local()
+_flights = SingleFlight()
+
+
+def get_session():
+    """Get the pooled HTTP session shared by all requests.
+
+        The connection pool holds up to `moncli.api_v2.max_connections` connections so that
+        concurrent requests reuse open connections instead of reconnecting.
+
+        Returns
+
+            session : `requests.Session`
+                The shared session.
+    """
+
+    global _session
+    if not _session:
+        with _session_lock:
+            if not _session:
+                # Deferred so that importing moncli does not load requests.
+                import requests
+                from . import max_connections
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
 
 def execute_query(timeout: int = None, **kwargs):
     """Executes a graphql query via Rest.
@@ -39,44 +79,82 @@ def execute_query(timeout: int = None, **kwargs):
                 Variables added to the query.
     """
 
-    api_key = kwargs.pop('api_key', None)
-    if not api_key:
-        from . import api_key
+    query_name, key, response, send = _prepare_query(timeout, **kwargs)
+    if response is None:
+        from . import coalesce_queries
+        if key is not None and coalesce_queries:
+            response = _flights.do(key, send)
+        else:
+            response = send()
+    return response[query_name]
 
-    if not timeout:
-        from . import connection_timeout
-        timeout = connection_timeout
 
-    query_name = kwargs.pop('query_name', None)
-    operation_type = kwargs.pop('operation_type', None)
-    fields = kwargs.pop('fields', ())
-    arguments = kwargs.pop('arguments', {})
-    query = kwargs.pop('query', None)
-    variables = kwargs.pop('variables', None)
-    include_complexity = kwargs.pop('include_complexity', False)
+async def execute_query_async(timeout: int = None, **kwargs):
+    """Executes a graphql query via Rest from an asyncio task.
 
-    if not query:
-        default_fields, default_arguments = QUERY_MAP.get(query_name, ([],{}))
-        fields = get_field_list(default_fields, None, *fields)
-        arguments = get_method_arguments(default_arguments, **arguments)
-        query = GraphQLOperation(operation_type, query_name, FIELD_MAP, *fields, **arguments).format_body()
+        The request is sent from an executor thread, and identical queries already in flight
+        are awaited instead of sent.  The arguments are the same as `execute_query`.
+    
+        Parameters
 
-    if include_complexity:
-        if 'mutation' in query:
-            query = query.replace('query {', 'mutation { complexity { before, after }')
+            timeout : `int`
+                The default timeout for Rest requests.
+            kwargs : `dict`
+                Optional keyword arguments
+
+        Returns
+        
+            data : `dict`
+                Response data in dictionary form.
+
+        Optional Arguments
+
+            api_key : `str`
+                The monday.com API v2 user key.
+            operation : `moncli.api_v2.graphql.GraphQLOperation`
+                Perform request with input graphql operation.
+            query_name: `str`:
+                The name of the query to execute.
+            operation_type: `moncli.api_v2.graphql.OperationType`:
+                The type of graphql operation to perform (QUERY or MUTATION).
+            fields: `list[str]`:
+                List of fields to return.
+            arguments: `dict`:
+                Additional graphql arguments.
+            query : `str`
+                Perform request with raw graphql query string.
+            variables : `dict`
+                Variables added to the query.
+    """
+
+    query_name, key, response, send = _prepare_query(timeout, **kwargs)
+    if response is None:
+        from . import coalesce_queries
+        # The request runs in the caller's context, keeping its priority.
+        send = functools.partial(contextvars.copy_context().run, send)
+        if key is not None and coalesce_queries:
+            response = await _flights.do_async(key, send)
         else:
-            query = query.replace('query {', 'query { complexity { before, after }')
+            response = await asyncio.get_running_loop().run_in_executor(None, send)
+    return response[query_name]
 
-    headers = { 'Authorization': api_key }
-    data = { 'query': query, 'variables': variables }
 
-    resp = requests.post(
-        API_V2_ENDPOINT,
-        headers=headers,
-        data=data,
-        timeout=timeout)
+@contextmanager
+def observe_requests():
+    """Collect the complexity and duration of the queries sent by the current thread while the context is open.
+
+        Returns
+
+            requests : `list[dict]`
+                The observed queries with their name, complexity (None if unknown) and seconds.
+    """
 
-    return _process_repsonse(api_key, timeout, resp, data, **kwargs)[query_name]
+    previous = getattr(_observed, 'requests', None)
+    _observed.requests = []
+    try:
+        yield _observed.requests
+    finally:
+        _observed.requests = previous
 
 
 def upload_file(file_path: str, timeout = 300, **kwargs):
@@ -106,12 +184,15 @@ def upload_file(file_path: str, timeout = 300, **kwargs):
                 List of fields to return.
             arguments: `dict`:
                 Additional graphql arguments.
+            callback : `callable`
+                Called with the bytes sent so far and the total request size while uploading.
     """
 
     api_key = kwargs.pop('api_key', None)
     if not api_key:
         from . import api_key
 
+    callback = kwargs.pop('callback', None)
     query_name = kwargs.pop('query_name')
     fields = kwargs.pop('fields', None)
     default_fields, _ = QUERY_MAP.get(query_name, ([],{}))
@@ -121,17 +202,48 @@ def upload_file(file_path: str, timeout = 300, **kwargs):
     operation.add_query_variable('file', 'File!')
     query = operation.format_body()
     
-    headers = { 'Authorization': api_key }
     data = { 'query': query }
-    files = { 'variables[file]': open(file_path, 'rb') }
-    resp = requests.post(
-        API_V2_FILE_ENDPOINT,
-        headers=headers,
-        data=data,
-        files=files,
-        timeout=timeout)
+    def post():
+        # The file is streamed from disk in chunks and closed once the request is sent.
+        with MultipartEncoder(data, {'variables[file]': file_path}, callback=callback) as body:
+            headers = { 'Authorization': api_key, 'Content-Type': body.content_type }
+            return get_session().post(
+                API_V2_FILE_ENDPOINT,
+                headers=headers,
+                data=body,
+                timeout=timeout)
+
+    response = _send(post, data)
+    from . import response_cache
+    if response_cache is not None:
+        response_cache.invalidate(*_get_changed_ids(arguments, response[query_name]))
+    return response[query_name]
+
+
+def create_operation(operation_type: OperationType, query_name: str, *args, **kwargs):
+    """Create the GraphQL operation for a query with its default fields and arguments.
+
+        Parameters
 
-    return _process_repsonse(api_key, timeout, resp, data, **kwargs)[query_name]
+            operation_type : `moncli.api_v2.graphql.OperationType`
+                The type of graphql operation (QUERY or MUTATION).
+            query_name : `str`
+                The name of the query.
+            args : `tuple`
+                The fields to return.
+            kwargs : `dict`
+                The query arguments.
+
+        Returns
+
+            operation : `moncli.api_v2.graphql.GraphQLOperation`
+                The graphql operation.
+    """
+
+    default_fields, default_arguments = QUERY_MAP.get(query_name, ([],{}))
+    fields = get_field_list(default_fields, None, *args)
+    arguments = get_method_arguments(default_arguments, **kwargs)
+    return GraphQLOperation(operation_type, query_name, FIELD_MAP, *fields, **arguments)
 
 
 def get_field_list(fields: list, prefix: str = None, *args):
@@ -197,8 +309,171 @@ def get_method_arguments(mappings: dict, **kwargs):
     return kwargs
 
 
-def _process_repsonse(api_key: str, timeout: int, resp, data, **kwargs):
-    """Process Rest graphql response/retry request."""
+def _check_complexity(operation: GraphQLOperation, query: str):
+    """Raise if an operation is estimated to exceed the maximum complexity, since sending it would fail."""
+
+    from . import max_query_complexity
+    if max_query_complexity is None:
+        return
+    complexity = estimate_complexity(operation)
+    if complexity > max_query_complexity:
+        raise ComplexityError(json.dumps({'query': query}), complexity, max_query_complexity)
+
+
+def _prepare_query(timeout: int = None, **kwargs):
+    """Build a request, returning its query name, its cache key (None unless it only reads data), the cached response if any and a function sending it."""
+
+    api_key = kwargs.pop('api_key', None)
+    priority = get_priority(api_key)
+    if not api_key:
+        from . import api_key
+
+    if not timeout:
+        from . import connection_timeout
+        timeout = connection_timeout
+
+    query_name = kwargs.pop('query_name', None)
+    operation_type = kwargs.pop('operation_type', None)
+    operation = None
+    fields = kwargs.pop('fields', ())
+    arguments = kwargs.pop('arguments', {})
+    query = kwargs.pop('query', None)
+    variables = kwargs.pop('variables', None)
+    include_complexity = kwargs.pop('include_complexity', False)
+
+    if not query:
+        operation = create_operation(operation_type, query_name, *fields, **arguments)
+        query = operation.format_body()
+        _check_complexity(operation, query)
+
+    from . import response_cache
+    cache_key = None
+    if _is_read(operation_type, query):
+        cache_key = get_cache_key(query, variables, api_key)
+        response = response_cache.get(cache_key) if response_cache is not None else None
+        if response is not None:
+            return query_name, cache_key, response, None
+
+    observed = getattr(_observed, 'requests', None)
+    if observed is not None and operation_type != OperationType.MUTATION:
+        include_complexity = True
+
+    if include_complexity:
+        if 'mutation' in query:
+            query = query.replace('query {', 'mutation { complexity { before, after }')
+        else:
+            query = query.replace('query {', 'query { complexity { before, after, query }')
+
+    headers = { 'Authorization': api_key }
+    data = { 'query': query, 'variables': variables }
+
+    def post():
+        return get_session().post(
+            API_V2_ENDPOINT,
+            headers=headers,
+            data=data,
+            timeout=timeout)
+
+    def send():
+        start = time.perf_counter()
+        response = _schedule(post, data, api_key, priority, operation)
+        if observed is not None:
+            observed.append({
+                'query_name': query_name,
+                'complexity': _get_complexity(response, operation),
+                'seconds': time.perf_counter() - start})
+        if response_cache is None:
+            return response
+        if cache_key is not None:
+            response_cache.put(cache_key, query_name, {key: value for key, value in response.items() if key != 'complexity'})
+        else:
+            # Mutations invalidate the cached responses containing the entities they change.
+            response_cache.invalidate(*_get_changed_ids(arguments, response[query_name]))
+        return response
+
+    return query_name, cache_key, None, send
+
+
+def _is_read(operation_type: OperationType, query: str):
+    """Check whether a request only reads data, so that its response may be cached and shared."""
+
+    if operation_type is not None:
+        return operation_type == OperationType.QUERY
+    return re.match(r'\s*(query\b|\{)', query) is not None
+
+
+def _get_changed_ids(arguments: dict, data):
+    """Get the ids of the entities changed by a mutation from its arguments and the entities it returns."""
+
+    # Other ids in the response (e.g. "creator_id") refer to entities the mutation did not change.
+    returned = data if isinstance(data, list) else [data]
+    changed = {key: value for key, value in arguments.items() if key in ENTITY_ID_ARGUMENTS}
+    return get_entity_ids(changed, [{'id': entity.get('id')} for entity in returned if isinstance(entity, dict)], arguments=ENTITY_ID_ARGUMENTS)
+
+
+def _get_complexity(response: dict, operation: GraphQLOperation = None):
+    """Get the complexity charged for a query, or its estimate if the response does not report it."""
+
+    complexity = response.get('complexity') or {}
+    if complexity.get('query') is not None:
+        return complexity['query']
+    if complexity.get('before') is not None and complexity.get('after') is not None:
+        return complexity['before'] - complexity['after']
+    if operation is not None:
+        return estimate_complexity(operation)
+    return None
+
+
+def _schedule(post, data: dict, api_key: str, priority, operation: GraphQLOperation = None):
+    """Send a request once the scheduler, if any, grants it a share of the complexity budget."""
+
+    from . import scheduler
+    if scheduler is None:
+        return _send(post, data)
+    # Raw queries are charged as a single default list until the response reports their cost.
+    cost = estimate_complexity(operation) if operation is not None else DEFAULT_LIST_COMPLEXITY
+    with scheduler.schedule(cost, priority, api_key) as ticket:
+        response = _send(post, data)
+        ticket.charged = _get_complexity(response, operation)
+    return response
+
+
+def _send(post, data: dict):
+    """Send a request, waiting and resending it while rate limited."""
+
+    from . import rate_limit_retries
+    for attempt in range(rate_limit_retries + 1):
+        resp = post()
+        wait = _get_rate_limit_wait(resp)
+        if wait is None or attempt == rate_limit_retries:
+            return _process_repsonse(resp, data)
+        time.sleep(wait)
+
+
+def _get_rate_limit_wait(resp):
+    """Get the seconds to wait before resending a rate limited request, or None."""
+
+    from . import rate_limit_wait
+    if resp.status_code == 429:
+        try:
+            return float(resp.headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return rate_limit_wait
+    if resp.status_code != 200:
+        return None
+    errors = resp.json().get('errors')
+    if not errors:
+        return None
+    # Queries exceeding the maximum complexity ("Query has complexity of...") fail on every attempt.
+    message = errors[0].get('message', '')
+    if 'Complexity budget exhausted' not in message:
+        return None
+    reset = re.search(r'reset in (\d+) seconds', message)
+    return float(reset.group(1)) if reset else rate_limit_wait
+
+
+def _process_repsonse(resp, data):
+    """Process Rest graphql response."""
 
     text: dict = resp.json()
     if resp.status_code == 401:
@@ -206,23 +481,15 @@ def _process_repsonse(api_key: str, timeout: int, resp, data, **kwargs):
     if resp.status_code == 403 or resp.status_code == 500:
         raise MondayApiError(json.dumps(data), resp.status_code, '', [text['error_message']])
     if resp.status_code == 429:
-        time.sleep(5)
-        return execute_query(api_key, timeout, **kwargs)
+        raise MondayApiError(json.dumps(data), resp.status_code, '', ['Rate limit exceeded.'])
     if text.__contains__('errors'):
+        error_query = json.dumps(data)
+        status_code = resp.status_code
         errors = text['errors']
-        if not 'Query has complexity of' in errors[0]['message']: 
-            error_query = json.dumps(data)
-            status_code = resp.status_code
-            errors = text['errors']
-            raise MondayApiError(error_query, status_code, '', errors)
-        # Wait for 5 seconds and try again in case of rate limiting... ^
-        time.sleep(5)
-        return execute_query(api_key, timeout, **kwargs)
+        raise MondayApiError(error_query, status_code, '', errors)
     # Raise exception for parse errors.
     if text.__contains__('error_code'):
         error_query = json.dumps(data)
         raise MondayApiError(error_query, 400, text['error_code'], [text['error_message']])
 
-    text: dict = resp.json()
     return text['data']
-
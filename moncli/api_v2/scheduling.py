@@ -0,0 +1,220 @@
+import contextvars, itertools, threading, time
+from contextlib import contextmanager
+
+from ..enums import Priority
+
+
+DEFAULT_COMPLEXITY_BUDGET = 1000000
+DEFAULT_BUDGET_WINDOW = 60
+# Shares of the budget served to each priority while others are waiting.
+DEFAULT_WEIGHTS = {Priority.interactive: 8, Priority.normal: 4, Priority.bulk: 1}
+# Parts of the budget each priority may spend, so that bulk work leaves room for interactive requests.
+DEFAULT_LIMITS = {Priority.interactive: 1.0, Priority.normal: 0.9, Priority.bulk: 0.7}
+
+_priority = contextvars.ContextVar('priority', default=None)
+
+
+class PriorityKey(str):
+    """An API key carrying the priority of the requests sent with it."""
+
+    def __new__(cls, api_key: str, priority: Priority):
+        key = super().__new__(cls, api_key)
+        key.priority = priority
+        return key
+
+
+class RequestScheduler(object):
+    """Shares the complexity budget of each API key between request priorities.
+
+    Requests wait until their estimated complexity fits the budget spent within the budget
+    window.  Waiting requests are served by weighted fair queuing: each priority receives a
+    share of the budget in proportion to its weight, and requests of a priority are served
+    in order.  A priority may only spend its limit, a part of the budget, so that lower
+    priorities cannot use up the budget needed by interactive requests.
+
+    Properties
+
+        budget : `int`
+            The complexity budget per API key and budget window.
+        window : `float`
+            The budget window in seconds.
+        weights : `dict[moncli.enums.Priority, float]`
+            The weight of each priority.
+        limits : `dict[moncli.enums.Priority, float]`
+            The part of the budget each priority may spend.
+
+    Methods
+
+        acquire : `object`
+            Wait until a request may be sent.
+        release : `void`
+            Record the complexity charged for a sent request.
+        schedule : `object`
+            Acquire a request while the context is open.
+        get_stats : `dict`
+            Get the number of requests and seconds waited per priority.
+    """
+
+    def __init__(self, budget: int = DEFAULT_COMPLEXITY_BUDGET, window: float = DEFAULT_BUDGET_WINDOW, weights: dict = None, limits: dict = None):
+        self.budget = budget
+        self.window = window
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.limits = {**DEFAULT_LIMITS, **(limits or {})}
+        self._condition = threading.Condition()
+        self._counter = itertools.count()
+        self._spent = {}
+        self._waiting = []
+        self._virtual_times = {}
+        self._finish_tags = {}
+        self._stats = {priority: {'requests': 0, 'wait': 0.0} for priority in Priority}
+
+    def acquire(self, cost: int, priority: Priority = None, api_key: str = None):
+        """Wait until a request may be sent.
+
+            Parameters
+
+                cost : `int`
+                    The estimated complexity of the request.
+                priority : `moncli.enums.Priority`
+                    The request priority; the default is normal.
+                api_key : `str`
+                    The API key whose budget is spent.
+
+            Returns
+
+                ticket : `object`
+                    The granted request, to be released once sent.
+        """
+
+        priority = priority or Priority.normal
+        key = str(api_key)
+        # Requests larger than a priority's limit are sent once nothing else is spent.
+        cost = max(0, min(cost, self.budget * self.limits[priority]))
+        start = time.monotonic()
+        with self._condition:
+            # The finish tag orders waiting requests: requests of heavier priorities finish earlier.
+            virtual_time = self._virtual_times.get(key, 0.0)
+            tag = max(virtual_time, self._finish_tags.get((key, priority), 0.0)) + cost / self.weights[priority]
+            self._finish_tags[(key, priority)] = tag
+            ticket = _Ticket(key, priority, cost, tag, next(self._counter))
+            self._waiting.append(ticket)
+            while not ticket.granted:
+                self._dispatch(key)
+                if not ticket.granted:
+                    self._condition.wait(self._get_wait(key))
+            stats = self._stats[priority]
+            stats['requests'] += 1
+            stats['wait'] += time.monotonic() - start
+        return ticket
+
+    def release(self, ticket, cost: int = None):
+        """Record the complexity charged for a sent request, if it differs from the estimate.
+
+            Parameters
+
+                ticket : `object`
+                    The ticket returned by `acquire`.
+                cost : `int`
+                    The complexity charged, if known.
+        """
+
+        with self._condition:
+            if cost is not None and ticket.spent is not None:
+                ticket.spent[1] = max(0, cost)
+            self._condition.notify_all()
+
+    @contextmanager
+    def schedule(self, cost: int, priority: Priority = None, api_key: str = None):
+        """Acquire a request while the context is open, releasing it when the context closes.
+
+            Parameters
+
+                cost : `int`
+                    The estimated complexity of the request.
+                priority : `moncli.enums.Priority`
+                    The request priority; the default is normal.
+                api_key : `str`
+                    The API key whose budget is spent.
+
+            Returns
+
+                ticket : `object`
+                    The granted request.  Set its `charged` complexity, if known.
+        """
+
+        ticket = self.acquire(cost, priority, api_key)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket, ticket.charged)
+
+    def get_stats(self):
+        """Get the number of requests and the seconds waited per priority."""
+
+        with self._condition:
+            return {priority: dict(stats) for priority, stats in self._stats.items()}
+
+    def _dispatch(self, key: str):
+        spent = self._get_spent(key)
+        blocked = set()
+        for ticket in sorted((ticket for ticket in self._waiting if ticket.key == key), key=lambda ticket: (ticket.tag, ticket.order)):
+            if ticket.priority in blocked:
+                continue
+            if spent + ticket.cost > self.budget * self.limits[ticket.priority]:
+                # Later requests of the same priority wait for this one.
+                blocked.add(ticket.priority)
+                continue
+            ticket.spent = [time.monotonic(), ticket.cost]
+            self._spent.setdefault(key, []).append(ticket.spent)
+            self._virtual_times[key] = max(self._virtual_times.get(key, 0.0), ticket.tag - ticket.cost / self.weights[ticket.priority])
+            self._waiting.remove(ticket)
+            ticket.granted = True
+            spent += ticket.cost
+        self._condition.notify_all()
+
+    def _get_spent(self, key: str):
+        now = time.monotonic()
+        spent = self._spent[key] = [entry for entry in self._spent.get(key, []) if now - entry[0] < self.window]
+        return sum(cost for _, cost in spent)
+
+    def _get_wait(self, key: str):
+        spent = self._spent.get(key)
+        if not spent:
+            return self.window
+        return max(0.001, self.window - (time.monotonic() - spent[0][0]))
+
+
+class _Ticket(object):
+
+    def __init__(self, key: str, priority: Priority, cost: int, tag: float, order: int):
+        self.key = key
+        self.priority = priority
+        self.cost = cost
+        self.tag = tag
+        self.order = order
+        self.granted = False
+        self.spent = None
+        self.charged = None
+
+
+@contextmanager
+def priority(value: Priority):
+    """Send the requests made while the context is open with a priority.
+
+        Parameters
+
+            value : `moncli.enums.Priority`
+                The priority of the requests.
+    """
+
+    token = _priority.set(value)
+    try:
+        yield value
+    finally:
+        _priority.reset(token)
+
+
+def get_priority(api_key: str = None):
+    """Get the priority of a request, from the open priority context or else the API key."""
+
+    return _priority.get() or getattr(api_key, 'priority', None) or Priority.normal
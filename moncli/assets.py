@@ -0,0 +1,255 @@
+import hashlib, os, shutil, tempfile, threading, time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from . import api, entities as en
+
+
+# Public urls are valid for one hour; they are refreshed a little before they expire.
+PUBLIC_URL_LIFETIME = 3600
+PUBLIC_URL_REFRESH_MARGIN = 300
+ASSETS_IDS_LIMIT = 100
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DEFAULT_CACHE_SIZE = 1024 ** 3
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+class AssetCache(object):
+    """A local, size-bounded LRU cache of downloaded asset contents.
+
+    Entries are addressed by a hash of the asset id, file size and creation date, so a
+    re-uploaded file never matches stale content.
+
+    Properties
+
+        path : `str`
+            The cache directory.
+        max_size : `int`
+            The maximum total size of the cached files in bytes.
+        size : `int`
+            The current total size of the cached files in bytes.
+
+    Methods
+
+        get : `str`
+            Get the cached file path of an asset.
+        put : `str`
+            Move a downloaded file into the cache.
+        clear : `void`
+            Remove all cached files.
+    """
+
+    def __init__(self, path: str = None, max_size: int = DEFAULT_CACHE_SIZE):
+        self.path = path or os.environ.get('MONCLI_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'moncli', 'assets')
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries = None
+
+    @property
+    def size(self):
+        """The current total size of the cached files in bytes."""
+
+        with self._lock:
+            return sum(self._get_entries().values())
+
+    def get(self, asset: en.Asset):
+        """Get the cached file path of an asset.
+
+            Parameters
+
+                asset : `moncli.entities.Asset`
+                    The asset to look up.
+
+            Returns
+
+                path : `str`
+                    The cached file path, or None if the asset is not cached.
+        """
+
+        key = get_cache_key(asset)
+        with self._lock:
+            entries = self._get_entries()
+            if key not in entries:
+                return None
+            path = self._get_path(key)
+            if not os.path.exists(path):
+                del entries[key]
+                return None
+            entries.move_to_end(key)
+            os.utime(path)
+            return path
+
+    def put(self, asset: en.Asset, file_path: str):
+        """Move a downloaded file into the cache.
+
+            Parameters
+
+                asset : `moncli.entities.Asset`
+                    The downloaded asset.
+                file_path : `str`
+                    The downloaded file, which is moved into the cache.
+
+            Returns
+
+                path : `str`
+                    The cached file path.
+        """
+
+        key = get_cache_key(asset)
+        path = self._get_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        size = os.path.getsize(file_path)
+        with self._lock:
+            entries = self._get_entries()
+            os.replace(file_path, path)
+            entries[key] = size
+            entries.move_to_end(key)
+            total = sum(entries.values())
+            # Evict the least recently used files, always keeping the newest one.
+            while total > self.max_size and len(entries) > 1:
+                evicted, evicted_size = entries.popitem(last=False)
+                total -= evicted_size
+                try:
+                    os.remove(self._get_path(evicted))
+                except FileNotFoundError:
+                    pass
+        return path
+
+    def clear(self):
+        """Remove all cached files."""
+
+        with self._lock:
+            shutil.rmtree(self.path, ignore_errors=True)
+            self._entries = OrderedDict()
+
+    def _get_entries(self):
+        if self._entries is None:
+            # Rebuild the LRU order from the files' modification times, which are touched on every hit.
+            found = []
+            for directory, _, file_names in os.walk(self.path):
+                for file_name in file_names:
+                    if file_name.endswith('.part'):
+                        continue
+                    stat = os.stat(os.path.join(directory, file_name))
+                    found.append((stat.st_mtime, file_name, stat.st_size))
+            self._entries = OrderedDict((key, size) for _, key, size in sorted(found))
+        return self._entries
+
+    def _get_path(self, key: str):
+        return os.path.join(self.path, key[:2], key)
+
+
+def get_default_cache():
+    """Get the asset cache shared by downloads that do not pass a cache."""
+
+    global _default_cache
+    with _default_cache_lock:
+        if not _default_cache:
+            _default_cache = AssetCache()
+        return _default_cache
+
+
+def get_cache_key(asset: en.Asset):
+    """Get the cache key of an asset from its id, file size and creation date."""
+
+    return hashlib.sha256('{}:{}:{}'.format(asset.id, asset.file_size, asset.created_at).encode('utf-8')).hexdigest()
+
+
+def refresh_public_urls(assets: list, api_key: str = None):
+    """Refresh expired asset public urls using batched requests.
+
+        Parameters
+
+            assets : `list[moncli.entities.Asset]`
+                The assets whose public urls should be valid.
+            api_key : `str`
+                The monday.com API v2 user key.
+    """
+
+    expired = {}
+    for asset in assets:
+        if asset.public_url_expired:
+            expired.setdefault(str(asset.id), []).append(asset)
+    ids = list(expired)
+    for index in range(0, len(ids), ASSETS_IDS_LIMIT):
+        fetched_at = time.time()
+        for data in api.get_assets(ids[index:index + ASSETS_IDS_LIMIT], 'id', 'public_url', api_key=api_key):
+            for asset in expired.get(str(data['id']), []):
+                asset.set_public_url(data.get('public_url'), fetched_at)
+
+
+def download_assets(assets: list, dest: str = None, concurrency: int = 4, cache = None, api_key: str = None):
+    """Download assets in parallel, serving repeated downloads from the local cache.
+
+        Parameters
+
+            assets : `list[moncli.entities.Asset]`
+                The assets to download.
+            dest : `str`
+                The directory to save the files to.  Files are named after the asset name, prefixed with
+                the asset id when names repeat.  If omitted, the cached file paths are returned.
+            concurrency : `int`
+                The number of files downloaded at the same time.
+            cache : `moncli.assets.AssetCache`
+                The cache to use, the shared default cache if omitted or False to disable caching.
+            api_key : `str`
+                The monday.com API v2 user key used to refresh expired public urls.
+
+        Returns
+
+            paths : `list[str]`
+                The downloaded file paths, in the order of the assets.
+    """
+
+    if cache is None:
+        cache = get_default_cache()
+    if dest is None and not cache:
+        raise ValueError('A destination directory is required when caching is disabled.')
+
+    paths = [cache.get(asset) if cache else None for asset in assets]
+    missing = [asset for asset, path in zip(assets, paths) if not path]
+    refresh_public_urls(missing, api_key)
+
+    download_dir = cache.path if cache else dest
+    os.makedirs(download_dir, exist_ok=True)
+    def download(asset: en.Asset):
+        file_path = _download(asset.public_url, download_dir)
+        return cache.put(asset, file_path) if cache else file_path
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        downloaded = iter(list(executor.map(download, missing)))
+    paths = [path or next(downloaded) for path in paths]
+
+    if dest is None:
+        return paths
+
+    os.makedirs(dest, exist_ok=True)
+    names = [asset.name or str(asset.id) for asset in assets]
+    results = []
+    for asset, name, path in zip(assets, names, paths):
+        file_name = name if names.count(name) == 1 else '{}_{}'.format(asset.id, name)
+        target = os.path.join(dest, file_name)
+        if cache:
+            shutil.copyfile(path, target)
+        else:
+            os.replace(path, target)
+        results.append(target)
+    return results
+
+
+def _download(url: str, directory: str):
+    """Stream a url to a temporary file in a directory."""
+
+    handle, file_path = tempfile.mkstemp(dir=directory, suffix='.part')
+    try:
+        with os.fdopen(handle, 'wb') as file:
+            with api.get_session().get(url, stream=True, timeout=api.connection_timeout) as resp:
+                resp.raise_for_status()
+                for chunk in resp.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    file.write(chunk)
+    except BaseException:
+        os.remove(file_path)
+        raise
+    return file_path
@@ -0,0 +1,167 @@
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from . import api
+from .utils import chunk, unique
+
+
+ITEMS_IDS_LIMIT = 100
+COLUMN_VALUES_LIMIT = 50
+
+
+class ItemList(list):
+    """A list of items fetched by id.
+
+    Properties
+
+        missing_ids : `list[str]`
+            The requested ids that no item was returned for, in the requested order.
+    """
+
+    def __init__(self, items: list = (), missing_ids: list = None):
+        super().__init__(items)
+        self.missing_ids = missing_ids or []
+
+
+def map_chunks(function, values: list, chunk_size: int, concurrency: int = 1):
+    """Call a function for chunks of values, concurrently if there are several chunks.
+
+        Parameters
+
+            function : `callable`
+                Called with each chunk.
+            values : `list`
+                The values to split.
+            chunk_size : `int`
+                The maximum number of values per chunk.
+            concurrency : `int`
+                The number of chunks handled at the same time.
+
+        Returns
+
+            results : `list`
+                The results of the function, in chunk order.
+    """
+
+    chunks = list(chunk(values, chunk_size))
+    if len(chunks) > 1 and concurrency > 1:
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks))) as executor:
+            # Each chunk runs in a copy of the caller's context, keeping its request priority.
+            futures = [executor.submit(contextvars.copy_context().run, function, values_chunk) for values_chunk in chunks]
+            return [future.result() for future in futures]
+    return [function(values_chunk) for values_chunk in chunks]
+
+
+def stream_pages(fetch_page, values: list, chunk_size: int, limit: int, concurrency: int = 1):
+    """Page through a query for chunks of values, fetching pages of several chunks at the same time.
+
+        Parameters
+
+            fetch_page : `callable`
+                Called with a chunk of values, a page number and the limit, returning the page's results.
+            values : `list`
+                The values to split.
+            chunk_size : `int`
+                The maximum number of values per chunk.
+            limit : `int`
+                The page size.  A chunk's next page is fetched while its pages are full.
+            concurrency : `int`
+                The number of pages fetched at the same time.
+
+        Returns
+
+            pages : `generator[list]`
+                The non-empty pages, as they arrive.
+    """
+
+    chunks = list(chunk(values, chunk_size))
+    if not chunks:
+        return
+    executor = ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(chunks))))
+    try:
+        queued = [(values_chunk, 1) for values_chunk in chunks]
+        pending = {}
+        while queued or pending:
+            while queued and len(pending) < max(1, concurrency):
+                values_chunk, page = queued.pop(0)
+                future = executor.submit(contextvars.copy_context().run, fetch_page, values_chunk, page, limit)
+                pending[future] = (values_chunk, page)
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                values_chunk, page = pending.pop(future)
+                results = future.result()
+                if len(results) >= limit:
+                    queued.append((values_chunk, page + 1))
+                if results:
+                    yield results
+    finally:
+        # Pages not yet fetched are dropped when the consumer stops early.
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def get_max_chunk_size(query_name: str, chunk_size: int, *args, **kwargs):
+    """Limit the number of ids per query so that the query stays within `api.max_query_complexity`.
+
+        Parameters
+
+            query_name : `str`
+                The name of the query taking the ids (e.g. "items").
+            chunk_size : `int`
+                The requested maximum number of ids per query.
+            args : `tuple`
+                The return fields of the query.
+            kwargs : `dict`
+                Other arguments of the query.
+
+        Returns
+
+            chunk_size : `int`
+                The requested chunk size, or a smaller one fitting the complexity.
+    """
+
+    if api.max_query_complexity is None:
+        return chunk_size
+    operation = api.create_operation(api.gql.OperationType.QUERY, query_name, *args, ids=[0], **kwargs)
+    # A single id exceeding the complexity fails when sent with a clear error.
+    return max(1, min(chunk_size, api.get_max_list_size(operation, query_name, api.max_query_complexity)))
+
+
+def get_items_data(item_ids: list, *args, api_key: str = None, chunk_size: int = ITEMS_IDS_LIMIT, concurrency: int = 4, **kwargs):
+    """Get items by id using chunked `items(ids:[...])` queries sent concurrently.
+
+        Parameters
+
+            item_ids : `list[str]`
+                The items' unique identifiers.  Duplicates are requested once.
+            args : `tuple`
+                The item return fields.
+            api_key : `str`
+                The monday.com API v2 user key.
+            chunk_size : `int`
+                The maximum number of ids per query.
+            concurrency : `int`
+                The number of queries sent at the same time.
+            kwargs : `dict`
+                Other arguments of the items query.
+
+        Returns
+
+            items_data : `list[dict]`
+                The item data in the order of the ids, once per id.
+            missing_ids : `list[str]`
+                The ids that no item was returned for.
+    """
+
+    item_ids = unique(str(item_id) for item_id in item_ids)
+    chunk_size = get_max_chunk_size(api.ITEMS, chunk_size, *args, **kwargs)
+
+    def fetch(ids: list):
+        return api.get_items(*args, api_key=api_key, ids=[int(id) for id in ids], limit=len(ids), **kwargs)
+
+    items_data = {}
+    for chunk_data in map_chunks(fetch, item_ids, chunk_size, concurrency):
+        for data in chunk_data:
+            items_data[str(data['id'])] = data
+    return [items_data[id] for id in item_ids if id in items_data], [id for id in item_ids if id not in items_data]
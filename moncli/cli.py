@@ -0,0 +1,476 @@
+"""The moncli command line interface.
+
+Usage:
+
+    moncli export --board-id 12345 --output items.jsonl
+    moncli export --board-id 12345 --group-id topics --format csv --output items.csv --checkpoint items.ckpt
+    moncli import --board-id 12345 --input items.csv --group-id topics
+
+The API key is read from the --api-key option or the MONDAY_API_KEY environment variable.
+"""
+
+import argparse, csv, json, os, sys, threading, time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import api, ColumnType, Priority, types
+from .entities import MondayClientCredentials, Board
+
+
+DEFAULT_PAGE_LIMIT = 100
+DEFAULT_WORKERS = 4
+DEFAULT_BATCH_SIZE = 25
+# The monday.com complexity budget per minute.
+DEFAULT_COMPLEXITY_BUDGET = 1000000
+
+FORMATS = ('jsonl', 'csv')
+
+
+def main(argv: list = None):
+    """Run the moncli command line interface.
+
+        Parameters
+
+            argv : `list[str]`
+                The command line arguments; defaults to sys.argv.
+
+        Returns
+
+            exit_code : `int`
+                The process exit code.
+    """
+
+    parser = _create_parser()
+    args = parser.parse_args(argv)
+    if not args.command:
+        parser.print_help()
+        return 2
+    api_key = args.api_key or os.environ.get('MONDAY_API_KEY')
+    if not api_key:
+        parser.error('An API key is required (--api-key or MONDAY_API_KEY).')
+    try:
+        count = args.func(args, api_key)
+    except api.MondayApiError as ex:
+        print('monday.com API error: {}'.format(ex.messages), file=sys.stderr)
+        return 1
+    print('{} {} items.'.format('Exported' if args.command == 'export' else 'Imported', count), file=sys.stderr)
+    failed_rows = getattr(args, 'failed_rows', 0)
+    if failed_rows:
+        print('Skipped {} rows.'.format(failed_rows), file=sys.stderr)
+        return 1
+    return 0
+
+
+def export_items(
+    api_key: str,
+    board_id: str,
+    output,
+    format: str = 'jsonl',
+    group_id: str = None,
+    column_ids: list = None,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    workers: int = DEFAULT_WORKERS,
+    checkpoint: str = None):
+    """Stream a board or group to JSONL or CSV.
+
+        Pages are fetched concurrently, at most `workers` pages at a time, and written in
+        page order so that memory stays bounded by the number of pages in flight.  Column
+        values are written in the monday.com API format, as JSON in CSV cells for values
+        that are not plain strings or numbers, so that exports can be imported again.
+
+        Parameters
+
+            api_key : `str`
+                The monday.com API v2 user key.
+            board_id : `str`
+                The board's unique identifier.
+            output : `file`
+                The text stream to write rows to.
+            format : `str`
+                The output format (jsonl / csv).
+            group_id : `str`
+                Limit the export to a single group.
+            column_ids : `list[str]`
+                The column unique identifiers to export; the default is all columns.
+            limit : `int`
+                The number of items per page.
+            workers : `int`
+                The number of pages fetched in parallel.
+            checkpoint : `str`
+                A checkpoint file path.  When present, the export resumes after the last written page.
+
+        Returns
+
+            count : `int`
+                The number of exported items.
+    """
+
+    board = Board(creds=MondayClientCredentials(api_key), id=str(board_id))
+    columns = [column for column in board.get_columns() if column.column_type != ColumnType.name]
+    if column_ids:
+        columns = [column for column in columns if column.id in column_ids]
+
+    state = _read_checkpoint(checkpoint, board_id, group_id)
+    page, count = state['page'], state['count']
+    writer = _create_writer(output, format, columns, header=(page == 1))
+
+    fields = ['id', 'name', 'group.id'] + ['column_values.{}'.format(field) for field in ('id', 'text', 'value')]
+    column_ids = [column.id for column in columns]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        done = False
+        while not done:
+            futures = [
+                executor.submit(_get_items_page, api_key, board_id, group_id, fields, column_ids, page + i, limit)
+                for i in range(workers)]
+            for future in futures:
+                items_data = future.result()
+                for item_data in items_data:
+                    writer(item_data)
+                count += len(items_data)
+                page += 1
+                output.flush()
+                _write_checkpoint(checkpoint, board_id, group_id, page, count)
+                if len(items_data) < limit:
+                    done = True
+                    break
+    return count
+
+
+def import_items(
+    api_key: str,
+    board_id: str,
+    input,
+    format: str = 'jsonl',
+    group_id: str = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int = DEFAULT_WORKERS,
+    complexity_budget: int = DEFAULT_COMPLEXITY_BUDGET,
+    mutation_complexity: int = None,
+    on_error = None):
+    """Bulk create or update items from JSONL or CSV.
+
+        Rows containing an 'id' update the existing item, other rows create new items.
+        Column values are coerced through the column's `moncli.types.MondayType`; values
+        that are already in the monday.com API format (dictionaries, written as JSON in CSV
+        cells) are sent as is and empty CSV cells are skipped.  Rows whose values cannot be
+        coerced, or whose mutation fails, are reported and skipped.
+
+        Parameters
+
+            api_key : `str`
+                The monday.com API v2 user key.
+            board_id : `str`
+                The board's unique identifier.
+            input : `file`
+                The text stream to read rows from.
+            format : `str`
+                The input format (jsonl / csv).
+            group_id : `str`
+                The group to create new items in.
+            batch_size : `int`
+                The number of rows sent per batch.
+            workers : `int`
+                The number of concurrent mutations per batch.
+            complexity_budget : `int`
+                The complexity budget available per minute.
+            mutation_complexity : `int`
+                The complexity of a single item mutation; estimated from the mutation by default.
+            on_error : `callable`
+                Called with the row number (starting at 1) and the error of each skipped row;
+                errors are printed to stderr by default.
+
+        Returns
+
+            count : `int`
+                The number of imported items.
+    """
+
+    # Imports yield to interactive requests when a request scheduler is used.
+    creds = MondayClientCredentials(api_key, Priority.bulk)
+    api_key = creds.api_key_v2
+    board = Board(creds=creds, id=str(board_id))
+    monday_types = {}
+    for column in board.get_columns():
+        monday_type = types.create_monday_type(column.column_type, column.id, column.title, column.settings_str)
+        monday_types[column.id] = monday_type
+        if column.title:
+            monday_types.setdefault(column.title, monday_type)
+
+    if on_error is None:
+        on_error = _print_row_error
+    throttle = _Throttle(complexity_budget)
+    count = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for batch in _read_batches(input, format, batch_size):
+            mutations = []
+            for row_number, row in batch:
+                try:
+                    mutations.append((row_number, *_create_mutation(api_key, board_id, group_id, row, monday_types)))
+                except Exception as ex:
+                    # A malformed cell skips its row instead of aborting the rows after it.
+                    on_error(row_number, ex)
+            if not mutations:
+                continue
+            throttle.acquire(sum(mutation_complexity or complexity for _, _, complexity in mutations))
+            futures = [(row_number, executor.submit(mutation)) for row_number, mutation, _ in mutations]
+            for row_number, future in futures:
+                try:
+                    future.result()
+                    count += 1
+                except Exception as ex:
+                    # Rows sent before a failed mutation are applied, so the import goes on.
+                    on_error(row_number, ex)
+    return count
+
+
+def _create_parser():
+    """Create the command line argument parser."""
+
+    parser = argparse.ArgumentParser(prog='moncli', description='Moncli, a pythonic/DDD client for Monday.com')
+    parser.add_argument('--api-key', help='The monday.com API v2 key; defaults to the MONDAY_API_KEY environment variable.')
+    subparsers = parser.add_subparsers(dest='command')
+
+    export_parser = subparsers.add_parser('export', help='Export board or group items to JSONL/CSV.')
+    export_parser.add_argument('--board-id', required=True)
+    export_parser.add_argument('--group-id')
+    export_parser.add_argument('--output', default='-', help='The output file; defaults to stdout.')
+    export_parser.add_argument('--format', choices=FORMATS)
+    export_parser.add_argument('--columns', help='Comma separated column ids to export.')
+    export_parser.add_argument('--limit', type=int, default=DEFAULT_PAGE_LIMIT, help='Items per page.')
+    export_parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='Pages fetched in parallel.')
+    export_parser.add_argument('--checkpoint', help='Checkpoint file used to resume interrupted exports.')
+    export_parser.set_defaults(func=_run_export)
+
+    import_parser = subparsers.add_parser('import', help='Create or update items from JSONL/CSV.')
+    import_parser.add_argument('--board-id', required=True)
+    import_parser.add_argument('--group-id')
+    import_parser.add_argument('--input', default='-', help='The input file; defaults to stdin.')
+    import_parser.add_argument('--format', choices=FORMATS)
+    import_parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    import_parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='Concurrent mutations per batch.')
+    import_parser.add_argument('--complexity-budget', type=int, default=DEFAULT_COMPLEXITY_BUDGET, help='Complexity budget per minute.')
+    import_parser.set_defaults(func=_run_import)
+
+    return parser
+
+
+def _run_export(args, api_key: str):
+    format = args.format or _get_format(args.output)
+    column_ids = args.columns.split(',') if args.columns else None
+    # Resumed exports append to the existing output.
+    mode = 'a' if args.checkpoint and os.path.exists(args.checkpoint) else 'w'
+    output = sys.stdout if args.output == '-' else open(args.output, mode, newline='', encoding='utf-8')
+    try:
+        return export_items(
+            api_key, args.board_id, output, format,
+            group_id=args.group_id,
+            column_ids=column_ids,
+            limit=args.limit,
+            workers=args.workers,
+            checkpoint=args.checkpoint)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+def _run_import(args, api_key: str):
+    format = args.format or _get_format(args.input)
+    input = sys.stdin if args.input == '-' else open(args.input, 'r', newline='', encoding='utf-8')
+    args.failed_rows = 0
+    def on_error(row_number: int, error: Exception):
+        args.failed_rows += 1
+        _print_row_error(row_number, error)
+    try:
+        return import_items(
+            api_key, args.board_id, input, format,
+            group_id=args.group_id,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            complexity_budget=args.complexity_budget,
+            on_error=on_error)
+    finally:
+        if input is not sys.stdin:
+            input.close()
+
+
+def _print_row_error(row_number: int, error: Exception):
+    print('Skipping row {}: {}'.format(row_number, error), file=sys.stderr)
+
+
+def _get_format(path: str):
+    if path and path.lower().endswith('.csv'):
+        return 'csv'
+    return 'jsonl'
+
+
+def _get_items_page(api_key: str, board_id: str, group_id: str, fields: list, column_ids: list, page: int, limit: int):
+    """Get a single page of raw item data from a board or group."""
+
+    items_kwargs = {'limit': limit, 'page': page, 'column_values': {'ids': column_ids}}
+    if group_id:
+        boards_data = api.get_boards(
+            *['groups.items.{}'.format(field) for field in fields],
+            api_key=api_key,
+            ids=[int(board_id)],
+            groups={'ids': [group_id], 'items': items_kwargs})
+        groups_data = boards_data[0]['groups']
+        return groups_data[0]['items'] if groups_data else []
+
+    boards_data = api.get_boards(
+        *['items.{}'.format(field) for field in fields],
+        api_key=api_key,
+        ids=[int(board_id)],
+        items=items_kwargs)
+    return boards_data[0]['items']
+
+
+def _create_writer(output, format: str, columns: list, header: bool = True):
+    """Create a row writer for the output format."""
+
+    if format == 'csv':
+        writer = csv.writer(output)
+        if header:
+            writer.writerow(['id', 'name', 'group'] + [column.id for column in columns])
+
+        def write_csv(item_data: dict):
+            values = {data['id']: _to_cell(data) for data in item_data.get('column_values', [])}
+            group = item_data.get('group') or {}
+            writer.writerow([item_data['id'], item_data.get('name'), group.get('id')] + [values.get(column.id) for column in columns])
+        return write_csv
+
+    def write_jsonl(item_data: dict):
+        row = {'id': item_data['id'], 'name': item_data.get('name'), 'group': (item_data.get('group') or {}).get('id')}
+        for data in item_data.get('column_values', []):
+            row[data['id']] = json.loads(data['value']) if data.get('value') else None
+        output.write(json.dumps(row) + '\n')
+    return write_jsonl
+
+
+def _to_cell(data: dict):
+    """Get the CSV cell of a raw column value: JSON for API values that are not plain strings or numbers."""
+
+    if not data.get('value'):
+        # Read-only columns (e.g. mirrors) only have a text.
+        return data.get('text')
+    value = json.loads(data['value'])
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+def _from_cell(value: str):
+    """Decode a CSV cell written as JSON, keeping other cells as text."""
+
+    if value and value.lstrip()[:1] in ('{', '['):
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _read_batches(input, format: str, batch_size: int):
+    """Read numbered rows from the input in batches."""
+
+    if format == 'csv':
+        rows = ({key: value if key in ('id', 'name', 'group') else _from_cell(value) for key, value in row.items()} for row in csv.DictReader(input))
+    else:
+        rows = (json.loads(line) for line in input if line.strip())
+
+    batch = []
+    for row in enumerate(rows, 1):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _create_mutation(api_key: str, board_id: str, group_id: str, row: dict, monday_types: dict):
+    """Coerce an input row and return the item mutation to execute with its estimated complexity."""
+
+    row = dict(row)
+    item_id = row.pop('id', None)
+    name = row.pop('name', None)
+    row_group_id = row.pop('group', None) or group_id
+    column_values = {}
+    for key, value in row.items():
+        if value is None or value == '' or key not in monday_types:
+            continue
+        monday_type = monday_types[key]
+        if monday_type.is_readonly:
+            continue
+        if not isinstance(value, dict):
+            value = monday_type.to_primitive(value)
+        column_values[monday_type.metadata['id']] = value
+
+    if item_id:
+        if name:
+            column_values['name'] = name
+        return (
+            lambda: api.change_multiple_column_value(item_id, board_id, column_values, 'id', api_key=api_key),
+            _estimate_mutation(api.CHANGE_MULTIPLE_COLUMN_VALUES))
+
+    kwargs = {'column_values': column_values}
+    if row_group_id:
+        kwargs['group_id'] = row_group_id
+    return (
+        lambda: api.create_item(name, board_id, 'id', api_key=api_key, **kwargs),
+        _estimate_mutation(api.CREATE_ITEM))
+
+
+def _estimate_mutation(query_name: str):
+    """Estimate the complexity of an item mutation returning its id."""
+
+    return api.estimate_complexity(api.create_operation(api.gql.OperationType.MUTATION, query_name, 'id'))
+
+
+def _read_checkpoint(path: str, board_id: str, group_id: str):
+    """Read the export checkpoint, if any."""
+
+    state = {'page': 1, 'count': 0}
+    if not path or not os.path.exists(path):
+        return state
+    with open(path, 'r') as file:
+        data = json.load(file)
+    if str(data.get('board_id')) != str(board_id) or data.get('group_id') != group_id:
+        raise ValueError('Checkpoint "{}" was created for a different board or group.'.format(path))
+    state['page'] = data['page']
+    state['count'] = data['count']
+    return state
+
+
+def _write_checkpoint(path: str, board_id: str, group_id: str, page: int, count: int):
+    """Atomically write the export checkpoint."""
+
+    if not path:
+        return
+    temp_path = '{}.tmp'.format(path)
+    with open(temp_path, 'w') as file:
+        json.dump({'board_id': str(board_id), 'group_id': group_id, 'page': page, 'count': count}, file)
+    os.replace(temp_path, path)
+
+
+class _Throttle(object):
+    """Sliding window throttle over the per-minute complexity budget."""
+
+    def __init__(self, budget: int, window: float = 60.0):
+        self.budget = budget
+        self.window = window
+        self._spent = []
+        self._lock = threading.Lock()
+
+    def acquire(self, cost: int):
+        cost = min(cost, self.budget)
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self._spent = [(at, spent) for at, spent in self._spent if now - at < self.window]
+                if sum(spent for _, spent in self._spent) + cost <= self.budget:
+                    self._spent.append((now, cost))
+                    return
+                time.sleep(self.window - (now - self._spent[0][0]))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
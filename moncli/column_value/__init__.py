@@ -6,6 +6,7 @@ from .base import *
 from .simple import *
 from .complex import *
 from .readonly import *
+from .columnar import ColumnBuffer, IdBuffer, NameBuffer, create_column_buffer, import_optional
 
 
 def create_column_value(column_type: ColumnType, **kwargs):
@@ -38,6 +38,8 @@ class ColumnValue(_ColumnValue):
 
         format : `dict`
             Format for column value update.
+        load : `void`
+            Load a value received from monday.com.
         set_value : `void`
             Sets the value of the column.
     """
@@ -76,6 +78,22 @@ class ColumnValue(_ColumnValue):
             raise ColumnValueError('invalid_column_value', self.id,
                                    'Unable to set value "{}" to column "{}".'.format(value, self.title))
 
+    def load(self, value, text: str = None):
+        """Load a value received from monday.com, such as a webhook event's value.
+
+            Unlike setting `value`, read-only columns are loaded and the value is not cast.
+
+            Parameters
+
+                value : `any`
+                    The column's value in a Python native format.
+                text : `str`
+                    The column's textual value in string form.
+        """
+
+        self._value = value
+        self.text = text
+
     @property
     def settings(self):
         return json.loads(self.settings_str)
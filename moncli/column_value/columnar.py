@@ -0,0 +1,304 @@
+import json, logging
+from array import array
+from datetime import datetime, timezone
+
+from .. import ColumnType, DATE_FORMAT, TIME_FORMAT
+
+
+# Sentinel values used for nulls inside the typed buffers.
+NAT = -2**63
+NULL_CODE = -1
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnBuffer(object):
+    """Base columnar buffer for raw column value data.
+
+    Properties
+
+        id : `str`
+            The column's unique identifier.
+        title : `str`
+            The column's title.
+        settings_str : `str`
+            The column's settings in a string form.
+        strict : `bool`
+            Raise on malformed values instead of appending nulls.
+        skipped : `int`
+            The number of malformed values appended as nulls.
+
+    Methods
+
+        append : `void`
+            Decode and append a raw column value to the buffer.
+        to_numpy : `numpy.ndarray`
+            Convert the buffer into a numpy array.
+        to_pandas : `pandas.Series`
+            Convert the buffer into a pandas series.
+        to_arrow : `pyarrow.Array`
+            Convert the buffer into a pyarrow array.
+    """
+
+    def __init__(self, id: str, title: str = None, settings_str: str = None, strict: bool = False):
+        self.id = id
+        self.title = title
+        self.settings_str = settings_str
+        self.strict = strict
+        self.skipped = 0
+        self._values = []
+
+    def __len__(self):
+        return len(self._values)
+
+    def append(self, data: dict = None):
+        """Decode and append a raw column value to the buffer.
+
+            Parameters
+
+                data : `dict`
+                    The raw column value data (id, text, value) or None for a missing value.
+        """
+
+        try:
+            value = None
+            if data:
+                raw_value = data.get('value')
+                if raw_value:
+                    value = json.loads(raw_value)
+            self._append(value, data)
+        except (KeyError, TypeError, ValueError):
+            if self.strict:
+                raise
+            self.skipped += 1
+            logger.warning('Unable to decode value %r for column "%s"; appending a null.', (data or {}).get('value'), self.id)
+            self._append(None, None)
+
+    def to_numpy(self):
+        np = import_optional('numpy')
+        return np.array(self._values, dtype=object)
+
+    def to_pandas(self):
+        pd = import_optional('pandas')
+        return pd.Series(self.to_numpy(), name=self.id)
+
+    def to_arrow(self):
+        pa = import_optional('pyarrow')
+        return pa.array(self._values)
+
+    def _append(self, value, data):
+        self._values.append(data.get('text') if data else None)
+
+
+class IdBuffer(ColumnBuffer):
+    """An int64 buffer for item unique identifiers."""
+
+    def __init__(self, id: str = 'id', title: str = None, settings_str: str = None, strict: bool = False):
+        super().__init__(id, title, settings_str, strict)
+        self._values = array('q')
+
+    def append(self, data: dict = None):
+        self._values.append(int(data['id']))
+
+    def to_numpy(self):
+        np = import_optional('numpy')
+        return np.frombuffer(self._values, dtype=np.int64)
+
+    def to_arrow(self):
+        pa = import_optional('pyarrow')
+        return pa.array(self.to_numpy())
+
+
+class NameBuffer(ColumnBuffer):
+    """An object buffer for item names."""
+
+    def __init__(self, id: str = 'name', title: str = None, settings_str: str = None, strict: bool = False):
+        super().__init__(id, title, settings_str, strict)
+
+    def append(self, data: dict = None):
+        self._values.append(data.get('name'))
+
+
+class NumberBuffer(ColumnBuffer):
+    """A float64 buffer for number columns."""
+
+    def __init__(self, id: str, title: str = None, settings_str: str = None, strict: bool = False):
+        super().__init__(id, title, settings_str, strict)
+        self._values = array('d')
+
+    def to_numpy(self):
+        np = import_optional('numpy')
+        return np.frombuffer(self._values, dtype=np.float64)
+
+    def to_arrow(self):
+        pa = import_optional('pyarrow')
+        return pa.array(self.to_numpy(), from_pandas=True)
+
+    def _append(self, value, data):
+        if value is None or value == '':
+            self._values.append(float('nan'))
+        else:
+            self._values.append(float(value))
+
+
+class DateBuffer(ColumnBuffer):
+    """A datetime64 buffer (UTC, microseconds) for date columns."""
+
+    def __init__(self, id: str, title: str = None, settings_str: str = None, strict: bool = False):
+        super().__init__(id, title, settings_str, strict)
+        self._values = array('q')
+
+    def to_numpy(self):
+        np = import_optional('numpy')
+        return np.frombuffer(self._values, dtype=np.int64).view('datetime64[us]')
+
+    def to_arrow(self):
+        pa = import_optional('pyarrow')
+        values = self.to_numpy()
+        return pa.array(values, mask=values != values, type=pa.timestamp('us', tz='UTC'))
+
+    def _append(self, value, data):
+        if not value or not value.get('date'):
+            self._values.append(NAT)
+            return
+        date = datetime.strptime(value['date'], DATE_FORMAT)
+        time = value.get('time')
+        if time:
+            time = datetime.strptime(time, TIME_FORMAT)
+            date = date.replace(hour=time.hour, minute=time.minute, second=time.second)
+        delta = date.replace(tzinfo=timezone.utc) - _EPOCH
+        self._values.append((delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds)
+
+
+class CheckboxBuffer(ColumnBuffer):
+    """A boolean buffer for checkbox columns."""
+
+    def __init__(self, id: str, title: str = None, settings_str: str = None, strict: bool = False):
+        super().__init__(id, title, settings_str, strict)
+        self._values = array('b')
+
+    def to_numpy(self):
+        np = import_optional('numpy')
+        return np.frombuffer(self._values, dtype=np.int8).astype(bool)
+
+    def to_arrow(self):
+        pa = import_optional('pyarrow')
+        return pa.array(self.to_numpy())
+
+    def _append(self, value, data):
+        self._values.append(1 if value and str(value.get('checked')).lower() == 'true' else 0)
+
+
+class CategoricalBuffer(ColumnBuffer):
+    """An int32 categorical code buffer with labels taken from the column settings.
+
+    Properties
+
+        categories : `list[str]`
+            The unique category labels indexed by code; settings keys sharing a label share its code.
+    """
+
+    def __init__(self, id: str, title: str = None, settings_str: str = None, strict: bool = False):
+        super().__init__(id, title, settings_str, strict)
+        self._values = array('i')
+        self.categories = []
+        self._codes = {}
+        label_codes = {}
+        settings = json.loads(settings_str) if settings_str else {}
+        for key, label in self._get_labels(settings):
+            # Labels may repeat (e.g. several empty labels), but categories must be unique.
+            if label not in label_codes:
+                label_codes[label] = len(self.categories)
+                self.categories.append(label)
+            self._codes[key] = label_codes[label]
+
+    def to_numpy(self):
+        np = import_optional('numpy')
+        return np.frombuffer(self._values, dtype=np.int32)
+
+    def to_pandas(self):
+        pd = import_optional('pandas')
+        return pd.Series(pd.Categorical.from_codes(self.to_numpy(), categories=self.categories), name=self.id)
+
+    def to_arrow(self):
+        pa = import_optional('pyarrow')
+        codes = self.to_numpy()
+        indices = pa.array(codes, mask=codes == NULL_CODE, type=pa.int32())
+        return pa.DictionaryArray.from_arrays(indices, pa.array(self.categories, type=pa.string()))
+
+    def _get_labels(self, settings: dict):
+        return []
+
+    def _append(self, value, data):
+        key = self._get_key(value) if value else None
+        self._values.append(self._codes.get(key, NULL_CODE))
+
+    def _get_key(self, value):
+        return None
+
+
+class StatusBuffer(CategoricalBuffer):
+    """A categorical buffer for status columns."""
+
+    def _get_labels(self, settings: dict):
+        labels = settings.get('labels', {})
+        return sorted(((int(index), label) for index, label in labels.items()), key=lambda pair: pair[0])
+
+    def _get_key(self, value):
+        index = value.get('index')
+        return int(index) if index is not None else None
+
+
+class DropdownBuffer(CategoricalBuffer):
+    """A categorical buffer for dropdown columns.
+
+    Only the first selected label of a multi-select dropdown is encoded.
+    """
+
+    def _get_labels(self, settings: dict):
+        return [(int(label['id']), label['name']) for label in settings.get('labels', [])]
+
+    def _get_key(self, value):
+        ids = value.get('ids')
+        return int(ids[0]) if ids else None
+
+
+COLUMN_TYPE_BUFFER_MAPPINGS = {
+    ColumnType.numbers: NumberBuffer,
+    ColumnType.date: DateBuffer,
+    ColumnType.checkbox: CheckboxBuffer,
+    ColumnType.status: StatusBuffer,
+    ColumnType.dropdown: DropdownBuffer
+}
+
+
+def create_column_buffer(column_type: ColumnType, **kwargs):
+    """Create a columnar buffer for a column.
+
+    Parameters
+
+        column_type : `moncli.ColumnType`
+            The column type to create a buffer for.
+        kwargs : `dict`
+            The column's id, title, settings_str and strict flag.
+    """
+
+    return COLUMN_TYPE_BUFFER_MAPPINGS.get(column_type, ColumnBuffer)(**kwargs)
+
+
+def import_optional(name: str):
+    """Lazily import an optional dependency.
+
+    Parameters
+
+        name : `str`
+            The name of the module to import.
+    """
+
+    from importlib import import_module
+    try:
+        return import_module(name)
+    except ImportError:
+        raise ImportError('The optional dependency "{}" is required for this operation.  Install it with "pip install {}".'.format(name, name))
@@ -80,9 +80,16 @@ class HourValue(ComplexNullValue):
         return COMPLEX_NULL_VALUE
 
 class ItemLinkValue(ComplexNullValue):
-    """An item link column value."""
+    """An item link column value.
+
+    Properties
+
+        linked_items : `list`
+            The linked items or models, once loaded by a `moncli.relations.RelationResolver`.
+    """
     native_type = list
     native_default = []
+    linked_items = None
 
     def _convert(self, value):
         try:
@@ -1,4 +1,3 @@
-import pytz
 from datetime import datetime, timedelta
 
 from .. import enums, DATE_FORMAT, TIME_FORMAT, ColumnValueError
@@ -14,6 +13,7 @@ class DateValue(ComplexNullValue):
     has_time = False
 
     def _convert(self,value):
+        import pytz
         try:
             new_time = datetime.strptime(value['time'], TIME_FORMAT)
             new_date = datetime.strptime(value['date'], DATE_FORMAT)
@@ -61,6 +61,7 @@ class DateValue(ComplexNullValue):
             
     def _format(self):
         if self.has_time:
+            import pytz
             utc_date = self.value.astimezone(pytz.timezone('UTC'))
             date = datetime.strftime(utc_date, DATE_FORMAT)
             time = datetime.strftime(utc_date, TIME_FORMAT)
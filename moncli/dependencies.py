@@ -0,0 +1,506 @@
+from array import array
+from collections import deque
+
+from . import entities as en
+from .error import DependencyGraphError
+
+
+MISSING_DATE = 0
+# Overridden item dependencies are folded back into the CSR arrays past this share of the items.
+COMPACT_RATIO = 16
+COMPACT_MIN_OVERRIDES = 64
+
+
+class DependencyGraph(object):
+    """A graph of item dependencies built from a dependency column.
+
+    Edges run from a dependency to the item that depends on it.  The graph is stored as
+    compressed sparse rows (offset and target arrays for successors and predecessors), so
+    boards with tens of thousands of items stay compact.  Changing a single item's
+    dependencies only updates a small overlay, which is folded back into the arrays once
+    it grows.
+
+    Properties
+
+        dependency_column : `str`
+            The id or title of the dependency column.
+        timeline_column : `str`
+            The id or title of the timeline column used to weight items, if any.
+
+    Methods
+
+        add_items : `void`
+            Add or refresh items in the graph.
+        add_pages : `void`
+            Add items from a page stream such as `Board.get_item_pages`.
+        remove_items : `void`
+            Remove items from the graph.
+        set_dependencies : `void`
+            Replace the dependencies of an item.
+        get_dependencies : `list[int]`
+            Get the items an item depends on.
+        get_dependents : `list[int]`
+            Get the items depending on an item.
+        get_upstream : `list[int]`
+            Get all items an item transitively depends on.
+        get_downstream : `list[int]`
+            Get all items transitively depending on an item.
+        topological_order : `list[int]`
+            Get the item ids ordered so that every item follows its dependencies.
+        find_cycles : `list[list[int]]`
+            Get the groups of items that depend on each other.
+        critical_path : `tuple`
+            Get the longest dependency chain weighted by timeline durations.
+        get_slip_impact : `dict`
+            Get the delay of downstream items if an item finishes late.
+    """
+
+    def __init__(self, dependency_column: str, timeline_column: str = None):
+        self.dependency_column = dependency_column
+        self.timeline_column = timeline_column
+        self._column_ids = {}
+        self._ids = array('q')
+        self._nodes = {}
+        self._loaded = bytearray()
+        self._starts = array('l')
+        self._ends = array('l')
+        # Compressed sparse rows of the compacted edges.
+        self._succ_offsets = array('l', [0])
+        self._succ_targets = array('l')
+        self._pred_offsets = array('l', [0])
+        self._pred_sources = array('l')
+        # Edges of newly loaded items, and dependencies replaced since the last compaction.
+        self._pending = array('l')
+        self._pred_overrides = {}
+        self._succ_added = {}
+        self._succ_removed = {}
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, item_id):
+        return int(item_id) in self._nodes
+
+    def add_items(self, items: list):
+        """Add or refresh items in the graph.
+
+            Parameters
+
+                items : `list[moncli.entities.Item]`
+                    The items to add.  Items already in the graph have their dependencies
+                    and timeline replaced.
+        """
+
+        for item in items:
+            dependencies = self._get_value(item, self.dependency_column) or []
+            timeline = self._get_value(item, self.timeline_column) if self.timeline_column else None
+            node = self._get_node(item.id)
+            # Partially filled timelines are treated as missing.
+            if timeline and timeline.from_date and timeline.to_date:
+                self._starts[node] = timeline.from_date.toordinal()
+                self._ends[node] = timeline.to_date.toordinal()
+            else:
+                self._starts[node] = self._ends[node] = MISSING_DATE
+            if self._loaded[node]:
+                self.set_dependencies(item.id, dependencies)
+                continue
+            # Items referenced before they are loaded have no dependencies of their own yet.
+            self._loaded[node] = 1
+            for dependency in dict.fromkeys(int(dependency) for dependency in dependencies):
+                self._pending.extend((self._get_node(dependency), node))
+
+    def add_pages(self, pages):
+        """Add items from a page stream such as `Board.get_item_pages`.
+
+            Parameters
+
+                pages : `iterable[list[moncli.entities.Item]]`
+                    The item pages to add.
+        """
+
+        for items in pages:
+            self.add_items(items)
+
+    def remove_items(self, item_ids: list):
+        """Remove items from the graph.
+
+            Removed items keep their node while other items still depend on them.
+
+            Parameters
+
+                item_ids : `list[str]`
+                    The unique identifiers of the items to remove.
+        """
+
+        for item_id in item_ids:
+            if item_id not in self:
+                continue
+            self.set_dependencies(item_id, [])
+            node = self._nodes[int(item_id)]
+            self._loaded[node] = 0
+            self._starts[node] = self._ends[node] = MISSING_DATE
+
+    def set_dependencies(self, item_id: str, dependency_ids: list):
+        """Replace the dependencies of an item.
+
+            Parameters
+
+                item_id : `str`
+                    The item's unique identifier.
+                dependency_ids : `list[str]`
+                    The unique identifiers of the items it depends on.
+        """
+
+        self._compact_pending()
+        node = self._get_node(item_id)
+        self._loaded[node] = 1
+        old = set(self._get_predecessors(node))
+        new = [self._get_node(dependency_id) for dependency_id in dependency_ids]
+        for source in old.difference(new):
+            if node in self._succ_added.get(source, ()):
+                self._succ_added[source].discard(node)
+            else:
+                self._succ_removed.setdefault(source, set()).add(node)
+        for source in set(new).difference(old):
+            if node in self._succ_removed.get(source, ()):
+                self._succ_removed[source].discard(node)
+            else:
+                self._succ_added.setdefault(source, set()).add(node)
+        self._pred_overrides[node] = list(dict.fromkeys(new))
+        if len(self._pred_overrides) > max(COMPACT_MIN_OVERRIDES, len(self._ids) // COMPACT_RATIO):
+            self._compact()
+
+    def get_dependencies(self, item_id: str):
+        """Get the items an item depends on.
+
+            Parameters
+
+                item_id : `str`
+                    The item's unique identifier.
+
+            Returns
+
+                item_ids : `list[int]`
+                    The unique identifiers of the dependencies.
+        """
+
+        self._compact_pending()
+        return [self._ids[node] for node in self._get_predecessors(self._require_node(item_id))]
+
+    def get_dependents(self, item_id: str):
+        """Get the items depending on an item.
+
+            Parameters
+
+                item_id : `str`
+                    The item's unique identifier.
+
+            Returns
+
+                item_ids : `list[int]`
+                    The unique identifiers of the dependents.
+        """
+
+        self._compact_pending()
+        return [self._ids[node] for node in self._get_successors(self._require_node(item_id))]
+
+    def get_upstream(self, item_id: str):
+        """Get all items an item transitively depends on.
+
+            Parameters
+
+                item_id : `str`
+                    The item's unique identifier.
+
+            Returns
+
+                item_ids : `list[int]`
+                    The unique identifiers of the upstream items, nearest first.
+        """
+
+        self._compact_pending()
+        return [self._ids[node] for node in self._traverse(self._require_node(item_id), self._get_predecessors)]
+
+    def get_downstream(self, item_id: str):
+        """Get all items transitively depending on an item.
+
+            Parameters
+
+                item_id : `str`
+                    The item's unique identifier.
+
+            Returns
+
+                item_ids : `list[int]`
+                    The unique identifiers of the downstream items, nearest first.
+        """
+
+        self._compact_pending()
+        return [self._ids[node] for node in self._traverse(self._require_node(item_id), self._get_successors)]
+
+    def topological_order(self):
+        """Get the item ids ordered so that every item follows its dependencies.
+
+            Returns
+
+                item_ids : `list[int]`
+                    The unique identifiers of all items in the graph.
+        """
+
+        return [self._ids[node] for node in self._get_order()]
+
+    def find_cycles(self):
+        """Get the groups of items that depend on each other.
+
+            Returns
+
+                cycles : `list[list[int]]`
+                    The unique identifiers of the items in each strongly connected group.
+        """
+
+        self._compact_pending()
+        # Iterative Tarjan strongly connected components.
+        count = len(self._ids)
+        index = array('l', [-1]) * count
+        lowlink = array('l', [0]) * count
+        on_stack = bytearray(count)
+        stack = []
+        cycles = []
+        counter = 0
+        for root in range(count):
+            if index[root] != -1:
+                continue
+            work = [(root, iter(self._get_successors(root)))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            while work:
+                node, successors = work[-1]
+                for successor in successors:
+                    if index[successor] == -1:
+                        index[successor] = lowlink[successor] = counter
+                        counter += 1
+                        stack.append(successor)
+                        on_stack[successor] = 1
+                        work.append((successor, iter(self._get_successors(successor))))
+                        break
+                    if on_stack[successor]:
+                        lowlink[node] = min(lowlink[node], index[successor])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] != index[node]:
+                        continue
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in self._get_successors(node):
+                        cycles.append([self._ids[member] for member in reversed(component)])
+        return cycles
+
+    def critical_path(self):
+        """Get the longest dependency chain weighted by timeline durations.
+
+            Items without a timeline weigh nothing.
+
+            Returns
+
+                path : `list[int]`
+                    The unique identifiers of the items on the chain, first dependency first.
+                duration : `int`
+                    The total duration of the chain in days.
+        """
+
+        order = self._get_order()
+        count = len(self._ids)
+        lengths = array('l', [0]) * count
+        previous = array('l', [-1]) * count
+        end = -1
+        for node in order:
+            length = lengths[node] + self._get_duration(node)
+            lengths[node] = length
+            if end == -1 or length > lengths[end]:
+                end = node
+            for successor in self._get_successors(node):
+                if length > lengths[successor]:
+                    lengths[successor] = length
+                    previous[successor] = node
+        path = []
+        node = end
+        while node != -1:
+            path.append(self._ids[node])
+            node = previous[node]
+        path.reverse()
+        return path, lengths[end] if end != -1 else 0
+
+    def get_slip_impact(self, item_id: str, days: int):
+        """Get the delay of downstream items if an item finishes late.
+
+            The delay is absorbed by the slack between an item's end date and the start date
+            of each dependent item.  Items without a timeline pass the delay on unchanged.
+
+            Parameters
+
+                item_id : `str`
+                    The unique identifier of the late item.
+                days : `int`
+                    The number of days the item finishes late.
+
+            Returns
+
+                delays : `dict`
+                    The delay in days of each delayed downstream item, keyed by item id.
+        """
+
+        self._compact_pending()
+        source = self._require_node(item_id)
+        downstream = set(self._traverse(source, self._get_successors))
+        delays = {source: days}
+        for node in self._get_order(downstream | {source}):
+            delay = delays.get(node, 0)
+            if delay <= 0:
+                continue
+            for successor in self._get_successors(node):
+                delay_passed = delay - self._get_slack(node, successor)
+                if delay_passed > delays.get(successor, 0):
+                    delays[successor] = delay_passed
+        delays.pop(source)
+        return {self._ids[node]: delay for node, delay in delays.items() if delay > 0}
+
+    def _get_value(self, item: en.Item, column: str):
+        column_id = self._column_ids.get(column, column)
+        try:
+            return item.column_values[column_id].value
+        except KeyError:
+            column_id = self._column_ids[column] = item.board.columns[column].id
+            return item.column_values[column_id].value
+
+    def _get_node(self, item_id):
+        item_id = int(item_id)
+        node = self._nodes.get(item_id)
+        if node is None:
+            node = self._nodes[item_id] = len(self._ids)
+            self._ids.append(item_id)
+            self._loaded.append(0)
+            self._starts.append(MISSING_DATE)
+            self._ends.append(MISSING_DATE)
+        return node
+
+    def _require_node(self, item_id):
+        try:
+            return self._nodes[int(item_id)]
+        except KeyError:
+            raise DependencyGraphError('item_not_found', item_id, 'Item "{}" is not in the graph.'.format(item_id))
+
+    def _get_predecessors(self, node: int):
+        if node in self._pred_overrides:
+            return self._pred_overrides[node]
+        if node + 1 >= len(self._pred_offsets):
+            return []
+        return self._pred_sources[self._pred_offsets[node]:self._pred_offsets[node + 1]]
+
+    def _get_successors(self, node: int):
+        successors = self._succ_targets[self._succ_offsets[node]:self._succ_offsets[node + 1]] \
+            if node + 1 < len(self._succ_offsets) else []
+        removed = self._succ_removed.get(node)
+        added = self._succ_added.get(node)
+        if not (removed or added):
+            return successors
+        return [successor for successor in successors if successor not in (removed or ())] + sorted(added or ())
+
+    def _get_duration(self, node: int):
+        if self._starts[node] == MISSING_DATE:
+            return 0
+        return self._ends[node] - self._starts[node] + 1
+
+    def _get_slack(self, node: int, successor: int):
+        if self._ends[node] == MISSING_DATE or self._starts[successor] == MISSING_DATE:
+            return 0
+        return max(0, self._starts[successor] - self._ends[node] - 1)
+
+    def _get_order(self, nodes: set = None):
+        # Kahn's algorithm over all nodes, or over the subgraph of the given nodes.
+        self._compact_pending()
+        count = len(self._ids)
+        members = range(count) if nodes is None else nodes
+        in_degrees = array('l', [0]) * count
+        for node in members:
+            for successor in self._get_successors(node):
+                if nodes is None or successor in nodes:
+                    in_degrees[successor] += 1
+        queue = deque(node for node in members if in_degrees[node] == 0)
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for successor in self._get_successors(node):
+                if nodes is not None and successor not in nodes:
+                    continue
+                in_degrees[successor] -= 1
+                if in_degrees[successor] == 0:
+                    queue.append(successor)
+        if len(order) < len(members):
+            cycle = next(node for node in members if in_degrees[node] > 0)
+            raise DependencyGraphError(
+                'dependency_cycle',
+                self._ids[cycle],
+                'Item "{}" is part of a dependency cycle.'.format(self._ids[cycle]))
+        return order
+
+    def _traverse(self, node: int, get_neighbours):
+        visited = {node}
+        queue = deque([node])
+        result = []
+        while queue:
+            for neighbour in get_neighbours(queue.popleft()):
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    result.append(neighbour)
+                    queue.append(neighbour)
+        return result
+
+    def _compact_pending(self):
+        if self._pending:
+            self._compact()
+
+    def _compact(self):
+        """Rebuild the CSR arrays from the compacted, overridden and pending edges."""
+
+        count = len(self._ids)
+        sources = array('l')
+        targets = array('l')
+        for node in range(count):
+            for source in self._get_predecessors(node):
+                sources.append(source)
+                targets.append(node)
+        sources.extend(self._pending[0::2])
+        targets.extend(self._pending[1::2])
+        self._succ_offsets, self._succ_targets = _build_rows(count, sources, targets)
+        self._pred_offsets, self._pred_sources = _build_rows(count, targets, sources)
+        self._pending = array('l')
+        self._pred_overrides = {}
+        self._succ_added = {}
+        self._succ_removed = {}
+
+
+def _build_rows(count: int, rows: array, columns: array):
+    """Build CSR offsets and values from edge arrays using a counting sort."""
+
+    offsets = array('l', [0]) * (count + 1)
+    for row in rows:
+        offsets[row + 1] += 1
+    for index in range(count):
+        offsets[index + 1] += offsets[index]
+    positions = array('l', offsets)
+    values = array('l', [0]) * len(columns)
+    for row, column in zip(rows, columns):
+        values[positions[row]] = column
+        positions[row] += 1
+    return offsets, values
@@ -1,3 +1,5 @@
+import time
+
 from schematics import types
 from schematics.models import Model
 
@@ -42,18 +44,27 @@ class Asset(_Asset):
             url_thumbnail : `str`
                 Url to view the asset in thumbnail mode. Only available for images.
 
+            public_url_expired : `bool`
+                Whether the public url is missing or about to expire.
+
         Methods
 
             get_uploaded_by_user : `moncli.entities.User`
                 Get the user who uploaded the file.
+            set_public_url : `void`
+                Set a newly fetched public url.
+            download : `str`
+                Download the file.
     """
 
     def __init__(self, **kwargs):
         self.__creds = kwargs.pop('creds', None)
+        self.__uploaded_by = None
         uploaded_by = kwargs.pop('uploaded_by', None)
         if uploaded_by:
             self.__uploaded_by = en.User(**uploaded_by)
         super(Asset, self).__init__(kwargs)
+        self.__public_url_fetched_at = time.time() if self.public_url else None
 
     @property
     def uploaded_by(self):
@@ -63,6 +74,15 @@ class Asset(_Asset):
             self.__uploaded_by = self.get_uploaded_by_user()
         return self.__uploaded_by
 
+    @property
+    def public_url_expired(self):
+        """Whether the public url is missing or about to expire."""
+
+        from ..assets import PUBLIC_URL_LIFETIME, PUBLIC_URL_REFRESH_MARGIN
+        if not self.public_url or not self.__public_url_fetched_at:
+            return True
+        return time.time() - self.__public_url_fetched_at > PUBLIC_URL_LIFETIME - PUBLIC_URL_REFRESH_MARGIN
+
 
     def get_uploaded_by_user(self, *args):
         """Get the user who uploaded the file.
@@ -135,4 +155,40 @@ class Asset(_Asset):
             *api.get_field_list(api.DEFAULT_USER_QUERY_FIELDS, 'uploaded_by', *args),
             api_key=self.__creds.api_key_v2,
             ids=[self.id])[0]['uploaded_by']
-        return en.User(**user_data)
\ No newline at end of file
+        return en.User(**user_data)
+
+
+    def set_public_url(self, public_url: str, fetched_at: float = None):
+        """Set a newly fetched public url.
+
+            Parameters
+
+                public_url : `str`
+                    The public url.
+                fetched_at : `float`
+                    The time at which the url was fetched, defaulting to now.
+        """
+
+        self.public_url = public_url
+        self.__public_url_fetched_at = fetched_at or time.time()
+
+
+    def download(self, dest: str = None, cache = None):
+        """Download the file.
+
+            Parameters
+
+                dest : `str`
+                    The directory to save the file to.  If omitted, the cached file path is returned.
+                cache : `moncli.assets.AssetCache`
+                    The cache to use, the shared default cache if omitted or False to disable caching.
+
+            Returns
+
+                path : `str`
+                    The downloaded file path.
+        """
+
+        from ..assets import download_assets
+        api_key = self.__creds.api_key_v2 if self.__creds else None
+        return download_assets([self], dest, concurrency=1, cache=cache, api_key=api_key)[0]
@@ -1,10 +1,21 @@
+from __future__ import annotations
+
+import time
+
 from schematics.models import Model
 from schematics.types import StringType, IntType
 
 from .. import api, entities as en, column_value as cv
+from ..batch import COLUMN_VALUES_LIMIT, stream_pages
 from ..enums import *
 from ..error import BoardError
 from ..models import MondayModel
+from ..paging import iter_pages
+from ..session import CanonicalModelMeta
+from ..utils import unique
+
+
+DEFAULT_PAGE_LIMIT = 100
 
 
 class _Board(Model):
@@ -23,7 +34,7 @@ class _Board(Model):
     updated_at = StringType()
 
 
-class Board(_Board):
+class Board(_Board, metaclass=CanonicalModelMeta):
     """The entity model for a board
 
         Properties
@@ -101,10 +112,22 @@ class Board(_Board):
                 Create a new item in the board.
             get_items : `list[moncli.entities.Item]`
                 Get the board's items (rows).
+            get_item_pages : `generator[list[moncli.entities.Item]]`
+                Stream the board's items (rows) page by page.
             get_items_by_column_values : `list[moncli.entities.Item]`
                 Search items in this board by their column values.
+            get_items_by_multiple_column_values : `list[moncli.entities.Item]`
+                Search items in this board by any of several column values.
+            get_item_pages_by_multiple_column_values : `generator[list[moncli.entities.Item]]`
+                Stream the items matching any of several column values page by page.
             get_column_value : `moncli.entities.ColumnValue`
                 Create a column value from a board's column.
+            to_columns : `dict[str, numpy.ndarray]`
+                Export the board's items into typed columnar arrays.
+            to_dataframe : `pandas.DataFrame`
+                Export the board's items into a pandas data frame.
+            to_arrow : `pyarrow.Table`
+                Export the board's items into a pyarrow table.
             create_webhook : `moncli.entities.Webhook`
                 Create a new webhook.
             delete_webhook : `moncli.entities.Webhook`
@@ -1085,7 +1108,7 @@ class Board(_Board):
             ids=[int(self.id)],
             **item_kwargs)[0]['items']
 
-        items = [en.Item(creds=self.__creds, **item_data) for item_data in items_data] 
+        items = [en.Item(creds=self.__creds, __board=self, **item_data) for item_data in items_data]
         if not as_model:
             return items
         if not issubclass(type(as_model), MondayModel):
@@ -1094,7 +1117,80 @@ class Board(_Board):
                 self.id,
                 'as_model parameter must be of MondayModel Type')
         return [as_model(item) for item in items]
- 
+
+
+    def get_item_pages(self, get_column_values: bool = False, as_model: type = None, *args, **kwargs):
+        """Stream the board's items (rows) page by page.
+
+            Parameters
+
+                get_column_values: `bool`
+                    Returns column values with items if set to `True`.
+                as_model: `type`
+                    The MondayModel subclass to be returned.
+                args : `tuple`
+                    The list of item return fields.
+                kwargs : `dict`
+                    The optional keyword arguments for getting items.
+
+            Returns
+
+                pages : `generator[list[moncli.entities.Item]]`
+                    The board's items, one list per retrieved page.
+
+            Optional Arguments
+
+                limit : `int`
+                    Number of items to get per page; by default the page size adapts to the observed cost of the pages.
+                page : `int`
+                    Page number to start from, starting at 1.
+                column_ids : `list[str]`
+                    The list of column unique identifiers to retrieve column values for.
+        """
+
+        if as_model and not issubclass(as_model, MondayModel):
+            raise BoardError(
+                'invalid_as_model_parameter',
+                self.id,
+                'as_model parameter must be of MondayModel Type')
+
+        for items_data in self._get_item_data_pages(get_column_values, *args, **kwargs):
+            items = [en.Item(creds=self.__creds, __board=self, **item_data) for item_data in items_data]
+            if not as_model:
+                yield items
+            else:
+                yield [as_model(item) for item in items]
+
+
+    def _get_item_data_pages(self, get_column_values: bool = False, *args, **kwargs):
+        """Stream raw item data from the board page by page."""
+
+        args = list(args)
+        if get_column_values:
+            for arg in ['items.column_values.{}'.format(arg) for arg in api.DEFAULT_COLUMN_VALUE_QUERY_FIELDS]:
+                if arg not in args:
+                    args.append(arg)
+            args.extend(['items.id', 'items.name'])
+        else:
+            args = api.get_field_list(api.DEFAULT_ITEM_QUERY_FIELDS, 'items', *args)
+
+        column_ids = kwargs.pop('column_ids', None)
+        if column_ids is not None:
+            kwargs['column_values'] = {'ids': list(column_ids)}
+        limit = kwargs.pop('limit', None)
+        page = kwargs.pop('page', None)
+
+        def fetch_page(page: int, limit: int):
+            return api.get_boards(
+                *args,
+                api_key=self.__creds.api_key_v2,
+                ids=[int(self.id)],
+                items=dict(limit=limit, page=page, **kwargs))[0]['items']
+
+        # Without a limit or page, page sizes adapt to the observed cost of this board's items.
+        key = (api.BOARDS, self.id, tuple(args), repr(sorted(kwargs.items())))
+        page_sizer = getattr(self.__creds, 'page_sizer', None)
+        yield from iter_pages(fetch_page, key, page_sizer, limit, page)
 
 
     def get_items_by_column_values(self, column_value: cv.ColumnValue, get_column_values: bool = False, as_model: type = None, *args, **kwargs):
@@ -1110,6 +1206,10 @@ class Board(_Board):
                     The MondayModel subclass to be returned.
                 args : `tuple`
                     The list of item return fields.
+                chunk_size : `int`
+                    The maximum number of values per query; the default is 50.
+                concurrency : `int`
+                    The number of queries sent at the same time.
                 kwargs : `dict`
                     The optional keyword arguments for searching items.
         
@@ -1184,7 +1284,7 @@ class Board(_Board):
             api_key=self.__creds.api_key_v2, 
             **kwargs)
 
-        items = [en.Item(creds=self.__creds, **item_data) for item_data in items_data] 
+        items = [en.Item(creds=self.__creds, __board=self, **item_data) for item_data in items_data]
         if not as_model:
             return items
         if not issubclass(type(as_model), MondayModel):
@@ -1196,8 +1296,13 @@ class Board(_Board):
 
 
     
-    def get_items_by_multiple_column_values(self, column: en.Column, column_values: list, get_column_values: bool = False, as_model: type = None, *args, **kwargs):
+    def get_items_by_multiple_column_values(self, column: en.Column, column_values: list, get_column_values: bool = False, as_model: type = None, *args, chunk_size: int = None, concurrency: int = 4, **kwargs):
         """Search items in this board by their column values.
+
+            When a `chunk_size` is given without a `limit` or `page`, the values are searched in
+            chunks sent concurrently, every page of each chunk is retrieved and items matching
+            values of several chunks are returned once.  Otherwise the values are searched in a
+            single query.
     
             Parameters
 
@@ -1211,6 +1316,10 @@ class Board(_Board):
                     The MondayModel subclass to be returned.
                 args : `tuple`
                     The list of item return fields.
+                chunk_size : `int`
+                    The maximum number of values per query, searching every page of each chunk.
+                concurrency : `int`
+                    The number of chunk pages retrieved at the same time.
                 kwargs : `dict`
                     The optional keyword arguments for searching items.
         
@@ -1263,27 +1372,28 @@ class Board(_Board):
                 state : `moncli.enumns.State`
                     The state of the item (all / active / archived / deleted), the default is active.
         """
-        if get_column_values:
-            args = list(args)
-            for arg in ['column_values.{}'.format(arg) for arg in api.DEFAULT_COLUMN_VALUE_QUERY_FIELDS]:
-                if arg not in args:
-                    args.append(arg)
-            args.extend(['id', 'name'])
-
-        if column.column_type == ColumnType.numbers:
-            value = [str(value) for value in column_values]
-        else:
-            value = column_values
-
+        if chunk_size is not None and 'limit' not in kwargs and 'page' not in kwargs:
+            pages = self.get_item_pages_by_multiple_column_values(
+                column,
+                column_values,
+                get_column_values,
+                as_model,
+                *args,
+                chunk_size=chunk_size,
+                concurrency=concurrency,
+                **kwargs)
+            return [item for items in pages for item in items]
+
+        args = self._get_search_fields(get_column_values, *args)
         items_data = api.get_items_by_multiple_column_values(
             self.id, 
             column.id, 
-            value, 
+            self._get_search_values(column, column_values), 
             *args,
             api_key=self.__creds.api_key_v2, 
             **kwargs)
 
-        items = [en.Item(creds=self.__creds, **item_data) for item_data in items_data] 
+        items = [en.Item(creds=self.__creds, __board=self, **item_data) for item_data in items_data]
         if not as_model:
             return items
         if not issubclass(type(as_model), MondayModel):
@@ -1294,6 +1404,107 @@ class Board(_Board):
         return [as_model(item) for item in items]
 
 
+    def get_item_pages_by_multiple_column_values(self, column: en.Column, column_values: list, get_column_values: bool = False, as_model: type = None, *args, chunk_size: int = None, concurrency: int = 4, **kwargs):
+        """Stream the items in this board matching any of several column values page by page.
+
+            The values are searched in chunks, pages of several chunks are retrieved at the
+            same time and yielded as they arrive, and each item is yielded once.
+
+            Parameters
+
+                column : `moncli.entites.objects.Column`
+                    The column to search on.
+                column_values : `list[str]`
+                    The list of values to search on.
+                get_column_values: `bool`
+                    Retrieves all item column values if set to `True`.
+                as_model: `type`
+                    The MondayModel subclass to be returned.
+                args : `tuple`
+                    The list of item return fields.
+                chunk_size : `int`
+                    The maximum number of values per query; the default is 50.
+                concurrency : `int`
+                    The number of queries sent at the same time.
+                kwargs : `dict`
+                    The optional keyword arguments for searching items.
+
+            Returns
+
+                pages : `generator[list[moncli.entities.Item]]`
+                    The board's queried items, one list per retrieved page.
+
+            Optional Arguments
+
+                limit : `int`
+                    Number of items to get per page; by default the page size is chosen from the observed cost of earlier searches.
+                state : `moncli.enumns.State`
+                    The state of the item (all / active / archived / deleted), the default is active.
+        """
+
+        if as_model and not issubclass(as_model, MondayModel):
+            raise BoardError(
+                'invalid_as_model_parameter',
+                self.id,
+                'as_model parameter must be of MondayModel Type')
+
+        # Items are told apart by id, which is added to the default fields when none are given.
+        args = api.get_field_list(api.DEFAULT_ITEM_QUERY_FIELDS, None, *self._get_search_fields(get_column_values, *args))
+        kwargs.pop('page', None)
+        key = (api.ITEMS_BY_MULTIPLE_COLUMN_VALUES, self.id, column.id, tuple(args), repr(sorted(kwargs.items())))
+        page_sizer = getattr(self.__creds, 'page_sizer', None)
+        limit = kwargs.pop('limit', None)
+        if not limit:
+            # The page size is chosen from earlier searches; it cannot change while paging.
+            limit = page_sizer.get_limit(key) if page_sizer else DEFAULT_PAGE_LIMIT
+
+        def fetch_page(values: list, page: int, limit: int):
+            start = time.perf_counter()
+            with api.observe_requests() as requests:
+                items_data = api.get_items_by_multiple_column_values(
+                    self.id,
+                    column.id,
+                    values,
+                    *args,
+                    api_key=self.__creds.api_key_v2,
+                    limit=limit,
+                    page=page,
+                    **kwargs)
+            if page_sizer:
+                complexities = [request['complexity'] for request in requests if request['complexity'] is not None]
+                page_sizer.observe(key, limit, len(items_data), sum(complexities) if complexities else None, time.perf_counter() - start)
+            return items_data
+
+        item_ids = set()
+        values = unique(self._get_search_values(column, column_values))
+        for items_data in stream_pages(fetch_page, values, chunk_size or COLUMN_VALUES_LIMIT, limit, concurrency):
+            items_data = [item_data for item_data in items_data if item_data['id'] not in item_ids]
+            item_ids.update(item_data['id'] for item_data in items_data)
+            if not items_data:
+                continue
+            items = [en.Item(creds=self.__creds, __board=self, **item_data) for item_data in items_data]
+            if not as_model:
+                yield items
+            else:
+                yield [as_model(item) for item in items]
+
+
+    def _get_search_fields(self, get_column_values: bool = False, *args):
+        args = list(args)
+        if get_column_values:
+            for arg in ['column_values.{}'.format(arg) for arg in api.DEFAULT_COLUMN_VALUE_QUERY_FIELDS]:
+                if arg not in args:
+                    args.append(arg)
+            args.extend(['id', 'name'])
+        return args
+
+
+    def _get_search_values(self, column: en.Column, column_values: list):
+        if column.column_type == ColumnType.numbers:
+            return [str(value) for value in column_values]
+        return list(column_values)
+
+
     def get_column_values(self):
         """This method has not yet been implemented."""
         pass
@@ -1333,6 +1544,125 @@ class Board(_Board):
         return cv.create_column_value(column_type, id=column.id, title=column.title, settings_str=column.settings_str, **kwargs)
 
 
+    def to_columns(self, columns: list = None, strict: bool = False, **kwargs):
+        """Export the board's items into typed columnar arrays.
+
+            Requires the optional numpy dependency.
+
+            Parameters
+
+                columns : `list[str]`
+                    The ids or titles of the columns to export; all columns are exported by default.
+                strict : `bool`
+                    Raise on malformed column values instead of exporting them as nulls.
+                kwargs : `dict`
+                    The optional keyword arguments for getting items.
+
+            Returns
+
+                columns : `dict[str, numpy.ndarray]`
+                    The exported arrays keyed by column id, including the item 'id' and 'name'.
+                    Numbers are exported as float64, dates as datetime64 (UTC), checkboxes as bool
+                    and statuses/dropdowns as int32 categorical codes (-1 for null).
+
+            Optional Arguments
+
+                limit : `int`
+                    Number of items to get per page; pages are sized adaptively by default.
+        """
+
+        ids, names, buffers = self._get_column_buffers(columns, strict, **kwargs)
+        result = {'id': ids.to_numpy(), 'name': names.to_numpy()}
+        for buffer in buffers:
+            result[buffer.id] = buffer.to_numpy()
+        return result
+
+
+    def to_dataframe(self, columns: list = None, strict: bool = False, **kwargs):
+        """Export the board's items into a pandas data frame.
+
+            Requires the optional pandas dependency.  Statuses and dropdowns are
+            exported as categorical series labeled with the column settings.
+
+            Parameters
+
+                columns : `list[str]`
+                    The ids or titles of the columns to export; all columns are exported by default.
+                strict : `bool`
+                    Raise on malformed column values instead of exporting them as nulls.
+                kwargs : `dict`
+                    The optional keyword arguments for getting items.
+
+            Returns
+
+                data_frame : `pandas.DataFrame`
+                    The board's items indexed by item id.
+        """
+
+        pd = cv.import_optional('pandas')
+        ids, names, buffers = self._get_column_buffers(columns, strict, **kwargs)
+        data = {'name': names.to_pandas()}
+        for buffer in buffers:
+            data[buffer.id] = buffer.to_pandas()
+        return pd.DataFrame(data).set_index(pd.Index(ids.to_numpy(), name='id'))
+
+
+    def to_arrow(self, columns: list = None, strict: bool = False, **kwargs):
+        """Export the board's items into a pyarrow table.
+
+            Requires the optional pyarrow dependency.  Statuses and dropdowns are
+            exported as dictionary encoded arrays.
+
+            Parameters
+
+                columns : `list[str]`
+                    The ids or titles of the columns to export; all columns are exported by default.
+                strict : `bool`
+                    Raise on malformed column values instead of exporting them as nulls.
+                kwargs : `dict`
+                    The optional keyword arguments for getting items.
+
+            Returns
+
+                table : `pyarrow.Table`
+                    The board's items.
+        """
+
+        pa = cv.import_optional('pyarrow')
+        ids, names, buffers = self._get_column_buffers(columns, strict, **kwargs)
+        arrays = [ids.to_arrow(), names.to_arrow()] + [buffer.to_arrow() for buffer in buffers]
+        return pa.Table.from_arrays(arrays, names=['id', 'name'] + [buffer.id for buffer in buffers])
+
+
+    def _get_column_buffers(self, columns: list = None, strict: bool = False, **kwargs):
+        """Decode the board's item pages into columnar buffers."""
+
+        # Item names are exported from the item data, not from the name column.
+        columns = [self.columns[column] for column in columns] if columns else list(self.columns)
+        columns = [column for column in columns if column.column_type != ColumnType.name]
+        for column in columns:
+            if column.id in ('id', 'name'):
+                raise BoardError(
+                    'invalid_export_column',
+                    self.id,
+                    'Column "{}" cannot be exported because its id is reserved for the item {}.'.format(column.title, column.id))
+        buffers = [
+            cv.create_column_buffer(column.column_type, id=column.id, title=column.title, settings_str=column.settings_str, strict=strict)
+            for column in columns]
+
+        ids = cv.IdBuffer()
+        names = cv.NameBuffer()
+        column_ids = [buffer.id for buffer in buffers]
+        for items_data in self._get_item_data_pages(True, column_ids=column_ids, **kwargs):
+            for item_data in items_data:
+                ids.append(item_data)
+                names.append(item_data)
+                values = {data['id']: data for data in item_data.get('column_values', [])}
+                for buffer in buffers:
+                    buffer.append(values.get(buffer.id))
+        return ids, names, buffers
+
+
     def create_webhook(self, url: str, event: WebhookEventType, *args, **kwargs):
         """Create a new webhook.
     
@@ -11,6 +11,12 @@ class MondayClient():
 
             me : `moncli.entities.User`
                 The client login user.
+            schema_cache : `moncli.schema.SchemaCache`
+                The board schemas shared by the client's bulk loading methods.
+            page_sizer : `moncli.paging.PageSizer`
+                The page sizer adapting the page sizes of the client's paginators.
+            priority : `moncli.enums.Priority`
+                The priority of the client's requests when a request scheduler is used.
 
         Methods
 
@@ -24,12 +30,22 @@ class MondayClient():
                 Get a board by unique identifier.
             get_board_by_name : `moncli.entities.Board`
                 Get a board by name.
+            get_boards_by_ids : `list[moncli.entities.Board]`
+                Get many boards and their columns, groups or views using concurrent multi-id queries.
             archive_board : `moncli.entities.Board`
                 Archive a board.
             get_assets : `list[monlci.entities.Asset]`
                 Get a collection of assets by IDs.
+            download_assets : `list[str]`
+                Download a collection of assets in parallel.
             get_items : `list[moncli.entities.Item]`
                 Get a collection of items.
+            get_subitem_trees : `moncli.subitems.SubitemTree`
+                Get items and their subitems using bulk queries.
+            resolve_relations : `dict`
+                Load the items linked by a board relation column using bulk queries.
+            session : `moncli.session.Session`
+                Open an identity map making the client's entities canonical by id.
             get_updates : `list[moncli.entities.Update]`
                 Get a collection of updates.
             delete_update : `moncli.entities.Update`
@@ -64,7 +80,8 @@ class MondayClient():
 
     def __init__(self, **kwargs):    
         self.__me = None
-        self.__creds = en.MondayClientCredentials(kwargs.pop('api_key', None))
+        self.__creds = en.MondayClientCredentials(kwargs.pop('api_key', None), kwargs.pop('priority', None))
+        self.__schema_cache = None
 
     @property
     def me(self):
@@ -73,6 +90,34 @@ class MondayClient():
             self.__me = self.get_me()
         return self.__me
 
+    @property
+    def schema_cache(self):
+        """The board schemas shared by the client's bulk loading methods."""
+        if not self.__schema_cache:
+            from ..schema import SchemaCache
+            self.__schema_cache = SchemaCache()
+        return self.__schema_cache
+
+    @property
+    def page_sizer(self):
+        """The page sizer adapting the page sizes of the client's paginators."""
+        return self.__creds.page_sizer
+
+    @page_sizer.setter
+    def page_sizer(self, value):
+        """Set the page sizer, or None to use fixed page sizes."""
+        self.__creds.page_sizer = value
+
+    @property
+    def priority(self):
+        """The priority of the client's requests when a request scheduler is used."""
+        return self.__creds.priority
+
+    @priority.setter
+    def priority(self, value):
+        """Set the priority of the client's requests."""
+        self.__creds.priority = value
+
     @property
     def api_key(self):
         """Get API Key V2"""
@@ -422,6 +467,32 @@ class MondayClient():
         return en.Board(creds=self.__creds, **board_data)
 
 
+    def get_boards_by_ids(self, ids: list, include: list = ('columns', 'groups'), concurrency: int = 4):
+        """Get many boards and their columns, groups or views using concurrent multi-id queries.
+
+            The ids are split into multi-id `boards` queries that are sent concurrently.  Boards
+            loaded with their columns are added to the client's schema cache, and boards already
+            cached are not fetched again unless views are included.
+
+            Parameters
+
+                ids : `list[str]`
+                    The boards' unique identifiers.
+                include : `list[str]`
+                    The board lists to load: "columns", "groups" and/or "views".
+                concurrency : `int`
+                    The number of queries sent at the same time.
+
+            Returns
+
+                boards : `list[moncli.entities.Board]`
+                    The boards in the order of the given ids, without the ones that do not exist.
+        """
+
+        from ..schema import get_boards_by_ids
+        return get_boards_by_ids(ids, include, creds=self.__creds, schema_cache=self.schema_cache, concurrency=concurrency)
+
+
     def get_board_by_name(self, name: str, *args):
         """Get a board by name.
 
@@ -485,25 +556,20 @@ class MondayClient():
                     The board's workspace unique identifier (null for main workspace).
         """
         
-        # Hard configure the pagination rate.
-        page = 1
-        page_limit = 500
-        record_count = 500
+        from ..paging import iter_pages
 
-        while record_count >= page_limit:
-            boards_data = api.get_boards(
+        def fetch_page(page: int, limit: int):
+            return api.get_boards(
                 'id', 'name',
                 api_key=self.__creds.api_key_v2, 
-                limit=page_limit,
+                limit=limit,
                 page=page)
-            
-            try:
-                target_board = [board for board in boards_data if board['name'].lower() == name.lower()][0]
-                return self.get_board_by_id(target_board['id'], *args)
-            except IndexError:
-                page += 1
-                record_count = len(boards_data)
-                continue
+
+        # Page sizes adapt to the observed cost of the boards query.
+        for boards_data in iter_pages(fetch_page, (api.BOARDS, 'id', 'name'), self.__creds.page_sizer):
+            for board_data in boards_data:
+                if board_data['name'].lower() == name.lower():
+                    return self.get_board_by_id(board_data['id'], *args)
         raise MondayClientError('board_not_found', 'Could not find board with name "{}".'.format(name))   
 
 
@@ -626,9 +692,46 @@ class MondayClient():
         return [en.asset.Asset(**data) for data in assets_data]
 
 
-    def get_items(self, get_column_values = None, as_model: type = None, *args, **kwargs):
+    def download_assets(self, assets: list, dest: str = None, concurrency: int = 4, cache = None):
+        """Download a collection of assets in parallel.
+
+            Expired public urls are refreshed using batched requests, and files already in the
+            local asset cache are not downloaded again.
+
+            Parameters
+
+                assets : `list[moncli.entities.Asset | str]`
+                    The assets, or asset IDs, to download.
+                dest : `str`
+                    The directory to save the files to.  If omitted, the cached file paths are returned.
+                concurrency : `int`
+                    The number of files downloaded at the same time.
+                cache : `moncli.assets.AssetCache`
+                    The cache to use, the shared default cache if omitted or False to disable caching.
+
+            Returns
+
+                paths : `list[str]`
+                    The downloaded file paths, in the order of the assets.
+        """
+
+        from ..assets import download_assets
+
+        ids = [asset for asset in assets if not isinstance(asset, en.Asset)]
+        if ids:
+            fetched = {asset.id: asset for asset in self.get_assets(ids, 'id', 'name', 'file_size', 'created_at', 'public_url')}
+            assets = [asset if isinstance(asset, en.Asset) else fetched[str(asset)] for asset in assets]
+        return download_assets(assets, dest, concurrency=concurrency, cache=cache, api_key=self.__creds.api_key_v2)
+
+
+    def get_items(self, get_column_values = None, as_model: type = None, *args, chunk_size: int = None, concurrency: int = 4, **kwargs):
         """Get a collection of items.
 
+            Items requested by ids without a limit or page are fetched in chunks of `chunk_size` ids
+            sent concurrently.  Duplicate ids are requested once, the items are returned in the
+            order of the ids, and the ids that no item was returned for are available as the
+            `missing_ids` of the returned list.
+
             Parameters
 
                 get_column_values: `bool`
@@ -637,12 +740,16 @@ class MondayClient():
                     The MondayModel subclass to be returned.
                 args : `tuple`
                     The list of item return fields.
+                chunk_size : `int`
+                    The maximum number of ids per request, 100 by default.
+                concurrency : `int`
+                    The number of requests sent at the same time.
                 kwargs : `dict`
                     Optional keyword arguments for querying items.
 
             Returns
 
-                items : `list[moncli.entities.Item]`
+                items : `moncli.batch.ItemList`
                     The collection of items.
 
             Return Fields
@@ -692,14 +799,24 @@ class MondayClient():
                 if arg not in args:
                     args.append(arg)
 
-        if kwargs.__contains__('ids'):
-            kwargs['ids'] = [int(id) for id in kwargs['ids']]
-
-        items_data = api.get_items(
-            *args,
-            api_key=self.__creds.api_key_v2, 
-            **kwargs)
-        items = [en.Item(creds=self.__creds, **item_data) for item_data in items_data] 
+        from ..batch import ITEMS_IDS_LIMIT, ItemList, get_items_data
+        missing_ids = []
+        if kwargs.get('ids') is not None and 'limit' not in kwargs and 'page' not in kwargs:
+            items_data, missing_ids = get_items_data(
+                kwargs.pop('ids'),
+                *args,
+                api_key=self.__creds.api_key_v2,
+                chunk_size=chunk_size or ITEMS_IDS_LIMIT,
+                concurrency=concurrency,
+                **kwargs)
+        else:
+            if kwargs.__contains__('ids'):
+                kwargs['ids'] = [int(id) for id in kwargs['ids']]
+            items_data = api.get_items(
+                *args,
+                api_key=self.__creds.api_key_v2, 
+                **kwargs)
+        items = ItemList([en.Item(creds=self.__creds, **item_data) for item_data in items_data], missing_ids)
         if not as_model:
             return items
         if not issubclass(as_model, MondayModel):
@@ -708,9 +825,81 @@ class MondayClient():
                 self.id,
                 'as_model parameter must be of MondayModel Type'
             )
-        return [as_model(item) for item in items]
+        return ItemList([as_model(item) for item in items], missing_ids)
             
 
+    def get_subitem_trees(self, item_ids: list, depth: int = 1, get_column_values: bool = True):
+        """Get items and their subitems using bulk queries.
+
+            Subitems are loaded for chunks of parent items in a single query, and the subitem
+            board schemas are shared through the client's schema cache, so no item loads its
+            own board.
+
+            Parameters
+
+                item_ids : `list[str]`
+                    The unique identifiers of the parent items.
+                depth : `int`
+                    The number of subitem levels to load.
+                get_column_values : `bool`
+                    Load column values for the items and subitems.
+
+            Returns
+
+                tree : `moncli.subitems.SubitemTree`
+                    The items and subitems indexed by id, with parent and child links.
+        """
+
+        from ..subitems import get_subitem_trees
+        return get_subitem_trees(item_ids, depth, get_column_values, creds=self.__creds, schema_cache=self.schema_cache)
+
+
+    def resolve_relations(self, items: list, column, depth: int = None, as_model = None):
+        """Load the items linked by a board relation column using bulk queries.
+
+            Linked items are fetched in chunks across all items, and the linked board schemas
+            are shared through the client's schema cache.  The linked items are also attached
+            to each relation column value as `linked_items`.
+
+            Parameters
+
+                items : `list[moncli.entities.Item]`
+                    The items whose links are resolved.
+                column : `str | list[str]`
+                    The relation column id or title, or one column per hop for multi-hop joins.
+                depth : `int`
+                    The maximum number of hops.
+                as_model : `type | dict`
+                    The MondayModel subclass the linked items are converted to, or a subclass per board id.
+
+            Returns
+
+                links : `dict`
+                    The linked items or models of every resolved item, keyed by item id.
+        """
+
+        from ..relations import resolve_relations
+        return resolve_relations(items, column, depth, as_model, creds=self.__creds, schema_cache=self.schema_cache)
+
+
+    def session(self):
+        """Open an identity map making the client's entities canonical by id.
+
+            While the returned session is open, boards, groups, columns, users, teams and items
+            built by the client are shared by id, and newly fetched fields are merged into the
+            shared objects.  Properties loaded once, such as a board's columns, are then not
+            fetched again for every item of the board.
+
+            Returns
+
+                session : `moncli.session.Session`
+                    The session, to be used as a context manager.
+        """
+
+        from ..session import Session
+        return Session(self.__creds)
+
+
     def get_updates(self, *args, **kwargs):
         """Get a collection of updates.
 
@@ -100,4 +100,25 @@ class BaseColumnCollection(en.BaseCollection):
                     return i
             raise KeyError('Collection contains no value for key "{}".'.format(index))
 
-        super().__init__(column_values, BaseColumn, get_index)
\ No newline at end of file
+        super().__init__(column_values, BaseColumn, get_index)
+
+    def update(self, columns):
+        """Update the columns with the ids of other columns in place and append the other columns.
+
+            Parameters
+
+                columns : `list[moncli.entities.BaseColumn]`
+                    The columns to merge into the collection.
+        """
+
+        for column in columns:
+            try:
+                existing = self[column.id]
+            except KeyError:
+                self.append(column)
+                continue
+            if existing is column:
+                continue
+            for name, value in vars(column).items():
+                if value is not None:
+                    setattr(existing, name, value)
\ No newline at end of file
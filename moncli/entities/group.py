@@ -4,6 +4,7 @@ from schematics import types
 from .. import api, entities as en, models as m
 from ..error import GroupError
 from ..models import MondayModel
+from ..session import CanonicalModelMeta
 
 class _Group(Model):
     """Group base model"""
@@ -16,13 +17,15 @@ class _Group(Model):
     position = types.StringType()
 
 
-class Group(_Group):
+class Group(_Group, metaclass=CanonicalModelMeta):
     """ A group of items in a board.
 
         Properties
 
             archived : `bool`
                 Is the group archived or not.
+            board : `moncli.entities.Board`
+                The board that contains this group, if known.
             color : `str`
                 The group's color.
             deleted : `bool`
@@ -67,6 +70,11 @@ class Group(_Group):
             o['items'] = [item.to_primitive() for item in self.__items]
         return str(o)
 
+    @property
+    def board(self):
+        """The board that contains this group, if known."""
+        return self.__board
+
     @property
     def items(self):
         """The items in the group."""
@@ -354,7 +362,7 @@ class Group(_Group):
             ids=[int(self.__board.id)],
             limit=1,
             **group_kwargs)[0]['groups'][0]['items']
-        items = [en.Item(creds=self.__creds, **item_data) for item_data in items_data] 
+        items = [en.Item(creds=self.__creds, __board=self.__board, **item_data) for item_data in items_data]
         if not as_model:
             return items
         if not issubclass(type(as_model), MondayModel):
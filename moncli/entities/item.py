@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 from schematics.models import Model
 from schematics.types import StringType
@@ -6,6 +9,7 @@ from schematics.types import StringType
 from .. import api, entities as en, models as m, error as e, column_value as cv
 from ..error import ItemError
 from ..models import MondayModel
+from ..session import CanonicalModelMeta
 
 
 class _Item(Model):
@@ -19,7 +23,7 @@ class _Item(Model):
     updated_at = StringType()
 
 
-class Item(_Item):
+class Item(_Item, metaclass=CanonicalModelMeta):
     """An item (table row)
     
         Properties
@@ -59,6 +63,8 @@ class Item(_Item):
 
             add_file : `moncli.entities.Asset`
                 Add a file to a column value.
+            add_files : `list[moncli.entities.Asset]`
+                Add several files to a column value in parallel.
             get_files : `list[moncli.entities.Asset]`
                 Retrieves the file assets for the login user's account.
             remove_files : `moncli.entities.Item`
@@ -230,7 +236,7 @@ class Item(_Item):
         return self.__subitems
 
 
-    def add_file(self, file_column: cv.FileValue, file_path: str, *args):
+    def add_file(self, file_column: cv.FileValue, file_path: str, *args, callback = None):
         """Add a file to a column value.
 
             Parameters
@@ -241,6 +247,8 @@ class Item(_Item):
                     The file path.
                 args : `tuple`
                     Optional file return fields.
+                callback : `callable`
+                    Called with the bytes sent so far and the total request size while uploading.
 
             Returns
 
@@ -274,9 +282,62 @@ class Item(_Item):
             file_column.id,
             file_path,
             *args,
-            api_key=self.__creds.api_key_v2)
+            api_key=self.__creds.api_key_v2,
+            callback=callback)
         return en.Asset(**asset_data)
 
+    def add_files(self, file_column: cv.FileValue, file_paths: list, *args, concurrency: int = 4, callback = None):
+        """Add several files to a column value in parallel.
+
+            Parameters
+
+                file_column : moncli.entities.FileValue
+                    The file column value to be updated.
+                file_paths : `list[str]`
+                    The file paths.
+                args : `tuple`
+                    Optional file return fields.
+                concurrency : `int`
+                    The number of files uploaded at the same time.
+                callback : `callable`
+                    Called with the file path, the bytes sent so far and the total request size while uploading.
+
+            Returns
+
+                assets : `list[moncli.entities.Asset]`
+                    The newly created file assets, in the order of the file paths.
+
+            Return Fields
+
+                created_at : `str`
+                    The file's creation date.
+                file_extension : `str`
+                    The file's extension.
+                file_size : `int`
+                    The file's size in bytes.
+                id : `str`
+                    The file's unique identifier.
+                name : `str`
+                    The file's name.
+                public_url : `str`
+                    Public url to the asset, valid for 1 hour.
+                uploaded_by : `moncli.entities.user.User`
+                    The user who uploaded the file
+                url : `str`
+                    The user who uploaded the file
+                url_thumbnail : `str`
+                    Url to view the asset in thumbnail mode. Only available for images.
+        """
+
+        def upload(file_path: str):
+            file_callback = None
+            if callback:
+                file_callback = lambda sent, total: callback(file_path, sent, total)
+            return self.add_file(file_column, file_path, *args, callback=file_callback)
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            return list(executor.map(upload, file_paths))
+
 
     def get_files(self, column_ids: list = None, *args):
         """Retrieves the file assets for the login user's account.
@@ -14,10 +14,33 @@ class MondayClientCredentials():
             The access key for monday.com API v1.
         api_key_v2 : `str`
             The access key for monday.com API v2.
+        page_sizer : `moncli.paging.PageSizer`
+            The page sizer shared by the paginators of the entities built with these credentials.
+        priority : `moncli.enums.Priority`
+            The priority of the requests sent with these credentials, if any.
     """
 
-    def __init__(self, api_key_v2: str = None):
+    def __init__(self, api_key_v2: str = None, priority = None):
+        from ..paging import PageSizer
         self.api_key_v2 = api_key_v2
+        self.page_sizer = PageSizer()
+        self.priority = priority
+
+    @property
+    def api_key_v2(self):
+        api_key = self.__api_key_v2
+        if not self.priority:
+            return api_key
+        # The key carries the priority to the request scheduler, so the global key is carried instead of none.
+        from .. import api_v2 as api
+        api_key = api_key or api.api_key
+        if not api_key:
+            return api_key
+        return api.PriorityKey(api_key, self.priority)
+
+    @api_key_v2.setter
+    def api_key_v2(self, value):
+        self.__api_key_v2 = value
 
 
 class ActivityLog(Model):
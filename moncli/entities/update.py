@@ -280,7 +280,7 @@ class Update(_Update):
         return [] 
 
 
-    def add_file(self, file_path: str, *args):
+    def add_file(self, file_path: str, *args, callback = None):
         """Add a file to update.
     
             Parameters
@@ -289,6 +289,8 @@ class Update(_Update):
                     The path to the file to upload.
                 args : `tuple`
                     The list of update fields to return.
+                callback : `callable`
+                    Called with the bytes sent so far and the total request size while uploading.
 
             Returns
 
@@ -321,7 +323,8 @@ class Update(_Update):
             self.id,
             file_path,
             *args,
-            api_key=self.__creds.api_key_v2)
+            api_key=self.__creds.api_key_v2,
+            callback=callback)
         return en.Asset(**asset_data)
 
 
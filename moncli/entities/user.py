@@ -3,6 +3,7 @@ from schematics import types
 
 from .. import api, entities as en
 from ..enums import *
+from ..session import CanonicalModelMeta
 
 
 class _User(Model):
@@ -33,7 +34,7 @@ class _User(Model):
     utc_hours_diff = types.IntType()
 
 
-class User(_User):
+class User(_User, metaclass=CanonicalModelMeta):
     """A monday.com user
     
         Properties
@@ -268,7 +269,7 @@ class _Team(Model):
     picture_url = types.StringType()
 
 
-class Team(_Team):
+class Team(_Team, metaclass=CanonicalModelMeta):
     """A team of users.
     
         Properties
@@ -102,4 +102,10 @@ class SubscriberKind(Enum):
 
 class WorkspaceSubscriberKind(Enum):
     subscriber = 0
-    owner = 1
\ No newline at end of file
+    owner = 1
+
+
+class Priority(Enum):
+    interactive = 1
+    normal = 2
+    bulk = 3
@@ -38,4 +38,17 @@ class ColumnValueError(MoncliError):
     entity_type = 'ColumnValue'
 
     def __init__(self, error_code, entity_id, message):
-        super().__init__(error_code, entity_id, self.entity_type, message)
\ No newline at end of file
+        super().__init__(error_code, entity_id, self.entity_type, message)
+
+class ItemIndexError(MoncliError):
+    entity_type = 'ItemIndex'
+
+    def __init__(self, error_code, entity_id, message):
+        super().__init__(error_code, entity_id, self.entity_type, message)
+
+
+class DependencyGraphError(MoncliError):
+    entity_type = 'DependencyGraph'
+
+    def __init__(self, error_code, entity_id, message):
+        super().__init__(error_code, entity_id, self.entity_type, message)
@@ -0,0 +1,458 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime, timezone
+
+from . import column_value as cv
+from .error import ItemIndexError
+
+
+OPERATORS = ('==', '!=', 'in', '<', '<=', '>', '>=', 'between', 'overlaps')
+
+
+class ColumnIndex(object):
+    """Base index over a single column's values.
+
+    Properties
+
+        column_id : `str`
+            The indexed column's unique identifier.
+        operators : `tuple[str]`
+            The filter operators supported by the index.
+
+    Methods
+
+        add : `void`
+            Index an item's column value.
+        remove : `void`
+            Remove an item from the index.
+        get_key : `object`
+            Get the sort/group key of an indexed item.
+        search : `set[int]`
+            Get the unique identifiers of the items matching a filter.
+    """
+
+    operators = ()
+
+    def __init__(self, column_id: str):
+        self.column_id = column_id
+        self._keys = {}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, item_id: int, column_value: cv.ColumnValue):
+        self.remove(item_id)
+        keys = self._get_keys(column_value.value) if column_value.value is not None else None
+        if keys is None:
+            return
+        self._keys[item_id] = keys
+        self._add(item_id, keys)
+
+    def remove(self, item_id: int):
+        keys = self._keys.pop(item_id, None)
+        if keys is not None:
+            self._remove(item_id, keys)
+
+    def get_key(self, item_id: int):
+        return self._keys.get(item_id)
+
+    def search(self, operator: str, value):
+        if operator not in self.operators:
+            raise ItemIndexError(
+                'invalid_operator',
+                self.column_id,
+                'Operator "{}" is not supported for column "{}".'.format(operator, self.column_id))
+        return self._search(operator, value)
+
+    def _get_keys(self, value):
+        return value
+
+    def _add(self, item_id: int, keys):
+        pass
+
+    def _remove(self, item_id: int, keys):
+        pass
+
+    def _search(self, operator: str, value):
+        return set()
+
+
+class HashIndex(ColumnIndex):
+    """An equality index for status, dropdown, people, checkbox and text values.
+
+    Multi-valued columns (dropdown, people) index the item under every selected value.
+    """
+
+    operators = ('==', '!=', 'in')
+
+    def __init__(self, column_id: str):
+        super().__init__(column_id)
+        self._buckets = {}
+
+    def _get_keys(self, value):
+        if isinstance(value, list):
+            return tuple(_get_hash_key(element) for element in value)
+        return (_get_hash_key(value),)
+
+    def get_key(self, item_id: int):
+        keys = self._keys.get(item_id)
+        if not keys:
+            return None
+        return keys[0] if len(keys) == 1 else keys
+
+    def _add(self, item_id: int, keys):
+        for key in keys:
+            self._buckets.setdefault(key, set()).add(item_id)
+
+    def _remove(self, item_id: int, keys):
+        for key in keys:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            bucket.discard(item_id)
+            if not bucket:
+                del self._buckets[key]
+
+    def _search(self, operator: str, value):
+        if operator == '==':
+            return set(self._buckets.get(_get_hash_key(value), ()))
+        if operator == 'in':
+            result = set()
+            for element in value:
+                result.update(self._buckets.get(_get_hash_key(element), ()))
+            return result
+        return set(self._keys) - self._buckets.get(_get_hash_key(value), set())
+
+
+class SortedIndex(ColumnIndex):
+    """A range index for number and date values."""
+
+    operators = ('==', '!=', 'in', '<', '<=', '>', '>=', 'between')
+
+    def __init__(self, column_id: str):
+        super().__init__(column_id)
+        self._entries = []
+
+    def _get_keys(self, value):
+        return _get_sort_key(value)
+
+    def _add(self, item_id: int, keys):
+        insort(self._entries, (keys, item_id))
+
+    def _remove(self, item_id: int, keys):
+        index = bisect_left(self._entries, (keys, item_id))
+        if index < len(self._entries) and self._entries[index] == (keys, item_id):
+            del self._entries[index]
+
+    def _search(self, operator: str, value):
+        if operator == 'in':
+            result = set()
+            for element in value:
+                result.update(self._search('==', element))
+            return result
+        if operator == 'between':
+            low, high = _get_sort_key(value[0]), _get_sort_key(value[1])
+            return self._slice(self._lower(low), self._upper(high))
+        key = _get_sort_key(value)
+        if operator == '==':
+            return self._slice(self._lower(key), self._upper(key))
+        if operator == '!=':
+            return set(self._keys) - self._slice(self._lower(key), self._upper(key))
+        if operator == '<':
+            return self._slice(0, self._lower(key))
+        if operator == '<=':
+            return self._slice(0, self._upper(key))
+        if operator == '>':
+            return self._slice(self._upper(key), len(self._entries))
+        return self._slice(self._lower(key), len(self._entries))
+
+    def _lower(self, key):
+        return bisect_left(self._entries, (key,))
+
+    def _upper(self, key):
+        # Item ids are ints, so (key, inf) sorts after every entry with this key.
+        return bisect_right(self._entries, (key, float('inf')))
+
+    def _slice(self, start: int, end: int):
+        return set(item_id for _, item_id in self._entries[start:end])
+
+
+class IntervalIndex(ColumnIndex):
+    """An overlap index for timeline values.
+
+    Entries are sorted by start date and paired with a running maximum of their end dates,
+    so an overlap search only scans entries that start before the searched range ends.
+    """
+
+    operators = ('overlaps',)
+
+    def __init__(self, column_id: str):
+        super().__init__(column_id)
+        self._entries = []
+        self._max_ends = None
+
+    def get_key(self, item_id: int):
+        keys = self._keys.get(item_id)
+        return keys[0] if keys else None
+
+    def _get_keys(self, value):
+        if not value.from_date:
+            return None
+        to_date = value.to_date or value.from_date
+        return (_get_sort_key(value.from_date), _get_sort_key(to_date))
+
+    def _add(self, item_id: int, keys):
+        insort(self._entries, (keys[0], keys[1], item_id))
+        self._max_ends = None
+
+    def _remove(self, item_id: int, keys):
+        index = bisect_left(self._entries, (keys[0], keys[1], item_id))
+        if index < len(self._entries) and self._entries[index] == (keys[0], keys[1], item_id):
+            del self._entries[index]
+            self._max_ends = None
+
+    def _search(self, operator: str, value):
+        low, high = _get_sort_key(value[0]), _get_sort_key(value[1])
+        if self._max_ends is None:
+            self._max_ends = []
+            for _, end, _ in self._entries:
+                self._max_ends.append(end if not self._max_ends or end > self._max_ends[-1] else self._max_ends[-1])
+        result = set()
+        index = bisect_right(self._entries, (high, _MAX_KEY)) - 1
+        while index >= 0 and self._max_ends[index] >= low:
+            _, end, item_id = self._entries[index]
+            if end >= low:
+                result.add(item_id)
+            index -= 1
+        return result
+
+
+COLUMN_VALUE_INDEX_MAPPINGS = {
+    cv.StatusValue: HashIndex,
+    cv.DropdownValue: HashIndex,
+    cv.PeopleValue: HashIndex,
+    cv.CheckboxValue: HashIndex,
+    cv.TextValue: HashIndex,
+    cv.NumberValue: SortedIndex,
+    cv.DateValue: SortedIndex,
+    cv.TimelineValue: IntervalIndex
+}
+
+
+class ItemIndex(object):
+    """An in-memory index for querying loaded items without server round trips.
+
+    Status, dropdown, people, checkbox and text columns get hash indexes, number and date
+    columns get sorted indexes and timeline columns get interval indexes.
+
+    Properties
+
+        columns : `list[str]`
+            The ids or titles of the columns to index, or None to index all supported columns.
+
+    Methods
+
+        add_items : `void`
+            Add or refresh items in the index.
+        add_pages : `void`
+            Add items from a page stream such as `Board.get_item_pages`.
+        get_item : `moncli.entities.Item`
+            Get an indexed item by unique identifier.
+        remove_items : `void`
+            Remove items from the index.
+        query : `list[moncli.entities.Item]`
+            Get items matching compound filters, optionally sorted and grouped.
+    """
+
+    def __init__(self, items: list = None, columns: list = None):
+        self.columns = columns
+        self._items = {}
+        self._indexes = {}
+        self._aliases = {}
+        self._ignored = set()
+        if items:
+            self.add_items(items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item_id):
+        return int(item_id) in self._items
+
+    def add_items(self, items: list):
+        """Add or refresh items in the index.
+
+            Parameters
+
+                items : `list[moncli.entities.Item]`
+                    The items to index.  Items already in the index are re-indexed.
+        """
+
+        for item in items:
+            item_id = int(item.id)
+            self.remove_items([item_id])
+            self._items[item_id] = item
+            for column_value in item.column_values:
+                index = self._get_index(item, column_value)
+                if index is not None:
+                    index.add(item_id, column_value)
+
+    def add_pages(self, pages):
+        """Add items from a page stream such as `Board.get_item_pages`.
+
+            Parameters
+
+                pages : `iterable[list[moncli.entities.Item]]`
+                    The item pages to index.
+        """
+
+        for items in pages:
+            self.add_items(items)
+
+    def get_item(self, item_id: str):
+        """Get an indexed item by unique identifier.
+
+            Parameters
+
+                item_id : `str`
+                    The item's unique identifier.
+
+            Returns
+
+                item : `moncli.entities.Item`
+                    The indexed item, or None if the item is not indexed.
+        """
+
+        return self._items.get(int(item_id))
+
+    def remove_items(self, items: list):
+        """Remove items from the index.
+
+            Parameters
+
+                items : `list`
+                    The items or item ids to remove.
+        """
+
+        for item in items:
+            item_id = int(getattr(item, 'id', item))
+            if self._items.pop(item_id, None) is None:
+                continue
+            for index in self._indexes.values():
+                index.remove(item_id)
+
+    def query(self, filters: list = None, order_by: str = None, descending: bool = False, group_by = None, limit: int = None):
+        """Get items matching compound filters, optionally sorted and grouped.
+
+            Parameters
+
+                filters : `list[tuple]`
+                    The (column, operator, value) filters, all of which must match.  Supported operators
+                    are ==, !=, in, <, <=, >, >=, between (inclusive (low, high) pair) and overlaps ((start, end)
+                    pair for timeline columns).
+                order_by : `str`
+                    The id or title of the column to sort by.  Items without a value are sorted last.
+                descending : `bool`
+                    Sort in descending order.
+                group_by : `str | callable`
+                    The id or title of the column, or a function of the item, to group by.
+                limit : `int`
+                    The maximum number of items to return (per group when grouping).
+
+            Returns
+
+                items : `list[moncli.entities.Item] | dict`
+                    The matching items, or a dictionary of matching items keyed by group value.
+        """
+
+        if filters:
+            item_ids = None
+            # Apply the most selective filter first so later intersections stay small.
+            for result in sorted((self._search(*filter) for filter in filters), key=len):
+                item_ids = result if item_ids is None else item_ids & result
+                if not item_ids:
+                    break
+        else:
+            item_ids = set(self._items)
+
+        if order_by and item_ids:
+            index = self._find_index(order_by)
+            present = [item_id for item_id in item_ids if index.get_key(item_id) is not None]
+            missing = sorted(item_ids.difference(present))
+            ordered = sorted(present, key=lambda item_id: (index.get_key(item_id), item_id), reverse=descending) + missing
+        else:
+            ordered = sorted(item_ids)
+
+        if group_by is None:
+            return [self._items[item_id] for item_id in ordered[:limit]]
+
+        if not ordered:
+            return {}
+        if callable(group_by):
+            get_group_key = lambda item_id: group_by(self._items[item_id])
+        else:
+            get_group_key = self._find_index(group_by).get_key
+        groups = {}
+        for item_id in ordered:
+            group = groups.setdefault(get_group_key(item_id), [])
+            if limit is None or len(group) < limit:
+                group.append(self._items[item_id])
+        return groups
+
+    def _search(self, column: str, operator: str, value):
+        if operator not in OPERATORS:
+            raise ItemIndexError('invalid_operator', column, 'Unknown filter operator "{}".'.format(operator))
+        if not self._items:
+            return set()
+        return self._find_index(column).search(operator, value)
+
+    def _find_index(self, column: str):
+        column_id = self._aliases.get(column, column)
+        try:
+            return self._indexes[column_id]
+        except KeyError:
+            raise ItemIndexError('column_not_indexed', column, 'Column "{}" is not indexed.'.format(column))
+
+    def _get_index(self, item, column_value: cv.ColumnValue):
+        index = self._indexes.get(column_value.id)
+        if index is not None or column_value.id in self._ignored:
+            return index
+        index_type = COLUMN_VALUE_INDEX_MAPPINGS.get(type(column_value))
+        # Column values created from item data carry no title, so it is taken from the board schema.
+        title = column_value.title or next((column.title for column in item.board.columns if column.id == column_value.id), None)
+        if not index_type or (self.columns is not None and column_value.id not in self.columns and title not in self.columns):
+            self._ignored.add(column_value.id)
+            return None
+        index = self._indexes[column_value.id] = index_type(column_value.id)
+        if title:
+            self._aliases[title] = column_value.id
+        return index
+
+
+class _MaxKey(object):
+    """Sorts after every other key."""
+
+    def __lt__(self, other):
+        return False
+
+    def __gt__(self, other):
+        return True
+
+
+_MAX_KEY = _MaxKey()
+
+
+def _get_hash_key(value):
+    if isinstance(value, cv.PersonOrTeam):
+        return int(value.id)
+    return value
+
+
+def _get_sort_key(value):
+    # Date values may be naive (date only) or aware (date and time), so both are normalized to naive UTC.
+    if isinstance(value, datetime):
+        if value.tzinfo:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return value
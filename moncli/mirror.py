@@ -0,0 +1,434 @@
+import json, re, sqlite3, threading
+from datetime import datetime, timedelta, timezone
+
+from . import api, batch, entities as en
+from .error import BoardError
+from .models import MondayModel
+
+
+# Activity log events that change the board schema rather than an item.
+SCHEMA_EVENTS = ('create_column', 'delete_column', 'update_column', 'update_column_settings', 'update_column_name',
+                 'create_group', 'delete_group', 'update_group_name', 'move_group', 'archive_group')
+# Activity log events that remove an item from the board.
+DELETE_EVENTS = ('delete_pulse', 'archive_pulse', 'batch_delete_pulses', 'batch_archive_pulses', 'move_pulse_from_board')
+ITEM_ID_KEYS = ('pulse_id', 'item_id', 'pulse_ids', 'item_ids')
+
+ITEM_FIELDS = ['id', 'name', 'state', 'created_at', 'updated_at', 'group.id']
+ACTIVITY_LOG_PAGE_LIMIT = 500
+# Overlap applied to the activity log cursor to absorb clock skew with the server.
+SYNC_OVERLAP = timedelta(minutes=1)
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS boards (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    state TEXT,
+    updated_at TEXT,
+    synced_at TEXT
+);
+CREATE TABLE IF NOT EXISTS columns (
+    board_id INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    title TEXT,
+    type TEXT,
+    settings_str TEXT,
+    position INTEGER,
+    PRIMARY KEY (board_id, id)
+);
+CREATE TABLE IF NOT EXISTS groups (
+    board_id INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    title TEXT,
+    color TEXT,
+    position TEXT,
+    PRIMARY KEY (board_id, id)
+);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    board_id INTEGER NOT NULL,
+    group_id TEXT,
+    name TEXT,
+    state TEXT,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_items_board_group ON items (board_id, group_id);
+CREATE INDEX IF NOT EXISTS ix_items_board_name ON items (board_id, name);
+CREATE TABLE IF NOT EXISTS column_values (
+    item_id INTEGER NOT NULL,
+    column_id TEXT NOT NULL,
+    text TEXT,
+    value TEXT,
+    PRIMARY KEY (item_id, column_id)
+) WITHOUT ROWID;
+'''
+
+
+class BoardMirror(object):
+    """A local SQLite mirror of a board.
+
+        The mirror stores the board's columns, groups, items and raw column values.  After
+        a full initial load, `sync` applies deltas pulled from the board's activity logs and
+        falls back to scanning item `updated_at` values when activity logs are unavailable.
+
+        Properties
+
+            board_id : `str`
+                The mirrored board's unique identifier.
+            path : `str`
+                The SQLite database path.
+            indexed_columns : `list[str]`
+                The ids of the columns whose values are indexed.
+            synced_at : `datetime`
+                The time of the last load or sync.
+
+        Methods
+
+            load : `int`
+                Fully load the board into the mirror.
+            sync : `int`
+                Apply changes made since the last load or sync.
+            get_board : `moncli.entities.Board`
+                Get the mirrored board with its columns.
+            get_item : `moncli.entities.Item`
+                Get a mirrored item by unique identifier.
+            get_items : `list[moncli.entities.Item]`
+                Get mirrored items filtered by group, name and column values.
+            close : `void`
+                Close the database connection.
+    """
+
+    def __init__(self, board_id: str, path: str = ':memory:', api_key: str = None, indexed_columns: list = None):
+        self.board_id = str(board_id)
+        self.path = path
+        self.indexed_columns = list(indexed_columns or [])
+        self.__creds = en.MondayClientCredentials(api_key)
+        self.__board = None
+        self.__lock = threading.RLock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        self.__connection.row_factory = sqlite3.Row
+        with self.__connection:
+            self.__connection.executescript(_SCHEMA)
+            for column_id in self.indexed_columns:
+                self.__create_column_index(column_id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def synced_at(self):
+        """The time of the last load or sync."""
+
+        row = self.__execute('SELECT synced_at FROM boards WHERE id = ?', (int(self.board_id),)).fetchone()
+        if not row or not row['synced_at']:
+            return None
+        return datetime.fromisoformat(row['synced_at'])
+
+    def close(self):
+        """Close the database connection."""
+
+        with self.__lock:
+            self.__connection.close()
+
+    def load(self, limit: int = 100):
+        """Fully load the board into the mirror.
+
+            Parameters
+
+                limit : `int`
+                    Number of items to get per page.
+
+            Returns
+
+                count : `int`
+                    The number of loaded items.
+        """
+
+        synced_at = datetime.now(timezone.utc)
+        board = en.Board(creds=self.__creds, id=self.board_id)
+        self.__load_schema()
+
+        count = 0
+        with self.__lock, self.__connection:
+            self.__connection.execute('DELETE FROM column_values WHERE item_id IN (SELECT id FROM items WHERE board_id = ?)', (int(self.board_id),))
+            self.__connection.execute('DELETE FROM items WHERE board_id = ?', (int(self.board_id),))
+            for items_data in board._get_item_data_pages(True, *['items.{}'.format(field) for field in ITEM_FIELDS], limit=limit):
+                self.__save_items(items_data)
+                count += len(items_data)
+            self.__set_synced_at(synced_at)
+        return count
+
+    def sync(self, limit: int = 100):
+        """Apply changes made since the last load or sync.
+
+            Changed items are found using the board's activity logs, falling back to a
+            `updated_at` scan of the board's items.  The board is fully loaded if it has
+            never been synced.
+
+            Parameters
+
+                limit : `int`
+                    Number of items to get per page for `updated_at` scans.
+
+            Returns
+
+                count : `int`
+                    The number of refreshed or removed items.
+        """
+
+        synced_at = self.synced_at
+        if not synced_at:
+            return self.load(limit)
+
+        now = datetime.now(timezone.utc)
+        try:
+            changed_ids, deleted_ids, schema_changed = self.__get_activity_changes(synced_at - SYNC_OVERLAP)
+        except api.MondayApiError:
+            changed_ids, deleted_ids = self.__get_updated_at_changes(limit)
+            schema_changed = False
+
+        if schema_changed:
+            self.__load_schema()
+        with self.__lock, self.__connection:
+            self.__delete_items(deleted_ids)
+            changed_ids = [id for id in changed_ids if id not in deleted_ids]
+            items_data, _ = batch.get_items_data(
+                changed_ids,
+                *(ITEM_FIELDS + ['board.id'] + ['column_values.{}'.format(field) for field in api.DEFAULT_COLUMN_VALUE_QUERY_FIELDS]),
+                api_key=self.__creds.api_key_v2)
+            # Items that moved to another board or can no longer be found are removed.
+            found = [data for data in items_data if str((data.get('board') or {}).get('id', self.board_id)) == self.board_id]
+            self.__delete_items(set(changed_ids) - set(str(data['id']) for data in found))
+            self.__save_items(found)
+            self.__set_synced_at(now)
+        return len(changed_ids) + len(deleted_ids)
+
+    def get_board(self):
+        """Get the mirrored board with its columns.
+
+            Returns
+
+                board : `moncli.entities.Board`
+                    The mirrored board.
+        """
+
+        if not self.__board:
+            row = self.__execute('SELECT * FROM boards WHERE id = ?', (int(self.board_id),)).fetchone()
+            if not row:
+                raise BoardError('board_not_mirrored', self.board_id, 'Board has not been loaded into the mirror.')
+            columns = [
+                {'id': column['id'], 'title': column['title'], 'type': column['type'], 'settings_str': column['settings_str']}
+                for column in self.__execute('SELECT * FROM columns WHERE board_id = ? ORDER BY position', (int(self.board_id),))]
+            self.__board = en.Board(creds=self.__creds, id=self.board_id, name=row['name'], state=row['state'], updated_at=row['updated_at'], columns=columns)
+        return self.__board
+
+    def get_item(self, id: str, as_model: type = None):
+        """Get a mirrored item by unique identifier.
+
+            Parameters
+
+                id : `str`
+                    The item's unique identifier.
+                as_model: `type`
+                    The MondayModel subclass to be returned.
+
+            Returns
+
+                item : `moncli.entities.Item`
+                    The mirrored item, or None if the item is not mirrored.
+        """
+
+        items = self.__query_items('items.id = ?', [int(id)], as_model=as_model)
+        return items[0] if items else None
+
+    def get_items(self, group_id: str = None, name: str = None, column_values: dict = None, limit: int = None, as_model: type = None):
+        """Get mirrored items filtered by group, name and column values.
+
+            Parameters
+
+                group_id : `str`
+                    The unique identifier of the group containing the items.
+                name : `str`
+                    The item name to match.
+                column_values : `dict`
+                    Column values to match, as text keyed by column id.
+                limit : `int`
+                    The maximum number of items to return.
+                as_model: `type`
+                    The MondayModel subclass to be returned.
+
+            Returns
+
+                items : `list[moncli.entities.Item]`
+                    The matching items.
+        """
+
+        conditions = ['items.board_id = ?']
+        parameters = [int(self.board_id)]
+        if group_id:
+            conditions.append('items.group_id = ?')
+            parameters.append(group_id)
+        if name:
+            conditions.append('items.name = ?')
+            parameters.append(name)
+        for column_id, text in (column_values or {}).items():
+            conditions.append('items.id IN (SELECT item_id FROM column_values WHERE column_id = ? AND text = ?)')
+            parameters.extend([column_id, text])
+        return self.__query_items(' AND '.join(conditions), parameters, limit, as_model)
+
+    def __query_items(self, where: str, parameters: list, limit: int = None, as_model: type = None):
+        if as_model and not issubclass(as_model, MondayModel):
+            raise BoardError('invalid_as_model_parameter', self.board_id, 'as_model parameter must be of MondayModel Type')
+
+        query = 'SELECT * FROM items WHERE {} ORDER BY items.id'.format(where)
+        if limit:
+            query += ' LIMIT {}'.format(int(limit))
+        rows = self.__execute(query, parameters).fetchall()
+        if not rows:
+            return []
+
+        board = self.get_board()
+        groups = {
+            row['id']: en.Group(creds=self.__creds, __board=board, id=row['id'], title=row['title'], color=row['color'], position=row['position'])
+            for row in self.__execute('SELECT * FROM groups WHERE board_id = ?', (int(self.board_id),))}
+        column_values = {}
+        item_ids = [row['id'] for row in rows]
+        for index in range(0, len(item_ids), 500):
+            chunk = item_ids[index:index + 500]
+            for value in self.__execute(
+                'SELECT * FROM column_values WHERE item_id IN ({})'.format(', '.join('?' * len(chunk))), chunk):
+                column_values.setdefault(value['item_id'], []).append({'id': value['column_id'], 'text': value['text'], 'value': value['value']})
+
+        column_ids = set(column.id for column in board.columns)
+        items = []
+        for row in rows:
+            values = [value for value in column_values.get(row['id'], []) if value['id'] in column_ids]
+            items.append(en.Item(
+                creds=self.__creds,
+                __board=board,
+                __group=groups.get(row['group_id']),
+                id=str(row['id']),
+                name=row['name'],
+                state=row['state'],
+                created_at=row['created_at'],
+                updated_at=row['updated_at'],
+                column_values=values))
+        if not as_model:
+            return items
+        return [as_model(item) for item in items]
+
+    def __load_schema(self):
+        board_data = api.get_boards(
+            *(['id', 'name', 'state', 'updated_at'] +
+              ['columns.{}'.format(field) for field in api.DEFAULT_COLUMN_QUERY_FIELDS] +
+              ['groups.{}'.format(field) for field in ('id', 'title', 'color', 'position')]),
+            api_key=self.__creds.api_key_v2,
+            ids=[int(self.board_id)],
+            limit=1)
+        if not board_data:
+            raise BoardError('board_not_found', self.board_id, 'Could not find board with ID "{}".'.format(self.board_id))
+        board_data = board_data[0]
+        board_id = int(self.board_id)
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'INSERT INTO boards (id, name, state, updated_at) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT (id) DO UPDATE SET name = excluded.name, state = excluded.state, updated_at = excluded.updated_at',
+                (board_id, board_data.get('name'), board_data.get('state'), board_data.get('updated_at')))
+            self.__connection.execute('DELETE FROM columns WHERE board_id = ?', (board_id,))
+            self.__connection.executemany(
+                'INSERT INTO columns (board_id, id, title, type, settings_str, position) VALUES (?, ?, ?, ?, ?, ?)',
+                [(board_id, column['id'], column.get('title'), column.get('type'), column.get('settings_str'), position)
+                 for position, column in enumerate(board_data.get('columns') or [])])
+            self.__connection.execute('DELETE FROM groups WHERE board_id = ?', (board_id,))
+            self.__connection.executemany(
+                'INSERT INTO groups (board_id, id, title, color, position) VALUES (?, ?, ?, ?, ?)',
+                [(board_id, group['id'], group.get('title'), group.get('color'), group.get('position'))
+                 for group in board_data.get('groups') or []])
+        self.__board = None
+
+    def __get_activity_changes(self, since: datetime):
+        board = en.Board(creds=self.__creds, id=self.board_id)
+        changed_ids, deleted_ids = {}, set()
+        schema_changed = False
+        page = 1
+        while True:
+            activity_logs = board.get_activity_logs(
+                **{'from': since.strftime('%Y-%m-%dT%H:%M:%SZ'), 'limit': ACTIVITY_LOG_PAGE_LIMIT, 'page': page})
+            for log in activity_logs:
+                if log.event in SCHEMA_EVENTS:
+                    schema_changed = True
+                item_ids = _get_activity_item_ids(log)
+                if log.event in DELETE_EVENTS:
+                    deleted_ids.update(item_ids)
+                else:
+                    changed_ids.update((id, None) for id in item_ids)
+            if len(activity_logs) < ACTIVITY_LOG_PAGE_LIMIT:
+                break
+            page += 1
+        return list(changed_ids), deleted_ids, schema_changed
+
+    def __get_updated_at_changes(self, limit: int):
+        board = en.Board(creds=self.__creds, id=self.board_id)
+        stored = {
+            str(row['id']): row['updated_at']
+            for row in self.__execute('SELECT id, updated_at FROM items WHERE board_id = ?', (int(self.board_id),))}
+        changed_ids, remote_ids = [], set()
+        for items_data in board._get_item_data_pages(False, 'id', 'updated_at', limit=limit):
+            for data in items_data:
+                id = str(data['id'])
+                remote_ids.add(id)
+                if id not in stored or stored[id] != data.get('updated_at'):
+                    changed_ids.append(id)
+        return changed_ids, set(stored) - remote_ids
+
+    def __save_items(self, items_data: list):
+        board_id = int(self.board_id)
+        self.__connection.executemany(
+            'INSERT OR REPLACE INTO items (id, board_id, group_id, name, state, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [(int(data['id']), board_id, (data.get('group') or {}).get('id'), data.get('name'), data.get('state'), data.get('created_at'), data.get('updated_at'))
+             for data in items_data])
+        self.__connection.executemany(
+            'DELETE FROM column_values WHERE item_id = ?',
+            [(int(data['id']),) for data in items_data if data.get('column_values') is not None])
+        self.__connection.executemany(
+            'INSERT INTO column_values (item_id, column_id, text, value) VALUES (?, ?, ?, ?)',
+            [(int(data['id']), value['id'], value.get('text'), value.get('value'))
+             for data in items_data for value in data.get('column_values') or []])
+
+    def __delete_items(self, item_ids):
+        ids = [(int(id),) for id in item_ids]
+        self.__connection.executemany('DELETE FROM column_values WHERE item_id = ?', ids)
+        self.__connection.executemany('DELETE FROM items WHERE id = ?', ids)
+
+    def __set_synced_at(self, synced_at: datetime):
+        self.__connection.execute('UPDATE boards SET synced_at = ? WHERE id = ?', (synced_at.isoformat(), int(self.board_id)))
+
+    def __create_column_index(self, column_id: str):
+        index_name = 'ix_column_values_{}'.format(re.sub(r'\W', '_', column_id))
+        # Partial indexes only accept literals in their WHERE clause.
+        self.__connection.execute(
+            "CREATE INDEX IF NOT EXISTS {} ON column_values (text, item_id) WHERE column_id = '{}'".format(index_name, column_id.replace("'", "''")))
+
+    def __execute(self, query: str, parameters = ()):
+        with self.__lock:
+            return self.__connection.execute(query, parameters)
+
+
+def _get_activity_item_ids(activity_log: en.ActivityLog):
+    """Get the unique identifiers of the items affected by an activity log."""
+
+    try:
+        data = json.loads(activity_log.data) if activity_log.data else {}
+    except ValueError:
+        return []
+    item_ids = []
+    for key in ITEM_ID_KEYS:
+        value = data.get(key)
+        if value is None:
+            continue
+        for id in (value if isinstance(value, list) else [value]):
+            item_ids.append(str(id))
+    return item_ids
@@ -0,0 +1,388 @@
+import hashlib, json, logging, sqlite3, threading, time
+from datetime import datetime, timezone
+
+from . import api
+from .batch import map_chunks
+from .entities import MondayClientCredentials
+from .enums import Priority
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 25
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_ATTEMPTS = 5
+# Seconds to wait before retrying a failed mutation, doubled per attempt.
+RETRY_BACKOFF = 2
+MAX_RETRY_BACKOFF = 300
+
+PENDING = 'pending'
+SENDING = 'sending'
+SENT = 'sent'
+SUPERSEDED = 'superseded'
+FAILED = 'failed'
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS mutations (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL,
+    board_id INTEGER NOT NULL,
+    item_id INTEGER NOT NULL,
+    column_id TEXT NOT NULL,
+    value TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_mutations_status ON mutations (status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS ix_mutations_item_column ON mutations (item_id, column_id, status);
+CREATE INDEX IF NOT EXISTS ix_mutations_key ON mutations (key);
+'''
+
+
+class Outbox(object):
+    """A durable queue of column value changes backed by SQLite.
+
+        Changes are saved before they are sent, and sent in batches of items by `flush` or a
+        background worker.  Each change of an item's column to a value is identified by an
+        idempotency key hashed from the item, column and value: queueing a change that is
+        already pending or being sent does nothing, and a later change of the same column supersedes the
+        pending one.  Changes of an item are merged into one `change_multiple_column_values`
+        mutation.  Changes that were being sent when the process stopped are sent again on
+        the next flush, which is safe because setting the same values again has no effect.
+
+        Properties
+
+            path : `str`
+                The SQLite database path.
+            batch_size : `int`
+                The number of items whose changes are claimed per batch.
+            workers : `int`
+                The number of mutations sent at the same time.
+            max_attempts : `int`
+                The number of attempts after which a change fails.
+
+        Methods
+
+            change_column_value : `str`
+                Queue a change of an item's column value.
+            change_multiple_column_values : `list[str]`
+                Queue changes of an item's column values.
+            flush : `int`
+                Send the pending changes.
+            start : `void`
+                Flush the pending changes in a background thread.
+            stop : `void`
+                Stop the background thread.
+            get_status : `str`
+                Get the status of the latest change with an idempotency key.
+            get_counts : `dict`
+                Get the number of changes per status.
+            get_mutations : `list[dict]`
+                Get the queued changes.
+            close : `void`
+                Close the database connection.
+    """
+
+    def __init__(self, path: str = ':memory:', api_key: str = None, batch_size: int = DEFAULT_BATCH_SIZE, workers: int = DEFAULT_WORKERS, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        self.path = path
+        self.batch_size = batch_size
+        self.workers = workers
+        self.max_attempts = max_attempts
+        # Outbox mutations yield to interactive requests when a request scheduler is used.
+        self.__creds = MondayClientCredentials(api_key, Priority.bulk)
+        self.__lock = threading.RLock()
+        self.__flush_lock = threading.Lock()
+        self.__stopped = threading.Event()
+        self.__thread = None
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        self.__connection.row_factory = sqlite3.Row
+        with self.__connection:
+            self.__connection.executescript(_SCHEMA)
+        self.__recover()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Stop the background thread and close the database connection."""
+
+        self.stop()
+        with self.__lock:
+            self.__connection.close()
+
+    def change_column_value(self, board_id: str, item_id: str, column_id: str, value):
+        """Queue a change of an item's column value.
+
+            Parameters
+
+                board_id : `str`
+                    The board's unique identifier.
+                item_id : `str`
+                    The item's unique identifier.
+                column_id : `str`
+                    The column's unique identifier.
+                value : `object`
+                    The column value in the monday.com API format.
+
+            Returns
+
+                key : `str`
+                    The idempotency key of the change.
+        """
+
+        return self.change_multiple_column_values(board_id, item_id, {column_id: value})[0]
+
+    def change_multiple_column_values(self, board_id: str, item_id: str, column_values):
+        """Queue changes of an item's column values.
+
+            Parameters
+
+                board_id : `str`
+                    The board's unique identifier.
+                item_id : `str`
+                    The item's unique identifier.
+                column_values : `list[moncli.entities.ColumnValue] / dict`
+                    The column values to change, as column values or a dictionary in the monday.com API format.
+
+            Returns
+
+                keys : `list[str]`
+                    The idempotency keys of the changes.
+        """
+
+        if isinstance(column_values, list):
+            column_values = {column_value.id: column_value.format() for column_value in column_values}
+        now = _now()
+        keys = []
+        with self.__lock, self.__connection:
+            for column_id, value in column_values.items():
+                key = get_idempotency_key(item_id, column_id, value)
+                value = json.dumps(value, sort_keys=True)
+                keys.append(key)
+                queued = {row['status']: row['key'] for row in self.__connection.execute(
+                    'SELECT key, status FROM mutations WHERE item_id = ? AND column_id = ? AND status IN (?, ?)',
+                    (int(item_id), column_id, PENDING, SENDING))}
+                if queued.get(PENDING) == key:
+                    continue
+                self.__connection.execute(
+                    'UPDATE mutations SET status = ?, updated_at = ? WHERE item_id = ? AND column_id = ? AND status = ?',
+                    (SUPERSEDED, now, int(item_id), column_id, PENDING))
+                # A change being sent is sent again if it fails, unless superseded.
+                if queued.get(SENDING) == key:
+                    continue
+                self.__connection.execute(
+                    'INSERT INTO mutations (key, board_id, item_id, column_id, value, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    (key, int(board_id), int(item_id), column_id, value, PENDING, now, now))
+        return keys
+
+    def flush(self, wait: bool = False):
+        """Send the pending changes in batches of items.
+
+            Parameters
+
+                wait : `bool`
+                    Wait for changes whose retry is not due yet instead of leaving them pending.
+
+            Returns
+
+                count : `int`
+                    The number of sent changes.
+        """
+
+        count = 0
+        with self.__flush_lock:
+            while True:
+                batch = self.__claim()
+                if not batch:
+                    next_attempt_at = self.__get_next_attempt_at()
+                    if not wait or next_attempt_at is None:
+                        return count
+                    time.sleep(max(0, next_attempt_at - time.time()))
+                    continue
+                for rows, error in map_chunks(self.__send, batch, 1, self.workers):
+                    if error:
+                        logger.warning('Unable to send %d changes of item %s: %s', len(rows), rows[0]['item_id'], _format_error(error))
+                    count += self.__complete(rows, error)
+
+    def start(self, interval: float = 1.0):
+        """Flush the pending changes in a background thread.
+
+            Parameters
+
+                interval : `float`
+                    The seconds between flushes.
+        """
+
+        if self.__thread:
+            return
+        self.__stopped.clear()
+
+        def run():
+            while not self.__stopped.is_set():
+                try:
+                    self.flush()
+                except Exception:
+                    logger.exception('Outbox flush failed.')
+                self.__stopped.wait(interval)
+
+        self.__thread = threading.Thread(target=run, name='moncli-outbox', daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """Stop the background thread after its current flush."""
+
+        if not self.__thread:
+            return
+        self.__stopped.set()
+        self.__thread.join()
+        self.__thread = None
+
+    def get_status(self, key: str):
+        """Get the status (pending / sending / sent / superseded / failed) of the latest change with an idempotency key, or None."""
+
+        row = self.__execute('SELECT status FROM mutations WHERE key = ? ORDER BY seq DESC LIMIT 1', (key,)).fetchone()
+        return row['status'] if row else None
+
+    def get_counts(self):
+        """Get the number of changes per status."""
+
+        rows = self.__execute('SELECT status, COUNT(*) AS count FROM mutations GROUP BY status').fetchall()
+        return {row['status']: row['count'] for row in rows}
+
+    def get_mutations(self, status: str = None):
+        """Get the queued changes in order, optionally with a status.
+
+            Parameters
+
+                status : `str`
+                    The status of the changes to get.
+
+            Returns
+
+                mutations : `list[dict]`
+                    The changes with their key, board, item, column, value, status, attempts and last error.
+        """
+
+        query = 'SELECT * FROM mutations'
+        parameters = ()
+        if status:
+            query += ' WHERE status = ?'
+            parameters = (status,)
+        rows = self.__execute(query + ' ORDER BY seq', parameters).fetchall()
+        return [dict(row, board_id=str(row['board_id']), item_id=str(row['item_id']), value=json.loads(row['value'])) for row in rows]
+
+    def __recover(self):
+        # Changes claimed by a stopped process are sent again unless they were superseded since.
+        now = _now()
+        with self.__lock, self.__connection:
+            self.__connection.execute('''
+                UPDATE mutations SET status = ?, updated_at = ?
+                WHERE status = ? AND EXISTS (
+                    SELECT 1 FROM mutations AS newer
+                    WHERE newer.item_id = mutations.item_id AND newer.column_id = mutations.column_id AND newer.status = ?)''',
+                (SUPERSEDED, now, SENDING, PENDING))
+            self.__connection.execute('UPDATE mutations SET status = ?, updated_at = ? WHERE status = ?', (PENDING, now, SENDING))
+
+    def __claim(self):
+        now = _now()
+        with self.__lock, self.__connection:
+            item_ids = [row['item_id'] for row in self.__connection.execute('''
+                SELECT item_id FROM mutations WHERE status = ? AND next_attempt_at <= ?
+                GROUP BY item_id ORDER BY MIN(seq) LIMIT ?''', (PENDING, time.time(), self.batch_size))]
+            if not item_ids:
+                return []
+            placeholders = ', '.join('?' for _ in item_ids)
+            rows = self.__connection.execute(
+                'SELECT * FROM mutations WHERE status = ? AND item_id IN ({}) ORDER BY seq'.format(placeholders),
+                [PENDING] + item_ids).fetchall()
+            self.__connection.execute(
+                'UPDATE mutations SET status = ?, updated_at = ? WHERE status = ? AND item_id IN ({})'.format(placeholders),
+                [SENDING, now, PENDING] + item_ids)
+        batch = {}
+        for row in rows:
+            batch.setdefault(row['item_id'], []).append(row)
+        return list(batch.values())
+
+    def __send(self, chunk: list):
+        rows = chunk[0]
+        column_values = {row['column_id']: json.loads(row['value']) for row in rows}
+        try:
+            api.change_multiple_column_value(str(rows[0]['item_id']), str(rows[0]['board_id']), column_values, 'id', api_key=self.__creds.api_key_v2)
+        except Exception as error:
+            return rows, error
+        return rows, None
+
+    def __complete(self, rows: list, error: Exception):
+        now = _now()
+        seqs = [row['seq'] for row in rows]
+        placeholders = ', '.join('?' for _ in seqs)
+        with self.__lock, self.__connection:
+            if not error:
+                self.__connection.execute(
+                    'UPDATE mutations SET status = ?, attempts = attempts + 1, error = NULL, updated_at = ? WHERE seq IN ({})'.format(placeholders),
+                    [SENT, now] + seqs)
+                return len(rows)
+            # Changes of an item may have been queued at different times and retried a different number of times.
+            for row in rows:
+                attempts = row['attempts'] + 1
+                status = FAILED if attempts >= self.max_attempts else PENDING
+                next_attempt_at = time.time() + min(MAX_RETRY_BACKOFF, RETRY_BACKOFF ** attempts)
+                self.__connection.execute(
+                    'UPDATE mutations SET status = ?, attempts = ?, next_attempt_at = ?, error = ?, updated_at = ? WHERE seq = ?',
+                    (status, attempts, next_attempt_at, _format_error(error), now, row['seq']))
+            # Changes queued for the same columns while these were sent supersede them.
+            self.__connection.execute('''
+                UPDATE mutations SET status = ?
+                WHERE seq IN ({}) AND status = ? AND EXISTS (
+                    SELECT 1 FROM mutations AS newer
+                    WHERE newer.item_id = mutations.item_id AND newer.column_id = mutations.column_id AND newer.status = ? AND newer.seq > mutations.seq)'''.format(placeholders),
+                [SUPERSEDED] + seqs + [PENDING, PENDING])
+        return 0
+
+    def __get_next_attempt_at(self):
+        row = self.__execute('SELECT MIN(next_attempt_at) AS next_attempt_at FROM mutations WHERE status = ?', (PENDING,)).fetchone()
+        return row['next_attempt_at']
+
+    def __execute(self, query: str, parameters: tuple = ()):
+        with self.__lock:
+            return self.__connection.execute(query, parameters)
+
+
+def get_idempotency_key(item_id: str, column_id: str, value):
+    """Get the idempotency key of a change of an item's column to a value.
+
+        Parameters
+
+            item_id : `str`
+                The item's unique identifier.
+            column_id : `str`
+                The column's unique identifier.
+            value : `object`
+                The column value in the monday.com API format.
+
+        Returns
+
+            key : `str`
+                The hex digest identifying the change.
+    """
+
+    value_hash = hashlib.sha256(json.dumps(value, sort_keys=True).encode('utf-8')).hexdigest()
+    return hashlib.sha256('{}:{}:{}'.format(item_id, column_id, value_hash).encode('utf-8')).hexdigest()
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _format_error(error: Exception):
+    messages = getattr(error, 'messages', None)
+    if messages:
+        return json.dumps(messages) if not isinstance(messages, str) else messages
+    return str(error) or type(error).__name__
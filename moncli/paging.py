@@ -0,0 +1,191 @@
+import threading, time
+
+from . import api
+
+
+DEFAULT_TARGET_COMPLEXITY = 500000
+DEFAULT_TARGET_SECONDS = 2.0
+DEFAULT_MIN_LIMIT = 25
+DEFAULT_MAX_LIMIT = 800
+DEFAULT_INITIAL_LIMIT = 100
+
+
+class PageSizer(object):
+    """Chooses page sizes from the complexity and duration observed for each query shape.
+
+    Pages are offset based, so a query keeps its page size until the offset reached is a
+    multiple of the new size.  Page sizes are the initial size doubled or halved within the
+    bounds, which lets a paginator switch sizes every page or two.
+
+    Properties
+
+        target_complexity : `int`
+            The complexity a page should cost.
+        target_seconds : `float`
+            The seconds a page should take.
+        min_limit : `int`
+            The smallest page size.
+        max_limit : `int`
+            The largest page size.
+        initial_limit : `int`
+            The page size used before a query shape is observed.
+        smoothing : `float`
+            The weight of the latest page in the observed averages, between 0 and 1.
+
+    Methods
+
+        get_limit : `int`
+            Get the page size for the next page of a query shape.
+        observe : `void`
+            Record the complexity and duration of a page.
+        get_stats : `dict`
+            Get the observed per-item complexity and seconds of a query shape.
+    """
+
+    def __init__(self, target_complexity: int = DEFAULT_TARGET_COMPLEXITY, target_seconds: float = DEFAULT_TARGET_SECONDS, min_limit: int = DEFAULT_MIN_LIMIT,
+            max_limit: int = DEFAULT_MAX_LIMIT, initial_limit: int = DEFAULT_INITIAL_LIMIT, smoothing: float = 0.5):
+        if not 0 < min_limit <= initial_limit <= max_limit:
+            raise ValueError('Page sizes must satisfy 0 < min_limit <= initial_limit <= max_limit.')
+        if not 0 < smoothing <= 1:
+            raise ValueError('smoothing must be between 0 and 1.')
+        self.target_complexity = target_complexity
+        self.target_seconds = target_seconds
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.initial_limit = initial_limit
+        self.smoothing = smoothing
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def get_limit(self, key, offset: int = 0, limit: int = None):
+        """Get the page size for the next page of a query shape.
+
+            Parameters
+
+                key : `object`
+                    The query shape, e.g. the query name, board and fields.
+                offset : `int`
+                    The number of items already paged through.
+                limit : `int`
+                    The current page size, kept if the offset does not allow the new one.
+
+            Returns
+
+                limit : `int`
+                    The page size.
+        """
+
+        target = self._get_target(key)
+        sizes = self._get_sizes()
+        fitting = [size for size in sizes if size <= target] or sizes[:1]
+        for size in reversed(fitting):
+            if offset % size == 0:
+                return size
+        return limit or sizes[0]
+
+    def observe(self, key, limit: int, count: int, complexity: int = None, seconds: float = None):
+        """Record the complexity and duration of a page.
+
+            Parameters
+
+                key : `object`
+                    The query shape.
+                limit : `int`
+                    The page size requested.  Complexity is charged for the requested size.
+                count : `int`
+                    The number of items returned.
+                complexity : `int`
+                    The complexity charged for the page, if known.
+                seconds : `float`
+                    The seconds the page took, if known.
+        """
+
+        with self._lock:
+            stats = self._stats.setdefault(key, {'complexity': None, 'seconds': None, 'pages': 0})
+            if complexity is not None and limit:
+                stats['complexity'] = self._average(stats['complexity'], complexity / limit)
+            # A short page only tells how long its returned items took.
+            if seconds is not None and count:
+                stats['seconds'] = self._average(stats['seconds'], seconds / max(count, 1))
+            stats['pages'] += 1
+
+    def get_stats(self, key):
+        """Get the observed per-item complexity and seconds and the number of observed pages of a query shape."""
+
+        with self._lock:
+            return dict(self._stats.get(key) or {'complexity': None, 'seconds': None, 'pages': 0})
+
+    def _average(self, average: float, value: float):
+        if average is None:
+            return value
+        return self.smoothing * value + (1 - self.smoothing) * average
+
+    def _get_target(self, key):
+        stats = self.get_stats(key)
+        if not stats['pages']:
+            return self.initial_limit
+        targets = [self.max_limit]
+        if stats['complexity']:
+            targets.append(self.target_complexity / stats['complexity'])
+        if stats['seconds']:
+            targets.append(self.target_seconds / stats['seconds'])
+        return min(targets)
+
+    def _get_sizes(self):
+        size = self.initial_limit
+        while size // 2 >= self.min_limit:
+            size //= 2
+        sizes = []
+        while size <= self.max_limit:
+            sizes.append(size)
+            size *= 2
+        return sizes
+
+
+def iter_pages(fetch_page, key = None, page_sizer: PageSizer = None, limit: int = None, page: int = None):
+    """Page through a query, sizing the pages with a page sizer unless a limit or page is given.
+
+        Parameters
+
+            fetch_page : `callable`
+                Called with a page number and page size, returning the page's results.
+            key : `object`
+                The query shape observed by the page sizer.
+            page_sizer : `moncli.paging.PageSizer`
+                The page sizer.  Pages have a fixed size without one.
+            limit : `int`
+                A fixed page size.
+            page : `int`
+                The page number to start from, starting at 1.
+
+        Returns
+
+            pages : `generator[list]`
+                The non-empty pages.
+    """
+
+    if page_sizer is None or limit is not None or page is not None:
+        limit = limit or DEFAULT_INITIAL_LIMIT
+        page = page or 1
+        while True:
+            results = fetch_page(page, limit)
+            if results:
+                yield results
+            if len(results) < limit:
+                return
+            page += 1
+
+    offset = 0
+    limit = page_sizer.get_limit(key)
+    while True:
+        start = time.perf_counter()
+        with api.observe_requests() as requests:
+            results = fetch_page(offset // limit + 1, limit)
+        complexities = [request['complexity'] for request in requests if request['complexity'] is not None]
+        page_sizer.observe(key, limit, len(results), sum(complexities) if complexities else None, time.perf_counter() - start)
+        if results:
+            yield results
+        if len(results) < limit:
+            return
+        offset += limit
+        limit = page_sizer.get_limit(key, offset, limit)
@@ -0,0 +1,155 @@
+import json
+
+from . import api, batch, entities as en
+from .enums import ColumnType
+from .error import ItemError
+from .schema import SchemaCache
+
+
+class RelationResolver(object):
+    """Resolves board relation (item link) columns across boards in bulk.
+
+    All linked item ids of a hop are collected and fetched in chunked `items(ids:[...])`
+    queries grouped by target board, and the schemas of the linked boards are loaded once
+    through a schema cache, so following links costs a few queries instead of one query per
+    linked item.  Links of columns relating several boards are fetched together with their
+    board ids, since the board of a linked item is only known once it is fetched.
+
+    Properties
+
+        schema_cache : `moncli.schema.SchemaCache`
+            The cache providing the linked board schemas.
+        chunk_size : `int`
+            The number of linked items per query.
+
+    Methods
+
+        resolve : `dict`
+            Load the items linked by a relation column.
+    """
+
+    def __init__(self, creds: en.MondayClientCredentials = None, schema_cache: SchemaCache = None, chunk_size: int = batch.ITEMS_IDS_LIMIT):
+        self.schema_cache = schema_cache if schema_cache is not None else SchemaCache()
+        self.chunk_size = chunk_size
+        self.__creds = creds or en.MondayClientCredentials(None)
+
+    def resolve(self, items: list, column, depth: int = None, as_model = None):
+        """Load the items linked by a relation column.
+
+            The linked items are attached to each relation column value as `linked_items`.
+
+            Parameters
+
+                items : `list[moncli.entities.Item]`
+                    The items whose links are resolved.
+                column : `str | list[str]`
+                    The relation column id or title, or one column per hop for multi-hop joins.
+                    A single column is followed on every hop.
+                depth : `int`
+                    The maximum number of hops, 1 for a single column or the number of columns by default.
+                as_model : `type | dict`
+                    The MondayModel subclass the linked items are converted to, or a subclass per board id.
+
+            Returns
+
+                links : `dict`
+                    The linked items or models of every resolved item, keyed by item id.
+        """
+
+        path = [column] if isinstance(column, str) else list(column)
+        depth = depth if depth is not None else len(path)
+        loaded = {str(item.id): item for item in items}
+        links = {}
+        level = list(items)
+        for hop in range(depth):
+            if not level:
+                break
+            key = path[min(hop, len(path) - 1)]
+            values = []
+            board_ids = []
+            missing = {}
+            for item in level:
+                relation = self._get_relation_column(item, key, required=hop == 0)
+                if not relation:
+                    continue
+                value = item.column_values[relation.id]
+                values.append((item, value))
+                relation_board_ids = [str(board_id) for board_id in json.loads(relation.settings_str or '{}').get('boardIds', [])]
+                board_ids.extend(relation_board_ids)
+                target = relation_board_ids[0] if len(relation_board_ids) == 1 else None
+                for id in value.value or []:
+                    if str(id) not in loaded:
+                        missing.setdefault(str(id), target)
+
+            # Load the linked board schemas in one batch before building the linked items.
+            self.schema_cache.get_boards(board_ids, self.__creds)
+            targets = {}
+            for id, target in missing.items():
+                targets.setdefault(target, []).append(id)
+            level = [item for target, ids in targets.items() for item in self._get_items(ids, target)]
+            loaded.update((str(item.id), item) for item in level)
+
+            for item, value in values:
+                value.linked_items = [self._convert(loaded[str(id)], as_model) for id in value.value or [] if str(id) in loaded]
+                links[str(item.id)] = value.linked_items
+        return links
+
+    def _get_relation_column(self, item: en.Item, key: str, required: bool = False):
+        try:
+            relation = item.board.columns[key]
+        except KeyError:
+            if not required:
+                return None
+            raise ItemError('invalid_relation_column', item.id, 'Item board contains no column "{}".'.format(key))
+        if relation.column_type != ColumnType.board_relation:
+            raise ItemError('invalid_relation_column', item.id, 'Column "{}" is not a board relation column.'.format(key))
+        return relation
+
+    def _get_items(self, ids: list, board_id: str = None):
+        # Items of a known board are built with its schema; others are built with the board they are returned with.
+        fields = list(api.DEFAULT_ITEM_QUERY_FIELDS) + ['column_values.{}'.format(field) for field in api.DEFAULT_COLUMN_VALUE_QUERY_FIELDS]
+        if not board_id:
+            fields.append('board.id')
+        items_data, _ = batch.get_items_data(ids, *fields, api_key=self.__creds.api_key_v2, chunk_size=self.chunk_size)
+        if board_id:
+            boards = {board_id: self.schema_cache.get_board(board_id, self.__creds)}
+        else:
+            boards = self.schema_cache.get_boards([(data.get('board') or {}).get('id') for data in items_data], self.__creds)
+        items = []
+        for data in items_data:
+            board = boards.get(board_id or str((data.get('board') or {}).get('id')))
+            data = {key: value for key, value in data.items() if not (board and key == 'board')}
+            items.append(en.Item(creds=self.__creds, __board=board, **data))
+        return items
+
+    def _convert(self, item: en.Item, as_model):
+        if isinstance(as_model, dict):
+            as_model = as_model.get(str(item.board.id))
+        return as_model(item) if as_model else item
+
+
+def resolve_relations(items: list, column, depth: int = None, as_model = None, creds: en.MondayClientCredentials = None, schema_cache: SchemaCache = None):
+    """Load the items linked by a relation column using a `RelationResolver`.
+
+        Parameters
+
+            items : `list[moncli.entities.Item]`
+                The items whose links are resolved.
+            column : `str | list[str]`
+                The relation column id or title, or one column per hop.
+            depth : `int`
+                The maximum number of hops.
+            as_model : `type | dict`
+                The MondayModel subclass the linked items are converted to, or a subclass per board id.
+            creds : `moncli.entities.MondayClientCredentials`
+                The credentials used for the requests.
+            schema_cache : `moncli.schema.SchemaCache`
+                The cache providing the linked board schemas.
+
+        Returns
+
+            links : `dict`
+                The linked items or models of every resolved item, keyed by item id.
+    """
+
+    return RelationResolver(creds, schema_cache).resolve(items, column, depth, as_model)
@@ -0,0 +1,222 @@
+import threading, time
+
+from . import api, entities as en
+from .batch import get_max_chunk_size, map_chunks
+from .utils import unique
+
+
+BOARDS_IDS_LIMIT = 25
+SCHEMA_QUERY_FIELDS = ['id', 'name', 'board_kind', 'state'] + \
+    ['columns.{}'.format(field) for field in api.DEFAULT_COLUMN_QUERY_FIELDS] + \
+    ['groups.{}'.format(field) for field in ('id', 'title', 'color', 'position')]
+BOARD_INCLUDE_QUERY_FIELDS = {
+    'columns': ['columns.{}'.format(field) for field in api.DEFAULT_COLUMN_QUERY_FIELDS],
+    'groups': ['groups.{}'.format(field) for field in api.DEFAULT_GROUP_QUERY_FIELDS],
+    'views': ['views.{}'.format(field) for field in api.DEFAULT_BOARD_VIEW_QUERY_FIELDS]
+}
+SCHEMA_INCLUDE = ('columns', 'groups')
+
+
+class SchemaCache(object):
+    """A thread-safe cache of board schemas (columns and groups).
+
+    Boards are fetched in chunked `boards(ids:[...])` queries, so items from many boards
+    can be built without each item loading its own board.
+
+    Properties
+
+        ttl : `float`
+            Seconds a schema stays valid, or None to keep schemas until invalidated.
+
+    Methods
+
+        get : `moncli.entities.Board`
+            Get a cached board's schema without fetching it.
+        get_board : `moncli.entities.Board`
+            Get a board's schema, fetching it if needed.
+        get_boards : `dict`
+            Get the schemas of several boards, fetching the missing ones in batches.
+        put : `void`
+            Add a loaded board to the cache.
+        invalidate : `void`
+            Remove boards from the cache.
+        clear : `void`
+            Remove all boards from the cache.
+    """
+
+    def __init__(self, ttl: float = None):
+        self.ttl = ttl
+        self._boards = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, board_id):
+        return self.get(board_id) is not None
+
+    def __len__(self):
+        return len(self._boards)
+
+    def get_board(self, board_id: str, creds: en.MondayClientCredentials = None):
+        """Get a board's schema, fetching it if needed.
+
+            Parameters
+
+                board_id : `str`
+                    The board's unique identifier.
+                creds : `moncli.entities.MondayClientCredentials`
+                    The credentials used to fetch the board.
+
+            Returns
+
+                board : `moncli.entities.Board`
+                    The board with its columns and groups, or None if the board does not exist.
+        """
+
+        return self.get_boards([board_id], creds).get(str(board_id))
+
+    def get_boards(self, board_ids: list, creds: en.MondayClientCredentials = None):
+        """Get the schemas of several boards, fetching the missing ones in batches.
+
+            Parameters
+
+                board_ids : `list[str]`
+                    The boards' unique identifiers.
+                creds : `moncli.entities.MondayClientCredentials`
+                    The credentials used to fetch the boards.
+
+            Returns
+
+                boards : `dict`
+                    The boards with their columns and groups, keyed by id.
+        """
+
+        creds = creds or en.MondayClientCredentials(None)
+        board_ids = unique(str(board_id) for board_id in board_ids if board_id)
+        boards = {}
+        missing = []
+        for board_id in board_ids:
+            board = self.get(board_id)
+            if board is None:
+                missing.append(board_id)
+            else:
+                boards[board_id] = board
+        for board in _fetch_boards(missing, SCHEMA_QUERY_FIELDS, creds):
+            self.put(board)
+            boards[board.id] = board
+        return boards
+
+    def put(self, board: en.Board):
+        """Add a loaded board to the cache.
+
+            Parameters
+
+                board : `moncli.entities.Board`
+                    A board loaded with its columns.
+        """
+
+        with self._lock:
+            self._boards[str(board.id)] = (board, time.monotonic())
+
+    def invalidate(self, *board_ids):
+        """Remove boards from the cache.
+
+            Parameters
+
+                board_ids : `tuple[str]`
+                    The unique identifiers of the boards to remove.
+        """
+
+        with self._lock:
+            for board_id in board_ids:
+                self._boards.pop(str(board_id), None)
+
+    def clear(self):
+        """Remove all boards from the cache."""
+
+        with self._lock:
+            self._boards.clear()
+
+    def get(self, board_id: str):
+        """Get a cached board's schema without fetching it.
+
+            Parameters
+
+                board_id : `str`
+                    The board's unique identifier.
+
+            Returns
+
+                board : `moncli.entities.Board`
+                    The cached board, or None if it is not cached or expired.
+        """
+
+        board_id = str(board_id)
+        with self._lock:
+            entry = self._boards.get(board_id)
+            if entry is None:
+                return None
+            board, cached_at = entry
+            if self.ttl is not None and time.monotonic() - cached_at > self.ttl:
+                del self._boards[board_id]
+                return None
+            return board
+
+
+def get_boards_by_ids(board_ids: list, include: list = SCHEMA_INCLUDE, creds: en.MondayClientCredentials = None, schema_cache: SchemaCache = None, chunk_size: int = BOARDS_IDS_LIMIT, concurrency: int = 4):
+    """Load many boards with multi-id queries sent concurrently.
+
+        Parameters
+
+            board_ids : `list[str]`
+                The boards' unique identifiers.
+            include : `list[str]`
+                The board lists to load with the boards: "columns", "groups" and/or "views".
+            creds : `moncli.entities.MondayClientCredentials`
+                The credentials used for the requests.
+            schema_cache : `moncli.schema.SchemaCache`
+                The cache that boards loaded with their columns are added to.  Boards already in
+                the cache are not fetched again unless views are included.
+            chunk_size : `int`
+                The number of boards per query.
+            concurrency : `int`
+                The number of queries sent at the same time.
+
+        Returns
+
+            boards : `list[moncli.entities.Board]`
+                The boards in the order of the given ids, without the ones that do not exist.
+    """
+
+    creds = creds or en.MondayClientCredentials(None)
+    include = list(include or [])
+    for name in include:
+        if name not in BOARD_INCLUDE_QUERY_FIELDS:
+            raise ValueError('Unable to include "{}" with boards, expected one of {}.'.format(name, ', '.join(BOARD_INCLUDE_QUERY_FIELDS)))
+    board_ids = unique(str(board_id) for board_id in board_ids if board_id)
+    fields = list(api.DEFAULT_BOARD_QUERY_FIELDS) + [field for name in include for field in BOARD_INCLUDE_QUERY_FIELDS[name]]
+
+    boards = {}
+    # Cached schemas hold columns and groups only.
+    use_cache = schema_cache is not None and set(include) <= set(SCHEMA_INCLUDE)
+    if use_cache:
+        for board_id in board_ids:
+            board = schema_cache.get(board_id)
+            if board is not None:
+                boards[board_id] = board
+    missing = [board_id for board_id in board_ids if board_id not in boards]
+    for board in _fetch_boards(missing, fields, creds, chunk_size, concurrency):
+        if schema_cache is not None and 'columns' in include:
+            schema_cache.put(board)
+        boards[board.id] = board
+    return [boards[board_id] for board_id in board_ids if board_id in boards]
+
+
+def _fetch_boards(board_ids: list, fields: list, creds: en.MondayClientCredentials, chunk_size: int = BOARDS_IDS_LIMIT, concurrency: int = 1):
+    def fetch(ids: list):
+        return api.get_boards(
+            *fields,
+            api_key=creds.api_key_v2,
+            ids=[int(board_id) for board_id in ids],
+            limit=len(ids))
+
+    chunk_size = get_max_chunk_size(api.BOARDS, chunk_size, *fields)
+    return [en.Board(creds=creds, **board_data) for boards_data in map_chunks(fetch, board_ids, chunk_size, concurrency) for board_data in boards_data]
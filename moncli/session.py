@@ -0,0 +1,171 @@
+import contextvars, threading
+
+from schematics.models import Model, ModelMeta
+
+
+# The open sessions of the current thread or task, by credentials.  Work that moncli sends to
+# worker threads runs in a copy of the caller's context, so it sees the caller's sessions.
+_sessions = contextvars.ContextVar('sessions', default={})
+
+class Session(object):
+    """An identity map making the entities of a client canonical by id.
+
+    While the session is open, boards, groups, columns, users, teams and items built by the
+    client are registered by (entity type, id), and building an entity that is already
+    registered merges the new data into the registered object and returns it.  Groups and
+    columns are registered per board.  A session only applies to the thread or asyncio task
+    that opened it, and to the worker threads moncli uses on its behalf.
+
+    Methods
+
+        get : `object`
+            Get a registered entity.
+        clear : `void`
+            Forget all registered entities.
+    """
+
+    def __init__(self, creds):
+        self._creds = creds
+        self._entities = {}
+        self._lock = threading.RLock()
+        self._token = None
+
+    def __enter__(self):
+        sessions = dict(_sessions.get())
+        sessions[id(self._creds)] = self
+        self._token = _sessions.set(sessions)
+        return self
+
+    def __exit__(self, *args):
+        _sessions.reset(self._token)
+        self._token = None
+
+    def __len__(self):
+        return len(self._entities)
+
+    def get(self, entity_type: type, id, board_id = None):
+        """Get a registered entity.
+
+            Parameters
+
+                entity_type : `type`
+                    The entity type, e.g. `moncli.entities.Board`.
+                id : `str`
+                    The entity's unique identifier.
+                board_id : `str`
+                    The unique identifier of the board of a group or column.
+
+            Returns
+
+                entity : `object`
+                    The registered entity, or None.
+        """
+
+        key = (entity_type, str(board_id), str(id)) if board_id is not None else (entity_type, str(id))
+        return self._entities.get(key)
+
+    def clear(self):
+        """Forget all registered entities."""
+
+        with self._lock:
+            self._entities.clear()
+
+    def merge(self, entity):
+        """Register an entity, or merge it into the registered entity with the same id and return that."""
+
+        from .entities import Board, Column
+        key = _get_key(entity)
+        if not key:
+            return entity
+        with self._lock:
+            existing = self._entities.setdefault(key, entity)
+            if existing is not entity:
+                _merge_fields(existing, entity)
+            if isinstance(existing, Board):
+                # Merged boards update their columns in place, so a board's columns stay canonical.
+                for columns in _get_column_collections(existing):
+                    for column in columns:
+                        self._entities.setdefault((Column, str(existing.id), str(column.id)), column)
+            return existing
+
+
+class CanonicalModelMeta(ModelMeta):
+    """Makes the entities built with a credentials object canonical while its session is open."""
+
+    def __call__(cls, *args, **kwargs):
+        entity = super().__call__(*args, **kwargs)
+        session = get_session(kwargs.get('creds'))
+        return session.merge(entity) if session is not None else entity
+
+
+def get_session(creds):
+    """Get the session opened for credentials by the current thread or task, if any."""
+
+    if creds is None:
+        return None
+    return _sessions.get().get(id(creds))
+
+
+def _get_key(entity):
+    from .entities import Board, Group
+    if entity.id is None:
+        return None
+    if not isinstance(entity, Group):
+        return (type(entity), str(entity.id))
+    # Groups are only unique within their board.
+    if not isinstance(entity.board, Board):
+        return None
+    return (Group, str(entity.board.id), str(entity.id))
+
+
+def _merge_fields(existing, entity):
+    for name in entity._fields:
+        value = getattr(entity, name)
+        if value is not None:
+            setattr(existing, name, value)
+    for name, value in vars(entity).items():
+        if name == '_data' or not _is_set(value):
+            continue
+        current = getattr(existing, name, None)
+        # Related entities are kept, so they stay canonical; loaded values are replaced.
+        if isinstance(value, Model) and current is not None:
+            continue
+        if _is_column_collection(current):
+            current.update(value)
+            continue
+        setattr(existing, name, value)
+    # Entities built while the merged entity was built refer to it instead of the existing one.
+    for child in _get_related(existing):
+        for name, value in vars(child).items():
+            if value is entity:
+                setattr(child, name, existing)
+
+
+def _get_related(entity):
+    for name, value in vars(entity).items():
+        if name == '_data':
+            continue
+        if isinstance(value, Model):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, Model):
+                    yield item
+
+
+def _get_column_collections(entity):
+    return [value for value in vars(entity).values() if _is_column_collection(value)]
+
+
+def _is_column_collection(value):
+    from .entities import BaseColumnCollection
+    return isinstance(value, BaseColumnCollection)
+
+
+def _is_set(value):
+    if value is None:
+        return False
+    try:
+        return len(value) > 0
+    except TypeError:
+        return True
@@ -0,0 +1,187 @@
+from . import api, batch, entities as en
+from .schema import SchemaCache
+from .utils import unique
+
+
+class SubitemNode(object):
+    """An item in a subitem tree.
+
+    Properties
+
+        item : `moncli.entities.Item`
+            The item.
+        parent : `moncli.subitems.SubitemNode`
+            The parent item's node, or None for root items.
+        children : `list[moncli.subitems.SubitemNode]`
+            The nodes of the item's subitems.
+        depth : `int`
+            The number of ancestors of the item.
+    """
+
+    def __init__(self, item: en.Item, parent = None):
+        self.item = item
+        self.parent = parent
+        self.children = []
+        self.depth = parent.depth + 1 if parent else 0
+        self._subitems = []
+
+    def __repr__(self):
+        return str({'id': self.id, 'parent_id': self.parent.id if self.parent else None, 'children': [child.id for child in self.children]})
+
+    @property
+    def id(self):
+        """The item's unique identifier."""
+
+        return self.item.id
+
+
+class SubitemTree(object):
+    """Items and their subitems, indexed by item id.
+
+    Properties
+
+        roots : `list[moncli.subitems.SubitemNode]`
+            The nodes of the requested parent items, in the requested order.
+
+    Methods
+
+        get_ancestors : `list[moncli.subitems.SubitemNode]`
+            Get the ancestors of an item, nearest first.
+        walk : `generator[moncli.subitems.SubitemNode]`
+            Iterate over the tree depth first.
+    """
+
+    def __init__(self):
+        self.roots = []
+        self._nodes = {}
+
+    def __getitem__(self, item_id):
+        return self._nodes[str(item_id)]
+
+    def __contains__(self, item_id):
+        return str(item_id) in self._nodes
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self):
+        return iter(self._nodes.values())
+
+    def get(self, item_id, default = None):
+        return self._nodes.get(str(item_id), default)
+
+    def get_ancestors(self, item_id):
+        """Get the ancestors of an item, nearest first.
+
+            Parameters
+
+                item_id : `str`
+                    The item's unique identifier.
+
+            Returns
+
+                ancestors : `list[moncli.subitems.SubitemNode]`
+                    The item's ancestors.
+        """
+
+        ancestors = []
+        node = self[item_id].parent
+        while node:
+            ancestors.append(node)
+            node = node.parent
+        return ancestors
+
+    def walk(self, item_id = None):
+        """Iterate over the tree depth first.
+
+            Parameters
+
+                item_id : `str`
+                    The item to start at, or None to walk all root items.
+
+            Returns
+
+                nodes : `generator[moncli.subitems.SubitemNode]`
+                    The nodes, each parent before its subitems.
+        """
+
+        stack = list(reversed([self[item_id]] if item_id else self.roots))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def _add(self, data: dict, boards: dict, creds: en.MondayClientCredentials, parent: SubitemNode = None):
+        board = boards.get(str((data.get('board') or {}).get('id')))
+        data = {key: value for key, value in data.items() if key != 'subitems' and not (board and key == 'board')}
+        subitems = []
+        # The item's subitem list is shared with its node and filled as subitem nodes are added.
+        item = en.Item(creds=creds, __board=board, __parent_item=parent.item if parent else None, __subitems=subitems, **data)
+        node = SubitemNode(item, parent)
+        node._subitems = subitems
+        self._nodes[str(item.id)] = node
+        if parent:
+            parent.children.append(node)
+            parent._subitems.append(item)
+        else:
+            self.roots.append(node)
+        return node
+
+
+def get_subitem_trees(item_ids: list, depth: int = 1, get_column_values: bool = True, creds: en.MondayClientCredentials = None, schema_cache: SchemaCache = None, chunk_size: int = batch.ITEMS_IDS_LIMIT):
+    """Load items and their subitems using one query per chunk of parent items.
+
+        Parameters
+
+            item_ids : `list[str]`
+                The unique identifiers of the parent items.
+            depth : `int`
+                The number of subitem levels to load.
+            get_column_values : `bool`
+                Load column values for the items and subitems.
+            creds : `moncli.entities.MondayClientCredentials`
+                The credentials used for the requests.
+            schema_cache : `moncli.schema.SchemaCache`
+                The cache providing the item and subitem board schemas.
+            chunk_size : `int`
+                The maximum number of parent items per query, lowered to keep queries with
+                subitems within the maximum complexity.
+
+        Returns
+
+            tree : `moncli.subitems.SubitemTree`
+                The items and their subitems.
+    """
+
+    creds = creds or en.MondayClientCredentials(None)
+    schema_cache = schema_cache if schema_cache is not None else SchemaCache()
+    item_fields = list(api.DEFAULT_ITEM_QUERY_FIELDS) + ['board.id']
+    if get_column_values:
+        item_fields += ['column_values.{}'.format(field) for field in api.DEFAULT_COLUMN_VALUE_QUERY_FIELDS]
+    subitem_fields = ['subitems.{}'.format(field) for field in item_fields]
+
+    def get_items_data(ids: list, fields: list):
+        return batch.get_items_data(ids, *fields, api_key=creds.api_key_v2, chunk_size=chunk_size)[0]
+
+    tree = SubitemTree()
+    root_ids = unique(str(item_id) for item_id in item_ids)
+    # The parent items are loaded with their subitems; deeper levels only query the subitems.
+    level_data = [(None, data) for data in get_items_data(root_ids, item_fields + (subitem_fields if depth > 0 else []))]
+    for level in range(depth + 1):
+        boards = {}
+        if get_column_values:
+            boards = schema_cache.get_boards([(data.get('board') or {}).get('id') for _, data in level_data], creds)
+        nodes = []
+        for parent, data in level_data:
+            if str(data['id']) in tree:
+                continue
+            subitems_data = data.get('subitems')
+            nodes.append((tree._add(data, boards, creds, parent), subitems_data))
+        if level == depth or not nodes:
+            break
+        if level > 0:
+            subitems_data = {str(data['id']): data.get('subitems') for data in get_items_data([node.id for node, _ in nodes], ['id'] + subitem_fields)}
+            nodes = [(node, subitems_data.get(node.id)) for node, _ in nodes]
+        level_data = [(node, data) for node, subitems_data in nodes for data in subitems_data or []]
+    return tree
+
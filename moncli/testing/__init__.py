@@ -0,0 +1,3 @@
+from .backend import FakeMondayBackend, FakeApiError
+from .server import FakeMondayServer, FakeSession, FakeResponse, install
+from .recording import Recording, RecordingSession, ReplaySession, ReplayError, record, replay
@@ -0,0 +1,1084 @@
+import itertools, json, os, threading, time, uuid
+from collections import deque
+from datetime import datetime, timezone
+
+from ..api_v2.complexity import DEFAULT_LIST_COMPLEXITY, MUTATION_COMPLEXITY, SINGULAR_FIELDS
+from .graphql import GraphQLSyntaxError, Variable, parse
+
+
+DEFAULT_COMPLEXITY_BUDGET = 10000000
+DEFAULT_BUDGET_WINDOW = 60
+DEFAULT_PAGE_LIMITS = {'boards': 25, 'items': 25, 'updates': 25, 'activity_logs': 25, 'items_by_column_values': 25, 'items_by_multiple_column_values': 25}
+DEFAULT_FILE_URL = 'https://files.fake.monday.com'
+COLUMN_TYPES = {
+    'checkbox': 'boolean', 'country': 'country', 'date': 'date', 'dropdown': 'dropdown', 'dependency': 'dependency',
+    'email': 'email', 'hour': 'hour', 'link': 'link', 'location': 'location', 'long_text': 'long-text', 'name': 'name',
+    'numbers': 'numeric', 'people': 'multiple-person', 'phone': 'phone', 'last_updated': 'pulse-updated', 'rating': 'rating',
+    'status': 'color', 'tags': 'tag', 'team': 'team', 'text': 'text', 'timeline': 'timerange', 'week': 'week',
+    'world_clock': 'timezone', 'file': 'file', 'board_relation': 'board-relation', 'subitems': 'subtasks', 'creation_log': 'pulse-log'
+}
+
+
+class FakeApiError(Exception):
+    """An application error returned in the monday.com error format."""
+
+    def __init__(self, error_code: str, message: str):
+        super().__init__(message)
+        self.error_code = error_code
+        self.message = message
+
+
+class FakeMondayBackend(object):
+    """An in-memory monday.com GraphQL API for tests and load runs.
+
+    Parses the queries built by `moncli.api_v2`, resolves them over an in-memory store and
+    answers in the monday.com response format.  Complexity budgets, rate limits (429s),
+    latency and paging are simulated.  Use `moncli.testing.install` to route the client's
+    requests to the backend in-process, or `moncli.testing.FakeMondayServer` to serve it
+    over local HTTP.
+
+    Properties
+
+        api_keys : `set[str]`
+            The accepted API keys, or None to accept any key.
+        complexity_budget : `int`
+            The complexity available per API key and budget window.
+        budget_window : `float`
+            The seconds after which a complexity budget resets.
+        latency : `float | callable`
+            The seconds each request takes, or a function returning them.
+        requests_per_minute : `int`
+            The requests allowed per API key and minute before answering 429, if any.
+        file_url : `str`
+            The base url of uploaded asset downloads.
+        requests : `list[dict]`
+            The log of handled requests with their operation names, complexity, status code
+            and whether they were rate limited.
+        me : `dict`
+            The user owning the API keys.
+
+    Methods
+
+        add_user : `dict`
+            Add a user to the account.
+        add_workspace : `dict`
+            Add a workspace.
+        add_board : `dict`
+            Add a board with columns and groups.
+        add_column : `dict`
+            Add a column to a board.
+        add_group : `dict`
+            Add a group to a board.
+        add_item : `dict`
+            Add an item to a board.
+        fail_next : `void`
+            Answer the next requests with an error status.
+        execute : `tuple`
+            Execute a GraphQL request.
+        estimate_complexity : `int`
+            Get the complexity charged for a query.
+        get_file : `tuple`
+            Get the name and contents of an uploaded asset.
+    """
+
+    def __init__(self, api_keys: list = None, complexity_budget: int = DEFAULT_COMPLEXITY_BUDGET, budget_window: float = DEFAULT_BUDGET_WINDOW,
+                 latency = 0, requests_per_minute: int = None, file_url: str = DEFAULT_FILE_URL):
+        self.api_keys = set(api_keys) if api_keys is not None else None
+        self.complexity_budget = complexity_budget
+        self.budget_window = budget_window
+        self.latency = latency
+        self.requests_per_minute = requests_per_minute
+        self.file_url = file_url
+        self.requests = []
+        self._lock = threading.RLock()
+        self._ids = itertools.count(1000)
+        self._budgets = {}
+        self._request_times = {}
+        self._failures = deque()
+        self.users, self.teams, self.workspaces, self.boards, self.items = {}, {}, {}, {}, {}
+        self.updates, self.assets, self.tags, self.webhooks, self.notifications = {}, {}, {}, {}, {}
+        self._files = {}
+        self.account = {'id': 1, 'name': 'Fake Account', 'slug': 'fake', 'first_day_of_the_week': 'monday', 'logo': None,
+                        'show_timeline_weekends': True, 'plan': {'max_users': 100, 'period': 'monthly', 'tier': 'pro', 'version': 1}}
+        self.me = self.add_user('Test User', 'test.user@example.com', is_admin=True)
+
+    ## Seeding
+
+    def add_user(self, name: str, email: str = None, **kwargs):
+        """Add a user to the account and return its data."""
+
+        with self._lock:
+            user = {'id': self._next_id(), 'name': name, 'email': email or '{}@example.com'.format(name.lower().replace(' ', '.')),
+                    'enabled': True, 'is_admin': False, 'is_guest': False, 'is_pending': False, 'is_verified': True,
+                    'is_view_only': False, 'join_date': _today(), 'team_ids': []}
+            user.update(kwargs)
+            self.users[user['id']] = user
+            return user
+
+    def add_workspace(self, name: str, kind: str = 'open', description: str = None):
+        """Add a workspace and return its data."""
+
+        with self._lock:
+            workspace = {'id': self._next_id(), 'name': name, 'kind': kind, 'description': description, 'user_ids': [], 'team_ids': []}
+            self.workspaces[workspace['id']] = workspace
+            return workspace
+
+    def add_board(self, name: str, columns: list = None, groups: list = None, board_kind: str = 'public', workspace_id: int = None, **kwargs):
+        """Add a board and return its data.
+
+            Parameters
+
+                name : `str`
+                    The board name.
+                columns : `list[dict]`
+                    The columns, as dictionaries with an id, title, type and settings.
+                groups : `list[str | dict]`
+                    The group titles, or dictionaries with an id and title.  A "topics" group is
+                    created when omitted.
+                board_kind : `str`
+                    The board kind.
+                workspace_id : `int`
+                    The board's workspace.
+        """
+
+        with self._lock:
+            board = {'id': self._next_id(), 'name': name, 'board_kind': board_kind, 'state': 'active', 'description': None,
+                     'permissions': 'everyone', 'pos': None, 'board_folder_id': None, 'communication': None,
+                     'workspace_id': workspace_id, 'updated_at': _now_iso(), 'owner_id': self.me['id'],
+                     'subscriber_ids': [self.me['id']], 'columns': [], 'groups': [], 'item_ids': [], 'activity_logs': []}
+            board.update(kwargs)
+            self.boards[board['id']] = board
+            self.add_column(board['id'], 'Name', 'name', id='name')
+            for column in columns or []:
+                self.add_column(board['id'], column.get('title', column.get('id')), column.get('type', 'text'), column.get('settings'), id=column.get('id'))
+            for group in groups or [{'id': 'topics', 'title': 'Group Title'}]:
+                group = {'title': group} if isinstance(group, str) else group
+                self.add_group(board['id'], group['title'], id=group.get('id'))
+            return board
+
+    def add_column(self, board_id: int, title: str, column_type: str = 'text', settings: dict = None, id: str = None):
+        """Add a column to a board and return its data."""
+
+        with self._lock:
+            board = self._get_board(board_id)
+            column_type = COLUMN_TYPES.get(column_type, column_type)
+            column = {'id': id or _get_key(title, [column['id'] for column in board['columns']]), 'title': title,
+                      'type': column_type, 'settings_str': json.dumps(settings or {}), 'archived': False, 'width': None}
+            board['columns'].append(column)
+            return column
+
+    def add_group(self, board_id: int, title: str, id: str = None, add_to_top: bool = False):
+        """Add a group to a board and return its data."""
+
+        with self._lock:
+            board = self._get_board(board_id)
+            group = {'id': id or _get_key(title, [group['id'] for group in board['groups']]), 'title': title,
+                     'archived': False, 'deleted': False, 'color': '#579bfc', 'position': str(len(board['groups']) + 1)}
+            if add_to_top:
+                board['groups'].insert(0, group)
+            else:
+                board['groups'].append(group)
+            return group
+
+    def add_item(self, board_id: int, name: str, group_id: str = None, column_values: dict = None, parent_item_id: int = None):
+        """Add an item to a board and return its data.
+
+            Parameters
+
+                board_id : `int`
+                    The board.
+                name : `str`
+                    The item name.
+                group_id : `str`
+                    The group, the board's first group by default.
+                column_values : `dict`
+                    The column values by column id, in the formats accepted by `change_multiple_column_values`.
+                parent_item_id : `int`
+                    The parent of a subitem.
+        """
+
+        with self._lock:
+            board = self._get_board(board_id)
+            group_id = group_id or board['groups'][0]['id']
+            self._get_group(board, group_id)
+            now = _now_iso()
+            item = {'id': self._next_id(), 'name': name, 'board_id': board['id'], 'group_id': group_id, 'state': 'active',
+                    'created_at': now, 'updated_at': now, 'creator_id': self.me['id'], 'parent_item_id': parent_item_id,
+                    'subitem_ids': [], 'update_ids': [], 'values': {}}
+            self.items[item['id']] = item
+            board['item_ids'].append(item['id'])
+            for column_id, value in (column_values or {}).items():
+                self._set_value(item, column_id, value)
+            self._log(board, 'create_pulse', {'pulse_id': item['id'], 'pulse_name': name, 'group_id': group_id})
+            return item
+
+    ## Simulation
+
+    def fail_next(self, status_code: int = 429, count: int = 1, retry_after: float = None, message: str = None):
+        """Answer the next requests with an error status.
+
+            Parameters
+
+                status_code : `int`
+                    The status code to answer with.
+                count : `int`
+                    The number of requests to fail.
+                retry_after : `float`
+                    The Retry-After header value of 429 answers.
+                message : `str`
+                    The error message.
+        """
+
+        with self._lock:
+            for _ in range(count):
+                self._failures.append((status_code, retry_after, message))
+
+    def estimate_complexity(self, query: str):
+        """Get the complexity charged for a query.
+
+            Each object a field may return costs one point, multiplied by the size of its parent
+            lists.  List sizes are taken from the `limit` or `ids` arguments, or default to
+            `DEFAULT_LIST_COMPLEXITY`.  Mutations cost `MUTATION_COMPLEXITY` extra points.
+        """
+
+        operation_type, selections = parse(query)
+        return self._estimate(selections) + (MUTATION_COMPLEXITY * len(selections) if operation_type == 'mutation' else 0)
+
+    def execute(self, query: str, variables: dict = None, api_key: str = None, files: dict = None):
+        """Execute a GraphQL request.
+
+            Parameters
+
+                query : `str`
+                    The GraphQL query or mutation.
+                variables : `dict`
+                    The query variables.
+                api_key : `str`
+                    The API key from the Authorization header.
+                files : `dict`
+                    Uploaded files as (file name, contents) tuples keyed by variable name.
+
+            Returns
+
+                status_code : `int`
+                    The HTTP status code.
+                body : `dict`
+                    The JSON response body.
+                headers : `dict`
+                    The response headers.
+        """
+
+        latency = self.latency() if callable(self.latency) else self.latency
+        if latency:
+            time.sleep(latency)
+        with self._lock:
+            status_code, body, headers, names, complexity = self._execute(query, variables or {}, api_key, files or {})
+            rate_limited = status_code == 429 or any('Complexity budget exhausted' in error['message'] for error in body.get('errors', []))
+            self.requests.append({'operations': names, 'complexity': complexity, 'status_code': status_code, 'errors': 'data' not in body, 'rate_limited': rate_limited})
+            return status_code, body, headers
+
+    def get_file(self, asset_id: int):
+        """Get the name and contents of an uploaded asset, or None if it does not exist."""
+
+        with self._lock:
+            return self._files.get(int(asset_id))
+
+    def _execute(self, query: str, variables: dict, api_key: str, files: dict):
+        if self.api_keys is not None and api_key not in self.api_keys:
+            return 401, {'errors': [{'message': 'Not Authenticated'}], 'status_code': 401}, {}, [], 0
+        if self._failures:
+            status_code, retry_after, message = self._failures.popleft()
+            headers = {'Retry-After': str(retry_after)} if retry_after is not None else {}
+            return status_code, {'error_message': message or 'Simulated failure', 'status_code': status_code}, headers, [], 0
+        wait = self._get_rate_limit_wait(api_key)
+        if wait is not None:
+            return 429, {'error_message': 'Rate Limit Exceeded', 'status_code': 429}, {'Retry-After': str(int(wait) + 1)}, [], 0
+
+        try:
+            operation_type, selections = parse(query)
+        except GraphQLSyntaxError as error:
+            return 200, {'errors': [{'message': 'Parse error on query: {}'.format(error.message)}], 'account_id': self.account['id']}, {}, [], 0
+        names = [selection.name for selection in selections if selection.name != 'complexity']
+        root = 'mutation' if operation_type == 'mutation' else 'query'
+        for selection in selections:
+            if selection.name != 'complexity' and not hasattr(self, '_resolve_{}_{}'.format(root, selection.name)):
+                message = "Field '{}' doesn't exist on type '{}'".format(selection.name, root.capitalize())
+                return 200, {'errors': [{'message': message}], 'account_id': self.account['id']}, {}, names, 0
+
+        complexity = self._estimate(selections) + (MUTATION_COMPLEXITY * len(names) if root == 'mutation' else 0)
+        if complexity > self.complexity_budget:
+            message = 'Query has complexity of {}, which exceeds max complexity of {}'.format(complexity, self.complexity_budget)
+            return 200, {'errors': [{'message': message}], 'account_id': self.account['id']}, {}, names, 0
+        before = self._get_budget(api_key)
+        if complexity > before:
+            reset = self._budgets[api_key][0] + self.budget_window - time.monotonic()
+            message = 'Complexity budget exhausted, query cost {} budget remaining {} out of {} reset in {} seconds'.format(
+                complexity, before, self.complexity_budget, max(0, int(reset + 0.999)))
+            return 200, {'errors': [{'message': message}], 'account_id': self.account['id']}, {}, names, complexity
+        self._budgets[api_key][1] -= complexity
+
+        data = {}
+        try:
+            for selection in selections:
+                if selection.name == 'complexity':
+                    continue
+                arguments = _substitute(selection.arguments, variables, files)
+                child_type, value = getattr(self, '_resolve_{}_{}'.format(root, selection.name))(arguments)
+                data[selection.name] = self._render(child_type, value, selection.selections)
+        except FakeApiError as error:
+            return 200, {'error_code': error.error_code, 'error_message': error.message, 'status_code': 200, 'account_id': self.account['id']}, {}, names, complexity
+        for selection in selections:
+            if selection.name == 'complexity':
+                values = {'before': before, 'after': before - complexity, 'query': complexity, 'reset_in_x_seconds': int(self.budget_window)}
+                data['complexity'] = {field.name: values.get(field.name) for field in selection.selections}
+        return 200, {'data': data, 'account_id': self.account['id']}, {}, names, complexity
+
+    def _get_budget(self, api_key: str):
+        now = time.monotonic()
+        budget = self._budgets.get(api_key)
+        if not budget or now - budget[0] >= self.budget_window:
+            budget = self._budgets[api_key] = [now, self.complexity_budget]
+        return budget[1]
+
+    def _get_rate_limit_wait(self, api_key: str):
+        if not self.requests_per_minute:
+            return None
+        now = time.monotonic()
+        times = self._request_times.setdefault(api_key, deque())
+        while times and now - times[0] >= 60:
+            times.popleft()
+        if len(times) >= self.requests_per_minute:
+            return 60 - (now - times[0])
+        times.append(now)
+        return None
+
+    def _estimate(self, selections: list):
+        cost = 0
+        for selection in selections:
+            if not selection.selections:
+                continue
+            if selection.name in SINGULAR_FIELDS:
+                size = 1
+            else:
+                ids = selection.arguments.get('ids')
+                size = selection.arguments.get('limit') or (len(ids) if isinstance(ids, list) else DEFAULT_LIST_COMPLEXITY)
+            cost += size * (1 + self._estimate(selection.selections))
+        return cost
+
+    ## Rendering
+
+    def _render(self, type_name: str, value, selections: list):
+        if value is None or not selections:
+            return value
+        if isinstance(value, list):
+            return [self._render(type_name, element, selections) for element in value]
+        rendered = {}
+        for selection in selections:
+            resolver = getattr(self, '_resolve_{}_{}'.format(type_name, selection.name), None)
+            if resolver:
+                child_type, child = resolver(value, selection.arguments)
+                rendered[selection.name] = self._render(child_type, child, selection.selections)
+            elif selection.selections:
+                rendered[selection.name] = self._render('object', value.get(selection.name), selection.selections)
+            else:
+                rendered[selection.name] = _format_scalar(selection.name, value.get(selection.name))
+        return rendered
+
+    ## Queries
+
+    def _resolve_query_boards(self, arguments: dict):
+        boards = self._filter_ids(self.boards, arguments.get('ids'))
+        state = arguments.get('state', 'active')
+        boards = [board for board in boards if state == 'all' or board['state'] == state]
+        if arguments.get('board_kind'):
+            boards = [board for board in boards if board['board_kind'] == arguments['board_kind']]
+        return 'board', _page(boards, arguments, DEFAULT_PAGE_LIMITS['boards'])
+
+    def _resolve_query_items(self, arguments: dict):
+        items = self._filter_ids(self.items, arguments.get('ids'))
+        items = [item for item in items if item['state'] != 'deleted']
+        if arguments.get('newest_first'):
+            items.sort(key=lambda item: item['id'], reverse=True)
+        return 'item', _page(items, arguments, DEFAULT_PAGE_LIMITS['items'])
+
+    def _resolve_query_items_by_column_values(self, arguments: dict):
+        return self._find_items(arguments, [arguments.get('column_value')], 'items_by_column_values')
+
+    def _resolve_query_items_by_multiple_column_values(self, arguments: dict):
+        return self._find_items(arguments, arguments.get('column_values') or [], 'items_by_multiple_column_values')
+
+    def _resolve_query_updates(self, arguments: dict):
+        updates = sorted(self.updates.values(), key=lambda update: update['id'], reverse=True)
+        return 'update', _page(updates, arguments, DEFAULT_PAGE_LIMITS['updates'])
+
+    def _resolve_query_tags(self, arguments: dict):
+        return 'tag', self._filter_ids(self.tags, arguments.get('ids'))
+
+    def _resolve_query_users(self, arguments: dict):
+        users = self._filter_ids(self.users, arguments.get('ids'))
+        kind = arguments.get('kind', 'all')
+        if kind == 'guests':
+            users = [user for user in users if user['is_guest']]
+        elif kind == 'non_guests':
+            users = [user for user in users if not user['is_guest']]
+        elif kind == 'non_pending':
+            users = [user for user in users if not user['is_pending']]
+        return 'user', _page(users, arguments, None)
+
+    def _resolve_query_teams(self, arguments: dict):
+        return 'team', self._filter_ids(self.teams, arguments.get('ids'))
+
+    def _resolve_query_me(self, arguments: dict):
+        return 'user', self.me
+
+    def _resolve_query_account(self, arguments: dict):
+        return 'account', self.account
+
+    def _resolve_query_assets(self, arguments: dict):
+        return 'asset', self._filter_ids(self.assets, arguments.get('ids'))
+
+    ## Board mutations
+
+    def _resolve_mutation_create_board(self, arguments: dict):
+        board = self.add_board(arguments['board_name'], board_kind=arguments.get('board_kind', 'public'), workspace_id=arguments.get('workspace_id'))
+        return 'board', board
+
+    def _resolve_mutation_archive_board(self, arguments: dict):
+        board = self._get_board(arguments.get('board_id'))
+        board['state'] = 'archived'
+        return 'board', board
+
+    def _resolve_mutation_add_subscribers_to_board(self, arguments: dict):
+        board = self._get_board(arguments.get('board_id'))
+        users = [self._get_user(user_id) for user_id in arguments.get('user_ids') or []]
+        for user in users:
+            if user['id'] not in board['subscriber_ids']:
+                board['subscriber_ids'].append(user['id'])
+        return 'user', users
+
+    def _resolve_mutation_delete_subscribers_from_board(self, arguments: dict):
+        board = self._get_board(arguments.get('board_id'))
+        users = [self._get_user(user_id) for user_id in arguments.get('user_ids') or []]
+        board['subscriber_ids'] = [user_id for user_id in board['subscriber_ids'] if user_id not in [user['id'] for user in users]]
+        return 'user', users
+
+    def _resolve_mutation_create_column(self, arguments: dict):
+        board = self._get_board(arguments.get('board_id'))
+        defaults = arguments.get('defaults')
+        column = self.add_column(board['id'], arguments['title'], arguments.get('column_type', 'text'), json.loads(defaults) if defaults else None)
+        self._log(board, 'create_column', {'column_id': column['id'], 'column_title': column['title']})
+        return 'column', column
+
+    def _resolve_mutation_change_column_title(self, arguments: dict):
+        board = self._get_board(arguments.get('board_id'))
+        column = self._get_column(board, arguments.get('column_id'))
+        column['title'] = arguments['title']
+        self._log(board, 'update_column_name', {'column_id': column['id'], 'column_title': column['title']})
+        return 'column', column
+
+    ## Column value mutations
+
+    def _resolve_mutation_change_column_value(self, arguments: dict):
+        item = self._get_item(arguments.get('item_id'), arguments.get('board_id'))
+        self._change_values(item, {arguments.get('column_id'): json.loads(arguments['value']) if arguments.get('value') else None})
+        return 'item', item
+
+    def _resolve_mutation_change_simple_column_value(self, arguments: dict):
+        item = self._get_item(arguments.get('item_id'), arguments.get('board_id'))
+        self._change_values(item, {arguments.get('column_id'): arguments.get('value')})
+        return 'item', item
+
+    def _resolve_mutation_change_multiple_column_values(self, arguments: dict):
+        item = self._get_item(arguments.get('item_id'), arguments.get('board_id'))
+        values = arguments.get('column_values')
+        self._change_values(item, json.loads(values) if isinstance(values, str) else values or {})
+        return 'item', item
+
+    ## Group mutations
+
+    def _resolve_mutation_create_group(self, arguments: dict):
+        board = self._get_board(arguments.get('board_id'))
+        group = self.add_group(board['id'], arguments['group_name'])
+        self._log(board, 'create_group', {'group_id': group['id'], 'group_title': group['title']})
+        return 'group', group
+
+    def _resolve_mutation_duplicate_group(self, arguments: dict):
+        board = self._get_board(arguments.get('board_id'))
+        group = self._get_group(board, arguments.get('group_id'))
+        duplicate = self.add_group(board['id'], arguments.get('group_title') or 'Duplicate of {}'.format(group['title']), add_to_top=arguments.get('add_to_top', False))
+        for item in self._get_group_items(board, group['id']):
+            self._duplicate_item(item, group_id=duplicate['id'])
+        return 'group', duplicate
+
+    def _resolve_mutation_archive_group(self, arguments: dict):
+        board = self._get_board(arguments.get('board_id'))
+        group = self._get_group(board, arguments.get('group_id'))
+        group['archived'] = True
+        self._log(board, 'archive_group', {'group_id': group['id']})
+        return 'group', group
+
+    def _resolve_mutation_delete_group(self, arguments: dict):
+        board = self._get_board(arguments.get('board_id'))
+        group = self._get_group(board, arguments.get('group_id'))
+        group['deleted'] = True
+        board['groups'].remove(group)
+        for item in self._get_group_items(board, group['id']):
+            item['state'] = 'deleted'
+            board['item_ids'].remove(item['id'])
+        self._log(board, 'delete_group', {'group_id': group['id']})
+        return 'group', group
+
+    ## Item mutations
+
+    def _resolve_mutation_create_item(self, arguments: dict):
+        values = arguments.get('column_values')
+        item = self.add_item(arguments.get('board_id'), arguments['item_name'], arguments.get('group_id'), json.loads(values) if values else None)
+        return 'item', item
+
+    def _resolve_mutation_create_subitem(self, arguments: dict):
+        parent = self._get_item(arguments.get('parent_item_id'))
+        board = self._get_subitems_board(self.boards[parent['board_id']])
+        values = arguments.get('column_values')
+        item = self.add_item(board['id'], arguments['item_name'], column_values=json.loads(values) if values else None, parent_item_id=parent['id'])
+        parent['subitem_ids'].append(item['id'])
+        return 'item', item
+
+    def _resolve_mutation_clear_item_updates(self, arguments: dict):
+        item = self._get_item(arguments.get('item_id'))
+        for update_id in item['update_ids']:
+            self.updates.pop(update_id, None)
+        item['update_ids'] = []
+        return 'item', item
+
+    def _resolve_mutation_move_item_to_group(self, arguments: dict):
+        item = self._get_item(arguments.get('item_id'))
+        board = self.boards[item['board_id']]
+        group = self._get_group(board, arguments.get('group_id'))
+        item['group_id'] = group['id']
+        self._touch(item)
+        self._log(board, 'move_pulse_into_group', {'pulse_id': item['id'], 'dest_group_id': group['id']})
+        return 'item', item
+
+    def _resolve_mutation_archive_item(self, arguments: dict):
+        item = self._get_item(arguments.get('item_id'))
+        item['state'] = 'archived'
+        self._touch(item)
+        self._log(self.boards[item['board_id']], 'archive_pulse', {'pulse_id': item['id']})
+        return 'item', item
+
+    def _resolve_mutation_delete_item(self, arguments: dict):
+        item = self._get_item(arguments.get('item_id'))
+        item['state'] = 'deleted'
+        board = self.boards[item['board_id']]
+        board['item_ids'].remove(item['id'])
+        self._log(board, 'delete_pulse', {'pulse_id': item['id']})
+        return 'item', item
+
+    def _resolve_mutation_duplicate_item(self, arguments: dict):
+        item = self._get_item(arguments.get('item_id'), arguments.get('board_id'))
+        return 'item', self._duplicate_item(item, arguments.get('with_updates', False))
+
+    ## Update, notification and tag mutations
+
+    def _resolve_mutation_create_update(self, arguments: dict):
+        item = self._get_item(arguments.get('item_id'))
+        now = _now_iso()
+        update = {'id': self._next_id(), 'body': arguments['body'], 'text_body': arguments['body'], 'item_id': item['id'],
+                  'creator_id': self.me['id'], 'created_at': now, 'updated_at': now, 'parent_id': arguments.get('parent_id'),
+                  'reply_ids': [], 'asset_ids': []}
+        self.updates[update['id']] = update
+        if update['parent_id'] and update['parent_id'] in self.updates:
+            self.updates[update['parent_id']]['reply_ids'].append(update['id'])
+        else:
+            item['update_ids'].insert(0, update['id'])
+        return 'update', update
+
+    def _resolve_mutation_delete_update(self, arguments: dict):
+        update = self.updates.pop(_to_int(arguments.get('id')), None)
+        if not update:
+            raise FakeApiError('InvalidUpdateIdException', 'Update not found.')
+        item = self.items.get(update['item_id'])
+        if item and update['id'] in item['update_ids']:
+            item['update_ids'].remove(update['id'])
+        return 'update', update
+
+    def _resolve_mutation_create_notification(self, arguments: dict):
+        self._get_user(arguments.get('user_id'))
+        notification = {'id': self._next_id(), 'text': arguments.get('text'), 'user_id': arguments.get('user_id'),
+                        'target_id': arguments.get('target_id'), 'target_type': arguments.get('target_type')}
+        self.notifications[notification['id']] = notification
+        return 'notification', notification
+
+    def _resolve_mutation_create_or_get_tag(self, arguments: dict):
+        for tag in self.tags.values():
+            if tag['name'] == arguments['tag_name']:
+                return 'tag', tag
+        tag = {'id': self._next_id(), 'name': arguments['tag_name'], 'color': '#00c875'}
+        self.tags[tag['id']] = tag
+        return 'tag', tag
+
+    ## File mutations
+
+    def _resolve_mutation_add_file_to_update(self, arguments: dict):
+        update = self.updates.get(_to_int(arguments.get('update_id')))
+        if not update:
+            raise FakeApiError('InvalidUpdateIdException', 'Update not found.')
+        asset = self._add_asset(arguments.get('file'))
+        update['asset_ids'].append(asset['id'])
+        return 'asset', asset
+
+    def _resolve_mutation_add_file_to_column(self, arguments: dict):
+        item = self._get_item(arguments.get('item_id'))
+        column = self._get_column(self.boards[item['board_id']], arguments.get('column_id'))
+        asset = self._add_asset(arguments.get('file'))
+        value = json.loads(item['values'].get(column['id']) or '{"files": []}')
+        value['files'].append({'name': asset['name'], 'assetId': asset['id'], 'isImage': 'false', 'fileType': 'ASSET',
+                               'createdAt': int(time.time() * 1000), 'createdBy': str(self.me['id'])})
+        self._change_values(item, {column['id']: value})
+        return 'asset', asset
+
+    ## Webhook and workspace mutations
+
+    def _resolve_mutation_create_webhook(self, arguments: dict):
+        board = self._get_board(arguments.get('board_id'))
+        webhook = {'id': self._next_id(), 'board_id': board['id'], 'url': arguments.get('url'), 'event': arguments.get('event'), 'config': arguments.get('config')}
+        self.webhooks[webhook['id']] = webhook
+        return 'webhook', webhook
+
+    def _resolve_mutation_delete_webhook(self, arguments: dict):
+        webhook = self.webhooks.pop(_to_int(arguments.get('id')), None)
+        if not webhook:
+            raise FakeApiError('ResourceNotFoundException', 'Webhook not found.')
+        return 'webhook', webhook
+
+    def _resolve_mutation_create_workspace(self, arguments: dict):
+        return 'workspace', self.add_workspace(arguments['name'], arguments.get('kind', 'open'), arguments.get('description'))
+
+    def _resolve_mutation_add_users_to_workspace(self, arguments: dict):
+        workspace = self._get_workspace(arguments.get('workspace_id'))
+        users = [self._get_user(user_id) for user_id in arguments.get('user_ids') or []]
+        workspace['user_ids'].extend(user['id'] for user in users if user['id'] not in workspace['user_ids'])
+        return 'user', users
+
+    def _resolve_mutation_delete_users_from_workspace(self, arguments: dict):
+        workspace = self._get_workspace(arguments.get('workspace_id'))
+        users = [self._get_user(user_id) for user_id in arguments.get('user_ids') or []]
+        workspace['user_ids'] = [user_id for user_id in workspace['user_ids'] if user_id not in [user['id'] for user in users]]
+        return 'user', users
+
+    def _resolve_mutation_add_teams_to_workspace(self, arguments: dict):
+        workspace = self._get_workspace(arguments.get('workspace_id'))
+        teams = [self._get_team(team_id) for team_id in arguments.get('team_ids') or []]
+        workspace['team_ids'].extend(team['id'] for team in teams if team['id'] not in workspace['team_ids'])
+        return 'team', teams
+
+    def _resolve_mutation_delete_teams_from_workspace(self, arguments: dict):
+        workspace = self._get_workspace(arguments.get('workspace_id'))
+        teams = [self._get_team(team_id) for team_id in arguments.get('team_ids') or []]
+        workspace['team_ids'] = [team_id for team_id in workspace['team_ids'] if team_id not in [team['id'] for team in teams]]
+        return 'team', teams
+
+    ## Object fields
+
+    def _resolve_board_columns(self, board: dict, arguments: dict):
+        columns = board['columns']
+        if arguments.get('ids'):
+            columns = [column for column in columns if column['id'] in arguments['ids']]
+        return 'column', columns
+
+    def _resolve_board_groups(self, board: dict, arguments: dict):
+        groups = [dict(group, board_id=board['id']) for group in board['groups']]
+        if arguments.get('ids'):
+            groups = [group for group in groups if group['id'] in arguments['ids']]
+        return 'group', groups
+
+    def _resolve_board_top_group(self, board: dict, arguments: dict):
+        return 'group', dict(board['groups'][0], board_id=board['id']) if board['groups'] else None
+
+    def _resolve_board_items(self, board: dict, arguments: dict):
+        items = [self.items[item_id] for item_id in board['item_ids'] if self.items[item_id]['state'] == 'active']
+        if arguments.get('ids'):
+            ids = set(_to_int(id) for id in arguments['ids'])
+            items = [item for item in items if item['id'] in ids]
+        if arguments.get('newest_first'):
+            items = list(reversed(items))
+        return 'item', _page(items, arguments, None)
+
+    def _resolve_board_owner(self, board: dict, arguments: dict):
+        return 'user', self.users.get(board['owner_id'])
+
+    def _resolve_board_subscribers(self, board: dict, arguments: dict):
+        return 'user', [self.users[user_id] for user_id in board['subscriber_ids']]
+
+    def _resolve_board_workspace(self, board: dict, arguments: dict):
+        return 'workspace', self.workspaces.get(board['workspace_id'])
+
+    def _resolve_board_updates(self, board: dict, arguments: dict):
+        updates = [update for update in self.updates.values() if update['item_id'] in board['item_ids']]
+        return 'update', _page(sorted(updates, key=lambda update: update['id'], reverse=True), arguments, DEFAULT_PAGE_LIMITS['updates'])
+
+    def _resolve_board_activity_logs(self, board: dict, arguments: dict):
+        logs = list(reversed(board['activity_logs']))
+        start, end = _parse_datetime(arguments.get('from')), _parse_datetime(arguments.get('to'))
+        logs = [log for log in logs if (not start or log['_time'] >= start) and (not end or log['_time'] <= end)]
+        for key, name in (('item_ids', 'pulse_id'), ('column_ids', 'column_id'), ('group_ids', 'group_id'), ('user_ids', '_user_id')):
+            if arguments.get(key):
+                values = set(str(value) for value in arguments[key])
+                logs = [log for log in logs if str(log['_data'].get(name)) in values]
+        return 'activity_log', _page(logs, arguments, DEFAULT_PAGE_LIMITS['activity_logs'])
+
+    def _resolve_board_views(self, board: dict, arguments: dict):
+        return 'view', []
+
+    def _resolve_board_tags(self, board: dict, arguments: dict):
+        return 'tag', []
+
+    def _resolve_group_items(self, group: dict, arguments: dict):
+        board = self.boards[group['board_id']]
+        items = [item for item in self._get_group_items(board, group['id']) if item['state'] == 'active']
+        if arguments.get('ids'):
+            ids = set(_to_int(id) for id in arguments['ids'])
+            items = [item for item in items if item['id'] in ids]
+        return 'item', _page(items, arguments, None)
+
+    def _resolve_item_board(self, item: dict, arguments: dict):
+        return 'board', self.boards[item['board_id']]
+
+    def _resolve_item_group(self, item: dict, arguments: dict):
+        board = self.boards[item['board_id']]
+        group = next((group for group in board['groups'] if group['id'] == item['group_id']), None)
+        return 'group', dict(group, board_id=board['id']) if group else None
+
+    def _resolve_item_column_values(self, item: dict, arguments: dict):
+        board = self.boards[item['board_id']]
+        columns = [column for column in board['columns'] if column['type'] != 'name']
+        if arguments.get('ids'):
+            columns = [column for column in columns if column['id'] in arguments['ids']]
+        return 'column_value', [self._get_column_value(item, column) for column in columns]
+
+    def _resolve_item_subitems(self, item: dict, arguments: dict):
+        return 'item', [self.items[item_id] for item_id in item['subitem_ids'] if self.items[item_id]['state'] != 'deleted']
+
+    def _resolve_item_parent_item(self, item: dict, arguments: dict):
+        return 'item', self.items.get(item['parent_item_id'])
+
+    def _resolve_item_creator(self, item: dict, arguments: dict):
+        return 'user', self.users.get(item['creator_id'])
+
+    def _resolve_item_subscribers(self, item: dict, arguments: dict):
+        return 'user', [self.users[item['creator_id']]]
+
+    def _resolve_item_updates(self, item: dict, arguments: dict):
+        return 'update', _page([self.updates[update_id] for update_id in item['update_ids']], arguments, DEFAULT_PAGE_LIMITS['updates'])
+
+    def _resolve_item_assets(self, item: dict, arguments: dict):
+        board = self.boards[item['board_id']]
+        column_ids = arguments.get('column_ids') or [column['id'] for column in board['columns'] if column['type'] == 'file']
+        assets = []
+        for column_id in column_ids:
+            value = json.loads(item['values'].get(column_id) or '{}')
+            assets.extend(self.assets[file['assetId']] for file in value.get('files', []) if file.get('assetId') in self.assets)
+        return 'asset', assets
+
+    def _resolve_update_creator(self, update: dict, arguments: dict):
+        return 'user', self.users.get(update['creator_id'])
+
+    def _resolve_update_replies(self, update: dict, arguments: dict):
+        return 'update', [self.updates[reply_id] for reply_id in update['reply_ids'] if reply_id in self.updates]
+
+    def _resolve_update_assets(self, update: dict, arguments: dict):
+        return 'asset', [self.assets[asset_id] for asset_id in update['asset_ids']]
+
+    def _resolve_asset_uploaded_by(self, asset: dict, arguments: dict):
+        return 'user', self.users.get(asset['uploaded_by_id'])
+
+    def _resolve_user_account(self, user: dict, arguments: dict):
+        return 'account', self.account
+
+    def _resolve_user_teams(self, user: dict, arguments: dict):
+        return 'team', [self.teams[team_id] for team_id in user['team_ids'] if team_id in self.teams]
+
+    def _resolve_team_users(self, team: dict, arguments: dict):
+        return 'user', [user for user in self.users.values() if team['id'] in user['team_ids']]
+
+    def _resolve_workspace_users(self, workspace: dict, arguments: dict):
+        return 'user', [self.users[user_id] for user_id in workspace['user_ids']]
+
+    ## Store helpers
+
+    def _next_id(self):
+        return next(self._ids)
+
+    def _filter_ids(self, objects: dict, ids: list):
+        if ids is None:
+            return list(objects.values())
+        ids = [_to_int(id) for id in ids]
+        return [objects[id] for id in ids if id in objects]
+
+    def _get_board(self, board_id):
+        board = self.boards.get(_to_int(board_id))
+        if not board:
+            raise FakeApiError('ResourceNotFoundException', 'Board not found.')
+        return board
+
+    def _get_group(self, board: dict, group_id: str):
+        for group in board['groups']:
+            if group['id'] == group_id:
+                return group
+        raise FakeApiError('InvalidGroupIdException', 'Group not found.')
+
+    def _get_column(self, board: dict, column_id: str):
+        for column in board['columns']:
+            if column['id'] == column_id:
+                return column
+        raise FakeApiError('InvalidColumnIdException', 'This column ID doesn\'t exist for the board')
+
+    def _get_item(self, item_id, board_id = None):
+        item = self.items.get(_to_int(item_id))
+        if not item or item['state'] == 'deleted' or (board_id is not None and item['board_id'] != _to_int(board_id)):
+            raise FakeApiError('InvalidItemIdException', 'Item not found.')
+        return item
+
+    def _get_user(self, user_id):
+        user = self.users.get(_to_int(user_id))
+        if not user:
+            raise FakeApiError('InvalidUserIdException', 'User not found.')
+        return user
+
+    def _get_team(self, team_id):
+        team = self.teams.get(_to_int(team_id))
+        if not team:
+            raise FakeApiError('InvalidTeamIdException', 'Team not found.')
+        return team
+
+    def _get_workspace(self, workspace_id):
+        workspace = self.workspaces.get(_to_int(workspace_id))
+        if not workspace:
+            raise FakeApiError('InvalidWorkspaceIdException', 'Workspace not found.')
+        return workspace
+
+    def _get_group_items(self, board: dict, group_id: str):
+        return [self.items[item_id] for item_id in board['item_ids'] if self.items[item_id]['group_id'] == group_id]
+
+    def _get_subitems_board(self, board: dict):
+        for column in board['columns']:
+            if column['type'] == 'subtasks':
+                return self.boards[json.loads(column['settings_str'])['boardIds'][0]]
+        subitems_board = self.add_board('Subitems of {}'.format(board['name']), board_kind='private', workspace_id=board['workspace_id'])
+        self.add_column(board['id'], 'Subitems', 'subtasks', {'allowMultipleItems': True, 'boardIds': [subitems_board['id']]}, id='subitems')
+        return subitems_board
+
+    def _find_items(self, arguments: dict, values: list, name: str):
+        board = self._get_board(arguments.get('board_id'))
+        column = self._get_column(board, arguments.get('column_id'))
+        state = arguments.get('state', 'active')
+        values = set(str(value) for value in values)
+        items = []
+        for item_id in board['item_ids']:
+            item = self.items[item_id]
+            if state != 'all' and item['state'] != state:
+                continue
+            text = item['name'] if column['type'] == 'name' else self._get_column_value(item, column)['text']
+            if text in values:
+                items.append(item)
+        return 'item', _page(items, arguments, DEFAULT_PAGE_LIMITS[name])
+
+    def _duplicate_item(self, item: dict, with_updates: bool = False, group_id: str = None):
+        duplicate = self.add_item(item['board_id'], item['name'], group_id or item['group_id'])
+        duplicate['values'] = dict(item['values'])
+        if with_updates:
+            duplicate['update_ids'] = list(item['update_ids'])
+        return duplicate
+
+    def _add_asset(self, file):
+        if not file:
+            raise FakeApiError('InvalidArgumentException', 'A file is required.')
+        name, contents = file
+        asset = {'id': self._next_id(), 'name': name, 'file_size': len(contents), 'file_extension': os.path.splitext(name)[1],
+                 'created_at': _today(), 'uploaded_by_id': self.me['id']}
+        asset['url'] = asset['public_url'] = '{}/files/{}/{}'.format(self.file_url, asset['id'], name)
+        self.assets[asset['id']] = asset
+        self._files[asset['id']] = (name, contents)
+        return asset
+
+    def _change_values(self, item: dict, values: dict):
+        board = self.boards[item['board_id']]
+        for column_id, value in values.items():
+            if column_id == 'name':
+                self._log(board, 'update_name', {'pulse_id': item['id'], 'previous_value': item['name'], 'value': value})
+                item['name'] = value
+                continue
+            previous = item['values'].get(column_id)
+            self._set_value(item, column_id, value)
+            self._log(board, 'update_column_value', {'pulse_id': item['id'], 'column_id': column_id, 'previous_value': previous, 'value': item['values'].get(column_id)})
+        self._touch(item)
+
+    def _set_value(self, item: dict, column_id: str, value):
+        column = self._get_column(self.boards[item['board_id']], column_id)
+        if column['type'] == 'name':
+            item['name'] = value
+            return
+        item['values'][column['id']] = _normalize_value(column, value)
+
+    def _get_column_value(self, item: dict, column: dict):
+        value = item['values'].get(column['id'])
+        return {'id': column['id'], 'title': column['title'], 'type': column['type'], 'value': value,
+                'text': self._get_text(column, json.loads(value) if value else None), 'additional_info': None}
+
+    def _get_text(self, column: dict, value):
+        if value is None:
+            return ''
+        settings = json.loads(column['settings_str'] or '{}')
+        column_type = column['type']
+        if column_type in ('text', 'numeric', 'email', 'phone', 'link', 'country') and not isinstance(value, dict):
+            return str(value)
+        if column_type == 'long-text':
+            return value.get('text', '')
+        if column_type == 'color':
+            return settings.get('labels', {}).get(str(value.get('index')), '')
+        if column_type == 'dropdown':
+            labels = {label['id']: label['name'] for label in settings.get('labels', [])}
+            return ', '.join(labels.get(id, '') for id in value.get('ids', []))
+        if column_type == 'date':
+            return ' '.join(part for part in (value.get('date'), value.get('time')) if part)
+        if column_type == 'boolean':
+            return 'v' if value.get('checked') in (True, 'true') else ''
+        if column_type == 'timerange':
+            return '{} - {}'.format(value.get('from'), value.get('to'))
+        if column_type in ('board-relation', 'dependency'):
+            ids = [link['linkedPulseId'] for link in value.get('linkedPulseIds', [])]
+            return ', '.join(self.items[id]['name'] for id in ids if id in self.items)
+        if column_type == 'multiple-person':
+            ids = [person['id'] for person in value.get('personsAndTeams', []) if person.get('kind') == 'person']
+            return ', '.join(self.users[id]['name'] for id in ids if id in self.users)
+        if column_type == 'file':
+            return ', '.join(self.assets[file['assetId']]['public_url'] for file in value.get('files', []) if file.get('assetId') in self.assets)
+        if column_type in ('email', 'link', 'phone', 'country'):
+            return value.get('text') or value.get('url') or value.get('phone') or value.get('countryName') or ''
+        if column_type == 'numeric':
+            return str(value)
+        if column_type == 'text':
+            return value.get('text', '')
+        return json.dumps(value)
+
+    def _touch(self, item: dict):
+        item['updated_at'] = _now_iso()
+        self.boards[item['board_id']]['updated_at'] = item['updated_at']
+
+    def _log(self, board: dict, event: str, data: dict):
+        now = datetime.now(timezone.utc)
+        data = dict(data, board_id=board['id'])
+        board['activity_logs'].append({
+            'id': str(uuid.uuid4()), 'event': event, 'entity': 'pulse' if 'pulse_id' in data else 'board',
+            'data': json.dumps(data), 'created_at': str(int(now.timestamp() * 10 ** 7)), 'user_id': str(self.me['id']),
+            'account_id': str(self.account['id']), '_time': now, '_data': dict(data, _user_id=self.me['id'])})
+
+
+def _normalize_value(column: dict, value):
+    """Convert a written column value to the stored JSON string."""
+
+    if value is None or value == {} or value == '':
+        return None
+    settings = json.loads(column['settings_str'] or '{}')
+    column_type = column['type']
+    if isinstance(value, str) and column_type not in ('text', 'numeric'):
+        # Simple values as accepted by change_simple_column_value.
+        if column_type == 'color':
+            value = {'label': value}
+        elif column_type == 'dropdown':
+            value = {'labels': [label.strip() for label in value.split(',')]}
+        elif column_type == 'date':
+            value = dict(zip(('date', 'time'), value.split(' ', 1)))
+        elif column_type == 'long-text':
+            value = {'text': value}
+        elif column_type in ('board-relation', 'dependency'):
+            value = {'item_ids': [int(id) for id in value.split(',') if id.strip()]}
+        elif column_type == 'boolean':
+            value = {'checked': 'true'} if value.lower() in ('true', 'v', '1') else {}
+        elif column_type == 'timerange':
+            value = dict(zip(('from', 'to'), [part.strip() for part in value.split(',')]))
+        elif column_type == 'multiple-person':
+            value = {'personsAndTeams': [{'id': int(id), 'kind': 'person'} for id in value.split(',') if id.strip()]}
+        else:
+            return json.dumps(value)
+    if column_type == 'color':
+        labels = settings.get('labels', {})
+        if 'label' in value:
+            index = next((key for key, label in labels.items() if label == value['label']), None)
+            if index is None:
+                raise FakeApiError('ColumnValueException', 'This status label doesn\'t exist')
+            value = {'index': int(index)}
+        return json.dumps({'index': int(value['index']), 'post_id': None, 'changed_at': _now_iso()})
+    if column_type == 'dropdown' and 'labels' in value:
+        ids = {label['name']: label['id'] for label in settings.get('labels', [])}
+        missing = [label for label in value['labels'] if label not in ids]
+        if missing:
+            raise FakeApiError('ColumnValueException', 'The dropdown label {} does not exist'.format(missing[0]))
+        value = {'ids': [ids[label] for label in value['labels']]}
+    if column_type in ('board-relation', 'dependency') and 'item_ids' in value:
+        value = {'linkedPulseIds': [{'linkedPulseId': int(id)} for id in value['item_ids']]}
+        if not value['linkedPulseIds']:
+            return None
+    if column_type == 'boolean' and value.get('checked') in (None, False, 'false'):
+        return None
+    if column_type in ('text', 'numeric') and isinstance(value, (int, float)):
+        value = str(value)
+    return json.dumps(value)
+
+
+def _substitute(value, variables: dict, files: dict):
+    if isinstance(value, Variable):
+        if value.name in files:
+            return files[value.name]
+        return variables.get(value.name)
+    if isinstance(value, dict):
+        return {key: _substitute(element, variables, files) for key, element in value.items()}
+    if isinstance(value, list):
+        return [_substitute(element, variables, files) for element in value]
+    return value
+
+
+def _page(values: list, arguments: dict, default_limit: int = None):
+    limit = arguments.get('limit') or (None if arguments.get('ids') else default_limit)
+    if not limit:
+        return values
+    page = max(1, arguments.get('page') or 1)
+    return values[(page - 1) * limit:page * limit]
+
+
+def _format_scalar(name: str, value):
+    # Identifiers are returned as strings, like the ID type of the monday.com schema.
+    if isinstance(value, int) and not isinstance(value, bool) and (name == 'id' or name.endswith('_id')):
+        return str(value)
+    return value
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _get_key(title: str, existing: list):
+    base = ''.join(char if char.isalnum() else '_' for char in title.lower()).strip('_') or 'column'
+    key = base
+    for index in itertools.count(1):
+        if key not in existing:
+            return key
+        key = '{}{}'.format(base, index)
+
+
+def _parse_datetime(value: str):
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _now_iso():
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _today():
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d')
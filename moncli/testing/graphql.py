@@ -0,0 +1,178 @@
+import json, re
+
+
+class GraphQLSyntaxError(Exception):
+    """A query the fake backend cannot parse."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
+class Selection(object):
+    """A parsed GraphQL field selection.
+
+    Properties
+
+        name : `str`
+            The field name.
+        arguments : `dict`
+            The field arguments as Python values.
+        selections : `list[moncli.testing.graphql.Selection]`
+            The selected child fields.
+    """
+
+    def __init__(self, name: str, arguments: dict = None, selections: list = None):
+        self.name = name
+        self.arguments = arguments or {}
+        self.selections = selections or []
+
+    def __repr__(self):
+        return str({'name': self.name, 'arguments': self.arguments, 'selections': self.selections})
+
+
+class Variable(object):
+    """A reference to a query variable."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+_TOKEN = re.compile(r'\s*(?:(?P<string>"(?:[^"\\]|\\.)*")|(?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)|(?P<name>[_A-Za-z][_0-9A-Za-z]*)|(?P<punctuator>[{}()\[\]:,$!=]))', re.S)
+
+
+def parse(query: str):
+    """Parse a query generated by `moncli.api_v2.graphql`.
+
+        Parameters
+
+            query : `str`
+                The GraphQL query or mutation.
+
+        Returns
+
+            operation_type : `str`
+                Either "query" or "mutation".
+            selections : `list[moncli.testing.graphql.Selection]`
+                The root field selections.
+    """
+
+    parser = _Parser(query)
+    operation_type = 'query'
+    if parser.peek() in ('query', 'mutation'):
+        operation_type = parser.next()
+        if parser.peek() == '(':
+            parser.skip_group('(', ')')
+    selections = parser.parse_selections()
+    parser.expect(None)
+    return operation_type, selections
+
+
+class _Parser(object):
+
+    def __init__(self, query: str):
+        self._tokens = []
+        position = 0
+        query = query.rstrip()
+        while position < len(query):
+            match = _TOKEN.match(query, position)
+            if not match:
+                raise GraphQLSyntaxError('Unexpected character "{}" at position {}.'.format(query[position], position))
+            self._tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            position = match.end()
+        self._index = 0
+
+    def peek(self):
+        if self._index >= len(self._tokens):
+            return None
+        return self._tokens[self._index][1]
+
+    def next(self):
+        if self._index >= len(self._tokens):
+            raise GraphQLSyntaxError('Unexpected end of query.')
+        token = self._tokens[self._index]
+        self._index += 1
+        return token[1]
+
+    def expect(self, value):
+        if self.peek() != value:
+            raise GraphQLSyntaxError('Expected "{}" but found "{}".'.format(value, self.peek()))
+        if value is not None:
+            self._index += 1
+
+    def skip_group(self, opening: str, closing: str):
+        depth = 0
+        while True:
+            token = self.next()
+            if token == opening:
+                depth += 1
+            elif token == closing:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def parse_selections(self):
+        self.expect('{')
+        selections = []
+        while self.peek() != '}':
+            if self.peek() == ',':
+                self.next()
+                continue
+            selections.append(self.parse_selection())
+        self.expect('}')
+        return selections
+
+    def parse_selection(self):
+        kind, name = self._tokens[self._index] if self._index < len(self._tokens) else (None, None)
+        if kind != 'name':
+            raise GraphQLSyntaxError('Expected a field name but found "{}".'.format(name))
+        self._index += 1
+        arguments = {}
+        if self.peek() == '(':
+            self.next()
+            while self.peek() != ')':
+                if self.peek() == ',':
+                    self.next()
+                    continue
+                key = self.next()
+                self.expect(':')
+                arguments[key] = self.parse_value()
+            self.expect(')')
+        selections = self.parse_selections() if self.peek() == '{' else []
+        return Selection(name, arguments, selections)
+
+    def parse_value(self):
+        kind, token = self._tokens[self._index] if self._index < len(self._tokens) else (None, None)
+        self._index += 1
+        if kind == 'string':
+            try:
+                return json.loads(token)
+            except ValueError:
+                return token[1:-1]
+        if kind == 'number':
+            return float(token) if any(char in token for char in '.eE') else int(token)
+        if kind == 'name':
+            return {'true': True, 'True': True, 'false': False, 'False': False, 'null': None, 'None': None}.get(token, token)
+        if token == '$':
+            return Variable(self.next())
+        if token == '[':
+            values = []
+            while self.peek() != ']':
+                if self.peek() == ',':
+                    self.next()
+                    continue
+                values.append(self.parse_value())
+            self.expect(']')
+            return values
+        if token == '{':
+            values = {}
+            while self.peek() != '}':
+                if self.peek() == ',':
+                    self.next()
+                    continue
+                key = self.parse_value()
+                self.expect(':')
+                values[key] = self.parse_value()
+            self.expect('}')
+            return values
+        raise GraphQLSyntaxError('Unexpected value "{}".'.format(token))
@@ -0,0 +1,258 @@
+import base64, gzip, json, threading, time
+from collections import deque
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from .graphql import GraphQLSyntaxError, parse
+from .server import FakeResponse, _get_header, _parse_multipart
+
+
+FORMAT = 'moncli-recording'
+VERSION = 1
+# Only the response headers the client reads are kept.
+RECORDED_HEADERS = ('Content-Type', 'Retry-After')
+
+
+class ReplayError(Exception):
+    """A request that is not in the replayed recording."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
+class Recording(object):
+    """Request and response pairs captured from a client run.
+
+    Properties
+
+        exchanges : `list[dict]`
+            The recorded exchanges in the order they completed, with the method, query,
+            variables, uploaded file names, status code, response and elapsed seconds.
+
+    Methods
+
+        save : `void`
+            Write the recording to a JSON lines file, gzipped if the path ends with ".gz".
+        load : `moncli.testing.Recording`
+            Read a recording from a file.
+        get_operation_counts : `dict`
+            Get the number of requests per root operation.
+    """
+
+    def __init__(self, exchanges: list = None):
+        self.exchanges = exchanges or []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.exchanges)
+
+    def add(self, exchange: dict):
+        with self._lock:
+            self.exchanges.append(exchange)
+
+    def save(self, path: str):
+        """Write the recording to a JSON lines file, gzipped if the path ends with ".gz"."""
+
+        with _open(path, 'wt') as file:
+            file.write(json.dumps({'format': FORMAT, 'version': VERSION}) + '\n')
+            for exchange in self.exchanges:
+                file.write(json.dumps(exchange, separators=(',', ':')) + '\n')
+
+    @classmethod
+    def load(cls, path: str):
+        """Read a recording from a file written by `save`."""
+
+        with _open(path, 'rt') as file:
+            header = json.loads(file.readline())
+            if header.get('format') != FORMAT or header.get('version') != VERSION:
+                raise ValueError('{} is not a version {} moncli recording.'.format(path, VERSION))
+            return cls([json.loads(line) for line in file if line.strip()])
+
+    def get_operation_counts(self):
+        """Get the number of requests per root operation (e.g. "boards" or "change_column_value")."""
+
+        counts = {}
+        for exchange in self.exchanges:
+            name = exchange.get('operation') or exchange['method']
+            counts[name] = counts.get(name, 0) + 1
+        return counts
+
+
+class RecordingSession(object):
+    """Forwards requests to another session and records the exchanges."""
+
+    def __init__(self, session, recording: Recording):
+        self.session = session
+        self.recording = recording
+
+    def post(self, url: str, headers: dict = None, data = None, timeout = None, **kwargs):
+        headers = headers or {}
+        if not isinstance(data, dict):
+            # Streamed bodies are read once here so they can be both recorded and sent.
+            data = data if isinstance(data, bytes) else b''.join(data)
+        start = time.perf_counter()
+        response = self.session.post(url, headers=headers, data=data, timeout=timeout, **kwargs)
+        elapsed = time.perf_counter() - start
+        exchange = dict(_get_request_key(headers, data), method='POST', elapsed=round(elapsed, 6), **_get_response(response, False))
+        self.recording.add(exchange)
+        return _create_response(exchange)
+
+    def get(self, url: str, stream: bool = False, timeout = None, **kwargs):
+        start = time.perf_counter()
+        with self.session.get(url, stream=stream, timeout=timeout, **kwargs) as response:
+            exchange = dict(method='GET', path=urlparse(url).path, **_get_response(response, True))
+        exchange['elapsed'] = round(time.perf_counter() - start, 6)
+        self.recording.add(exchange)
+        return _create_response(exchange)
+
+
+class ReplaySession(object):
+    """Answers requests from a recording.
+
+    Identical requests are answered with their recorded responses in order, and the last
+    response is repeated once they run out.
+
+    Properties
+
+        recording : `moncli.testing.Recording`
+            The replayed recording.
+        latency : `bool`
+            Wait for the recorded elapsed time before answering.
+        requests : `list[dict]`
+            The replayed exchanges, in the order they were requested.
+    """
+
+    def __init__(self, recording: Recording, latency: bool = False):
+        self.recording = recording
+        self.latency = latency
+        self.requests = []
+        self._lock = threading.Lock()
+        self._queues = {}
+        for exchange in recording.exchanges:
+            self._queues.setdefault(_get_exchange_key(exchange), deque()).append(exchange)
+
+    def post(self, url: str, headers: dict = None, data = None, timeout = None, **kwargs):
+        if not isinstance(data, (dict, bytes)):
+            data = b''.join(data)
+        request = dict(_get_request_key(headers or {}, data), method='POST')
+        return self._replay(request)
+
+    def get(self, url: str, stream: bool = False, timeout = None, **kwargs):
+        return self._replay({'method': 'GET', 'path': urlparse(url).path})
+
+    def _replay(self, request: dict):
+        key = _get_exchange_key(request)
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise ReplayError('No recorded response for {} {}.'.format(request['method'], request.get('query') or request.get('path')))
+            exchange = queue.popleft() if len(queue) > 1 else queue[0]
+            self.requests.append(exchange)
+        if self.latency:
+            time.sleep(exchange['elapsed'])
+        return _create_response(exchange)
+
+
+@contextmanager
+def record(path: str = None):
+    """Record the client's requests and responses while the context is open.
+
+        Parameters
+
+            path : `str`
+                The file to save the recording to when the context closes, if any.
+
+        Returns
+
+            recording : `moncli.testing.Recording`
+                The recorded exchanges.
+    """
+
+    from ..api_v2 import requests
+    session = requests._session
+    recording = Recording()
+    requests._session = RecordingSession(requests.get_session(), recording)
+    try:
+        yield recording
+    finally:
+        requests._session = session
+        if path:
+            recording.save(path)
+
+
+@contextmanager
+def replay(recording, latency: bool = False):
+    """Answer the client's requests from a recording while the context is open.
+
+        Parameters
+
+            recording : `moncli.testing.Recording | str`
+                The recording or the path of a saved recording.
+            latency : `bool`
+                Wait for the recorded elapsed time before answering each request.
+
+        Returns
+
+            session : `moncli.testing.ReplaySession`
+                The replaying session, logging the replayed exchanges.
+    """
+
+    from ..api_v2 import requests
+    if not isinstance(recording, Recording):
+        recording = Recording.load(recording)
+    session = requests._session
+    requests._session = ReplaySession(recording, latency)
+    try:
+        yield requests._session
+    finally:
+        requests._session = session
+
+
+def _open(path: str, mode: str):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode, encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def _get_request_key(headers: dict, data):
+    files = []
+    if isinstance(data, dict):
+        fields = data
+    else:
+        fields, files = _parse_multipart(data, _get_header(headers, 'Content-Type'))
+        files = sorted(file_name for file_name, _ in files.values())
+    query = fields.get('query') or ''
+    variables = fields.get('variables')
+    if isinstance(variables, str):
+        variables = json.loads(variables) if variables not in ('', 'None') else None
+    try:
+        operation = ','.join(selection.name for selection in parse(query)[1] if selection.name != 'complexity')
+    except GraphQLSyntaxError:
+        operation = None
+    return {'query': query, 'variables': variables, 'files': files, 'operation': operation}
+
+
+def _get_exchange_key(exchange: dict):
+    if exchange['method'] == 'GET':
+        return ('GET', exchange['path'])
+    return ('POST', exchange['query'], json.dumps(exchange['variables'], sort_keys=True), tuple(exchange['files']))
+
+
+def _get_response(response, binary: bool):
+    headers = {name: _get_header(response.headers, name) for name in RECORDED_HEADERS if _get_header(response.headers, name) is not None}
+    result = {'status_code': response.status_code, 'headers': headers}
+    if binary:
+        result['content'] = base64.b64encode(response.content).decode('ascii')
+        return result
+    try:
+        result['body'] = response.json()
+    except ValueError:
+        result['content'] = base64.b64encode(response.content).decode('ascii')
+    return result
+
+
+def _create_response(exchange: dict):
+    if 'body' in exchange:
+        return FakeResponse(exchange['status_code'], exchange['body'], dict(exchange['headers']))
+    return FakeResponse(exchange['status_code'], headers=dict(exchange['headers']), content=base64.b64decode(exchange['content']))
@@ -0,0 +1,224 @@
+import json, re, threading
+from contextlib import contextmanager
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from .backend import FakeMondayBackend
+
+
+_FILE_PATH = re.compile(r'^/files/(\d+)(?:/.*)?$')
+
+
+class FakeResponse(object):
+    """A response of the fake backend, with the parts of `requests.Response` moncli uses."""
+
+    def __init__(self, status_code: int, body = None, headers: dict = None, content: bytes = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = content if content is not None else json.dumps(body).encode('utf-8')
+        self._body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return self._body if self._body is not None else json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 1):
+        for index in range(0, len(self.content), chunk_size):
+            yield self.content[index:index + chunk_size]
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise IOError('{} error for fake request'.format(self.status_code))
+
+
+class FakeSession(object):
+    """A drop-in for the pooled `requests.Session` answering from a fake backend in-process."""
+
+    def __init__(self, backend: FakeMondayBackend):
+        self.backend = backend
+
+    def post(self, url: str, headers: dict = None, data = None, timeout = None, **kwargs):
+        status_code, body, response_headers = handle_post(self.backend, headers or {}, data)
+        return FakeResponse(status_code, body, response_headers)
+
+    def get(self, url: str, stream: bool = False, timeout = None, **kwargs):
+        return handle_get(self.backend, urlparse(url).path)
+
+
+class FakeMondayServer(object):
+    """Serves a fake backend over local HTTP.
+
+    Properties
+
+        backend : `moncli.testing.FakeMondayBackend`
+            The served backend.
+        url : `str`
+            The server's base url.
+
+    Methods
+
+        start : `moncli.testing.FakeMondayServer`
+            Start serving in a background thread.
+        stop : `void`
+            Stop serving.
+        install : `contextmanager`
+            Point the client's API endpoints at the server.
+    """
+
+    def __init__(self, backend: FakeMondayBackend = None, host: str = '127.0.0.1', port: int = 0):
+        self.backend = backend or FakeMondayBackend()
+        self._server = ThreadingHTTPServer((host, port), _create_handler(self.backend))
+        self._server.daemon_threads = True
+        self._thread = None
+        self.url = 'http://{}:{}'.format(*self._server.server_address[:2])
+        self.backend.file_url = self.url
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        """Start serving in a background thread."""
+
+        if not self._thread:
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving."""
+
+        if self._thread:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    @contextmanager
+    def install(self):
+        """Point the client's API endpoints at the server while the context is open."""
+
+        from ..api_v2 import requests
+        endpoints = requests.API_V2_ENDPOINT, requests.API_V2_FILE_ENDPOINT
+        requests.API_V2_ENDPOINT, requests.API_V2_FILE_ENDPOINT = self.url + '/v2', self.url + '/v2/file'
+        try:
+            yield self
+        finally:
+            requests.API_V2_ENDPOINT, requests.API_V2_FILE_ENDPOINT = endpoints
+
+
+@contextmanager
+def install(backend: FakeMondayBackend = None):
+    """Route the client's requests to a fake backend in-process while the context is open.
+
+        Parameters
+
+            backend : `moncli.testing.FakeMondayBackend`
+                The backend to use, a new one by default.
+
+        Returns
+
+            backend : `moncli.testing.FakeMondayBackend`
+                The installed backend.
+    """
+
+    from ..api_v2 import requests
+    backend = backend or FakeMondayBackend()
+    session = requests._session
+    requests._session = FakeSession(backend)
+    try:
+        yield backend
+    finally:
+        requests._session = session
+
+
+def handle_post(backend: FakeMondayBackend, headers: dict, data):
+    """Execute a form, JSON or multipart request body against a backend."""
+
+    content_type = _get_header(headers, 'Content-Type') or ''
+    api_key = _get_header(headers, 'Authorization')
+    files = {}
+    if isinstance(data, dict):
+        fields = data
+    elif content_type.startswith('multipart/form-data'):
+        body = data if isinstance(data, bytes) else b''.join(data)
+        fields, files = _parse_multipart(body, content_type)
+    elif content_type.startswith('application/json'):
+        fields = json.loads(data)
+    else:
+        fields = {key: values[0] for key, values in parse_qs(data.decode('utf-8') if isinstance(data, bytes) else data or '').items()}
+    variables = fields.get('variables')
+    if isinstance(variables, str):
+        variables = json.loads(variables) if variables not in ('', 'None') else None
+    return backend.execute(fields.get('query', ''), variables, api_key, files)
+
+
+def handle_get(backend: FakeMondayBackend, path: str):
+    """Download an uploaded asset from a backend."""
+
+    match = _FILE_PATH.match(path)
+    file = backend.get_file(match.group(1)) if match else None
+    if not file:
+        return FakeResponse(404, content=b'Not Found')
+    return FakeResponse(200, content=file[1], headers={'Content-Type': 'application/octet-stream'})
+
+
+def _get_header(headers: dict, name: str):
+    for key, value in headers.items():
+        if key.lower() == name.lower():
+            return value
+    return None
+
+
+def _parse_multipart(body: bytes, content_type: str):
+    message = BytesParser().parsebytes(b'Content-Type: ' + content_type.encode('utf-8') + b'\r\n\r\n' + body)
+    fields, files = {}, {}
+    for part in message.get_payload():
+        name = part.get_param('name', header='content-disposition')
+        file_name = part.get_filename()
+        contents = part.get_payload(decode=True)
+        if file_name is not None:
+            # Variables are posted as "variables[name]".
+            files[name[len('variables['):-1] if name.startswith('variables[') else name] = (file_name, contents)
+        else:
+            fields[name] = contents.decode('utf-8')
+    return fields, files
+
+
+def _create_handler(backend: FakeMondayBackend):
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            status_code, data, headers = handle_post(backend, dict(self.headers.items()), body)
+            self._respond(status_code, json.dumps(data).encode('utf-8'), dict(headers, **{'Content-Type': 'application/json'}))
+
+        def do_GET(self):
+            response = handle_get(backend, urlparse(self.path).path)
+            self._respond(response.status_code, response.content, response.headers)
+
+        def _respond(self, status_code: int, content: bytes, headers: dict):
+            self.send_response(status_code)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
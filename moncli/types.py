@@ -1,9 +1,7 @@
-import pytz, json, re
+import json, re
 from datetime import datetime, timedelta, timezone
 from enum import EnumMeta
-from pytz.exceptions import UnknownTimeZoneError
 
-from pycountry import countries
 from schematics.exceptions import ConversionError, ValidationError
 from schematics.types import BaseType
 
@@ -43,6 +41,7 @@ class MondayType(BaseType):
         value = self.metadata.get('changed_at', None)
         if not value:
             return None
+        import pytz
         changed_at = datetime.strptime(value, ZULU_FORMAT)
         utc = pytz.timezone('UTC')
         changed_at = utc.localize(changed_at, is_dst=False)
@@ -118,6 +117,7 @@ class CountryType(MondayType):
         return self.null_value
     
     def validate_country(self, value): 
+        from pycountry import countries
         country = countries.get(name=value.name)
         if not country:
             raise ValidationError('Value "{}" is not a valid country.'.format(value.name))
@@ -410,9 +410,12 @@ class NumberType(MondayType):
     
     def _cast(self, value):
         try:
-            number_value = int(value) if int(value) else float(value)
-            return number_value
-        except TypeError:
+            return int(value)
+        except ValueError:
+            pass
+        try:
+            return float(value)
+        except ValueError:
             raise ConversionError('Couldn\'t interpret str {} as int or float.'.format(value))
     
     def _export(self, value):
@@ -522,6 +525,7 @@ class PhoneType(MondayType):
         return self.null_value
     
     def validate_country_code(self, value):
+        from pycountry import countries
         country = countries.get(alpha_2=value.code)
         if not country:
             raise ValidationError('Value "{}" is not a valid alpha 2 country code.'.format(value.code))
@@ -677,9 +681,10 @@ class TimeZoneType(MondayType):
         return {'timezone': value}
 
     def validate_timezone(self, value):
+        import pytz
         try:
             pytz.timezone(value)
-        except (UnknownTimeZoneError):
+        except (pytz.UnknownTimeZoneError):
             raise ValidationError('Unknown time zone "{}".'.format(value))
 
 
@@ -700,4 +705,58 @@ class WeekType(MondayType):
             return self.null_value
         start =  value.start.strftime(DATE_FORMAT) 
         end  = value.end.strftime(DATE_FORMAT)
-        return  {'week': {'startDate': start, 'endDate': end}}
\ No newline at end of file
+        return  {'week': {'startDate': start, 'endDate': end}}
+
+MONDAY_TYPE_MAPPINGS = {
+    enums.ColumnType.checkbox: CheckboxType,
+    enums.ColumnType.country: CountryType,
+    enums.ColumnType.creation_log: CreationLogType,
+    enums.ColumnType.date: DateType,
+    enums.ColumnType.dependency: DependencyType,
+    enums.ColumnType.dropdown: DropdownType,
+    enums.ColumnType.email: EmailType,
+    enums.ColumnType.hour: HourType,
+    enums.ColumnType.board_relation: ItemLinkType,
+    enums.ColumnType.last_updated: LastUpdatedType,
+    enums.ColumnType.link: LinkType,
+    enums.ColumnType.location: LocationType,
+    enums.ColumnType.long_text: LongTextType,
+    enums.ColumnType.numbers: NumberType,
+    enums.ColumnType.people: PeopleType,
+    enums.ColumnType.phone: PhoneType,
+    enums.ColumnType.rating: RatingType,
+    enums.ColumnType.status: StatusType,
+    enums.ColumnType.subitems: SubItemType,
+    enums.ColumnType.tags: TagsType,
+    enums.ColumnType.text: TextType,
+    enums.ColumnType.timeline: TimelineType,
+    enums.ColumnType.world_clock: TimeZoneType,
+    enums.ColumnType.week: WeekType
+}
+
+
+def create_monday_type(column_type: enums.ColumnType, id: str, title: str = None, settings_str: str = None):
+    """Create a monday type for a board column.
+
+    Parameters
+
+        column_type : `moncli.ColumnType`
+            The column type to create.
+        id : `str`
+            The column's unique identifier.
+        title : `str`
+            The column's title.
+        settings_str : `str`
+            The column's settings in a string form.
+
+    Returns
+
+        monday_type : `moncli.types.MondayType`
+            The monday type configured with the column settings.  Unmapped column types default to text.
+    """
+
+    monday_type = MONDAY_TYPE_MAPPINGS.get(column_type, TextType)(id=id, title=title)
+    settings = json.loads(settings_str) if settings_str else {}
+    for k, v in settings.items():
+        monday_type.metadata[k] = v
+    return monday_type
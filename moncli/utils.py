@@ -0,0 +1,25 @@
+def chunk(values, size: int):
+    """Split values into lists of at most `size` values.
+
+        Parameters
+
+            values : `iterable`
+                The values to split.
+            size : `int`
+                The maximum chunk size.
+
+        Returns
+
+            chunks : `generator[list]`
+                The chunks, in order.
+    """
+
+    values = list(values)
+    for index in range(0, len(values), size):
+        yield values[index:index + size]
+
+
+def unique(values):
+    """Get values without duplicates, keeping their first occurrence order."""
+
+    return list(dict.fromkeys(values))
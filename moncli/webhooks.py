@@ -0,0 +1,486 @@
+import asyncio, inspect, json, logging
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from . import column_value as cv
+from .enums import ColumnType, WebhookEventType
+from .entities.column import COLUMN_TYPE_MAPPINGS
+from .error import ColumnValueError
+
+
+logger = logging.getLogger(__name__)
+
+# Webhook payload event types mapped to the event types used to register webhooks.
+EVENT_TYPE_MAPPINGS = {
+    'create_pulse': WebhookEventType.create_item,
+    'update_column_value': WebhookEventType.change_column_value,
+    'create_update': WebhookEventType.create_update,
+    'update_name': WebhookEventType.change_name,
+    'create_subitem': WebhookEventType.create_subitem,
+    'update_subitem_column_value': WebhookEventType.change_subitem_column_value,
+    'update_subitem_name': WebhookEventType.change_subitem_name,
+    'create_subitem_update': WebhookEventType.create_subitem_update
+}
+
+MAX_REQUEST_SIZE = 1024 * 1024
+HTTP_STATUS_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large'}
+
+
+class WebhookEvent(object):
+    """A decoded webhook event.
+
+    Properties
+
+        type : `moncli.enums.WebhookEventType`
+            The event type, or None for event types unknown to moncli.
+        board_id : `str`
+            The unique identifier of the event's board.
+        item_id : `str`
+            The unique identifier of the event's item.
+        item_name : `str`
+            The item's name.
+        group_id : `str`
+            The unique identifier of the item's group.
+        parent_item_id : `str`
+            The unique identifier of the parent item for subitem events.
+        user_id : `str`
+            The unique identifier of the user that triggered the event.
+        column_id : `str`
+            The unique identifier of the changed column.
+        column_value : `moncli.column_value.ColumnValue`
+            The changed column's new value.
+        previous_column_value : `moncli.column_value.ColumnValue`
+            The changed column's previous value.
+        trigger_uuid : `str`
+            The event's unique identifier, shared by retries of the same event.
+        triggered_at : `datetime`
+            The time at which the event was triggered.
+        data : `dict`
+            The raw event payload.
+    """
+
+    def __init__(self, data: dict, settings_str: str = None):
+        self.data = data
+        self.type = EVENT_TYPE_MAPPINGS.get(data.get('type'))
+        self.board_id = _to_str(data.get('boardId'))
+        self.item_id = _to_str(data.get('pulseId'))
+        self.item_name = data.get('pulseName')
+        self.group_id = data.get('groupId')
+        self.parent_item_id = _to_str(data.get('parentItemId'))
+        self.user_id = _to_str(data.get('userId'))
+        self.column_id = data.get('columnId')
+        self.trigger_uuid = data.get('triggerUuid')
+        self.triggered_at = _parse_time(data.get('triggerTime'))
+        self.column_value = None
+        self.previous_column_value = None
+        if self.column_id and 'value' in data:
+            self.column_value = decode_column_value(data, data.get('value'), settings_str)
+            self.previous_column_value = decode_column_value(data, data.get('previousValue'), settings_str)
+
+    def __repr__(self):
+        return str({'type': self.type, 'board_id': self.board_id, 'item_id': self.item_id, 'column_id': self.column_id})
+
+    @property
+    def is_column_change(self):
+        """Whether the event changes a column value."""
+
+        return self.column_value is not None
+
+
+class WebhookServer(object):
+    """An asyncio server receiving monday.com webhooks.
+
+    The server answers the challenge handshake, decodes event payloads, drops retried
+    events and delivers events to the registered hooks in batches per board.
+
+    Properties
+
+        host : `str`
+            The host to listen on.
+        port : `int`
+            The port to listen on.
+        path : `str`
+            The request path that receives webhooks.
+        batch_interval : `float`
+            Seconds to collect a board's events before delivering them.
+        max_batch_size : `int`
+            The number of events that triggers an immediate delivery.
+
+    Methods
+
+        on_events : `callable`
+            Register a hook receiving a board's batched events.
+        on_patch : `callable`
+            Register a hook patching cached state from a single event.
+        on_invalidate : `callable`
+            Register a hook invalidating the cached items of a board.
+        handle_payload : `dict`
+            Decode and enqueue a webhook payload, returning the response body.
+        flush : `void`
+            Deliver all pending event batches.
+        start : `void`
+            Start listening for webhooks.
+        stop : `void`
+            Stop listening and deliver all pending event batches.
+        serve_forever : `void`
+            Start listening and serve until cancelled.
+    """
+
+    def __init__(self, host: str = '0.0.0.0', port: int = 8080, path: str = '/', column_resolver = None, batch_interval: float = 0.5, max_batch_size: int = 100, dedupe_size: int = 10000):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.batch_interval = batch_interval
+        self.max_batch_size = max_batch_size
+        self._column_resolver = column_resolver
+        self._dedupe_size = dedupe_size
+        self._seen = OrderedDict()
+        self._batches = {}
+        self._timers = {}
+        self._event_hooks = []
+        self._patch_hooks = []
+        self._invalidate_hooks = []
+        self._server = None
+
+    def on_events(self, hook):
+        """Register a hook receiving a board's batched events.
+
+            Parameters
+
+                hook : `callable`
+                    A function or coroutine function called with the board id and a list of `WebhookEvent`.
+
+            Returns
+
+                hook : `callable`
+                    The registered hook, so the method can be used as a decorator.
+        """
+
+        self._event_hooks.append(hook)
+        return hook
+
+    def on_patch(self, hook):
+        """Register a hook patching cached state from a single event.
+
+            Parameters
+
+                hook : `callable`
+                    A function or coroutine function called with each `WebhookEvent` before batches are delivered.
+
+            Returns
+
+                hook : `callable`
+                    The registered hook, so the method can be used as a decorator.
+        """
+
+        self._patch_hooks.append(hook)
+        return hook
+
+    def on_invalidate(self, hook):
+        """Register a hook invalidating the cached items of a board.
+
+            Parameters
+
+                hook : `callable`
+                    A function or coroutine function called with the board id and the set of changed item ids.
+
+            Returns
+
+                hook : `callable`
+                    The registered hook, so the method can be used as a decorator.
+        """
+
+        self._invalidate_hooks.append(hook)
+        return hook
+
+    async def handle_payload(self, payload: dict):
+        """Decode and enqueue a webhook payload.
+
+            Parameters
+
+                payload : `dict`
+                    The webhook request body.
+
+            Returns
+
+                response : `dict`
+                    The response body (the echoed challenge during the handshake).
+        """
+
+        # Payloads that are not JSON objects are answered with 400 Bad Request.
+        if not isinstance(payload, dict):
+            raise ValueError('The webhook payload is not a JSON object.')
+        if 'challenge' in payload:
+            return {'challenge': payload['challenge']}
+
+        data = payload.get('event') or {}
+        if not isinstance(data, dict):
+            raise ValueError('The webhook event is not a JSON object.')
+        trigger_uuid = data.get('triggerUuid')
+        if trigger_uuid:
+            if trigger_uuid in self._seen:
+                self._seen.move_to_end(trigger_uuid)
+                return {}
+            self._seen[trigger_uuid] = None
+            if len(self._seen) > self._dedupe_size:
+                self._seen.popitem(last=False)
+
+        settings_str = None
+        if data.get('columnId') and self._column_resolver:
+            settings_str = await _call(self._column_resolver, _to_str(data.get('boardId')), data['columnId'])
+        event = WebhookEvent(data, settings_str)
+
+        batch = self._batches.setdefault(event.board_id, [])
+        batch.append(event)
+        if len(batch) >= self.max_batch_size:
+            await self._flush_board(event.board_id)
+        elif event.board_id not in self._timers:
+            loop = asyncio.get_running_loop()
+            self._timers[event.board_id] = loop.call_later(
+                self.batch_interval, lambda: loop.create_task(self._flush_board(event.board_id)))
+        return {}
+
+    async def flush(self):
+        """Deliver all pending event batches."""
+
+        for board_id in list(self._batches):
+            await self._flush_board(board_id)
+
+    async def start(self):
+        """Start listening for webhooks."""
+
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        if not self.port:
+            self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """Stop listening and deliver all pending event batches."""
+
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.flush()
+
+    async def serve_forever(self):
+        """Start listening and serve until cancelled."""
+
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _flush_board(self, board_id: str):
+        timer = self._timers.pop(board_id, None)
+        if timer:
+            timer.cancel()
+        events = self._batches.pop(board_id, None)
+        if not events:
+            return
+
+        for event in events:
+            for hook in self._patch_hooks:
+                await self._run_hook(hook, event)
+        item_ids = set(event.item_id for event in events if event.item_id)
+        for hook in self._invalidate_hooks:
+            await self._run_hook(hook, board_id, item_ids)
+        for hook in self._event_hooks:
+            await self._run_hook(hook, board_id, events)
+
+    async def _run_hook(self, hook, *args):
+        try:
+            await _call(hook, *args)
+        except Exception:
+            logger.exception('Webhook hook %r failed.', hook)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            status, body = await self._handle_request(reader)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            status, body = 400, {}
+        content = json.dumps(body).encode()
+        writer.write('HTTP/1.1 {} {}\r\nContent-Type: application/json\r\nContent-Length: {}\r\nConnection: close\r\n\r\n'.format(
+            status, HTTP_STATUS_REASONS[status], len(content)).encode() + content)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _handle_request(self, reader: asyncio.StreamReader):
+        request_line = (await reader.readline()).decode('latin-1').split()
+        if len(request_line) < 2:
+            return 400, {}
+        method, path = request_line[0], request_line[1].split('?')[0]
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1')
+            if line in ('\r\n', '\n', ''):
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get('content-length', 0))
+        if length > MAX_REQUEST_SIZE:
+            return 413, {}
+        body = await reader.readexactly(length) if length else b''
+        if path != self.path:
+            return 404, {}
+        if method != 'POST':
+            return 405, {}
+        return 200, await self.handle_payload(json.loads(body or b'{}'))
+
+
+def decode_column_value(data: dict, value: dict, settings_str: str = None):
+    """Decode a webhook column value into a typed column value.
+
+        Webhook values are formatted differently from API column values, so they are
+        converted to the API format before being passed to `create_column_value`.
+
+        Parameters
+
+            data : `dict`
+                The webhook event payload.
+            value : `dict`
+                The webhook column value (`value` or `previousValue`).
+            settings_str : `str`
+                The column's settings, if known.
+
+        Returns
+
+            column_value : `moncli.column_value.ColumnValue`
+                The decoded column value.
+    """
+
+    column_type = COLUMN_TYPE_MAPPINGS.get(data.get('columnType'), ColumnType.text)
+    if value and column_type == ColumnType.status and not settings_str:
+        label = value.get('label') or {}
+        settings_str = json.dumps({'labels': {str(label.get('index')): label.get('text')}})
+    elif value and column_type == ColumnType.dropdown and not settings_str:
+        settings_str = json.dumps({'labels': [{'id': choice['id'], 'name': choice.get('name')} for choice in value.get('chosenValues') or []]})
+
+    converter = WEBHOOK_VALUE_CONVERTERS.get(column_type)
+    raw_value = converter(value) if (value and converter) else value
+    kwargs = {'id': data.get('columnId'), 'title': data.get('columnTitle'), 'settings_str': settings_str}
+    try:
+        return cv.create_column_value(column_type, value=json.dumps(raw_value) if raw_value is not None else None, **kwargs)
+    except (ColumnValueError, KeyError, TypeError, ValueError):
+        logger.warning('Unable to decode webhook value for column "%s".', data.get('columnId'))
+        return cv.ReadonlyValue(value=json.dumps(value), **kwargs)
+
+
+def patch_item(item, event: WebhookEvent):
+    """Apply a webhook event to a loaded item without refetching it.
+
+        Parameters
+
+            item : `moncli.entities.Item`
+                The item to patch.
+            event : `moncli.webhooks.WebhookEvent`
+                The webhook event.
+
+        Returns
+
+            patched : `bool`
+                Whether the item was patched.
+    """
+
+    if event.type in (WebhookEventType.change_name, WebhookEventType.change_subitem_name):
+        item.name = (event.data.get('value') or {}).get('name', item.name)
+        return True
+    if not event.is_column_change:
+        return False
+    try:
+        column_value = item.column_values[event.column_id]
+    except (KeyError, IndexError):
+        return False
+    column_value.load(event.column_value.value, event.column_value.text)
+    return True
+
+
+def patch_index(index):
+    """Create a patch hook keeping an `ItemIndex` current without refetching items.
+
+        Parameters
+
+            index : `moncli.index.ItemIndex`
+                The index to patch.
+
+        Returns
+
+            hook : `callable`
+                The hook to register using `WebhookServer.on_patch`.
+    """
+
+    def hook(event: WebhookEvent):
+        # Board level events (e.g. column or group changes) have no item.
+        if event.item_id is None or event.item_id not in index:
+            return
+        item = index.get_item(event.item_id)
+        if patch_item(item, event):
+            index.add_items([item])
+    return hook
+
+
+def _convert_number(value):
+    return str(value.get('value')) if value.get('value') is not None else None
+
+
+def _convert_text(value):
+    return value.get('value')
+
+
+def _convert_status(value):
+    label = value.get('label') or {}
+    return {'index': label.get('index')}
+
+
+def _convert_dropdown(value):
+    return {'ids': [choice['id'] for choice in value.get('chosenValues') or []]}
+
+
+def _convert_checkbox(value):
+    return {'checked': 'true' if value.get('checked') in (True, 'true') else 'false'}
+
+
+def _convert_link(value):
+    return {'url': value.get('url'), 'text': value.get('url_text', value.get('text'))}
+
+
+def _convert_email(value):
+    return {'email': value.get('email'), 'text': value.get('label', value.get('text'))}
+
+
+def _convert_phone(value):
+    return {'phone': value.get('phone'), 'countryShortName': (value.get('countryShortName') or '')}
+
+
+WEBHOOK_VALUE_CONVERTERS = {
+    ColumnType.numbers: _convert_number,
+    ColumnType.text: _convert_text,
+    ColumnType.status: _convert_status,
+    ColumnType.dropdown: _convert_dropdown,
+    ColumnType.checkbox: _convert_checkbox,
+    ColumnType.link: _convert_link,
+    ColumnType.email: _convert_email,
+    ColumnType.phone: _convert_phone
+}
+
+
+async def _call(function, *args):
+    result = function(*args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def _to_str(value):
+    return str(value) if value is not None else None
+
+
+def _parse_time(value: str):
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value[:19], '%Y-%m-%dT%H:%M:%S').replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
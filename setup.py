@@ -18,6 +18,11 @@ config = {
         'deprecated>=1.2.10',
         'schematics>=2.1.0'
     ],
+    'extras_require': {
+        'numpy': ['numpy>=1.19.0'],
+        'pandas': ['numpy>=1.19.0', 'pandas>=1.1.0'],
+        'arrow': ['numpy>=1.19.0', 'pyarrow>=2.0.0']
+    },
     'tests_require': [
         'nose>=1.3.7'
     ],
@@ -26,9 +31,15 @@ config = {
         'moncli.api_v1',
         'moncli.api_v2',
         'moncli.entities',
-        'moncli.column_value'
+        'moncli.column_value',
+        'moncli.testing'
     ],    
     'scripts': [],
+    'entry_points': {
+        'console_scripts': [
+            'moncli=moncli.cli:main'
+        ]
+    },
     'name': 'moncli'
 }
 
@@ -0,0 +1,94 @@
+import time
+
+from unittest.mock import patch
+from nose.tools import ok_, eq_
+
+from moncli import api_v2 as api
+from moncli.testing import install
+
+
+def test_should_serve_repeated_queries_from_cache():
+
+    # Arrange
+    cache = api.ResponseCache()
+    with install() as backend, patch('moncli.api_v2.response_cache', cache):
+        board_id = backend.add_board('Tasks')['id']
+
+        # Act
+        first = api.get_boards('id', 'name', ids=[board_id])
+        first[0]['name'] = 'Changed'
+        second = api.get_boards('name', 'id', ids=[board_id])
+        third = api.get_boards('id', 'name', ids=[board_id])
+        me = api.get_me('id', 'name', api_key='other')
+        requests = len(backend.requests)
+
+    # Assert
+    eq_(third[0]['name'], 'Tasks')
+    eq_(second[0]['name'], 'Tasks')
+    ok_(me)
+    eq_(requests, 3)
+    stats = cache.get_stats()
+    eq_((stats['hits'], stats['misses'], stats['size']), (1, 3, 3))
+
+
+def test_should_invalidate_cached_queries_touched_by_mutations():
+
+    # Arrange
+    cache = api.ResponseCache()
+    with install() as backend, patch('moncli.api_v2.response_cache', cache):
+        board_id = backend.add_board('Tasks', columns=[{'title': 'Notes', 'id': 'notes'}])['id']
+        item_id = backend.add_item(board_id, 'Task')['id']
+        api.get_items('id', 'column_values.text', ids=[item_id])
+        api.get_me('id')
+
+        # Act
+        api.change_column_value(item_id, 'notes', board_id, 'Done')
+        items = api.get_items('id', 'column_values.text', ids=[item_id])
+
+    # Assert
+    eq_(items[0]['column_values'][0]['text'], 'Done')
+    stats = cache.get_stats()
+    eq_((stats['invalidations'], stats['size']), (1, 2))
+
+
+def test_should_keep_cached_queries_only_referring_to_mutated_entities():
+
+    # Arrange
+    cache = api.ResponseCache()
+    with install() as backend, patch('moncli.api_v2.response_cache', cache):
+        board_id = backend.add_board('Tasks')['id']
+        item_id = backend.add_item(board_id, 'Task')['id']
+        other_board_id = backend.add_board('Other')['id']
+        api.get_items('id', 'creator_id', ids=[item_id])
+
+        # Act
+        api.add_subscribers_to_board(other_board_id, [backend.me['id']], 'id')
+        items = api.get_items('id', 'creator_id', ids=[item_id])
+        requests = len(backend.requests)
+
+    # Assert
+    eq_(items[0]['id'], str(item_id))
+    eq_(requests, 2)
+    eq_(cache.get_stats()['invalidations'], 0)
+
+
+def test_should_expire_evict_and_invalidate_by_webhook_events():
+
+    # Arrange
+    cache = api.ResponseCache(max_size=2, ttls={'me': 0.05})
+    cache.put('me', 'me', {'me': {'id': '1'}})
+    cache.put('items', 'items', {'items': [{'id': '10', 'board': {'id': '5'}}]})
+
+    # Act
+    time.sleep(0.1)
+    me = cache.get('me')
+    cache.put('boards', 'boards', {'boards': [{'id': '5'}]})
+    cache.put('tags', 'tags', {'tags': [{'id': '7'}]})
+    invalidated = cache.invalidate_items('5', {'10'})
+
+    # Assert
+    eq_(me, None)
+    eq_(invalidated, 1)
+    eq_(cache.get('tags'), {'tags': [{'id': '7'}]})
+    stats = cache.get_stats()
+    eq_((stats['expirations'], stats['evictions'], stats['size']), (1, 1, 1))
@@ -0,0 +1,110 @@
+import asyncio, threading, time
+
+from unittest.mock import patch
+from nose.tools import ok_, eq_, raises
+
+from moncli import api_v2 as api
+from moncli.api_v2 import requests
+from moncli.testing import install
+
+
+def _slow(schedule):
+    def slow_schedule(*args, **kwargs):
+        time.sleep(0.1)
+        return schedule(*args, **kwargs)
+    return slow_schedule
+
+
+@patch('moncli.api_v2.coalesce_queries', True)
+def test_should_share_identical_queries_in_flight_between_threads():
+
+    # Arrange
+    results = []
+    with install() as backend, patch('moncli.api_v2.requests._schedule', side_effect=_slow(requests._schedule)):
+        board_id = backend.add_board('Tasks')['id']
+        def get_board():
+            results.append(api.get_boards('id', 'name', ids=[board_id]))
+        threads = [threading.Thread(target=get_board) for _ in range(5)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        api.get_boards('id', 'name', ids=[board_id])
+        requests_sent = len(backend.requests)
+
+    # Assert
+    eq_(requests_sent, 2)
+    eq_(len(results), 5)
+    eq_(set(result[0]['name'] for result in results), {'Tasks'})
+    ok_(len(set(id(result) for result in results)) == 5)
+
+
+@patch('moncli.api_v2.coalesce_queries', True)
+def test_should_share_identical_queries_in_flight_between_tasks():
+
+    # Arrange
+    async def get_boards(board_id):
+        return await asyncio.gather(*[
+            api.execute_query_async(query_name='boards', operation_type=api.gql.OperationType.QUERY, fields=['id', 'name'], arguments={'ids': [board_id]})
+            for _ in range(5)])
+    with install() as backend, patch('moncli.api_v2.requests._schedule', side_effect=_slow(requests._schedule)):
+        board_id = backend.add_board('Tasks')['id']
+
+        # Act
+        results = asyncio.run(get_boards(board_id))
+        requests_sent = len(backend.requests)
+
+    # Assert
+    eq_(requests_sent, 1)
+    eq_([result[0]['name'] for result in results], ['Tasks'] * 5)
+
+
+def test_should_send_identical_queries_in_flight_unless_coalescing():
+
+    # Arrange
+    with install() as backend, patch('moncli.api_v2.requests._schedule', side_effect=_slow(requests._schedule)):
+        board_id = backend.add_board('Tasks')['id']
+        threads = [threading.Thread(target=api.get_boards, args=('id', 'name'), kwargs={'ids': [board_id]}) for _ in range(3)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        requests_sent = len(backend.requests)
+
+    # Assert
+    eq_(requests_sent, 3)
+
+
+@raises(ValueError)
+def test_should_raise_error_of_shared_call_for_every_caller():
+
+    # Arrange
+    flights = api.SingleFlight()
+    started = threading.Event()
+    errors = []
+    def fail():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError('failed')
+    def follow():
+        try:
+            flights.do('key', fail)
+        except ValueError as error:
+            errors.append(error)
+    leader = threading.Thread(target=follow)
+    leader.start()
+    started.wait()
+
+    # Act
+    try:
+        flights.do('key', fail)
+    finally:
+        leader.join()
+
+        # Assert
+        eq_(len(errors), 1)
+        eq_(flights.get_stats(), {'calls': 1, 'shared': 1, 'pending': 0})
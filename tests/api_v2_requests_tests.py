@@ -0,0 +1,87 @@
+import os, tempfile
+
+from unittest.mock import patch, MagicMock
+from nose.tools import ok_, eq_, raises
+
+from moncli import api_v2 as api
+from moncli.api_v2 import handlers
+from moncli.api_v2.multipart import MultipartEncoder
+
+
+def test_should_stream_multipart_body_in_chunks():
+
+    # Arrange
+    with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as temp_file:
+        temp_file.write(b'x' * 1000)
+    progress = []
+    encoder = MultipartEncoder({'query': 'mutation'}, {'variables[file]': temp_file.name}, chunk_size=100, callback=lambda read, total: progress.append(read))
+
+    # Act
+    body = b''.join(encoder)
+    encoder.close()
+    os.remove(temp_file.name)
+
+    # Assert
+    eq_(len(body), len(encoder))
+    eq_(progress[-1], len(encoder))
+    ok_(len(progress) > 10)
+    ok_(b'name="query"\r\n\r\nmutation\r\n' in body)
+    ok_('filename="{}"'.format(os.path.basename(temp_file.name)).encode() in body)
+    ok_(b'Content-Type: text/plain\r\n\r\n' + b'x' * 1000 + b'\r\n' in body)
+    ok_(body.endswith('--{}--\r\n'.format(encoder.boundary).encode()))
+    ok_(encoder._parts[2]._file is None)
+
+
+@patch('moncli.api_v2.requests.get_session')
+def test_should_upload_file_as_streamed_multipart(get_session):
+
+    # Arrange
+    with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as temp_file:
+        temp_file.write(b'image')
+    requests = []
+    def post(url, headers, data, timeout):
+        requests.append((headers, b''.join(data)))
+        return MagicMock(status_code=200, json=lambda: {'data': {'add_file_to_column': {'id': '12345'}}})
+    get_session.return_value.post.side_effect = post
+
+    # Act
+    asset = handlers.add_file_to_column('1', 'files', temp_file.name, api_key='key', callback=lambda read, total: None)
+    os.remove(temp_file.name)
+
+    # Assert
+    eq_(asset, {'id': '12345'})
+    headers, body = requests[0]
+    ok_(headers['Content-Type'].startswith('multipart/form-data; boundary='))
+    ok_(b'Content-Type: image/jpeg\r\n\r\nimage\r\n' in body)
+    ok_(b'callback' not in body)
+
+
+def test_should_estimate_operation_complexity_like_the_backend():
+
+    # Arrange
+    from moncli.testing import FakeMondayBackend
+    operation = api.create_operation(api.gql.OperationType.QUERY, api.BOARDS, 'id', 'items.id', 'items.column_values.text', 'owner.id', ids=[1, 2], items={'limit': 10})
+
+    # Act
+    complexity = api.estimate_complexity(operation)
+    max_size = api.get_max_list_size(operation, 'boards.items', 1000)
+
+    # Assert
+    eq_(complexity, 2 * (1 + 10 * (1 + 25) + 1))
+    eq_(complexity, FakeMondayBackend().estimate_complexity(operation.format_body()))
+    eq_(max_size, (1000 - 2 * 2) // (2 * 26))
+
+
+@patch('moncli.api_v2.requests.get_session')
+@raises(api.ComplexityError)
+def test_should_fail_queries_estimated_to_exceed_max_complexity_without_sending(get_session):
+
+    # Arrange
+    with patch('moncli.api_v2.max_query_complexity', 100):
+
+        # Act
+        try:
+            handlers.get_items('id', 'name', 'column_values.text', api_key='key', limit=100)
+        finally:
+            # Assert
+            ok_(not get_session.called)
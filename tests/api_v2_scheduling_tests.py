@@ -0,0 +1,91 @@
+import threading, time
+
+from unittest.mock import patch
+from nose.tools import ok_, eq_
+
+from moncli import api_v2 as api, entities as en
+from moncli.enums import Priority
+from moncli.testing import install
+
+
+def test_should_keep_budget_for_interactive_requests():
+
+    # Arrange
+    scheduler = api.RequestScheduler(budget=100, window=0.2)
+    scheduler.acquire(70, Priority.bulk, 'key')
+
+    # Act
+    start = time.monotonic()
+    scheduler.acquire(20, Priority.interactive, 'key')
+    interactive_wait = time.monotonic() - start
+    start = time.monotonic()
+    scheduler.acquire(10, Priority.bulk, 'key')
+    bulk_wait = time.monotonic() - start
+
+    # Assert
+    ok_(interactive_wait < 0.05)
+    ok_(bulk_wait > 0.1)
+    eq_(scheduler.get_stats()[Priority.bulk]['requests'], 2)
+
+
+def test_should_serve_waiting_requests_by_weighted_fair_queuing():
+
+    # Arrange
+    # One request fits the budget per window, so that requests are granted one at a time.
+    scheduler = api.RequestScheduler(budget=10, window=0.4, limits={Priority.bulk: 1.0, Priority.normal: 1.0})
+    scheduler.acquire(10, Priority.normal, 'key')
+    order = []
+    def send(priority: Priority):
+        scheduler.acquire(10, priority, 'key')
+        order.append(priority)
+    threads = [threading.Thread(target=send, args=(priority,)) for priority in [Priority.bulk] * 3 + [Priority.interactive] * 3]
+
+    # Act
+    for thread in threads:
+        thread.start()
+        time.sleep(0.02)
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    eq_(order, [Priority.interactive] * 3 + [Priority.bulk] * 3)
+
+
+def test_should_schedule_requests_with_client_and_context_priorities():
+
+    # Arrange
+    scheduler = api.RequestScheduler()
+    with install() as backend, patch('moncli.api_v2.scheduler', scheduler), patch('moncli.api_v2.api_key', 'key'):
+        board_id = backend.add_board('Tasks')['id']
+        client = en.MondayClient(priority=Priority.bulk)
+
+        # Act
+        client.get_board_by_id(board_id)
+        with api.priority(Priority.interactive):
+            client.get_board_by_id(board_id)
+
+    # Assert
+    stats = scheduler.get_stats()
+    eq_(stats[Priority.bulk]['requests'], 1)
+    eq_(stats[Priority.interactive]['requests'], 1)
+    eq_(stats[Priority.normal]['requests'], 0)
+
+
+def test_should_carry_priority_only_with_an_api_key():
+
+    # Arrange
+    creds = en.MondayClientCredentials(priority=Priority.bulk)
+
+    # Act
+    without_key = creds.api_key_v2
+    with patch('moncli.api_v2.api_key', 'global'):
+        global_key = creds.api_key_v2
+    creds.api_key_v2 = 'key'
+    own_key = creds.api_key_v2
+
+    # Assert
+    eq_(without_key, None)
+    eq_(global_key, 'global')
+    eq_(global_key.priority, Priority.bulk)
+    eq_(own_key, 'key')
+    eq_(own_key.priority, Priority.bulk)
@@ -0,0 +1,100 @@
+import os, tempfile
+
+from unittest.mock import patch, MagicMock
+from nose.tools import ok_, eq_
+
+from moncli import client, entities as en
+from moncli.assets import AssetCache, download_assets
+
+
+def _create_session(contents: dict):
+    session = MagicMock()
+    def get(url, stream, timeout):
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.return_value = [contents[url]]
+        return response
+    session.get.side_effect = get
+    return session
+
+
+@patch('moncli.api_v2.get_session')
+@patch('moncli.api_v2.get_assets')
+def test_should_download_assets_and_refresh_expired_urls_in_one_request(get_assets, get_session):
+
+    # Arrange
+    get_assets.return_value = [{'id': '1', 'public_url': 'https://files/1'}, {'id': '2', 'public_url': 'https://files/2'}]
+    get_session.return_value = _create_session({'https://files/1': b'one', 'https://files/2': b'two'})
+    assets = [en.Asset(id='1', name='a.txt', file_size=3), en.Asset(id='2', name='a.txt', file_size=3)]
+    cache = AssetCache(tempfile.mkdtemp(), max_size=100)
+    dest = tempfile.mkdtemp()
+
+    # Act
+    paths = download_assets(assets, dest, concurrency=2, cache=cache)
+
+    # Assert
+    eq_(get_assets.call_count, 1)
+    eq_(get_assets.call_args[0][0], ['1', '2'])
+    eq_([os.path.basename(path) for path in paths], ['1_a.txt', '2_a.txt'])
+    eq_([open(path, 'rb').read() for path in paths], [b'one', b'two'])
+    ok_(not assets[0].public_url_expired)
+    eq_(cache.size, 6)
+
+
+@patch('moncli.api_v2.get_session')
+@patch('moncli.api_v2.get_assets')
+def test_should_serve_cached_assets_without_downloading(get_assets, get_session):
+
+    # Arrange
+    get_session.return_value = _create_session({'https://files/1': b'one'})
+    cache = AssetCache(tempfile.mkdtemp())
+    asset = en.Asset(id='1', name='a.txt', file_size=3, public_url='https://files/1')
+    first = asset.download(cache=cache)
+
+    # Act
+    second = en.Asset(id='1', name='a.txt', file_size=3).download(cache=cache)
+
+    # Assert
+    eq_(first, second)
+    eq_(get_session.return_value.get.call_count, 1)
+    eq_(get_assets.call_count, 0)
+
+
+def test_should_evict_least_recently_used_assets():
+
+    # Arrange
+    cache = AssetCache(tempfile.mkdtemp(), max_size=6)
+    assets = [en.Asset(id=str(id), file_size=3) for id in range(3)]
+    for asset in assets[:2]:
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            temp_file.write(b'abc')
+        cache.put(asset, temp_file.name)
+
+    # Act
+    cache.get(assets[0])
+    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+        temp_file.write(b'abc')
+    cache.put(assets[2], temp_file.name)
+
+    # Assert
+    ok_(cache.get(assets[0]))
+    ok_(not cache.get(assets[1]))
+    ok_(cache.get(assets[2]))
+
+
+@patch('moncli.api_v2.get_session')
+@patch('moncli.api_v2.get_assets')
+def test_should_download_assets_by_id_from_client(get_assets, get_session):
+
+    # Arrange
+    get_assets.return_value = [{'id': '1', 'name': 'a.txt', 'file_size': 3, 'public_url': 'https://files/1'}]
+    get_session.return_value = _create_session({'https://files/1': b'one'})
+    dest = tempfile.mkdtemp()
+
+    # Act
+    paths = client.download_assets(['1'], dest, cache=False)
+
+    # Assert
+    eq_(get_assets.call_count, 1)
+    eq_(paths, [os.path.join(dest, 'a.txt')])
+    eq_(open(paths[0], 'rb').read(), b'one')
@@ -0,0 +1,172 @@
+import io, json, os, tempfile
+
+from unittest.mock import patch
+from nose.tools import ok_, eq_
+
+from moncli import api, cli
+from moncli.testing import install
+
+COLUMNS = [
+    {'id': 'name', 'title': 'Name', 'type': 'name'},
+    {'id': 'status', 'title': 'Status', 'type': 'color', 'settings_str': json.dumps({'labels': {'0': 'Working on it', '1': 'Done'}})},
+    {'id': 'number', 'title': 'Number', 'type': 'numeric'}]
+
+
+def get_items_page(*args, **kwargs):
+    page = kwargs['items']['page']
+    limit = kwargs['items']['limit']
+    items = [
+        {'id': str(id), 'name': 'Item {}'.format(id), 'group': {'id': 'topics'}, 'column_values': [
+            {'id': 'status', 'text': 'Done', 'value': json.dumps({'index': 1})},
+            {'id': 'number', 'text': str(id), 'value': json.dumps(str(id))}]}
+        for id in range((page - 1) * limit + 1, min(page * limit, 5) + 1)]
+    return [{'id': '1', 'items': items}]
+
+
+@patch('moncli.api_v2.get_boards')
+def test_should_export_board_to_jsonl(get_boards):
+
+    # Arrange
+    get_boards.side_effect = lambda *args, **kwargs: [{'id': '1', 'columns': COLUMNS}] if 'items' not in kwargs else get_items_page(*args, **kwargs)
+    output = io.StringIO()
+
+    # Act
+    count = cli.export_items('api_key', '1', output, 'jsonl', limit=2, workers=2)
+
+    # Assert
+    rows = [json.loads(line) for line in output.getvalue().splitlines()]
+    eq_(count, 5)
+    eq_([row['id'] for row in rows], ['1', '2', '3', '4', '5'])
+    eq_(rows[0]['status'], {'index': 1})
+    eq_(rows[0]['group'], 'topics')
+
+
+@patch('moncli.api_v2.get_boards')
+def test_should_resume_export_from_checkpoint(get_boards):
+
+    # Arrange
+    get_boards.side_effect = lambda *args, **kwargs: [{'id': '1', 'columns': COLUMNS}] if 'items' not in kwargs else get_items_page(*args, **kwargs)
+    output = io.StringIO()
+    checkpoint = os.path.join(tempfile.mkdtemp(), 'export.ckpt')
+    with open(checkpoint, 'w') as file:
+        json.dump({'board_id': '1', 'group_id': None, 'page': 3, 'count': 4}, file)
+
+    # Act
+    count = cli.export_items('api_key', '1', output, 'csv', limit=2, workers=2, checkpoint=checkpoint)
+
+    # Assert
+    eq_(count, 5)
+    eq_(output.getvalue().splitlines(), ['5,Item 5,topics,"{""index"": 1}",5'])
+    with open(checkpoint) as file:
+        eq_(json.load(file)['page'], 4)
+
+
+@patch('moncli.api_v2.get_boards')
+@patch('moncli.api_v2.create_item')
+@patch('moncli.api_v2.change_multiple_column_value')
+def test_should_import_items_from_csv(change_multiple_column_value, create_item, get_boards):
+
+    # Arrange
+    get_boards.return_value = [{'id': '1', 'columns': COLUMNS}]
+    create_item.return_value = {'id': '2'}
+    change_multiple_column_value.return_value = {'id': '1'}
+    input = io.StringIO('id,name,Status,number\n1,Item 1,Done,\n,Item 2,Working on it,12\n')
+
+    # Act
+    count = cli.import_items('api_key', '1', input, 'csv', group_id='topics')
+
+    # Assert
+    eq_(count, 2)
+    eq_(change_multiple_column_value.call_args[0][:3], ('1', '1', {'status': {'index': 1}, 'name': 'Item 1'}))
+    eq_(create_item.call_args[0][:2], ('Item 2', '1'))
+    eq_(create_item.call_args[1]['column_values'], {'status': {'index': 0}, 'number': '12'})
+    eq_(create_item.call_args[1]['group_id'], 'topics')
+
+
+def test_should_require_api_key():
+
+    # Arrange
+    with patch.dict(os.environ, {}, clear=True):
+        try:
+            # Act
+            cli.main(['export', '--board-id', '1'])
+            ok_(False)
+        except SystemExit as ex:
+            # Assert
+            eq_(ex.code, 2)
+
+
+def test_should_import_csv_export_of_a_board():
+
+    # Arrange
+    columns = [
+        {'id': 'timeline', 'title': 'Timeline', 'type': 'timerange'},
+        {'id': 'people', 'title': 'People', 'type': 'multiple-person'},
+        {'id': 'number', 'title': 'Number', 'type': 'numeric'},
+        {'id': 'date', 'title': 'Date', 'type': 'date'}]
+    with install() as backend:
+        user_id = backend.add_user('Test User')['id']
+        board_id = backend.add_board('Tasks', columns=columns)['id']
+        item_id = backend.add_item(board_id, 'Task', column_values={
+            'timeline': {'from': '2021-01-01', 'to': '2021-01-31'},
+            'people': {'personsAndTeams': [{'id': user_id, 'kind': 'person'}]},
+            'number': '1.5',
+            'date': {'date': '2021-01-02', 'time': '10:30:00'}})['id']
+        get_values = lambda: {value['id']: value['text'] for value in api.get_items('column_values.id', 'column_values.text', ids=[item_id])[0]['column_values']}
+        exported = get_values()
+        output = io.StringIO()
+        cli.export_items('api_key', board_id, output, 'csv')
+        api.change_multiple_column_value(item_id, board_id, {'timeline': {}, 'people': {}, 'number': '', 'date': {}})
+
+        # Act
+        count = cli.import_items('api_key', board_id, io.StringIO(output.getvalue()), 'csv')
+        values = get_values()
+
+    # Assert
+    eq_(count, 1)
+    eq_(values, exported)
+    eq_(values['date'], '2021-01-02 10:30:00')
+    eq_(values['number'], '1.5')
+    eq_(values['people'], 'Test User')
+
+
+@patch('moncli.api_v2.get_boards')
+@patch('moncli.api_v2.create_item')
+def test_should_skip_rows_with_malformed_values(create_item, get_boards):
+
+    # Arrange
+    get_boards.return_value = [{'id': '1', 'columns': COLUMNS}]
+    create_item.return_value = {'id': '2'}
+    input = io.StringIO('name,number\nItem 1,abc\nItem 2,1.5\n')
+    errors = []
+
+    # Act
+    count = cli.import_items('api_key', '1', input, 'csv', on_error=lambda row_number, error: errors.append(row_number))
+
+    # Assert
+    eq_(count, 1)
+    eq_(errors, [1])
+    eq_(create_item.call_args[1]['column_values'], {'number': '1.5'})
+
+
+@patch('moncli.api_v2.get_boards')
+@patch('moncli.api_v2.create_item')
+def test_should_skip_rows_whose_mutation_fails(create_item, get_boards):
+
+    # Arrange
+    get_boards.return_value = [{'id': '1', 'columns': COLUMNS}]
+    def create(item_name, *args, **kwargs):
+        if item_name == 'Item 2':
+            raise api.MondayApiError('mutation', 500, '', ['Internal server error'])
+        return {'id': '2'}
+    create_item.side_effect = create
+    input = io.StringIO('name,number\nItem 1,1\nItem 2,2\nItem 3,3\n')
+    errors = []
+
+    # Act
+    count = cli.import_items('api_key', '1', input, 'csv', workers=1, on_error=lambda row_number, error: errors.append(row_number))
+
+    # Assert
+    eq_(count, 2)
+    eq_(errors, [2])
+    eq_([call[0][0] for call in create_item.call_args_list], ['Item 1', 'Item 2', 'Item 3'])
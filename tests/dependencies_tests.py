@@ -0,0 +1,132 @@
+import json
+
+from nose.tools import ok_, eq_, raises
+
+from moncli import entities as en, DependencyGraphError
+from moncli.dependencies import DependencyGraph
+
+from .fixtures import create_board
+
+
+COLUMNS = [
+    {'id': 'dependency', 'title': 'Depends On', 'type': 'dependency'},
+    {'id': 'timeline', 'title': 'Timeline', 'type': 'timerange'}]
+
+
+def _create_item(board: en.Board, id: int, dependencies: list = [], timeline: tuple = None):
+    column_values = [
+        {'id': 'dependency', 'text': '', 'value': json.dumps({'linkedPulseIds': [{'linkedPulseId': dependency} for dependency in dependencies]})},
+        {'id': 'timeline', 'text': '', 'value': json.dumps({'from': timeline[0], 'to': timeline[1]}) if timeline else None}]
+    return en.Item(creds=en.MondayClientCredentials(None), __board=board, id=str(id), name='Task {}'.format(id), column_values=column_values)
+
+
+def _create_graph():
+    board = create_board(COLUMNS)
+    graph = DependencyGraph('Depends On', 'Timeline')
+    graph.add_pages([
+        [_create_item(board, 1, [], ('2021-01-01', '2021-01-05')),
+         _create_item(board, 2, [1], ('2021-01-06', '2021-01-07'))],
+        [_create_item(board, 3, [1], ('2021-01-10', '2021-01-19')),
+         _create_item(board, 4, [2, 3], ('2021-01-20', '2021-01-20'))]])
+    return board, graph
+
+
+def test_should_order_items_after_their_dependencies():
+
+    # Arrange
+    _, graph = _create_graph()
+
+    # Act
+    order = graph.topological_order()
+
+    # Assert
+    eq_(order, [1, 2, 3, 4])
+    eq_(graph.get_dependencies(4), [2, 3])
+    eq_(graph.get_dependents(1), [2, 3])
+    eq_(graph.get_downstream(1), [2, 3, 4])
+    eq_(graph.get_upstream(4), [2, 3, 1])
+
+
+def test_should_get_critical_path_weighted_by_timeline_durations():
+
+    # Arrange
+    _, graph = _create_graph()
+
+    # Act
+    path, duration = graph.critical_path()
+
+    # Assert
+    eq_(path, [1, 3, 4])
+    eq_(duration, 16)
+
+
+def test_should_get_slip_impact_absorbed_by_slack():
+
+    # Arrange
+    _, graph = _create_graph()
+
+    # Act
+    impact = graph.get_slip_impact(1, 6)
+
+    # Assert
+    eq_(impact, {2: 6, 3: 2, 4: 2})
+
+
+def test_should_update_dependencies_of_a_single_item_incrementally():
+
+    # Arrange
+    board, graph = _create_graph()
+    graph.topological_order()
+
+    # Act
+    graph.add_items([_create_item(board, 3, [2], ('2021-01-10', '2021-01-19'))])
+
+    # Assert
+    eq_(graph.get_dependents(1), [2])
+    eq_(graph.get_dependents(2), [4, 3])
+    eq_(graph.topological_order(), [1, 2, 3, 4])
+    ok_(graph._pred_overrides)
+
+
+def test_should_find_dependency_cycles():
+
+    # Arrange
+    board, graph = _create_graph()
+    graph.add_items([_create_item(board, 1, [4], ('2021-01-01', '2021-01-05')), _create_item(board, 5, [5])])
+
+    # Act
+    cycles = graph.find_cycles()
+
+    # Assert
+    eq_(sorted(sorted(cycle) for cycle in cycles), [[1, 2, 3, 4], [5]])
+
+
+@raises(DependencyGraphError)
+def test_should_fail_to_order_items_with_cycles():
+
+    # Arrange
+    board, graph = _create_graph()
+    graph.add_items([_create_item(board, 1, [4])])
+
+    # Act
+    graph.topological_order()
+
+
+def test_should_treat_partially_filled_timelines_as_missing():
+
+    # Arrange
+    board = create_board(COLUMNS)
+    graph = DependencyGraph('Depends On', 'Timeline')
+
+    items = [_create_item(board, 1), _create_item(board, 2, [1]), _create_item(board, 3, [2], ('2021-01-10', '2021-01-12'))]
+    items[0].column_values['timeline'].value = {'from': '2021-01-01', 'to': None}
+    items[1].column_values['timeline'].value = {'from': None, 'to': '2021-01-07'}
+
+    # Act
+    graph.add_items(items)
+    path, duration = graph.critical_path()
+
+    # Assert
+    eq_(graph.topological_order(), [1, 2, 3])
+    eq_(path, [3])
+    eq_(duration, 3)
@@ -1,10 +1,12 @@
 import json
 
 from unittest.mock import patch
+from unittest import SkipTest
 from nose.tools import ok_, eq_, raises
 
 from moncli import client, entities as en, column_value as cv
 from moncli.enums import ColumnType, BoardKind, WebhookEventType
+from moncli.testing import install
 
 USERNAME = 'test.user@foobar.org' 
 
@@ -419,6 +421,57 @@ def test_should_retrieve_a_list_of_items_by_column_value(get_items_by_column_val
     eq_(items[0].name, name)
 
 
+@patch('moncli.api_v2.create_board')
+@patch('moncli.api_v2.get_items_by_multiple_column_values')
+def test_should_retrieve_items_by_multiple_column_values_in_chunks_and_pages(get_items_by_multiple_column_values, create_board):
+
+    # Arrange
+    matches = {'SKU-{}'.format(index): [{'id': str(index), 'name': 'Item {}'.format(index)}, {'id': '99', 'name': 'Bundle'}] for index in range(5)}
+    def search(board_id, column_id, column_values, *args, limit=None, page=1, **kwargs):
+        items_data = [item_data for value in column_values for item_data in matches.get(value, [])]
+        items_data = list({item_data['id']: item_data for item_data in items_data}.values())
+        if limit is None:
+            return items_data
+        return items_data[(page - 1) * limit:page * limit]
+    get_items_by_multiple_column_values.side_effect = search
+    create_board.return_value = {'id': '1', 'name': 'Test Board 1'}
+    board = client.create_board('Test Board 1', BoardKind.public)
+    column = en.Column(id='text_column_01', title='SKU', type='text')
+
+    # Act
+    single = board.get_items_by_multiple_column_values(column, list(matches))
+    page = board.get_items_by_multiple_column_values(column, list(matches), limit=2)
+    items = board.get_items_by_multiple_column_values(column, list(matches) + ['SKU-0'], chunk_size=2, concurrency=2)
+    pages = list(board.get_item_pages_by_multiple_column_values(column, list(matches), chunk_size=2, limit=2))
+
+    # Assert
+    eq_(len(single), 6)
+    eq_(get_items_by_multiple_column_values.call_args_list[0][0][2], list(matches))
+    eq_([item.id for item in page], ['0', '99'])
+    eq_(sorted(item.id for item in items), ['0', '1', '2', '3', '4', '99'])
+    eq_(sorted(item.id for page in pages for item in page), ['0', '1', '2', '3', '4', '99'])
+    eq_(get_items_by_multiple_column_values.call_count, 1 + 1 + 3 + 6)
+
+
+def test_should_retrieve_default_item_fields_by_multiple_column_values_in_chunks():
+
+    # Arrange
+    with install() as backend:
+        board_id = backend.add_board('Products', columns=[{'id': 'sku', 'title': 'SKU', 'type': 'text'}])['id']
+        for index in range(3):
+            backend.add_item(board_id, 'Item {}'.format(index), column_values={'sku': 'SKU-{}'.format(index)})
+        board = en.MondayClient().get_board_by_id(board_id)
+        column = en.Column(id='sku', title='SKU', type='text')
+
+        # Act
+        chunked = board.get_items_by_multiple_column_values(column, ['SKU-0', 'SKU-1', 'SKU-2'], chunk_size=2)
+        single = board.get_items_by_multiple_column_values(column, ['SKU-0', 'SKU-1', 'SKU-2'])
+
+    # Assert
+    eq_(sorted(item.name for item in chunked), ['Item 0', 'Item 1', 'Item 2'])
+    eq_(sorted(item.name for item in chunked), sorted(item.name for item in single))
+
+
 @patch('moncli.api_v2.create_board')
 @raises(en.board.NotEnoughGetColumnValueParameters)
 def test_should_fail_from_too_few_parameters(create_board):
@@ -535,4 +588,121 @@ def test_should_delete_webhook(delete_webhook, create_board):
     ok_(webhook != None)
     eq_(webhook.board_id, board_id)
     eq_(webhook.id, webhook_id)
-    ok_(not webhook.is_active)
\ No newline at end of file
+    ok_(not webhook.is_active)
+
+@patch('moncli.api_v2.get_boards')
+def test_should_stream_item_pages(get_boards):
+
+    # Arrange
+    get_boards.return_value = [{'id': '1', 'name': 'Test Board 1'}]
+    board = client.get_boards(ids=['1'])[0]
+    get_boards.side_effect = [
+        [{'id': '1', 'items': [{'id': '1', 'name': 'Item 1'}, {'id': '2', 'name': 'Item 2'}]}],
+        [{'id': '1', 'items': [{'id': '3', 'name': 'Item 3'}]}]]
+
+    # Act
+    pages = list(board.get_item_pages(limit=2))
+
+    # Assert
+    eq_(len(pages), 2)
+    eq_([item.id for item in pages[0]], ['1', '2'])
+    eq_([item.id for item in pages[1]], ['3'])
+    eq_(get_boards.call_args[1]['items'], {'limit': 2, 'page': 2})
+
+
+@patch('moncli.api_v2.get_boards')
+def test_should_export_board_to_columns(get_boards):
+
+    # Arrange
+    try:
+        import numpy as np
+    except ImportError:
+        raise SkipTest('numpy is not installed.')
+    columns = [
+        {'id': 'number', 'title': 'Number', 'type': 'numeric'},
+        {'id': 'date', 'title': 'Date', 'type': 'date'},
+        {'id': 'checkbox', 'title': 'Checkbox', 'type': 'boolean'},
+        {'id': 'status', 'title': 'Status', 'type': 'color', 'settings_str': json.dumps({'labels': {'0': 'Working on it', '1': 'Done'}})}]
+    get_boards.return_value = [{'id': '1', 'name': 'Test Board 1', 'columns': columns}]
+    board = client.get_boards(ids=['1'])[0]
+    get_boards.return_value = [{'id': '1', 'items': [
+        {'id': '1', 'name': 'Item 1', 'column_values': [
+            {'id': 'number', 'text': '12.5', 'value': json.dumps('12.5')},
+            {'id': 'date', 'text': '2021-01-02', 'value': json.dumps({'date': '2021-01-02'})},
+            {'id': 'checkbox', 'text': 'v', 'value': json.dumps({'checked': 'true'})},
+            {'id': 'status', 'text': 'Done', 'value': json.dumps({'index': 1})}]},
+        {'id': '2', 'name': 'Item 2', 'column_values': []}]}]
+
+    # Act
+    result = board.to_columns()
+
+    # Assert
+    eq_(result['id'].tolist(), [1, 2])
+    eq_(result['number'].dtype, np.float64)
+    eq_(result['number'][0], 12.5)
+    ok_(np.isnan(result['number'][1]))
+    eq_(str(result['date'][0]), '2021-01-02T00:00:00.000000')
+    ok_(np.isnat(result['date'][1]))
+    eq_(result['checkbox'].tolist(), [True, False])
+    eq_(result['status'].tolist(), [1, -1])
+
+
+def test_should_share_categories_of_duplicate_status_labels():
+
+    # Arrange
+    try:
+        import pandas as pd
+    except ImportError:
+        raise SkipTest('pandas is not installed.')
+    buffer = cv.create_column_buffer(ColumnType.status, id='status', settings_str=json.dumps({'labels': {'0': 'Done', '1': '', '2': '', '5': 'Stuck'}}))
+
+    # Act
+    for index in [0, 1, 2, 5, None]:
+        buffer.append({'id': 'status', 'text': '', 'value': json.dumps({'index': index}) if index is not None else None})
+    series = buffer.to_pandas()
+
+    # Assert
+    eq_(buffer.categories, ['Done', '', 'Stuck'])
+    eq_(buffer.to_numpy().tolist(), [0, 1, 1, 2, -1])
+    eq_(series.tolist()[:4], ['Done', '', '', 'Stuck'])
+    ok_(pd.isna(series.tolist()[4]))
+
+
+@patch('moncli.api_v2.get_boards')
+@raises(en.board.BoardError)
+def test_should_fail_to_export_columns_with_reserved_ids(get_boards):
+
+    # Arrange
+    columns = [{'id': 'name', 'title': 'Name', 'type': 'name'}, {'id': 'id', 'title': 'Id', 'type': 'text'}]
+    get_boards.return_value = [{'id': '1', 'name': 'Test Board 1', 'columns': columns}]
+    board = client.get_boards(ids=['1'])[0]
+
+    # Act
+    board.to_columns()
+
+
+@patch('moncli.api_v2.get_boards')
+def test_should_count_malformed_values_unless_exporting_strictly(get_boards):
+
+    # Arrange
+    buffer = cv.create_column_buffer(ColumnType.numbers, id='number')
+    columns = [{'id': 'number', 'title': 'Number', 'type': 'numeric'}]
+    get_boards.return_value = [{'id': '1', 'name': 'Test Board 1', 'columns': columns}]
+    board = client.get_boards(ids=['1'])[0]
+    get_boards.return_value = [{'id': '1', 'items': [
+        {'id': '1', 'name': 'Item 1', 'column_values': [{'id': 'number', 'text': 'abc', 'value': json.dumps('abc')}]}]}]
+
+    # Act
+    buffer.append({'id': 'number', 'text': 'abc', 'value': json.dumps('abc')})
+    buffer.append({'id': 'number', 'text': '1', 'value': '{not json'})
+    buffer.append({'id': 'number', 'text': '2', 'value': json.dumps('2')})
+    try:
+        board.to_columns(strict=True)
+        error = None
+    except ValueError as e:
+        error = e
+
+    # Assert
+    eq_(buffer.skipped, 2)
+    eq_(len(buffer), 3)
+    ok_(error is not None)
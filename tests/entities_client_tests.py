@@ -2,6 +2,7 @@ from unittest.mock import patch
 from nose.tools import ok_, eq_, raises
 
 from moncli import client, entities as en
+from moncli.models import MondayModel
 from moncli.enums import BoardKind, NotificationTargetType, WorkspaceKind, WorkspaceSubscriberKind
 
 
@@ -145,6 +146,38 @@ def test_should_get_items(get_items):
     ok_(len(items), 1)
 
 
+@patch('moncli.api_v2.get_items')
+def test_should_get_items_by_ids_in_chunks(get_items):
+
+    # Arrange
+    get_items.side_effect = lambda *args, **kwargs: [{'id': str(id), 'name': 'Item {}'.format(id)} for id in kwargs['ids'] if id != 4]
+
+    # Act
+    items = client.get_items(ids=[5, 1, '3', 5, 2, 4], chunk_size=2)
+
+    # Assert
+    eq_(get_items.call_count, 3)
+    eq_(sorted(call[1]['ids'] for call in get_items.call_args_list), [[3, 2], [4], [5, 1]])
+    eq_([item.id for item in items], ['5', '1', '3', '2'])
+    eq_(items.missing_ids, ['4'])
+
+
+@patch('moncli.api_v2.get_items')
+def test_should_get_missing_ids_of_items_as_models(get_items):
+
+    # Arrange
+    class Task(MondayModel):
+        pass
+    get_items.side_effect = lambda *args, **kwargs: [{'id': str(id), 'name': 'Item {}'.format(id)} for id in kwargs['ids'] if id != 2]
+
+    # Act
+    tasks = client.get_items(ids=[1, 2, 3], as_model=Task)
+
+    # Assert
+    eq_([task.item.id for task in tasks], ['1', '3'])
+    eq_(tasks.missing_ids, ['2'])
+
+
 @patch('moncli.api_v2.get_updates')
 def test_should_get_updates(get_updates):
 
@@ -660,6 +660,28 @@ def test_item_should_add_file(add_file_to_column, get_items):
     eq_(asset.url, 'https://test.monday.com/12345/33.jpg')
 
 
+@patch('moncli.api_v2.get_items')
+@patch('moncli.api_v2.add_file_to_column')
+def test_item_should_add_files_in_parallel(add_file_to_column, get_items):
+    
+    # Arrange
+    get_items.return_value = [{'id': '1', 'name': 'Test Item 01', 'board': {'id': '1'}}]
+    def add_file(item_id, column_id, file_path, *args, **kwargs):
+        kwargs['callback'](10, 10)
+        return {'id': file_path[-1], 'name': file_path}
+    add_file_to_column.side_effect = add_file
+    item = client.get_items()[0]
+    file_column = cv.create_column_value(ColumnType.file, id='files', title='Files')
+    progress = []
+
+    # Act
+    assets = item.add_files(file_column, ['/Users/test/1', '/Users/test/2', '/Users/test/3'], concurrency=2, callback=lambda *args: progress.append(args))
+
+    # Assert 
+    eq_([asset.id for asset in assets], ['1', '2', '3'])
+    eq_(sorted(progress), [('/Users/test/1', 10, 10), ('/Users/test/2', 10, 10), ('/Users/test/3', 10, 10)])
+
+
 @patch('moncli.api_v2.get_items')
 def test_item_should_get_files(get_items):
     
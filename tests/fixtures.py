@@ -0,0 +1,21 @@
+from moncli import entities as en
+
+STATUS_SETTINGS = {'labels': {'0': 'Working on it', '1': 'Done'}}
+TASK_COLUMNS = [
+    {'id': 'status', 'title': 'Status', 'type': 'color', 'settings': STATUS_SETTINGS},
+    {'id': 'estimate', 'title': 'Estimate', 'type': 'numeric'},
+    {'id': 'text', 'title': 'Text', 'type': 'text'},
+    {'id': 'files', 'title': 'Files', 'type': 'file'}]
+
+
+def add_board(backend, items: int = 0, name: str = 'Tasks'):
+    # The returned board data lists the ids of its items in 'item_ids'.
+    board = backend.add_board(name, columns=TASK_COLUMNS)
+    for index in range(items):
+        backend.add_item(board['id'], 'Task {}'.format(index), column_values={'status': {'index': index % 2}, 'estimate': str(index)})
+    return board
+
+
+def create_board(columns: list, id: str = '1', **kwargs):
+    # Boards built without a backend, for code that only reads their columns.
+    return en.Board(creds=en.MondayClientCredentials(None), id=id, columns=columns, **kwargs)
@@ -0,0 +1,27 @@
+import subprocess, sys
+
+from nose.tools import eq_
+
+
+def test_should_import_moncli_without_loading_dependencies():
+
+    # Arrange
+    script = 'import sys, moncli; print(sorted(name for name in ("requests", "schematics", "pytz", "pycountry", "moncli.entities", "moncli.api_v2") if name in sys.modules))'
+
+    # Act
+    output = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True).stdout
+
+    # Assert
+    eq_(output.strip(), '[]')
+
+
+def test_should_load_submodules_and_client_on_access():
+
+    # Arrange
+    script = 'import moncli; print(moncli.client.__class__.__name__, moncli.api.__name__, moncli.cv.__name__)'
+
+    # Act
+    output = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True).stdout
+
+    # Assert
+    eq_(output.strip(), 'MondayClient moncli.api_v2 moncli.column_value')
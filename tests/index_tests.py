@@ -0,0 +1,98 @@
+import json
+from datetime import datetime
+
+from nose.tools import ok_, eq_, raises
+
+from moncli import entities as en, ItemIndexError
+from moncli.index import ItemIndex
+
+COLUMNS = [
+    {'id': 'status', 'title': 'Status', 'type': 'color', 'settings_str': json.dumps({'labels': {'0': 'Working on it', '1': 'Done'}})},
+    {'id': 'numbers', 'title': 'Estimate', 'type': 'numeric'},
+    {'id': 'people', 'title': 'Owner', 'type': 'multiple-person'},
+    {'id': 'timeline', 'title': 'Timeline', 'type': 'timerange'}]
+
+
+def _create_items():
+    board = en.Board(creds=en.MondayClientCredentials(None), id='1', name='Test Board 1', columns=COLUMNS)
+    rows = [
+        ('1', 1, 5, [1], ('2021-01-01', '2021-01-10')),
+        ('2', 0, 3, [2], ('2021-01-05', '2021-02-01')),
+        ('3', 1, 8, [1, 2], ('2021-03-01', '2021-03-02')),
+        ('4', 0, None, [], None)]
+    items = []
+    for id, status, estimate, people, timeline in rows:
+        column_values = [
+            {'id': 'status', 'text': '', 'value': json.dumps({'index': status})},
+            {'id': 'numbers', 'text': '', 'value': json.dumps(str(estimate)) if estimate is not None else None},
+            {'id': 'people', 'text': '', 'value': json.dumps({'personsAndTeams': [{'id': person, 'kind': 'person'} for person in people]})},
+            {'id': 'timeline', 'text': '', 'value': json.dumps({'from': timeline[0], 'to': timeline[1]}) if timeline else None}]
+        items.append(en.Item(creds=board._Board__creds, __board=board, id=id, name='Item {}'.format(id), column_values=column_values))
+    return items
+
+
+def test_should_query_items_with_compound_filters():
+
+    # Arrange
+    index = ItemIndex(_create_items())
+
+    # Act
+    items = index.query([('Status', '==', 'Done'), ('numbers', '>=', 6)])
+
+    # Assert
+    eq_([item.id for item in items], ['3'])
+
+
+def test_should_query_items_by_people_and_timeline():
+
+    # Arrange
+    index = ItemIndex(_create_items())
+
+    # Act
+    owned = index.query([('people', '==', 2)])
+    overlapping = index.query([('timeline', 'overlaps', (datetime(2021, 1, 8), datetime(2021, 1, 20)))])
+
+    # Assert
+    eq_([item.id for item in owned], ['2', '3'])
+    eq_([item.id for item in overlapping], ['1', '2'])
+
+
+def test_should_sort_and_group_items():
+
+    # Arrange
+    index = ItemIndex(_create_items())
+
+    # Act
+    items = index.query(order_by='numbers', descending=True)
+    groups = index.query(group_by='status', order_by='numbers')
+
+    # Assert
+    eq_([item.id for item in items], ['3', '1', '2', '4'])
+    eq_([item.id for item in groups['Done']], ['1', '3'])
+    eq_([item.id for item in groups['Working on it']], ['2', '4'])
+
+
+def test_should_refresh_items_incrementally():
+
+    # Arrange
+    items = _create_items()
+    index = ItemIndex(items)
+    items[1].column_values['numbers'].value = 10
+
+    # Act
+    index.add_items([items[1]])
+    index.remove_items(['3'])
+
+    # Assert
+    eq_([item.id for item in index.query([('numbers', 'between', (4, 10))])], ['1', '2'])
+    ok_('3' not in index)
+
+
+@raises(ItemIndexError)
+def test_should_fail_to_query_unindexed_column():
+
+    # Arrange
+    index = ItemIndex(_create_items(), columns=['status'])
+
+    # Act
+    index.query([('numbers', '>', 1)])
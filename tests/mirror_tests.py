@@ -0,0 +1,98 @@
+import json
+
+from unittest.mock import patch
+from nose.tools import ok_, eq_
+
+from moncli import api_v2 as api
+from moncli.mirror import BoardMirror
+
+COLUMNS = [
+    {'id': 'name', 'title': 'Name', 'type': 'name'},
+    {'id': 'status', 'title': 'Status', 'type': 'color', 'settings_str': json.dumps({'labels': {'0': 'Working on it', '1': 'Done'}})}]
+GROUPS = [{'id': 'topics', 'title': 'Topics'}]
+
+
+def _get_boards(items):
+    def get_boards(*args, **kwargs):
+        if 'items' in kwargs:
+            return [{'id': '1', 'items': items if kwargs['items'].get('page', 1) == 1 else []}]
+        return [{'id': '1', 'name': 'Test Board 1', 'columns': COLUMNS, 'groups': GROUPS}]
+    return get_boards
+
+
+def _create_item(id, name, status, updated_at='2021-01-01T00:00:00Z'):
+    return {
+        'id': id,
+        'name': name,
+        'updated_at': updated_at,
+        'group': {'id': 'topics'},
+        'column_values': [{'id': 'status', 'text': status, 'value': json.dumps({'index': 1 if status == 'Done' else 0})}]}
+
+
+@patch('moncli.api_v2.get_boards')
+def test_should_load_board_into_mirror(get_boards):
+
+    # Arrange
+    get_boards.side_effect = _get_boards([_create_item('1', 'Item 1', 'Done'), _create_item('2', 'Item 2', 'Working on it')])
+    mirror = BoardMirror('1', indexed_columns=['status'])
+
+    # Act
+    count = mirror.load()
+    items = mirror.get_items(column_values={'status': 'Done'})
+
+    # Assert
+    eq_(count, 2)
+    ok_(mirror.synced_at)
+    eq_([item.id for item in items], ['1'])
+    eq_(items[0].group.id, 'topics')
+    eq_(items[0].column_values['status'].value, 'Done')
+    eq_(mirror.get_item('2').name, 'Item 2')
+
+
+@patch('moncli.api_v2.get_items')
+@patch('moncli.api_v2.get_boards')
+def test_should_sync_mirror_from_activity_logs(get_boards, get_items):
+
+    # Arrange
+    get_boards.side_effect = _get_boards([_create_item('1', 'Item 1', 'Done'), _create_item('2', 'Item 2', 'Working on it')])
+    mirror = BoardMirror('1')
+    mirror.load()
+    activity_logs = [
+        {'id': '1', 'event': 'update_column_value', 'data': json.dumps({'pulse_id': 2})},
+        {'id': '2', 'event': 'delete_pulse', 'data': json.dumps({'pulse_id': 1})}]
+    get_boards.side_effect = lambda *args, **kwargs: [{'id': '1', 'name': 'Test Board 1', 'activity_logs': activity_logs}]
+    get_items.return_value = [dict(_create_item('2', 'Item 2', 'Done'), board={'id': '1'})]
+
+    # Act
+    count = mirror.sync()
+
+    # Assert
+    eq_(count, 2)
+    eq_(get_items.call_args[1]['ids'], [2])
+    ok_(not mirror.get_item('1'))
+    eq_(mirror.get_item('2').column_values['status'].value, 'Done')
+
+
+@patch('moncli.api_v2.get_items')
+@patch('moncli.api_v2.get_boards')
+def test_should_sync_mirror_from_updated_at_when_activity_logs_fail(get_boards, get_items):
+
+    # Arrange
+    get_boards.side_effect = _get_boards([_create_item('1', 'Item 1', 'Done'), _create_item('2', 'Item 2', 'Working on it')])
+    mirror = BoardMirror('1')
+    mirror.load()
+    items = [_create_item('2', 'Item 2', 'Done', '2021-01-02T00:00:00Z')]
+    def get_boards_without_logs(*args, **kwargs):
+        if 'activity_logs' in kwargs:
+            raise api.MondayApiError('query', 400, '', ['Unavailable'])
+        return _get_boards(items)(*args, **kwargs)
+    get_boards.side_effect = get_boards_without_logs
+    get_items.return_value = [dict(items[0], board={'id': '1'})]
+
+    # Act
+    count = mirror.sync()
+
+    # Assert
+    eq_(count, 2)
+    eq_(get_items.call_args[1]['ids'], [2])
+    eq_([item.id for item in mirror.get_items()], ['2'])
@@ -66,4 +66,16 @@ def test_number_type_should_succeed_when_to_primitive_returns_export_string_when
 
     # Assert
     eq_(int_value,'1')
-    eq_(float_value,'1.0')
\ No newline at end of file
+    eq_(float_value,'1.0')
+
+def test_number_type_should_succeed_when_to_primitive_returns_export_string_when_passed_a_str_value():
+    # Arrange
+    number_type = NumberType(id=1)
+
+    # Act
+    int_value = number_type.to_primitive('12')
+    float_value = number_type.to_primitive('1.5')
+
+    # Assert
+    eq_(int_value,'12')
+    eq_(float_value,'1.5')
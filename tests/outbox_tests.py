@@ -0,0 +1,146 @@
+import os, sqlite3, tempfile
+
+from unittest.mock import patch
+from nose.tools import ok_, eq_
+
+from moncli.outbox import Outbox, get_idempotency_key
+from moncli.testing import install
+
+from .fixtures import add_board
+
+
+def test_should_send_queued_changes_after_restart():
+
+    # Arrange
+    path = tempfile.mktemp(suffix='.db')
+    with install() as backend:
+        board = add_board(backend, 3)
+        board_id, item_ids = board['id'], board['item_ids']
+        with Outbox(path) as outbox:
+            for item_id in item_ids:
+                outbox.change_multiple_column_values(board_id, item_id, {'text': 'Draft', 'estimate': '1'})
+            outbox.change_column_value(board_id, item_ids[0], 'text', 'Final')
+            key = outbox.change_column_value(board_id, item_ids[0], 'text', 'Final')
+
+        # Act
+        with Outbox(path) as outbox:
+            count = outbox.flush()
+            counts = outbox.get_counts()
+            status = outbox.get_status(key)
+    os.remove(path)
+
+    # Assert
+    eq_(count, 6)
+    eq_(counts, {'sent': 6, 'superseded': 1})
+    eq_(status, 'sent')
+    eq_(key, get_idempotency_key(item_ids[0], 'text', 'Final'))
+    eq_(len(backend.requests), 3)
+    eq_(backend.items[item_ids[0]]['values']['text'], '"Final"')
+
+
+def test_should_resend_changes_claimed_before_a_crash():
+
+    # Arrange
+    path = tempfile.mktemp(suffix='.db')
+    with install() as backend:
+        board = add_board(backend, 2)
+        board_id, item_ids = board['id'], board['item_ids']
+        with Outbox(path) as outbox:
+            outbox.change_column_value(board_id, item_ids[0], 'text', 'Sent twice')
+            outbox.change_column_value(board_id, item_ids[1], 'text', 'Old')
+        connection = sqlite3.connect(path)
+        with connection:
+            connection.execute("UPDATE mutations SET status = 'sending'")
+            connection.execute("INSERT INTO mutations (key, board_id, item_id, column_id, value, status) VALUES ('new', ?, ?, 'text', '\"New\"', 'pending')", (board_id, item_ids[1]))
+        connection.close()
+
+        # Act
+        with Outbox(path) as outbox:
+            count = outbox.flush()
+            counts = outbox.get_counts()
+    os.remove(path)
+
+    # Assert
+    eq_(count, 2)
+    eq_(counts, {'sent': 2, 'superseded': 1})
+    eq_(backend.items[item_ids[1]]['values']['text'], '"New"')
+
+
+@patch('moncli.outbox.RETRY_BACKOFF', 0)
+def test_should_fail_changes_after_max_attempts():
+
+    # Arrange
+    with install() as backend:
+        board = add_board(backend, 1)
+        board_id, item_ids = board['id'], board['item_ids']
+        outbox = Outbox(max_attempts=2)
+        outbox.change_column_value(board_id, item_ids[0], 'text', 'Rejected')
+        backend.fail_next(500, count=2, message='Internal server error')
+
+        # Act
+        count = outbox.flush()
+
+    # Assert
+    eq_(count, 0)
+    failed = outbox.get_mutations('failed')
+    eq_(len(failed), 1)
+    eq_(failed[0]['attempts'], 2)
+    eq_(failed[0]['value'], 'Rejected')
+    ok_('Internal server error' in failed[0]['error'])
+    outbox.close()
+
+
+def test_should_retry_each_change_by_its_own_attempts():
+
+    # Arrange
+    path = tempfile.mktemp(suffix='.db')
+    with install() as backend:
+        board = add_board(backend, 1)
+        board_id, item_ids = board['id'], board['item_ids']
+        outbox = Outbox(path, max_attempts=2)
+        outbox.change_column_value(board_id, item_ids[0], 'text', 'Retried')
+        backend.fail_next(500, count=1, message='Internal server error')
+        outbox.flush()
+        outbox.change_column_value(board_id, item_ids[0], 'estimate', '3')
+        connection = sqlite3.connect(path)
+        with connection:
+            connection.execute('UPDATE mutations SET next_attempt_at = 0')
+        connection.close()
+
+        # Act
+        with patch('moncli.api_v2.change_multiple_column_value', side_effect=ValueError('Unexpected response')):
+            count = outbox.flush()
+
+    # Assert
+    eq_(count, 0)
+    failed = outbox.get_mutations('failed')
+    pending = outbox.get_mutations('pending')
+    eq_([mutation['column_id'] for mutation in failed], ['text'])
+    eq_([mutation['column_id'] for mutation in pending], ['estimate'])
+    eq_(pending[0]['attempts'], 1)
+    eq_(pending[0]['error'], 'Unexpected response')
+    outbox.close()
+    os.remove(path)
+
+
+def test_should_not_queue_a_change_being_sent_again():
+
+    # Arrange
+    with install() as backend:
+        board = add_board(backend, 1)
+        board_id, item_ids = board['id'], board['item_ids']
+        outbox = Outbox()
+        key = outbox.change_column_value(board_id, item_ids[0], 'text', 'Once')
+
+        def send(*args, **kwargs):
+            outbox.change_column_value(board_id, item_ids[0], 'text', 'Once')
+
+        # Act
+        with patch('moncli.api_v2.change_multiple_column_value', side_effect=send):
+            count = outbox.flush()
+
+    # Assert
+    eq_(count, 1)
+    eq_(outbox.get_counts(), {'sent': 1})
+    eq_(outbox.get_status(key), 'sent')
+    outbox.close()
@@ -0,0 +1,70 @@
+from nose.tools import ok_, eq_, raises
+
+from moncli import entities as en
+from moncli.paging import PageSizer, iter_pages
+from moncli.testing import install
+
+
+def test_should_size_pages_toward_target_complexity():
+
+    # Arrange
+    page_sizer = PageSizer(target_complexity=1000, min_limit=25, max_limit=800, initial_limit=100)
+
+    # Act
+    initial = page_sizer.get_limit('items')
+    page_sizer.observe('items', 100, 100, complexity=4000)
+    smaller = page_sizer.get_limit('items', offset=100)
+    page_sizer.observe('cheap', 100, 100, complexity=100)
+    larger = page_sizer.get_limit('cheap', offset=800)
+    aligned = page_sizer.get_limit('cheap', offset=200)
+
+    # Assert
+    eq_(initial, 100)
+    eq_(smaller, 25)
+    eq_(larger, 800)
+    eq_(aligned, 200)
+
+
+def test_should_keep_offsets_when_page_sizes_change():
+
+    # Arrange
+    values = list(range(230))
+    page_sizer = PageSizer(initial_limit=100)
+    requested = []
+    def fetch_page(page: int, limit: int):
+        requested.append((page, limit))
+        return values[(page - 1) * limit:page * limit]
+
+    # Act
+    pages = list(iter_pages(fetch_page, 'values', page_sizer))
+
+    # Assert
+    eq_([value for page in pages for value in page], values)
+    eq_(requested, [(1, 100), (2, 100), (2, 200)])
+
+
+def test_should_adapt_board_item_pages_to_observed_complexity():
+
+    # Arrange
+    with install() as backend:
+        board = backend.add_board('Tasks', columns=[{'id': 'text', 'title': 'Text', 'type': 'text'}])
+        for index in range(300):
+            backend.add_item(board['id'], 'Task {}'.format(index))
+        client = en.MondayClient()
+        client.page_sizer = PageSizer(target_complexity=2600, initial_limit=100)
+        board = client.get_board_by_id(board['id'])
+        start = len(backend.requests)
+
+        # Act
+        pages = list(board.get_item_pages(get_column_values=True))
+
+    # Assert
+    eq_([len(page) for page in pages], [100, 50, 50, 50, 50])
+    eq_([request['complexity'] for request in backend.requests[start:] if request['complexity'] > 100], [2602, 1302, 1302, 1302, 1302, 1302])
+
+
+@raises(ValueError)
+def test_should_fail_to_create_page_sizer_with_invalid_bounds():
+
+    # Act
+    PageSizer(min_limit=200, initial_limit=100)
@@ -0,0 +1,125 @@
+import json
+
+from unittest.mock import patch
+from nose.tools import ok_, eq_, raises
+
+from moncli import client, entities as en, ItemError
+from moncli.relations import RelationResolver
+from moncli.schema import SchemaCache
+
+from .fixtures import create_board
+
+
+def _get_board(id: str, relation_board_ids: list):
+    columns = [
+        {'id': 'name', 'title': 'Name', 'type': 'name'},
+        {'id': 'link', 'title': 'Link', 'type': 'board-relation', 'settings_str': json.dumps({'boardIds': relation_board_ids})}]
+    return {'id': id, 'name': 'Board {}'.format(id), 'columns': columns, 'groups': []}
+
+
+def _get_item_data(id: str, board_id: str, linked_ids: list = []):
+    value = json.dumps({'linkedPulseIds': [{'linkedPulseId': int(linked_id)} for linked_id in linked_ids]})
+    return {'id': id, 'name': 'Item {}'.format(id), 'board': {'id': board_id}, 'column_values': [{'id': 'link', 'text': '', 'value': value}]}
+
+
+def _create_items(board_data: dict, *items_data):
+    board = create_board(**board_data)
+    items = []
+    for data in items_data:
+        data = dict(data)
+        data.pop('board')
+        items.append(en.Item(creds=en.MondayClientCredentials(None), __board=board, **data))
+    return items
+
+
+@patch('moncli.api_v2.get_boards')
+@patch('moncli.api_v2.get_items')
+def test_should_resolve_links_of_many_items_with_one_query(get_items, get_boards):
+
+    # Arrange
+    items = _create_items(_get_board('1', ['2']), _get_item_data('11', '1', ['21', '22']), _get_item_data('12', '1', ['22']))
+    get_boards.return_value = [_get_board('2', [])]
+    get_items.return_value = [_get_item_data('21', '2'), _get_item_data('22', '2')]
+
+    # Act
+    links = RelationResolver(schema_cache=SchemaCache()).resolve(items, 'Link')
+
+    # Assert
+    eq_(get_items.call_count, 1)
+    eq_(get_items.call_args[1]['ids'], [21, 22])
+    eq_(get_boards.call_count, 1)
+    eq_([item.id for item in links['11']], ['21', '22'])
+    ok_(links['12'][0] is links['11'][1])
+    ok_(items[0].column_values['link'].linked_items is links['11'])
+    eq_(links['11'][0].board.name, 'Board 2')
+
+
+@patch('moncli.api_v2.get_boards')
+@patch('moncli.api_v2.get_items')
+def test_should_follow_links_up_to_depth_without_refetching_items(get_items, get_boards):
+
+    # Arrange
+    items = _create_items(_get_board('1', ['1']), _get_item_data('11', '1', ['12']))
+    get_boards.return_value = [_get_board('1', ['1'])]
+    get_items.side_effect = [[_get_item_data('12', '1', ['13'])], [_get_item_data('13', '1', ['11'])]]
+
+    # Act
+    links = RelationResolver(schema_cache=SchemaCache()).resolve(items, 'link', depth=3)
+
+    # Assert
+    eq_(get_items.call_count, 2)
+    eq_(get_boards.call_count, 1)
+    eq_(links['11'][0].column_values['link'].linked_items[0].id, '13')
+    ok_(links['13'][0] is items[0])
+
+
+@patch('moncli.api_v2.get_boards')
+@patch('moncli.api_v2.get_items')
+def test_should_fetch_linked_items_grouped_by_target_board(get_items, get_boards):
+
+    # Arrange
+    items = _create_items(_get_board('1', ['2']), _get_item_data('11', '1', ['21', '22']))
+    items += _create_items(_get_board('3', ['4']), _get_item_data('31', '3', ['41']))
+    items += _create_items(_get_board('5', ['2', '4']), _get_item_data('51', '5', ['22', '42']))
+    get_boards.return_value = [_get_board('2', []), _get_board('4', [])]
+    def get(*args, ids=None, **kwargs):
+        board_ids = {21: '2', 22: '2', 41: '4', 42: '4'}
+        return [_get_item_data(str(id), board_ids[id]) for id in ids]
+    get_items.side_effect = get
+
+    # Act
+    links = RelationResolver(schema_cache=SchemaCache()).resolve(items, 'link')
+
+    # Assert
+    eq_([call[1]['ids'] for call in get_items.call_args_list], [[21, 22], [41], [42]])
+    ok_('board.id' not in get_items.call_args_list[0][0])
+    ok_('board.id' in get_items.call_args_list[2][0])
+    eq_(get_boards.call_count, 1)
+    eq_([item.board.name for item in links['51']], ['Board 2', 'Board 4'])
+
+
+@raises(ItemError)
+def test_should_fail_to_resolve_a_column_that_is_not_a_relation():
+
+    # Arrange
+    items = _create_items(_get_board('1', []), _get_item_data('11', '1'))
+
+    # Act
+    RelationResolver(schema_cache=SchemaCache()).resolve(items, 'name')
+
+
+@patch('moncli.api_v2.get_boards')
+@patch('moncli.api_v2.get_items')
+def test_should_resolve_relations_from_client(get_items, get_boards):
+
+    # Arrange
+    items = _create_items(_get_board('1', ['2']), _get_item_data('11', '1', ['21']))
+    get_boards.return_value = [_get_board('2', [])]
+    get_items.return_value = [_get_item_data('21', '2')]
+    client.schema_cache.clear()
+
+    # Act
+    links = client.resolve_relations(items, 'link')
+
+    # Assert
+    eq_(links['11'][0].name, 'Item 21')
@@ -0,0 +1,52 @@
+from nose.tools import ok_, eq_, raises
+
+from moncli import entities as en
+from moncli.schema import SchemaCache, get_boards_by_ids
+from moncli.testing import install
+
+from .fixtures import add_board
+
+
+def test_should_get_boards_by_ids_with_chunked_queries():
+
+    # Arrange
+    with install() as backend:
+        board_ids = list(reversed([add_board(backend, name='Board {}'.format(index))['id'] for index in range(30)]))
+        client = en.MondayClient()
+
+        # Act
+        boards = client.get_boards_by_ids(board_ids + [board_ids[0], 99999])
+
+    # Assert
+    eq_([int(board.id) for board in boards], board_ids)
+    eq_([column.id for column in boards[0].columns], ['name', 'status', 'estimate', 'text', 'files'])
+    eq_(len(backend.requests), 2)
+    eq_(len(client.schema_cache), 30)
+
+
+def test_should_get_cached_boards_without_requests():
+
+    # Arrange
+    schema_cache = SchemaCache()
+    with install() as backend:
+        board_ids = [add_board(backend, name='Board {}'.format(index))['id'] for index in range(3)]
+        schema_cache.get_boards(board_ids[:2])
+
+        # Act
+        boards = get_boards_by_ids(board_ids, schema_cache=schema_cache)
+        views = get_boards_by_ids(board_ids[:1], include=['views'], schema_cache=schema_cache)
+
+    # Assert
+    eq_([int(board.id) for board in boards], board_ids)
+    ok_(boards[0] is schema_cache.get_board(board_ids[0]))
+    ok_(boards[0] is schema_cache.get(board_ids[0]))
+    eq_(SchemaCache().get(board_ids[0]), None)
+    eq_(len(backend.requests), 3)
+    eq_(len(views), 1)
+
+
+@raises(ValueError)
+def test_should_fail_to_include_unknown_board_lists():
+
+    # Act
+    get_boards_by_ids(['1'], include=['columns', 'items'])
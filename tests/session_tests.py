@@ -0,0 +1,131 @@
+import threading
+
+from unittest.mock import patch
+from nose.tools import ok_, eq_
+
+from moncli import entities as en
+from moncli.testing import install
+
+from .fixtures import add_board
+
+
+def test_should_share_boards_and_columns_of_items_in_session():
+
+    # Arrange
+    with install() as backend:
+        board = add_board(backend, items=3)
+        board_id, item_ids = board['id'], board['item_ids']
+        client = en.MondayClient()
+
+        # Act
+        with client.session() as session:
+            items = [client.get_items(ids=[item_id])[0] for item_id in item_ids]
+            values = [item.column_values['estimate'].value for item in items]
+            board = client.get_board(id=board_id)
+
+    # Assert
+    eq_(values, [0, 1, 2])
+    ok_(all(item.board is board for item in items))
+    ok_(board.columns['estimate'] is session.get(en.Column, 'estimate', board_id))
+    eq_([request['operations'] for request in backend.requests].count(['boards']), 2)
+
+
+def test_should_merge_fetched_fields_into_shared_item():
+
+    # Arrange
+    with install() as backend:
+        board = add_board(backend, items=1)
+        board_id, item_ids = board['id'], board['item_ids']
+        client = en.MondayClient()
+
+        with client.session() as session:
+            item = client.get_items(ids=item_ids)[0]
+            backend.items[item_ids[0]]['name'] = 'Renamed'
+
+            # Act
+            fetched = client.get_items(get_column_values=True, ids=item_ids)[0]
+
+    # Assert
+    ok_(fetched is item)
+    eq_(item.name, 'Renamed')
+    eq_(item.column_values['estimate'].value, 0)
+    ok_(session.get(en.Item, item_ids[0]) is item)
+
+
+def test_should_build_separate_entities_without_session():
+
+    # Arrange
+    with install() as backend:
+        board_id = add_board(backend)['id']
+        client = en.MondayClient()
+
+        # Act
+        first = client.get_board(id=board_id)
+        second = client.get_board(id=board_id)
+        with client.session():
+            pass
+        third = client.get_board(id=board_id)
+
+    # Assert
+    ok_(first is not second)
+    ok_(second is not third)
+
+
+def test_should_only_share_entities_in_thread_of_session():
+
+    # Arrange
+    with install() as backend:
+        board_id = add_board(backend)['id']
+        client = en.MondayClient()
+        boards = []
+        def get_board():
+            boards.append(client.get_board(id=board_id))
+
+        # Act
+        with client.session() as session:
+            board = client.get_board(id=board_id)
+            thread = threading.Thread(target=get_board)
+            thread.start()
+            thread.join()
+
+    # Assert
+    ok_(boards[0] is not board)
+    ok_(session.get(en.Board, board_id) is board)
+    eq_(len(session), 1)
+
+
+def test_should_merge_columns_of_refetched_board_in_place():
+
+    # Arrange
+    with install() as backend:
+        board_id = add_board(backend)['id']
+        client = en.MondayClient()
+
+        with client.session() as session:
+            board = client.get_board(id=board_id)
+            column = board.columns['estimate']
+            backend.add_column(board_id, 'Owner', 'text', id='owner')
+
+            # Act
+            fetched = client.get_board_by_id(board_id, 'id', 'name', 'columns.id', 'columns.title', 'columns.type')
+
+    # Assert
+    ok_(fetched is board)
+    ok_(board.columns['estimate'] is column)
+    ok_(board.columns['owner'] is session.get(en.Column, 'owner', board_id))
+
+
+@patch('moncli.api_v2.get_boards')
+def test_should_build_board_items_with_their_board(get_boards):
+
+    # Arrange
+    get_boards.return_value = [{'id': '1', 'name': 'Test Board 1'}]
+    board = en.MondayClient().get_boards(ids=['1'])[0]
+    get_boards.return_value = [{'id': '1', 'items': [{'id': '1', 'name': 'Item 1'}]}]
+
+    # Act
+    items = board.get_items()
+
+    # Assert
+    ok_(items[0].board is board)
+    eq_(get_boards.call_count, 2)
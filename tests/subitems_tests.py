@@ -0,0 +1,84 @@
+import json
+
+from unittest.mock import patch
+from nose.tools import ok_, eq_
+
+from moncli import client
+from moncli.schema import SchemaCache
+from moncli.subitems import get_subitem_trees
+
+
+def _get_board_data(id: str):
+    return {'id': id, 'name': 'Board {}'.format(id), 'columns': [{'id': 'status', 'title': 'Status', 'type': 'color', 'settings_str': json.dumps({'labels': {'0': 'Done'}})}], 'groups': []}
+
+
+def _get_item_data(id: str, board_id: str, subitems: list = None):
+    data = {'id': id, 'name': 'Item {}'.format(id), 'board': {'id': board_id}, 'column_values': [{'id': 'status', 'text': 'Done', 'value': json.dumps({'index': 0})}]}
+    if subitems is not None:
+        data['subitems'] = subitems
+    return data
+
+
+@patch('moncli.api_v2.get_boards')
+@patch('moncli.api_v2.get_items')
+def test_should_load_subitem_trees_with_one_query_per_chunk(get_items, get_boards):
+
+    # Arrange
+    get_items.return_value = [
+        _get_item_data('1', '10', [_get_item_data('11', '20'), _get_item_data('12', '20')]),
+        _get_item_data('2', '10', [_get_item_data('21', '20')])]
+    get_boards.side_effect = [[_get_board_data('10')], [_get_board_data('20')]]
+
+    # Act
+    tree = get_subitem_trees(['1', '2'], schema_cache=SchemaCache())
+
+    # Assert
+    eq_(get_items.call_count, 1)
+    eq_(get_boards.call_count, 2)
+    eq_([node.id for node in tree.roots], ['1', '2'])
+    eq_(len(tree), 5)
+    eq_(tree['21'].parent.id, '2')
+    eq_([item.id for item in tree['1'].item.subitems], ['11', '12'])
+    ok_(tree['11'].item.parent_item is tree['1'].item)
+    ok_(tree['11'].item.board is tree['12'].item.board)
+    eq_(tree['21'].item.column_values['status'].value, 'Done')
+    eq_([node.id for node in tree.walk()], ['1', '11', '12', '2', '21'])
+
+
+@patch('moncli.api_v2.get_boards')
+@patch('moncli.api_v2.get_items')
+def test_should_query_deeper_subitem_levels_in_bulk(get_items, get_boards):
+
+    # Arrange
+    get_items.side_effect = [
+        [_get_item_data('1', '10', [_get_item_data('11', '20'), _get_item_data('12', '20')])],
+        [{'id': '11', 'subitems': [_get_item_data('111', '30')]}, {'id': '12', 'subitems': []}]]
+    get_boards.side_effect = [[_get_board_data('10')], [_get_board_data('20')], [_get_board_data('30')]]
+
+    # Act
+    tree = get_subitem_trees(['1'], depth=2, schema_cache=SchemaCache())
+
+    # Assert
+    eq_(get_items.call_count, 2)
+    eq_(get_items.call_args[1]['ids'], [11, 12])
+    eq_([node.id for node in tree.get_ancestors('111')], ['11', '1'])
+    eq_(tree['111'].depth, 2)
+
+
+@patch('moncli.api_v2.get_boards')
+@patch('moncli.api_v2.get_items')
+def test_should_share_cached_board_schemas_between_client_calls(get_items, get_boards):
+
+    # Arrange
+    get_items.return_value = [_get_item_data('1', '10', [])]
+    get_boards.return_value = [_get_board_data('10')]
+    client.schema_cache.clear()
+
+    # Act
+    client.get_subitem_trees(['1'])
+    tree = client.get_subitem_trees(['1'])
+
+    # Assert
+    eq_(get_items.call_count, 2)
+    eq_(get_boards.call_count, 1)
+    eq_(tree['1'].children, [])
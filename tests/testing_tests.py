@@ -0,0 +1,154 @@
+import os, tempfile, time
+
+from unittest.mock import patch
+from nose.tools import ok_, eq_, raises
+
+from moncli import api, entities as en
+from moncli.testing import FakeMondayBackend, FakeMondayServer, ReplayError, install, record, replay
+
+from .fixtures import add_board
+
+
+_sleep = time.sleep
+def test_should_create_and_query_items_end_to_end():
+
+    # Arrange
+    with install() as backend:
+        board_id = add_board(backend)['id']
+        board = en.MondayClient().get_board(id=board_id)
+
+        # Act
+        item = board.add_item('Write tests', column_values={'status': 'Done', 'estimate': 3})
+        item.change_column_value(id='estimate', column_value='5')
+        items = board.get_items(get_column_values=True)
+        columns = board.columns
+
+    # Assert
+    eq_([column.title for column in columns], ['Name', 'Status', 'Estimate', 'Text', 'Files'])
+    eq_(items[0].name, 'Write tests')
+    eq_(items[0].column_values['status'].value, 'Done')
+    eq_(items[0].column_values['estimate'].value, 5)
+    eq_([request['operations'] for request in backend.requests[1:4]], [['create_item'], ['change_column_value'], ['boards']])
+
+
+def test_should_page_items():
+
+    # Arrange
+    with install() as backend:
+        board = en.MondayClient().get_board(id=add_board(backend, items=7)['id'])
+
+        # Act
+        pages = list(board.get_item_pages(limit=3))
+
+    # Assert
+    eq_([len(page) for page in pages], [3, 3, 1])
+    eq_(pages[2][0].name, 'Task 6')
+
+
+@patch('moncli.api_v2.rate_limit_wait', 0)
+def test_should_resend_requests_answered_with_429():
+
+    # Arrange
+    with install() as backend:
+        board_id = add_board(backend, items=2)['id']
+        backend.fail_next(429, count=2)
+
+        # Act
+        items = api.get_items('id', 'name', ids=[board_id + 1, board_id + 2])
+
+    # Assert
+    eq_(len(items), 2)
+    eq_([request['status_code'] for request in backend.requests], [429, 429, 200])
+
+
+@patch('time.sleep')
+def test_should_wait_for_complexity_budget_reset(sleep):
+
+    # Arrange
+    sleep.side_effect = lambda seconds: _sleep(0.06)
+    backend = FakeMondayBackend(complexity_budget=30, budget_window=0.05)
+    with install(backend):
+        add_board(backend, items=2)
+
+        # Act
+        items = [api.get_items('id', 'name', limit=10) for _ in range(4)]
+
+    # Assert
+    eq_(len(items[3]), 2)
+    eq_(sleep.call_count, 1)
+    eq_(sleep.call_args[0][0], 1)
+    eq_([request['errors'] for request in backend.requests], [False, False, False, True, False])
+
+
+@raises(api.MondayApiError)
+def test_should_fail_queries_exceeding_max_complexity():
+
+    # Arrange
+    with install(FakeMondayBackend(complexity_budget=10)):
+
+        # Act
+        api.get_boards('id', 'items.id', limit=5)
+
+
+@raises(api.MondayApiError)
+def test_should_fail_for_unknown_items():
+
+    # Arrange
+    with install():
+
+        # Act
+        api.change_column_value('1', 'status', '1', {'index': 1})
+
+
+def test_should_upload_and_download_files_over_local_http():
+
+    # Arrange
+    with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as temp_file:
+        temp_file.write(b'contents')
+    with FakeMondayServer() as server, server.install():
+        board = add_board(server.backend)
+        item_data = server.backend.add_item(board['id'], 'Task')
+        item = en.MondayClient().get_items(ids=[item_data['id']], get_column_values=True)[0]
+
+        # Act
+        asset = item.add_file(item.column_values['files'], temp_file.name)
+        paths = en.MondayClient().download_assets([asset.id], tempfile.mkdtemp(), cache=False)
+    os.remove(temp_file.name)
+
+    # Assert
+    eq_(asset.name, os.path.basename(temp_file.name))
+    eq_(open(paths[0], 'rb').read(), b'contents')
+    eq_(server.backend.requests[-1]['operations'], ['assets'])
+
+
+def test_should_replay_recorded_requests_offline():
+
+    # Arrange
+    path = os.path.join(tempfile.mkdtemp(), 'run.jsonl.gz')
+    with install() as backend:
+        board_id = add_board(backend, items=3)['id']
+        with record(path) as recording:
+            expected = [item.name for item in en.MondayClient().get_board(id=board_id).get_items()]
+
+    # Act
+    with replay(path) as session:
+        names = [item.name for item in en.MondayClient().get_board(id=board_id).get_items()]
+
+    # Assert
+    eq_(names, expected)
+    eq_(len(session.requests), len(recording))
+    eq_(recording.get_operation_counts(), {'boards': 2})
+
+
+@raises(ReplayError)
+def test_should_fail_requests_missing_from_replayed_recording():
+
+    # Arrange
+    with install() as backend:
+        board_id = add_board(backend)['id']
+        with record() as recording:
+            en.MondayClient().get_board(id=board_id)
+
+    # Act
+    with replay(recording):
+        api.get_items('id', 'name', limit=10)
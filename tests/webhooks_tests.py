@@ -0,0 +1,140 @@
+import asyncio, json
+
+from nose.tools import ok_, eq_
+
+from moncli import entities as en
+from moncli.enums import WebhookEventType
+from moncli.index import ItemIndex
+from moncli.webhooks import WebhookEvent, WebhookServer, patch_index
+
+
+def _create_payload(trigger_uuid='abc', index=1, text='Done'):
+    return {'event': {
+        'type': 'update_column_value',
+        'triggerUuid': trigger_uuid,
+        'boardId': 1,
+        'pulseId': 2,
+        'columnId': 'status',
+        'columnType': 'color',
+        'columnTitle': 'Status',
+        'value': {'label': {'index': index, 'text': text}},
+        'previousValue': {'label': {'index': 0, 'text': 'Working on it'}}}}
+
+
+def test_should_echo_challenge():
+
+    # Arrange
+    server = WebhookServer()
+
+    # Act
+    response = asyncio.run(server.handle_payload({'challenge': 'token'}))
+
+    # Assert
+    eq_(response, {'challenge': 'token'})
+
+
+def test_should_decode_dedupe_and_batch_events():
+
+    # Arrange
+    server = WebhookServer(batch_interval=60)
+    batches = []
+    invalidated = []
+    server.on_events(lambda board_id, events: batches.append((board_id, events)))
+    server.on_invalidate(lambda board_id, item_ids: invalidated.append((board_id, item_ids)))
+
+    async def receive():
+        await server.handle_payload(_create_payload('abc'))
+        await server.handle_payload(_create_payload('abc'))
+        await server.handle_payload(_create_payload('def', 0, 'Working on it'))
+        await server.flush()
+
+    # Act
+    asyncio.run(receive())
+
+    # Assert
+    eq_(len(batches), 1)
+    board_id, events = batches[0]
+    eq_(board_id, '1')
+    eq_(len(events), 2)
+    eq_(events[0].type, WebhookEventType.change_column_value)
+    eq_(events[0].item_id, '2')
+    eq_(events[0].column_value.value, 'Done')
+    eq_(events[0].previous_column_value.value, 'Working on it')
+    eq_(invalidated, [('1', {'2'})])
+
+
+def test_should_receive_webhooks_over_http():
+
+    # Arrange
+    server = WebhookServer(host='127.0.0.1', port=0, path='/hooks', batch_interval=0)
+    received = []
+    server.on_events(lambda board_id, events: received.extend(events))
+
+    async def post(body):
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+        content = json.dumps(body).encode()
+        writer.write('POST /hooks HTTP/1.1\r\nHost: localhost\r\nContent-Length: {}\r\n\r\n'.format(len(content)).encode() + content)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response
+
+    async def receive():
+        await server.start()
+        challenge = await post({'challenge': 'token'})
+        malformed = await post(['challenge'])
+        await post(_create_payload())
+        await asyncio.sleep(0.05)
+        await server.stop()
+        return challenge, malformed
+
+    # Act
+    challenge, malformed = asyncio.run(receive())
+
+    # Assert
+    ok_(malformed.startswith(b'HTTP/1.1 400 Bad Request'))
+    ok_(challenge.startswith(b'HTTP/1.1 200 OK'))
+    ok_(challenge.endswith(b'{"challenge": "token"}'))
+    eq_(len(received), 1)
+
+
+def test_should_patch_index_from_events():
+
+    # Arrange
+    columns = [{'id': 'status', 'title': 'Status', 'type': 'color', 'settings_str': json.dumps({'labels': {'0': 'Working on it', '1': 'Done'}})}]
+    board = en.Board(creds=en.MondayClientCredentials(None), id='1', name='Test Board 1', columns=columns)
+    item = en.Item(creds=board._Board__creds, __board=board, id='2', name='Item 2', column_values=[
+        {'id': 'status', 'text': 'Working on it', 'value': json.dumps({'index': 0})}])
+    index = ItemIndex([item])
+    server = WebhookServer()
+    server.on_patch(patch_index(index))
+
+    async def receive():
+        await server.handle_payload(_create_payload())
+        await server.flush()
+
+    # Act
+    asyncio.run(receive())
+
+    # Assert
+    eq_(item.column_values['status'].value, 'Done')
+    eq_([item.id for item in index.query([('status', '==', 'Done')])], ['2'])
+
+
+def test_should_ignore_board_level_events_when_patching_index():
+
+    # Arrange
+    columns = [{'id': 'status', 'title': 'Status', 'type': 'color', 'settings_str': json.dumps({'labels': {'0': 'Working on it', '1': 'Done'}})}]
+    board = en.Board(creds=en.MondayClientCredentials(None), id='1', name='Test Board 1', columns=columns)
+    item = en.Item(creds=board._Board__creds, __board=board, id='2', name='Item 2', column_values=[
+        {'id': 'status', 'text': 'Working on it', 'value': json.dumps({'index': 0})}])
+    index = ItemIndex([item])
+    hook = patch_index(index)
+    event = WebhookEvent({'type': 'create_column', 'triggerUuid': 'abc', 'boardId': 1, 'columnId': 'status'})
+
+    # Act
+    hook(event)
+
+    # Assert
+    eq_(event.item_id, None)
+    eq_(len(index), 1)